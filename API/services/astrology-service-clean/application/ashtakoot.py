@@ -0,0 +1,272 @@
+"""
+Ashtakoot Guna Milan.
+
+Scores the eight kootas from the Moon's nakshatra and sign of the
+groom and the bride. Every koota is a precomputed lookup matrix
+indexed [groom, bride]:
+
+- Tara, Yoni, Gana, Nadi depend on the nakshatras (27 x 27)
+- Varna, Vashya, Graha Maitri, Bhakoot depend on the signs (12 x 12)
+
+so scoring one profile against N candidates is eight array gathers.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from domain.entities import Planet, ZodiacSign
+from domain.entities.zodiac import NAKSHATRAS
+
+# (name, hindi name, max points) in traditional order
+KOOTAS: Tuple[Tuple[str, str, int], ...] = (
+    ("Varna", "वर्ण", 1),
+    ("Vashya", "वश्य", 2),
+    ("Tara", "तारा", 3),
+    ("Yoni", "योनि", 4),
+    ("Graha Maitri", "ग्रह मैत्री", 5),
+    ("Gana", "गण", 6),
+    ("Bhakoot", "भकूट", 7),
+    ("Nadi", "नाड़ी", 8),
+)
+MAX_POINTS = sum(k[2] for k in KOOTAS)
+
+NAKSHATRA_NAMES = [n[0] for n in NAKSHATRAS]
+NAKSHATRA_SPAN = 360.0 / 27
+
+
+# =============================================================================
+# Attribute tables
+# =============================================================================
+
+# Varna by sign (higher is senior): Shudra 0, Vaishya 1, Kshatriya 2, Brahmin 3
+_SIGN_VARNA = (2, 1, 0, 3, 2, 1, 0, 3, 2, 1, 0, 3)
+
+# Vashya group by sign (whole-sign simplification):
+# 0 Chatushpada, 1 Manava, 2 Jalachara, 3 Vanachara, 4 Keeta
+_SIGN_VASHYA = (0, 0, 1, 2, 3, 1, 1, 4, 1, 0, 1, 2)
+_VASHYA_POINTS = np.array([
+    [2.0, 1.0, 1.0, 0.5, 1.0],
+    [1.0, 2.0, 0.5, 0.0, 1.0],
+    [1.0, 0.5, 2.0, 1.0, 1.0],
+    [0.5, 0.0, 1.0, 2.0, 0.0],
+    [1.0, 1.0, 1.0, 0.0, 2.0],
+])
+
+# Yoni animal by nakshatra:
+# Horse, Elephant, Sheep, Serpent, Dog, Cat, Rat, Cow, Buffalo, Tiger,
+# Deer, Monkey, Mongoose, Lion
+_NAKSHATRA_YONI = (
+    0, 1, 2, 3, 3, 4, 5, 2, 5, 6, 6, 7, 8, 9,
+    8, 9, 10, 10, 4, 11, 12, 11, 13, 0, 13, 7, 1,
+)
+_YONI_POINTS = np.array([
+    [4, 2, 2, 3, 2, 2, 2, 1, 0, 1, 3, 3, 2, 1],
+    [2, 4, 3, 3, 2, 2, 2, 2, 3, 1, 2, 3, 2, 0],
+    [2, 3, 4, 2, 1, 2, 1, 3, 3, 1, 2, 0, 3, 1],
+    [3, 3, 2, 4, 2, 1, 1, 1, 1, 2, 2, 2, 0, 2],
+    [2, 2, 1, 2, 4, 2, 1, 2, 2, 1, 0, 2, 1, 1],
+    [2, 2, 2, 1, 2, 4, 0, 2, 2, 1, 3, 3, 2, 1],
+    [2, 2, 1, 1, 1, 0, 4, 2, 2, 2, 2, 2, 1, 2],
+    [1, 2, 3, 1, 2, 2, 2, 4, 3, 0, 3, 2, 2, 1],
+    [0, 3, 3, 1, 2, 2, 2, 3, 4, 1, 2, 2, 2, 1],
+    [1, 1, 1, 2, 1, 1, 2, 0, 1, 4, 1, 1, 2, 1],
+    [3, 2, 2, 2, 0, 3, 2, 3, 2, 1, 4, 2, 2, 1],
+    [3, 3, 0, 2, 2, 3, 2, 2, 2, 1, 2, 4, 3, 2],
+    [2, 2, 3, 0, 1, 2, 1, 2, 2, 2, 2, 3, 4, 2],
+    [1, 0, 1, 2, 1, 1, 2, 1, 1, 1, 1, 2, 2, 4],
+], dtype=float)
+
+# Gana by nakshatra: 0 Deva, 1 Manushya, 2 Rakshasa
+_NAKSHATRA_GANA = (
+    0, 1, 2, 1, 0, 1, 0, 0, 2, 2, 1, 1, 0, 2,
+    0, 2, 0, 2, 2, 1, 1, 0, 2, 2, 1, 1, 0,
+)
+_GANA_POINTS = np.array([
+    [6.0, 6.0, 1.0],
+    [5.0, 6.0, 0.0],
+    [1.0, 0.0, 6.0],
+])
+
+# Nadi by nakshatra (Adi, Madhya, Antya in a zig-zag of six)
+_NAKSHATRA_NADI = tuple((0, 1, 2, 2, 1, 0)[n % 6] for n in range(27))
+
+# Sign lords and natural friendships
+_SIGN_LORD = (
+    Planet.MARS, Planet.VENUS, Planet.MERCURY, Planet.MOON, Planet.SUN, Planet.MERCURY,
+    Planet.VENUS, Planet.MARS, Planet.JUPITER, Planet.SATURN, Planet.SATURN, Planet.JUPITER,
+)
+_FRIENDS = {
+    Planet.SUN: ({Planet.MOON, Planet.MARS, Planet.JUPITER}, {Planet.VENUS, Planet.SATURN}),
+    Planet.MOON: ({Planet.SUN, Planet.MERCURY}, set()),
+    Planet.MARS: ({Planet.SUN, Planet.MOON, Planet.JUPITER}, {Planet.MERCURY}),
+    Planet.MERCURY: ({Planet.SUN, Planet.VENUS}, {Planet.MOON}),
+    Planet.JUPITER: ({Planet.SUN, Planet.MOON, Planet.MARS}, {Planet.MERCURY, Planet.VENUS}),
+    Planet.VENUS: ({Planet.MERCURY, Planet.SATURN}, {Planet.SUN, Planet.MOON}),
+    Planet.SATURN: ({Planet.MERCURY, Planet.VENUS}, {Planet.SUN, Planet.MOON, Planet.MARS}),
+}
+# Points by sorted pair of attitudes (each: 2 friend, 1 neutral, 0 enemy)
+_MAITRI_POINTS = {(2, 2): 5.0, (1, 2): 4.0, (1, 1): 3.0, (0, 2): 1.0, (0, 1): 0.5, (0, 0): 0.0}
+
+
+def _attitude(planet: Planet, towards: Planet) -> int:
+    friends, enemies = _FRIENDS[planet]
+    if towards in friends:
+        return 2
+    if towards in enemies:
+        return 0
+    return 1
+
+
+# =============================================================================
+# Koota matrices [groom, bride]
+# =============================================================================
+
+def _build_sign_matrices() -> Dict[str, np.ndarray]:
+    varna = np.zeros((12, 12))
+    vashya = np.zeros((12, 12))
+    maitri = np.zeros((12, 12))
+    bhakoot = np.zeros((12, 12))
+
+    for g in range(12):
+        for b in range(12):
+            varna[g, b] = 1.0 if _SIGN_VARNA[g] >= _SIGN_VARNA[b] else 0.0
+            vashya[g, b] = _VASHYA_POINTS[_SIGN_VASHYA[g], _SIGN_VASHYA[b]]
+
+            lord_g, lord_b = _SIGN_LORD[g], _SIGN_LORD[b]
+            if lord_g == lord_b:
+                maitri[g, b] = 5.0
+            else:
+                pair = tuple(sorted((_attitude(lord_g, lord_b), _attitude(lord_b, lord_g))))
+                maitri[g, b] = _MAITRI_POINTS[pair]
+
+            # Sign distance counted from each side; 2/12, 5/9, 6/8 are doshas
+            distance = (b - g) % 12 + 1
+            bhakoot[g, b] = 0.0 if distance in (2, 12, 5, 9, 6, 8) else 7.0
+
+    return {"Varna": varna, "Vashya": vashya, "Graha Maitri": maitri, "Bhakoot": bhakoot}
+
+
+def _build_nakshatra_matrices() -> Dict[str, np.ndarray]:
+    g = np.arange(27)[:, None]
+    b = np.arange(27)[None, :]
+
+    # Tara: count from one nakshatra to the other; 3rd, 5th, 7th (mod 9) are bad
+    good_for_groom = ~np.isin((g - b) % 27 % 9 + 1, (3, 5, 7))
+    good_for_bride = ~np.isin((b - g) % 27 % 9 + 1, (3, 5, 7))
+    tara = 1.5 * good_for_groom + 1.5 * good_for_bride
+
+    yoni = np.array(_NAKSHATRA_YONI)
+    gana = np.array(_NAKSHATRA_GANA)
+    nadi = np.array(_NAKSHATRA_NADI)
+
+    return {
+        "Tara": tara,
+        "Yoni": _YONI_POINTS[yoni[g], yoni[b]],
+        "Gana": _GANA_POINTS[gana[g], gana[b]],
+        "Nadi": np.where(nadi[g] == nadi[b], 0.0, 8.0),
+    }
+
+
+SIGN_MATRICES = _build_sign_matrices()
+NAKSHATRA_MATRICES = _build_nakshatra_matrices()
+
+for _matrix in (*SIGN_MATRICES.values(), *NAKSHATRA_MATRICES.values()):
+    _matrix.setflags(write=False)
+
+# Signs each nakshatra overlaps (a nakshatra can straddle two signs)
+NAKSHATRA_SIGNS = tuple(
+    frozenset({int(n * NAKSHATRA_SPAN // 30), int(((n + 1) * NAKSHATRA_SPAN - 1e-9) // 30)})
+    for n in range(27)
+)
+
+
+# =============================================================================
+# Scoring
+# =============================================================================
+
+def nakshatra_index(name: str) -> int:
+    """Get 0-based index of a nakshatra by name (case-insensitive)."""
+    lowered = name.strip().lower()
+    for i, nakshatra in enumerate(NAKSHATRA_NAMES):
+        if nakshatra.lower() == lowered:
+            return i
+    raise ValueError(f"Unknown nakshatra: {name}")
+
+
+def sign_index(sign: ZodiacSign) -> int:
+    """Get 0-based index of a sign."""
+    return sign.number - 1
+
+
+def score(
+    groom_nakshatra,
+    groom_sign,
+    bride_nakshatra,
+    bride_sign
+) -> np.ndarray:
+    """
+    Score kootas for pairs of Moon positions.
+
+    Arguments are 0-based index arrays (or scalars) that broadcast
+    against each other, e.g. one groom against N brides.
+
+    Returns:
+        Array of shape (..., 8), columns in KOOTAS order
+    """
+    gn, gs, bn, bs = np.broadcast_arrays(
+        np.asarray(groom_nakshatra), np.asarray(groom_sign),
+        np.asarray(bride_nakshatra), np.asarray(bride_sign),
+    )
+    columns = []
+    for name, _, _ in KOOTAS:
+        if name in SIGN_MATRICES:
+            columns.append(SIGN_MATRICES[name][gs, bs])
+        else:
+            columns.append(NAKSHATRA_MATRICES[name][gn, bn])
+    return np.stack(columns, axis=-1)
+
+
+def recommendations(total: float, nadi_dosha: bool) -> List[str]:
+    """Recommendations for a total score."""
+    if total < 18:
+        return ["Match score is below recommended threshold",
+                "Consult with a pandit for remedies"]
+    if nadi_dosha:
+        return ["Nadi dosha present - remedies recommended",
+                "Nadi shanti puja advised"]
+    return ["Match is favorable", "Proceed with confidence"]
+
+
+def match_details(
+    groom_nakshatra: int,
+    groom_sign: int,
+    bride_nakshatra: int,
+    bride_sign: int
+) -> dict:
+    """Full Guna Milan result for one pair (KundliRepository.match_kundlis shape)."""
+    points = score(groom_nakshatra, groom_sign, bride_nakshatra, bride_sign).tolist()
+    total = float(sum(points))
+    nadi_dosha = _NAKSHATRA_NADI[groom_nakshatra] == _NAKSHATRA_NADI[bride_nakshatra]
+
+    return {
+        "total_points": total,
+        "guna_details": [
+            {
+                "name": name,
+                "name_hindi": name_hindi,
+                "max_points": max_points,
+                "obtained_points": obtained,
+                "description": f"{name} compatibility score",
+            }
+            for (name, name_hindi, max_points), obtained in zip(KOOTAS, points)
+        ],
+        "nadi_dosha": nadi_dosha,
+        "recommendations": recommendations(total, nadi_dosha),
+    }
+
+
+def nadi_doshas(groom_nakshatra: Sequence[int], bride_nakshatra: Sequence[int]) -> np.ndarray:
+    """Nadi dosha flags for pairs of nakshatra index arrays."""
+    nadi = np.array(_NAKSHATRA_NADI)
+    return nadi[np.asarray(groom_nakshatra)] == nadi[np.asarray(bride_nakshatra)]
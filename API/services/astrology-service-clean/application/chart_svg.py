@@ -0,0 +1,169 @@
+"""
+Birth Chart Drawing.
+
+Renders a kundli as an SVG in either regional layout:
+
+- North Indian: houses are fixed (lagna at the top diamond, counted
+  anticlockwise) and each house shows its sign number
+- South Indian: signs are fixed (Pisces top left, running clockwise)
+  and the lagna's sign is marked
+
+Both draw the same content - the sign and planets of each house - so
+chart_key() hashes that content, and equal charts share one key
+whatever the birth details were.
+"""
+
+import hashlib
+from typing import Dict, List, Tuple
+
+from domain.entities import Kundli, Planet
+
+CHART_STYLES = ("north", "south")
+CHART_LANGUAGES = ("en", "hi")
+
+# Bumped whenever the drawing changes, so cached images are redrawn
+RENDER_VERSION = "1"
+
+SIZE = 400
+_FONT = 'font-family="sans-serif" text-anchor="middle" dominant-baseline="central"'
+_LINE_HEIGHT = 16
+
+PLANET_ABBREVIATIONS: Dict[Planet, Tuple[str, str]] = {
+    Planet.SUN: ("Su", "सू"),
+    Planet.MOON: ("Mo", "चं"),
+    Planet.MARS: ("Ma", "मं"),
+    Planet.MERCURY: ("Me", "बु"),
+    Planet.JUPITER: ("Ju", "गु"),
+    Planet.VENUS: ("Ve", "शु"),
+    Planet.SATURN: ("Sa", "श"),
+    Planet.RAHU: ("Ra", "रा"),
+    Planet.KETU: ("Ke", "के"),
+}
+_RETROGRADE = {"en": "(R)", "hi": "(व)"}
+_NODES = (Planet.RAHU, Planet.KETU)  # Always retrograde, never marked
+_LAGNA = {"en": "Asc", "hi": "लग्न"}
+
+# North Indian: (planets centre, sign number position) of houses 1-12
+_NORTH_HOUSES = (
+    ((200, 100), (200, 165)),
+    ((100, 33), (100, 70)),
+    ((33, 100), (70, 100)),
+    ((100, 200), (165, 200)),
+    ((33, 300), (70, 300)),
+    ((100, 367), (100, 330)),
+    ((200, 300), (200, 235)),
+    ((300, 367), (300, 330)),
+    ((367, 300), (330, 300)),
+    ((300, 200), (235, 200)),
+    ((367, 100), (330, 100)),
+    ((300, 33), (300, 70)),
+)
+_NORTH_LINES = (
+    "M0,0 L400,400 M400,0 L0,400 "
+    "M200,0 L400,200 L200,400 L0,200 Z"
+)
+
+# South Indian: (row, column) of signs Aries-Pisces on the 4 x 4 grid
+_SOUTH_CELLS = (
+    (0, 1), (0, 2), (0, 3), (1, 3), (2, 3), (3, 3),
+    (3, 2), (3, 1), (3, 0), (2, 0), (1, 0), (0, 0),
+)
+_CELL = SIZE // 4
+
+
+def house_contents(kundli: Kundli, lang: str = "en") -> List[Tuple[int, List[str]]]:
+    """(sign number, planet labels) of houses 1-12, as drawn."""
+    language = CHART_LANGUAGES.index(lang)
+    retrograde = {
+        p.planet for p in kundli.planets if p.is_retrograde and p.planet not in _NODES
+    }
+    houses = sorted(kundli.houses, key=lambda house: house.number)
+    return [
+        (
+            house.sign.number,
+            [
+                PLANET_ABBREVIATIONS[planet][language]
+                + (_RETROGRADE[lang] if planet in retrograde else "")
+                for planet in sorted(house.planets, key=list(Planet).index)
+            ]
+        )
+        for house in houses
+    ]
+
+
+def chart_key(kundli: Kundli, style: str, lang: str = "en") -> str:
+    """Content hash of a chart drawing."""
+    contents = ";".join(
+        f"{sign}:{','.join(labels)}" for sign, labels in house_contents(kundli, lang)
+    )
+    payload = f"{RENDER_VERSION}|{style}|{lang}|{contents}"
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def render_chart_svg(kundli: Kundli, style: str = "north", lang: str = "en") -> str:
+    """
+    Draw a kundli as an SVG document.
+
+    Raises:
+        ValueError: If the style or language is unknown
+    """
+    if style not in CHART_STYLES:
+        raise ValueError(f"Unknown chart style: {style}")
+    if lang not in CHART_LANGUAGES:
+        raise ValueError(f"Unknown chart language: {lang}")
+
+    houses = house_contents(kundli, lang)
+    body = _north(houses) if style == "north" else _south(houses, lang)
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{SIZE}" height="{SIZE}" '
+        f'viewBox="0 0 {SIZE} {SIZE}">'
+        f'<rect x="1" y="1" width="{SIZE - 2}" height="{SIZE - 2}" '
+        f'fill="#fffdf5" stroke="#7a3e00" stroke-width="2"/>'
+        f"{body}</svg>"
+    )
+
+
+def _north(houses: List[Tuple[int, List[str]]]) -> str:
+    parts = [f'<path d="{_NORTH_LINES}" fill="none" stroke="#7a3e00" stroke-width="1.5"/>']
+    for (sign, labels), (centre, number) in zip(houses, _NORTH_HOUSES):
+        parts.append(_text(number, str(sign), 12, "#7a3e00"))
+        parts.extend(_planets(centre, labels))
+    return "".join(parts)
+
+
+def _south(houses: List[Tuple[int, List[str]]], lang: str) -> str:
+    lines = "".join(
+        f"M{_CELL * i},0 L{_CELL * i},{SIZE} M0,{_CELL * i} L{SIZE},{_CELL * i} "
+        for i in (1, 3)
+    )
+    lines += f"M{_CELL * 2},0 L{_CELL * 2},{_CELL} M{_CELL * 2},{_CELL * 3} L{_CELL * 2},{SIZE} "
+    lines += f"M0,{_CELL * 2} L{_CELL},{_CELL * 2} M{_CELL * 3},{_CELL * 2} L{SIZE},{_CELL * 2}"
+    parts = [f'<path d="{lines}" fill="none" stroke="#7a3e00" stroke-width="1.5"/>']
+
+    for number, (sign, labels) in enumerate(houses, start=1):
+        row, column = _SOUTH_CELLS[sign - 1]
+        x, y = column * _CELL, row * _CELL
+        if number == 1:
+            parts.append(
+                f'<path d="M{x},{y + 24} L{x + 24},{y}" stroke="#7a3e00" stroke-width="1.5"/>'
+            )
+            parts.append(_text((x + 50, y + 14), _LAGNA[lang], 11, "#7a3e00"))
+        parts.extend(_planets((x + 50, y + 55), labels))
+    return "".join(parts)
+
+
+def _planets(centre: Tuple[int, int], labels: List[str]) -> List[str]:
+    """Planet labels, two per line, centred on a point."""
+    lines = [" ".join(labels[i:i + 2]) for i in range(0, len(labels), 2)]
+    top = centre[1] - (len(lines) - 1) * _LINE_HEIGHT / 2
+    return [
+        _text((centre[0], top + i * _LINE_HEIGHT), line, 14, "#222")
+        for i, line in enumerate(lines)
+    ]
+
+
+def _text(at: Tuple[float, float], text: str, size: int, color: str) -> str:
+    return (
+        f'<text x="{at[0]:g}" y="{at[1]:g}" font-size="{size}" fill="{color}" {_FONT}>'
+        f"{text}</text>"
+    )
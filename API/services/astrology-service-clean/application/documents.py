@@ -0,0 +1,154 @@
+"""
+Response Documents.
+
+Builds kundli and panchang responses as plain dicts holding exactly
+the fields of KundliResponse and PanchangResponse, in field order.
+Routers encode them straight to JSON instead of constructing nested
+DTOs and having FastAPI validate them again through response_model;
+use cases that need the DTO validate the dict once.
+
+Names of planets, signs, houses and doshas never change, so their
+sub-documents are built once at import and merged into each response.
+"""
+
+from datetime import time
+from typing import Any, Dict, Optional
+
+from domain.entities import Kundli, Panchang, Planet, ZodiacSign
+from domain.entities.kundli import DoshaType, House
+from domain.entities.panchang import Muhurta
+
+Document = Dict[str, Any]
+
+_PLANETS = {
+    planet: {"planet": planet.english, "planet_hindi": planet.hindi}
+    for planet in Planet
+}
+_SIGNS = {sign: {"sign": sign.english, "sign_hindi": sign.hindi} for sign in ZodiacSign}
+_SIGNIFICANCE = {
+    number: House(number, ZodiacSign.ARIES, 0.0).significance for number in range(1, 13)
+}
+_DOSHA_NAMES = {dosha: dosha.value for dosha in DoshaType}
+
+
+def _hhmm(value: time) -> str:
+    """Format a time (or datetime) as HH:MM without strftime."""
+    return f"{value.hour:02d}:{value.minute:02d}"
+
+
+def kundli_document(kundli: Kundli, kundli_id: Optional[str] = None) -> Document:
+    """KundliResponse fields of a kundli."""
+    birth = kundli.birth_details
+    moment = birth.date_time
+    return {
+        "success": True,
+        "kundli_id": kundli_id,
+        "name": birth.name,
+        "birth_date": f"{moment.year:04d}-{moment.month:02d}-{moment.day:02d}",
+        "birth_time": _hhmm(moment),
+        "birth_place": birth.place,
+        "lagna": kundli.lagna.english,
+        "lagna_hindi": kundli.lagna.hindi,
+        "moon_sign": kundli.moon_sign.english,
+        "moon_sign_hindi": kundli.moon_sign.hindi,
+        "sun_sign": kundli.sun_sign.english,
+        "nakshatra": kundli.moon_nakshatra,
+        "nakshatra_pada": kundli.moon_nakshatra_pada,
+        "planets": [
+            {
+                **_PLANETS[p.planet],
+                **_SIGNS[p.sign],
+                "house": p.house,
+                "degree": p.degree,
+                "nakshatra": p.nakshatra,
+                "nakshatra_pada": p.nakshatra_pada,
+                "is_retrograde": p.is_retrograde,
+                "strength": p.strength,
+            }
+            for p in kundli.planets
+        ],
+        "houses": [
+            {
+                "number": h.number,
+                **_SIGNS[h.sign],
+                "planets": [planet.english for planet in h.planets],
+                "significance": _SIGNIFICANCE.get(h.number, ""),
+            }
+            for h in kundli.houses
+        ],
+        "doshas": [
+            {
+                "name": _DOSHA_NAMES[d.dosha_type],
+                "is_present": d.is_present,
+                "severity": d.severity,
+                "description": d.description,
+                "remedies": list(d.remedies),
+            }
+            for d in kundli.doshas
+        ],
+        "has_manglik": kundli.has_manglik_dosha,
+        "has_kaal_sarp": kundli.has_kaal_sarp_dosha,
+        "current_mahadasha": kundli.current_mahadasha,
+        "current_antardasha": kundli.current_antardasha,
+        "mahadasha_end_date": (
+            kundli.mahadasha_end_date.date().isoformat()
+            if kundli.mahadasha_end_date else None
+        ),
+    }
+
+
+def _muhurta(muhurta: Optional[Muhurta], inauspicious: bool = False) -> Optional[Document]:
+    """MuhurtaDTO fields of a muhurta."""
+    if muhurta is None:
+        return None
+    return {
+        "name": muhurta.name,
+        "start_time": _hhmm(muhurta.start_time),
+        "end_time": _hhmm(muhurta.end_time),
+        "is_auspicious": False if inauspicious else muhurta.is_auspicious,
+        "suitable_for": [] if inauspicious else list(muhurta.suitable_for),
+    }
+
+
+def panchang_document(panchang: Panchang) -> Document:
+    """PanchangResponse fields of a panchang."""
+    tithi = panchang.tithi
+    return {
+        "success": True,
+        "date": panchang.date.isoformat(),
+        "day": panchang.vara,
+        "day_hindi": panchang.vara_hindi,
+        "city": panchang.city,
+        "hindu_month": panchang.hindu_month,
+        "hindu_month_hindi": panchang.hindu_month_hindi,
+        "hindu_year": panchang.hindu_year,
+        "tithi": {
+            "number": tithi.number,
+            "name": tithi.name,
+            "name_hindi": tithi.hindi_name,
+            "paksha": tithi.paksha.value,
+            "end_time": _hhmm(tithi.end_time),
+            "is_auspicious": tithi.is_auspicious,
+        },
+        "nakshatra": panchang.nakshatra_name,
+        "nakshatra_hindi": panchang.nakshatra_hindi,
+        "nakshatra_end_time": _hhmm(panchang.nakshatra_end_time),
+        "yoga": panchang.yoga.name,
+        "yoga_hindi": panchang.yoga.hindi_name,
+        "yoga_end_time": _hhmm(panchang.yoga.end_time),
+        "karana": panchang.karana.name,
+        "karana_hindi": panchang.karana.hindi_name,
+        "sunrise": _hhmm(panchang.sunrise),
+        "sunset": _hhmm(panchang.sunset),
+        "moonrise": _hhmm(panchang.moonrise) if panchang.moonrise else None,
+        "moonset": _hhmm(panchang.moonset) if panchang.moonset else None,
+        "abhijit_muhurta": _muhurta(panchang.abhijit_muhurta),
+        "rahukaal": _muhurta(panchang.rahukaal, inauspicious=True),
+        "yamaganda": _muhurta(panchang.yamaganda, inauspicious=True),
+        "is_auspicious_day": panchang.is_auspicious_day,
+        "is_ekadashi": panchang.is_ekadashi,
+        "is_pradosh": panchang.is_pradosh,
+        "is_amavasya": panchang.is_amavasya,
+        "is_purnima": panchang.is_purnima,
+        "festivals": list(panchang.festivals),
+    }
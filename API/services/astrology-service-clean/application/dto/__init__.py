@@ -18,12 +18,28 @@ from .kundli_dto import (
     MatchingRequest,
     MatchingResponse,
     GunaMatchDTO,
+    DashaRequest,
+    DashaPeriodDTO,
+    DashaResponse,
+    MatchCandidateDTO,
+    BulkMatchRequest,
+    BulkMatchItemDTO,
+    BulkMatchResponse,
 )
 from .panchang_dto import (
     PanchangRequest,
     PanchangResponse,
     TithiDTO,
     MuhurtaDTO,
+    PanchangRangeRequest,
+    PanchangColumnsDTO,
+    PanchangRangeResponse,
+    MuhuratRequest,
+    MuhuratWindowDTO,
+    MuhuratSearchResponse,
+    FestivalDTO,
+    FestivalsResponse,
+    NextFestivalResponse,
 )
 
 __all__ = [
@@ -38,8 +54,24 @@ __all__ = [
     "MatchingRequest",
     "MatchingResponse",
     "GunaMatchDTO",
+    "DashaRequest",
+    "DashaPeriodDTO",
+    "DashaResponse",
+    "MatchCandidateDTO",
+    "BulkMatchRequest",
+    "BulkMatchItemDTO",
+    "BulkMatchResponse",
     "PanchangRequest",
     "PanchangResponse",
     "TithiDTO",
     "MuhurtaDTO",
+    "PanchangRangeRequest",
+    "PanchangColumnsDTO",
+    "PanchangRangeResponse",
+    "MuhuratRequest",
+    "MuhuratWindowDTO",
+    "MuhuratSearchResponse",
+    "FestivalDTO",
+    "FestivalsResponse",
+    "NextFestivalResponse",
 ]
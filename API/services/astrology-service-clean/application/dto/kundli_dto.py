@@ -5,7 +5,7 @@ API request/response models for birth chart endpoints.
 """
 
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 
@@ -55,6 +55,7 @@ class DoshaDTO(BaseModel):
 class KundliResponse(BaseModel):
     """Kundli generation response."""
     success: bool = True
+    kundli_id: Optional[str] = None  # For /kundli/{kundli_id}/chart.svg
 
     # Birth details
     name: str
@@ -123,3 +124,80 @@ class MatchingResponse(BaseModel):
 
     # Recommendations
     recommendations: List[str] = []
+
+
+class DashaRequest(KundliRequest):
+    """Vimshottari dasha timeline request (one page of one level)."""
+    depth: int = Field(default=1, ge=1, le=3, description="1=Mahadasha, 2=Antardasha, 3=Pratyantardasha")
+    offset: int = Field(default=0, ge=0)
+    limit: int = Field(default=20, ge=1, le=100)
+    at: Optional[str] = Field(default=None, description="Date for current period (YYYY-MM-DD), default today")
+
+
+class DashaPeriodDTO(BaseModel):
+    """One dasha period."""
+    planet: str
+    planet_hindi: str
+    level: int
+    level_name: str
+    lords: List[str] = []  # Mahadasha lord down to this period's lord
+    start_date: str
+    end_date: str
+
+
+class DashaResponse(BaseModel):
+    """Vimshottari dasha timeline response."""
+    success: bool = True
+    name: str
+    moon_nakshatra: str
+    balance_years: float  # Of the first mahadasha, at birth
+
+    # Running periods at the requested date, mahadasha first
+    current: List[DashaPeriodDTO] = []
+
+    # Requested page of the timeline
+    depth: int
+    offset: int
+    limit: int
+    total: int
+    periods: List[DashaPeriodDTO] = []
+
+
+class MatchCandidateDTO(BaseModel):
+    """Bulk matching candidate: birth details or a known Moon position."""
+    id: str = Field(..., min_length=1, description="Caller's candidate identifier")
+    birth: Optional[KundliRequest] = None
+    moon_nakshatra: Optional[str] = Field(default=None, description="e.g. Rohini")
+    moon_sign: Optional[str] = Field(default=None, description="e.g. Taurus or वृषभ")
+
+
+class BulkMatchRequest(BaseModel):
+    """One profile matched against many candidates."""
+    profile: KundliRequest
+    profile_is_groom: bool = Field(default=True, description="Koota direction")
+    candidates: List[MatchCandidateDTO]
+    min_points: float = Field(default=0, ge=0, le=36)
+    limit: Optional[int] = Field(default=None, ge=1, description="Return only the top N")
+
+
+class BulkMatchItemDTO(BaseModel):
+    """One ranked candidate."""
+    id: str
+    rank: Optional[int] = None
+    success: bool = True
+    total_points: Optional[float] = None
+    match_percentage: Optional[float] = None
+    guna_points: Dict[str, float] = {}
+    nadi_dosha: Optional[bool] = None
+    error: Optional[str] = None
+
+
+class BulkMatchResponse(BaseModel):
+    """Bulk matching response, best match first."""
+    success: bool = True
+    profile_nakshatra: str
+    profile_moon_sign: str
+    total: int
+    ranked: int
+    results: List[BulkMatchItemDTO] = []
+    errors: List[BulkMatchItemDTO] = []
@@ -105,3 +105,123 @@ class PanchangResponse(BaseModel):
                 "sunset": "18:05"
             }
         }
+
+
+class PanchangRangeRequest(BaseModel):
+    """Panchang range request (inclusive dates)."""
+    from_date: str = Field(..., description="First date (YYYY-MM-DD)")
+    to_date: str = Field(..., description="Last date (YYYY-MM-DD)")
+    city: str = Field(default="Delhi")
+    latitude: float = Field(default=28.6139)
+    longitude: float = Field(default=77.2090)
+
+
+class PanchangColumnsDTO(BaseModel):
+    """
+    Panchang days as parallel columns, one entry per date.
+
+    Entries other than date and day are null where the Sun doesn't
+    rise or set (polar latitudes).
+    """
+    date: List[str]
+    day: List[str]
+    tithi: List[Optional[str]]
+    tithi_hindi: List[Optional[str]]
+    tithi_number: List[Optional[int]]
+    paksha: List[Optional[str]]
+    tithi_end_time: List[Optional[str]]
+    nakshatra: List[Optional[str]]
+    nakshatra_hindi: List[Optional[str]]
+    nakshatra_end_time: List[Optional[str]]
+    yoga: List[Optional[str]]
+    yoga_end_time: List[Optional[str]]
+    karana: List[Optional[str]]
+    karana_end_time: List[Optional[str]]
+    sunrise: List[Optional[str]]
+    sunset: List[Optional[str]]
+    moonrise: List[Optional[str]]
+    moonset: List[Optional[str]]
+    rahukaal_start: List[Optional[str]]
+    rahukaal_end: List[Optional[str]]
+    yamaganda_start: List[Optional[str]]
+    yamaganda_end: List[Optional[str]]
+    abhijit_start: List[Optional[str]]
+    abhijit_end: List[Optional[str]]
+    hindu_month: List[Optional[str]]
+    hindu_month_hindi: List[Optional[str]]
+    hindu_year: List[Optional[int]]
+    is_auspicious_day: List[Optional[bool]]
+    festivals: List[List[str]]
+
+
+class PanchangRangeResponse(BaseModel):
+    """Panchang for a date range in columnar form."""
+    success: bool = True
+    city: str
+    from_date: str
+    to_date: str
+    days: int
+    columns: PanchangColumnsDTO
+
+
+class MuhuratRequest(BaseModel):
+    """Muhurat search request."""
+    purpose: str = Field(..., description="marriage, griha_pravesh or vehicle_purchase")
+    from_date: str = Field(..., description="First date (YYYY-MM-DD)")
+    to_date: str = Field(..., description="Last date (YYYY-MM-DD)")
+    city: str = Field(default="Delhi")
+    latitude: float = Field(default=28.6139)
+    longitude: float = Field(default=77.2090)
+    limit: int = Field(default=20, description="Maximum windows to return")
+
+
+class MuhuratWindowDTO(BaseModel):
+    """One muhurat window, in local time."""
+    date: str
+    start_time: str
+    end_time: str  # May be past midnight, on the following date
+    minutes: int
+    score: float
+    tithi: str
+    paksha: str
+    nakshatra: str
+    vara: str
+    lagna: Optional[str] = None
+
+
+class MuhuratSearchResponse(BaseModel):
+    """Ranked muhurat windows for a purpose."""
+    success: bool = True
+    purpose: str
+    purpose_name: str
+    purpose_hindi: str
+    city: str
+    from_date: str
+    to_date: str
+    total: int  # Windows found, before the limit
+    windows: List[MuhuratWindowDTO]
+
+
+class FestivalDTO(BaseModel):
+    """Festival on a date."""
+    date: str
+    name: str
+    name_hindi: str = ""
+    category: str = "festival"  # festival / vrat
+
+
+class FestivalsResponse(BaseModel):
+    """Festivals of a month, or of a year when no month is given."""
+    success: bool = True
+    year: int
+    month: Optional[int] = None
+    count: int
+    festivals: List[FestivalDTO]
+
+
+class NextFestivalResponse(BaseModel):
+    """Next occurrence of a festival."""
+    success: bool = True
+    after: str
+    days_until: int
+    festival: FestivalDTO
@@ -0,0 +1,56 @@
+"""
+Kundli Identifiers.
+
+A kundli is fully determined by the birth moment, coordinates and
+timezone, so its id encodes exactly those (base64url, no padding) and
+needs no storage: any worker can decode an id and regenerate the
+chart, and equal births always share one id.
+"""
+
+import base64
+import binascii
+from datetime import datetime
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from domain.entities import BirthDetails
+
+_TIME_FORMAT = "%Y%m%dT%H%M"
+
+
+def encode_kundli_id(birth: BirthDetails) -> str:
+    """Id of the chart for a birth (name and place are not part of it)."""
+    payload = "|".join((
+        birth.date_time.strftime(_TIME_FORMAT),
+        f"{birth.latitude:.4f}",
+        f"{birth.longitude:.4f}",
+        birth.timezone,
+    ))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_kundli_id(kundli_id: str) -> BirthDetails:
+    """
+    Birth details of a kundli id.
+
+    Raises:
+        ValueError: If the id is malformed
+    """
+    try:
+        padded = kundli_id + "=" * (-len(kundli_id) % 4)
+        payload = base64.urlsafe_b64decode(padded.encode("ascii")).decode()
+        moment, latitude, longitude, timezone = payload.split("|")
+        birth = BirthDetails(
+            name="",
+            date_time=datetime.strptime(moment, _TIME_FORMAT),
+            place="",
+            latitude=float(latitude),
+            longitude=float(longitude),
+            timezone=timezone
+        )
+        ZoneInfo(timezone)
+    except (UnicodeError, binascii.Error, ValueError, ZoneInfoNotFoundError):
+        raise ValueError(f"Invalid kundli id: {kundli_id}")
+
+    if not -90 <= birth.latitude <= 90 or not -180 <= birth.longitude <= 180:
+        raise ValueError(f"Invalid kundli id: {kundli_id}")
+    return birth
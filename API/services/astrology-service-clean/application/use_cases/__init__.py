@@ -8,10 +8,22 @@ from .get_horoscope import GetHoroscopeUseCase
 from .generate_kundli import GenerateKundliUseCase
 from .match_kundli import MatchKundliUseCase
 from .get_panchang import GetPanchangUseCase
+from .get_panchang_range import GetPanchangRangeUseCase
+from .get_dasha import GetDashaUseCase
+from .match_kundli_bulk import BulkMatchKundliUseCase
+from .find_muhurat import FindMuhuratUseCase
+from .get_festivals import GetFestivalsUseCase
+from .render_chart import RenderChartUseCase
 
 __all__ = [
     "GetHoroscopeUseCase",
     "GenerateKundliUseCase",
     "MatchKundliUseCase",
     "GetPanchangUseCase",
+    "GetPanchangRangeUseCase",
+    "GetDashaUseCase",
+    "BulkMatchKundliUseCase",
+    "FindMuhuratUseCase",
+    "GetFestivalsUseCase",
+    "RenderChartUseCase",
 ]
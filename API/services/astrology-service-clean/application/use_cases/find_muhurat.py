@@ -0,0 +1,116 @@
+"""
+Find Muhurat Use Case.
+
+Single responsibility: Find ranked auspicious time windows for a purpose.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Tuple
+
+from domain.entities import MuhuratWindow
+from domain.entities.muhurat import MUHURAT_RULES
+from domain.repositories import PanchangRepository
+from application.dto import MuhuratRequest, MuhuratSearchResponse, MuhuratWindowDTO
+from .get_panchang import PanchangValidationError
+
+
+@dataclass
+class FindMuhuratUseCase:
+    """
+    Use case for muhurat search.
+
+    Windows come ranked by score; the response carries the best
+    `limit` of them along with how many were found.
+    """
+    panchang_repository: PanchangRepository
+    max_days: int = 366
+    max_limit: int = 500
+
+    async def execute(self, request: MuhuratRequest) -> MuhuratSearchResponse:
+        """
+        Execute the use case.
+
+        Args:
+            request: MuhuratRequest with purpose, dates and location
+
+        Returns:
+            MuhuratSearchResponse DTO
+
+        Raises:
+            PanchangValidationError: If input is invalid
+        """
+        # 1. Validate input
+        start, end = self._validate(request)
+        rule = MUHURAT_RULES[request.purpose]
+
+        # 2. Search
+        windows = await self.panchang_repository.find_muhurats(
+            rule,
+            start_date=start,
+            end_date=end,
+            latitude=request.latitude,
+            longitude=request.longitude
+        )
+
+        # 3. Transform to DTO
+        return MuhuratSearchResponse(
+            success=True,
+            purpose=rule.purpose,
+            purpose_name=rule.name,
+            purpose_hindi=rule.hindi_name,
+            city=request.city,
+            from_date=start.isoformat(),
+            to_date=end.isoformat(),
+            total=len(windows),
+            windows=[self._to_dto(window) for window in windows[:request.limit]]
+        )
+
+    def _validate(self, request: MuhuratRequest) -> Tuple[date, date]:
+        """Check the purpose, limit, range and coordinates."""
+        if request.purpose not in MUHURAT_RULES:
+            raise PanchangValidationError(
+                f"Unknown purpose: {request.purpose}. "
+                f"Use one of: {', '.join(MUHURAT_RULES)}"
+            )
+        if not 1 <= request.limit <= self.max_limit:
+            raise PanchangValidationError(f"limit must be 1-{self.max_limit}")
+
+        start = self._parse_date(request.from_date)
+        end = self._parse_date(request.to_date)
+        if end < start:
+            raise PanchangValidationError("to must not be before from")
+        if (end - start).days + 1 > self.max_days:
+            raise PanchangValidationError(
+                f"At most {self.max_days} days allowed per request"
+            )
+        if not -90 <= request.latitude <= 90:
+            raise PanchangValidationError("Invalid latitude")
+        if not -180 <= request.longitude <= 180:
+            raise PanchangValidationError("Invalid longitude")
+
+        return start, end
+
+    def _parse_date(self, date_str: str) -> date:
+        """Parse a YYYY-MM-DD date string."""
+        try:
+            return datetime.strptime(date_str, "%Y-%m-%d").date()
+        except ValueError:
+            raise PanchangValidationError(
+                f"Invalid date format: {date_str}. Use YYYY-MM-DD"
+            )
+
+    def _to_dto(self, window: MuhuratWindow) -> MuhuratWindowDTO:
+        """Transform a window entity to its DTO."""
+        return MuhuratWindowDTO(
+            date=window.start.date().isoformat(),
+            start_time=window.start.strftime("%H:%M"),
+            end_time=window.end.strftime("%H:%M"),
+            minutes=window.minutes,
+            score=window.score,
+            tithi=window.tithi,
+            paksha=window.paksha.value,
+            nakshatra=window.nakshatra,
+            vara=window.vara,
+            lagna=window.lagna.english if window.lagna else None
+        )
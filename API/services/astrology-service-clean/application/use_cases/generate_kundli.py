@@ -8,12 +8,11 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
-from domain.entities import BirthDetails, Kundli
+from domain.entities import BirthDetails
 from domain.repositories import KundliRepository
-from application.dto import (
-    KundliRequest, KundliResponse,
-    PlanetPositionDTO, HouseDTO, DoshaDTO
-)
+from application.documents import Document, kundli_document
+from application.kundli_id import encode_kundli_id
+from application.dto import KundliRequest, KundliResponse
 
 
 class KundliValidationError(Exception):
@@ -26,12 +25,44 @@ class KundliGenerationError(Exception):
     pass
 
 
+def create_birth_details(request: KundliRequest) -> BirthDetails:
+    """Create and validate birth details."""
+    if not request.name.strip():
+        raise KundliValidationError("Name is required")
+
+    try:
+        birth_datetime = datetime.strptime(
+            f"{request.date} {request.time}",
+            "%Y-%m-%d %H:%M"
+        )
+    except ValueError:
+        raise KundliValidationError(
+            "Invalid date/time format. Use YYYY-MM-DD and HH:MM"
+        )
+
+    if not -90 <= request.latitude <= 90:
+        raise KundliValidationError("Invalid latitude")
+
+    if not -180 <= request.longitude <= 180:
+        raise KundliValidationError("Invalid longitude")
+
+    return BirthDetails(
+        name=request.name.strip(),
+        date_time=birth_datetime,
+        place=request.place,
+        latitude=request.latitude,
+        longitude=request.longitude,
+        timezone=request.timezone
+    )
+
+
 @dataclass
 class GenerateKundliUseCase:
     """
     Use case for generating birth chart.
 
-    Validates input, generates kundli, transforms to DTO.
+    Validates input, generates kundli, transforms to a response
+    document (or its DTO).
     """
     kundli_repository: KundliRepository
 
@@ -45,6 +76,17 @@ class GenerateKundliUseCase:
         Returns:
             KundliResponse DTO
 
+        Raises:
+            KundliValidationError: If input is invalid
+            KundliGenerationError: If generation fails
+        """
+        return KundliResponse.model_validate(await self.execute_document(request))
+
+    async def execute_document(self, request: KundliRequest) -> Document:
+        """
+        Execute the use case, returning the KundliResponse fields as a
+        plain dict ready for JSON encoding.
+
         Raises:
             KundliValidationError: If input is invalid
             KundliGenerationError: If generation fails
@@ -64,101 +106,9 @@ class GenerateKundliUseCase:
         doshas = await self.kundli_repository.get_doshas(kundli)
         kundli.doshas = doshas
 
-        # 4. Transform to DTO
-        return self._to_response(kundli)
+        # 4. Transform to response document
+        return kundli_document(kundli, encode_kundli_id(kundli.birth_details))
 
     def _create_birth_details(self, request: KundliRequest) -> BirthDetails:
         """Create and validate birth details."""
-        if not request.name.strip():
-            raise KundliValidationError("Name is required")
-
-        try:
-            birth_datetime = datetime.strptime(
-                f"{request.date} {request.time}",
-                "%Y-%m-%d %H:%M"
-            )
-        except ValueError:
-            raise KundliValidationError(
-                "Invalid date/time format. Use YYYY-MM-DD and HH:MM"
-            )
-
-        if not -90 <= request.latitude <= 90:
-            raise KundliValidationError("Invalid latitude")
-
-        if not -180 <= request.longitude <= 180:
-            raise KundliValidationError("Invalid longitude")
-
-        return BirthDetails(
-            name=request.name.strip(),
-            date_time=birth_datetime,
-            place=request.place,
-            latitude=request.latitude,
-            longitude=request.longitude,
-            timezone=request.timezone
-        )
-
-    def _to_response(self, kundli: Kundli) -> KundliResponse:
-        """Transform domain entity to DTO."""
-        planets = [
-            PlanetPositionDTO(
-                planet=p.planet.english,
-                planet_hindi=p.planet.hindi,
-                sign=p.sign.english,
-                sign_hindi=p.sign.hindi,
-                house=p.house,
-                degree=p.degree,
-                nakshatra=p.nakshatra,
-                nakshatra_pada=p.nakshatra_pada,
-                is_retrograde=p.is_retrograde,
-                strength=p.strength
-            )
-            for p in kundli.planets
-        ]
-
-        houses = [
-            HouseDTO(
-                number=h.number,
-                sign=h.sign.english,
-                sign_hindi=h.sign.hindi,
-                planets=[p.english for p in h.planets],
-                significance=h.significance
-            )
-            for h in kundli.houses
-        ]
-
-        doshas = [
-            DoshaDTO(
-                name=d.dosha_type.value,
-                is_present=d.is_present,
-                severity=d.severity,
-                description=d.description,
-                remedies=d.remedies
-            )
-            for d in kundli.doshas
-        ]
-
-        return KundliResponse(
-            success=True,
-            name=kundli.birth_details.name,
-            birth_date=kundli.birth_details.date_time.strftime("%Y-%m-%d"),
-            birth_time=kundli.birth_details.date_time.strftime("%H:%M"),
-            birth_place=kundli.birth_details.place,
-            lagna=kundli.lagna.english,
-            lagna_hindi=kundli.lagna.hindi,
-            moon_sign=kundli.moon_sign.english,
-            moon_sign_hindi=kundli.moon_sign.hindi,
-            sun_sign=kundli.sun_sign.english,
-            nakshatra=kundli.moon_nakshatra,
-            nakshatra_pada=kundli.moon_nakshatra_pada,
-            planets=planets,
-            houses=houses,
-            doshas=doshas,
-            has_manglik=kundli.has_manglik_dosha,
-            has_kaal_sarp=kundli.has_kaal_sarp_dosha,
-            current_mahadasha=kundli.current_mahadasha,
-            current_antardasha=kundli.current_antardasha,
-            mahadasha_end_date=(
-                kundli.mahadasha_end_date.strftime("%Y-%m-%d")
-                if kundli.mahadasha_end_date else None
-            )
-        )
+        return create_birth_details(request)
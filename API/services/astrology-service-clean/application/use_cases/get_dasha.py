@@ -0,0 +1,99 @@
+"""
+Get Dasha Use Case.
+
+Single responsibility: Get the Vimshottari dasha timeline for a birth chart.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+from domain.entities import DashaPeriod
+from domain.entities.dasha import YEAR_DAYS
+from domain.entities.zodiac import NAKSHATRAS
+from domain.repositories import KundliRepository
+from application.dto import DashaRequest, DashaResponse, DashaPeriodDTO
+from .generate_kundli import (
+    KundliValidationError,
+    KundliGenerationError,
+    create_birth_details
+)
+
+
+@dataclass
+class GetDashaUseCase:
+    """
+    Use case for the dasha timeline.
+
+    Returns the running periods for a date and one page of one level
+    of the timeline; deeper levels are never expanded beyond the page.
+    """
+    kundli_repository: KundliRepository
+
+    async def execute(self, request: DashaRequest) -> DashaResponse:
+        """
+        Execute the use case.
+
+        Args:
+            request: DashaRequest with birth details and page
+
+        Returns:
+            DashaResponse DTO
+
+        Raises:
+            KundliValidationError: If input is invalid
+            KundliGenerationError: If the chart can't be computed
+        """
+        # 1. Validate input
+        birth_details = create_birth_details(request)
+        at = self._parse_date(request.at)
+
+        # 2. Compute chart and timeline
+        kundli = await self.kundli_repository.generate_kundli(birth_details)
+        timeline = kundli.dasha_timeline() if kundli else None
+
+        if timeline is None:
+            raise KundliGenerationError(
+                f"Failed to compute dasha for {request.name}"
+            )
+
+        # 3. Transform to DTO
+        return DashaResponse(
+            success=True,
+            name=birth_details.name,
+            moon_nakshatra=NAKSHATRAS[timeline.nakshatra_index][0],
+            balance_years=round(timeline.balance_at_birth / timedelta(days=YEAR_DAYS), 2),
+            current=[self._to_dto(p) for p in timeline.current(at)],
+            depth=request.depth,
+            offset=request.offset,
+            limit=request.limit,
+            total=timeline.count(request.depth),
+            periods=[
+                self._to_dto(p)
+                for p in timeline.periods(request.depth, request.offset, request.limit)
+            ]
+        )
+
+    def _parse_date(self, date_str: Optional[str]) -> datetime:
+        """Parse date string or return now."""
+        if not date_str:
+            return datetime.now()
+
+        try:
+            return datetime.strptime(date_str, "%Y-%m-%d")
+        except ValueError:
+            raise KundliValidationError(
+                f"Invalid date format: {date_str}. Use YYYY-MM-DD"
+            )
+
+    def _to_dto(self, period: DashaPeriod) -> DashaPeriodDTO:
+        """Transform dasha period to DTO."""
+        return DashaPeriodDTO(
+            planet=period.lord.english,
+            planet_hindi=period.lord.hindi,
+            level=period.level,
+            level_name=period.level_name,
+            lords=[lord.english for lord in period.lords],
+            start_date=period.start.strftime("%Y-%m-%d"),
+            end_date=period.end.strftime("%Y-%m-%d")
+        )
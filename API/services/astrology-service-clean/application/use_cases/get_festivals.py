@@ -0,0 +1,91 @@
+"""
+Get Festivals Use Case.
+
+Single responsibility: List festivals and find their next occurrence.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Optional
+
+from domain.entities.festival import FESTIVAL_NAMES, festival_key
+from domain.repositories import PanchangRepository
+from application.dto import FestivalDTO, FestivalsResponse, NextFestivalResponse
+from .get_panchang import PanchangValidationError, PanchangNotFoundError
+
+
+@dataclass
+class GetFestivalsUseCase:
+    """
+    Use case for festival listings and next-occurrence queries.
+
+    Festivals depend only on the year, so repositories can answer
+    both from a precomputed calendar.
+    """
+    panchang_repository: PanchangRepository
+    min_year: int = 1900
+    max_year: int = 2100
+
+    async def execute(self, year: int, month: Optional[int] = None) -> FestivalsResponse:
+        """
+        List festivals of a month, or of the whole year.
+
+        Raises:
+            PanchangValidationError: If year or month is out of range
+        """
+        self._validate_year(year)
+        if month is not None and not 1 <= month <= 12:
+            raise PanchangValidationError("Month must be 1-12")
+
+        festivals = []
+        for number in [month] if month else range(1, 13):
+            festivals.extend(await self.panchang_repository.get_festivals(number, year))
+
+        return FestivalsResponse(
+            success=True,
+            year=year,
+            month=month,
+            count=len(festivals),
+            festivals=[FestivalDTO(**festival) for festival in festivals]
+        )
+
+    async def next_occurrence(self, name: str, after: Optional[str] = None) -> NextFestivalResponse:
+        """
+        Find the first occurrence of a festival after a date (default today).
+
+        Raises:
+            PanchangValidationError: If the date is invalid
+            PanchangNotFoundError: If the festival is unknown or not found
+        """
+        if festival_key(name) not in FESTIVAL_NAMES:
+            raise PanchangNotFoundError(f"Unknown festival: {name}")
+
+        start = self._parse_date(after) if after else date.today()
+        self._validate_year(start.year)
+
+        festival = await self.panchang_repository.get_next_festival(name, start)
+        if festival is None:
+            raise PanchangNotFoundError(f"No {name} found after {start}")
+
+        dto = FestivalDTO(**festival)
+        return NextFestivalResponse(
+            success=True,
+            after=start.isoformat(),
+            days_until=(date.fromisoformat(dto.date) - start).days,
+            festival=dto
+        )
+
+    def _validate_year(self, year: int) -> None:
+        if not self.min_year <= year <= self.max_year:
+            raise PanchangValidationError(
+                f"Year must be {self.min_year}-{self.max_year}"
+            )
+
+    def _parse_date(self, date_str: str) -> date:
+        """Parse a YYYY-MM-DD date string."""
+        try:
+            return datetime.strptime(date_str, "%Y-%m-%d").date()
+        except ValueError:
+            raise PanchangValidationError(
+                f"Invalid date format: {date_str}. Use YYYY-MM-DD"
+            )
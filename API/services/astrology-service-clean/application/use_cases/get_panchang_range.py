@@ -0,0 +1,170 @@
+"""
+Get Panchang Range Use Case.
+
+Single responsibility: Get Hindu calendar for every day of a date range.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from domain.entities import Panchang, Muhurta
+from domain.entities.panchang import VARAS
+from domain.repositories import PanchangRepository
+from application.dto import PanchangRangeRequest, PanchangRangeResponse, PanchangColumnsDTO
+from .get_panchang import PanchangValidationError, PanchangNotFoundError
+
+
+@dataclass
+class GetPanchangRangeUseCase:
+    """
+    Use case for month and year calendar views.
+
+    The repository computes the whole range at once; the response
+    is columnar so a year stays compact. Panchang is a pure function
+    of the request, so its ETag can be derived without computing it.
+    """
+    panchang_repository: PanchangRepository
+    max_days: int = 366
+    version: str = ""  # Part of the ETag; change it when results change
+
+    async def execute(self, request: PanchangRangeRequest) -> PanchangRangeResponse:
+        """
+        Execute the use case.
+
+        Args:
+            request: PanchangRangeRequest with dates and location
+
+        Returns:
+            PanchangRangeResponse DTO
+
+        Raises:
+            PanchangValidationError: If input is invalid
+            PanchangNotFoundError: If panchang not available
+        """
+        # 1. Validate input
+        start, end = self._validate(request)
+
+        # 2. Fetch from repository
+        days = await self.panchang_repository.get_panchang_range(
+            start_date=start,
+            end_date=end,
+            city=request.city,
+            latitude=request.latitude,
+            longitude=request.longitude
+        )
+
+        if len(days) != (end - start).days + 1:
+            raise PanchangNotFoundError(
+                f"Panchang not available for {start} to {end}"
+            )
+
+        # 3. Transform to DTO
+        return PanchangRangeResponse(
+            success=True,
+            city=request.city,
+            from_date=start.isoformat(),
+            to_date=end.isoformat(),
+            days=len(days),
+            columns=self._to_columns(start, days)
+        )
+
+    def etag(self, request: PanchangRangeRequest) -> str:
+        """
+        Strong ETag for the response to a request.
+
+        Raises:
+            PanchangValidationError: If input is invalid
+        """
+        start, end = self._validate(request)
+        key = "|".join([
+            self.version, start.isoformat(), end.isoformat(), request.city,
+            f"{request.latitude:.4f}", f"{request.longitude:.4f}",
+        ])
+        return '"' + hashlib.blake2b(key.encode(), digest_size=16).hexdigest() + '"'
+
+    def _validate(self, request: PanchangRangeRequest) -> Tuple[date, date]:
+        """Parse dates and check the range and coordinates."""
+        start = self._parse_date(request.from_date)
+        end = self._parse_date(request.to_date)
+
+        if end < start:
+            raise PanchangValidationError("to must not be before from")
+        if (end - start).days + 1 > self.max_days:
+            raise PanchangValidationError(
+                f"At most {self.max_days} days allowed per request"
+            )
+        if not -90 <= request.latitude <= 90:
+            raise PanchangValidationError("Invalid latitude")
+        if not -180 <= request.longitude <= 180:
+            raise PanchangValidationError("Invalid longitude")
+
+        return start, end
+
+    def _parse_date(self, date_str: str) -> date:
+        """Parse a YYYY-MM-DD date string."""
+        try:
+            return datetime.strptime(date_str, "%Y-%m-%d").date()
+        except ValueError:
+            raise PanchangValidationError(
+                f"Invalid date format: {date_str}. Use YYYY-MM-DD"
+            )
+
+    def _to_columns(self, start: date, days: List[Optional[Panchang]]) -> PanchangColumnsDTO:
+        """Transform days to parallel columns."""
+        columns: Dict[str, list] = {name: [] for name in PanchangColumnsDTO.model_fields}
+
+        for offset, panchang in enumerate(days):
+            day = start + timedelta(days=offset)
+            columns["date"].append(day.isoformat())
+            columns["day"].append(VARAS[day.weekday()][0])
+            columns["festivals"].append(list(panchang.festivals) if panchang else [])
+
+            row = self._row(panchang) if panchang else {}
+            for name, values in columns.items():
+                if name not in ("date", "day", "festivals"):
+                    values.append(row.get(name))
+
+        return PanchangColumnsDTO(**columns)
+
+    def _row(self, panchang: Panchang) -> Dict[str, object]:
+        """Column values of one day."""
+        rahukaal = self._span(panchang.rahukaal)
+        yamaganda = self._span(panchang.yamaganda)
+        abhijit = self._span(panchang.abhijit_muhurta)
+
+        return {
+            "tithi": panchang.tithi.name,
+            "tithi_hindi": panchang.tithi.hindi_name,
+            "tithi_number": panchang.tithi.number,
+            "paksha": panchang.tithi.paksha.value,
+            "tithi_end_time": panchang.tithi.end_time.strftime("%H:%M"),
+            "nakshatra": panchang.nakshatra_name,
+            "nakshatra_hindi": panchang.nakshatra_hindi,
+            "nakshatra_end_time": panchang.nakshatra_end_time.strftime("%H:%M"),
+            "yoga": panchang.yoga.name,
+            "yoga_end_time": panchang.yoga.end_time.strftime("%H:%M"),
+            "karana": panchang.karana.name,
+            "karana_end_time": panchang.karana.end_time.strftime("%H:%M"),
+            "sunrise": panchang.sunrise.strftime("%H:%M"),
+            "sunset": panchang.sunset.strftime("%H:%M"),
+            "moonrise": panchang.moonrise.strftime("%H:%M") if panchang.moonrise else None,
+            "moonset": panchang.moonset.strftime("%H:%M") if panchang.moonset else None,
+            "rahukaal_start": rahukaal[0],
+            "rahukaal_end": rahukaal[1],
+            "yamaganda_start": yamaganda[0],
+            "yamaganda_end": yamaganda[1],
+            "abhijit_start": abhijit[0],
+            "abhijit_end": abhijit[1],
+            "hindu_month": panchang.hindu_month,
+            "hindu_month_hindi": panchang.hindu_month_hindi,
+            "hindu_year": panchang.hindu_year,
+            "is_auspicious_day": panchang.is_auspicious_day,
+        }
+
+    def _span(self, muhurta: Optional[Muhurta]) -> Tuple[Optional[str], Optional[str]]:
+        """Start and end of a muhurta as HH:MM."""
+        if muhurta is None:
+            return None, None
+        return muhurta.start_time.strftime("%H:%M"), muhurta.end_time.strftime("%H:%M")
@@ -4,11 +4,12 @@ Match Kundli Use Case.
 Single responsibility: Match two kundlis for marriage compatibility.
 """
 
+import asyncio
 from dataclasses import dataclass
 
 from domain.repositories import KundliRepository
 from application.dto import MatchingRequest, MatchingResponse, GunaMatchDTO
-from .generate_kundli import GenerateKundliUseCase, KundliValidationError
+from .generate_kundli import create_birth_details
 
 
 class MatchingError(Exception):
@@ -21,7 +22,8 @@ class MatchKundliUseCase:
     """
     Use case for kundli matching (Guna Milan).
 
-    Generates both kundlis and performs compatibility matching.
+    Computes both kundlis once, in one repository call, and performs
+    compatibility matching.
     """
     kundli_repository: KundliRepository
 
@@ -39,49 +41,23 @@ class MatchKundliUseCase:
             KundliValidationError: If input is invalid
             MatchingError: If matching fails
         """
-        # 1. Generate both kundlis
-        generate_use_case = GenerateKundliUseCase(
-            kundli_repository=self.kundli_repository
-        )
+        # 1. Validate both before computing anything
+        birth1 = create_birth_details(request.person1)
+        birth2 = create_birth_details(request.person2)
 
-        kundli1_response = await generate_use_case.execute(request.person1)
-        kundli2_response = await generate_use_case.execute(request.person2)
-
-        # 2. For matching, we need the domain entities
-        # Re-create them from birth details
-        from domain.entities import BirthDetails
-        from datetime import datetime
-
-        birth1 = BirthDetails(
-            name=request.person1.name,
-            date_time=datetime.strptime(
-                f"{request.person1.date} {request.person1.time}",
-                "%Y-%m-%d %H:%M"
-            ),
-            place=request.person1.place,
-            latitude=request.person1.latitude,
-            longitude=request.person1.longitude
-        )
-        birth2 = BirthDetails(
-            name=request.person2.name,
-            date_time=datetime.strptime(
-                f"{request.person2.date} {request.person2.time}",
-                "%Y-%m-%d %H:%M"
-            ),
-            place=request.person2.place,
-            latitude=request.person2.latitude,
-            longitude=request.person2.longitude
+        # 2. Generate both kundlis together
+        kundli1, kundli2 = await self.kundli_repository.generate_kundlis(
+            [birth1, birth2]
         )
 
-        kundli1 = await self.kundli_repository.generate_kundli(birth1)
-        kundli2 = await self.kundli_repository.generate_kundli(birth2)
-
         if not kundli1 or not kundli2:
             raise MatchingError("Failed to generate one or both kundlis")
 
-        # 3. Perform matching
-        match_result = await self.kundli_repository.match_kundlis(
-            kundli1, kundli2
+        # 3. Doshas (for Manglik status) and matching
+        kundli1.doshas, kundli2.doshas, match_result = await asyncio.gather(
+            self.kundli_repository.get_doshas(kundli1),
+            self.kundli_repository.get_doshas(kundli2),
+            self.kundli_repository.match_kundlis(kundli1, kundli2),
         )
 
         # 4. Transform to response
@@ -0,0 +1,181 @@
+"""
+Bulk Match Kundli Use Case.
+
+Single responsibility: Rank many candidates by Guna Milan against one profile.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from domain.entities import BirthDetails, Kundli, ZodiacSign
+from domain.repositories import KundliRepository
+from application import ashtakoot
+from application.dto import (
+    BulkMatchRequest, BulkMatchResponse, BulkMatchItemDTO, MatchCandidateDTO
+)
+from .generate_kundli import (
+    KundliValidationError,
+    KundliGenerationError,
+    create_birth_details
+)
+
+
+class BulkMatchValidationError(Exception):
+    """Raised when a bulk match request is invalid."""
+    pass
+
+
+@dataclass
+class BulkMatchKundliUseCase:
+    """
+    Use case for one-to-many kundli matching.
+
+    Candidate charts are computed in one repository batch; all
+    candidates are then scored at once from the koota lookup tables.
+    Invalid candidates are reported individually.
+    """
+    kundli_repository: KundliRepository
+    max_candidates: int = 5000
+
+    async def execute(self, request: BulkMatchRequest) -> BulkMatchResponse:
+        """
+        Execute the use case.
+
+        Args:
+            request: BulkMatchRequest with profile and candidates
+
+        Returns:
+            BulkMatchResponse DTO, best match first
+
+        Raises:
+            BulkMatchValidationError: If the batch is empty or too large
+            KundliValidationError: If the profile is invalid
+            KundliGenerationError: If the profile chart can't be computed
+        """
+        # 1. Validate batch and profile
+        if not request.candidates:
+            raise BulkMatchValidationError("At least one candidate is required")
+
+        if len(request.candidates) > self.max_candidates:
+            raise BulkMatchValidationError(
+                f"At most {self.max_candidates} candidates allowed per request"
+            )
+
+        profile_birth = create_birth_details(request.profile)
+
+        # 2. Resolve candidates to Moon positions, computing charts in one batch
+        positions: List[Optional[Tuple[int, int]]] = []
+        errors: List[BulkMatchItemDTO] = []
+        births: List[BirthDetails] = []
+        birth_slots: List[int] = []
+
+        for i, candidate in enumerate(request.candidates):
+            try:
+                position = self._known_position(candidate)
+                if position is None:
+                    births.append(create_birth_details(candidate.birth))
+                    birth_slots.append(i)
+            except (KundliValidationError, ValueError) as e:
+                errors.append(BulkMatchItemDTO(id=candidate.id, success=False, error=str(e)))
+                position = None
+            positions.append(position)
+
+        kundlis = await self.kundli_repository.generate_kundlis([profile_birth] + births)
+        profile = kundlis[0]
+        if profile is None:
+            raise KundliGenerationError(
+                f"Failed to generate kundli for {request.profile.name}"
+            )
+
+        for slot, kundli in zip(birth_slots, kundlis[1:]):
+            if kundli is None:
+                errors.append(BulkMatchItemDTO(
+                    id=request.candidates[slot].id, success=False,
+                    error="Failed to generate kundli"
+                ))
+            else:
+                positions[slot] = self._moon_position(kundli)
+
+        # 3. Score all valid candidates at once
+        valid = [i for i, p in enumerate(positions) if p is not None]
+        results = self._rank(request, profile, valid, positions)
+
+        return BulkMatchResponse(
+            success=True,
+            profile_nakshatra=profile.moon_nakshatra,
+            profile_moon_sign=profile.moon_sign.english,
+            total=len(request.candidates),
+            ranked=len(results),
+            results=results,
+            errors=errors
+        )
+
+    def _rank(
+        self,
+        request: BulkMatchRequest,
+        profile: Kundli,
+        valid: List[int],
+        positions: List[Optional[Tuple[int, int]]]
+    ) -> List[BulkMatchItemDTO]:
+        """Score, filter and rank candidates."""
+        if not valid:
+            return []
+
+        nakshatras = np.array([positions[i][0] for i in valid])
+        signs = np.array([positions[i][1] for i in valid])
+        own_nakshatra, own_sign = self._moon_position(profile)
+
+        if request.profile_is_groom:
+            points = ashtakoot.score(own_nakshatra, own_sign, nakshatras, signs)
+        else:
+            points = ashtakoot.score(nakshatras, signs, own_nakshatra, own_sign)
+        nadi = ashtakoot.nadi_doshas(own_nakshatra, nakshatras)
+
+        totals = points.sum(axis=1)
+        order = np.argsort(-totals, kind="stable")
+        order = order[totals[order] >= request.min_points]
+        if request.limit is not None:
+            order = order[:request.limit]
+
+        names = [k[0] for k in ashtakoot.KOOTAS]
+        return [
+            BulkMatchItemDTO(
+                id=request.candidates[valid[j]].id,
+                rank=rank,
+                total_points=float(totals[j]),
+                match_percentage=round(float(totals[j]) / ashtakoot.MAX_POINTS * 100, 1),
+                guna_points=dict(zip(names, points[j].tolist())),
+                nadi_dosha=bool(nadi[j])
+            )
+            for rank, j in enumerate(order.tolist(), start=1)
+        ]
+
+    def _known_position(self, candidate: MatchCandidateDTO) -> Optional[Tuple[int, int]]:
+        """
+        Get (nakshatra, sign) indices supplied directly by the caller.
+
+        Returns:
+            Indices, or None if the chart must be computed from birth details
+        """
+        if candidate.moon_nakshatra and candidate.moon_sign:
+            nakshatra = ashtakoot.nakshatra_index(candidate.moon_nakshatra)
+            sign = ashtakoot.sign_index(ZodiacSign.from_string(candidate.moon_sign))
+            if sign not in ashtakoot.NAKSHATRA_SIGNS[nakshatra]:
+                raise ValueError(
+                    f"{candidate.moon_nakshatra} is not in {candidate.moon_sign}"
+                )
+            return nakshatra, sign
+
+        if candidate.birth is None:
+            raise ValueError("Either birth or moon_nakshatra and moon_sign is required")
+
+        return None
+
+    def _moon_position(self, kundli: Kundli) -> Tuple[int, int]:
+        """Get (nakshatra, sign) indices of a chart's Moon."""
+        return (
+            ashtakoot.nakshatra_index(kundli.moon_nakshatra),
+            ashtakoot.sign_index(kundli.moon_sign),
+        )
@@ -0,0 +1,126 @@
+"""
+Render Chart Use Case.
+
+Single responsibility: Draw a kundli's birth chart as SVG or PNG.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+from domain.repositories import ChartImageRepository, KundliRepository
+from application.chart_svg import (
+    CHART_LANGUAGES, CHART_STYLES, chart_key, render_chart_svg
+)
+from application.kundli_id import decode_kundli_id
+
+MEDIA_TYPES = {"svg": "image/svg+xml", "png": "image/png"}
+
+
+class ChartValidationError(Exception):
+    """Raised when a chart request is invalid."""
+    pass
+
+
+class ChartNotFoundError(Exception):
+    """Raised when the kundli id does not resolve to a chart."""
+    pass
+
+
+class ChartFormatUnavailableError(Exception):
+    """Raised when PNG is requested but no rasterizer is installed."""
+    pass
+
+
+@dataclass
+class ChartImage:
+    """A rendered chart; content is None when the client's copy is current."""
+    etag: str
+    media_type: str
+    content: Optional[bytes] = None
+
+
+@dataclass
+class RenderChartUseCase:
+    """
+    Use case for chart images.
+
+    Images are named by a hash of what they show, which is also the
+    strong ETag: a matching If-None-Match is answered without drawing,
+    and a drawn image is stored once and served from the image
+    repository afterwards.
+    """
+    kundli_repository: KundliRepository
+    image_repository: ChartImageRepository
+    rasterizer: Optional[Callable[[bytes, int], bytes]] = None
+    png_sizes: Tuple[int, ...] = (256, 512, 1024)
+
+    async def execute(
+        self,
+        kundli_id: str,
+        image_format: str = "svg",
+        style: str = "north",
+        lang: str = "en",
+        size: Optional[int] = None,
+        if_none_match: Optional[str] = None
+    ) -> ChartImage:
+        """
+        Get a chart image.
+
+        Raises:
+            ChartValidationError: If style, language or size is invalid
+            ChartNotFoundError: If the kundli id is invalid
+            ChartFormatUnavailableError: If PNG cannot be produced
+        """
+        self._validate(image_format, style, lang, size)
+
+        try:
+            birth = decode_kundli_id(kundli_id)
+        except ValueError as e:
+            raise ChartNotFoundError(str(e))
+        kundli = await self.kundli_repository.generate_kundli(birth)
+        if kundli is None:
+            raise ChartNotFoundError(f"No chart for kundli id: {kundli_id}")
+
+        key = chart_key(kundli, style, lang)
+        name = f"{key}.svg" if image_format == "svg" else f"{key}-{size}.png"
+        image = ChartImage(etag=f'"{name}"', media_type=MEDIA_TYPES[image_format])
+        if if_none_match and _etag_matches(if_none_match, image.etag):
+            return image
+
+        image.content = await self.image_repository.get_image(name)
+        if image.content is None:
+            svg = render_chart_svg(kundli, style, lang).encode()
+            if image_format == "svg":
+                image.content = svg
+            else:
+                image.content = await asyncio.to_thread(self.rasterizer, svg, size)
+            await self.image_repository.save_image(name, image.content)
+        return image
+
+    def _validate(
+        self,
+        image_format: str,
+        style: str,
+        lang: str,
+        size: Optional[int]
+    ) -> None:
+        if style not in CHART_STYLES:
+            raise ChartValidationError(f"Style must be one of: {', '.join(CHART_STYLES)}")
+        if lang not in CHART_LANGUAGES:
+            raise ChartValidationError(f"Language must be one of: {', '.join(CHART_LANGUAGES)}")
+        if image_format not in MEDIA_TYPES:
+            raise ChartValidationError(f"Unknown image format: {image_format}")
+        if image_format == "png":
+            if size not in self.png_sizes:
+                raise ChartValidationError(
+                    f"Size must be one of: {', '.join(map(str, self.png_sizes))}"
+                )
+            if self.rasterizer is None:
+                raise ChartFormatUnavailableError("PNG charts are not available on this server")
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Whether an If-None-Match header names an ETag (or is "*")."""
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
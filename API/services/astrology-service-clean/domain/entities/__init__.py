@@ -7,7 +7,9 @@ Core business objects representing astrological concepts.
 from .zodiac import ZodiacSign, Nakshatra, Planet
 from .horoscope import Horoscope, HoroscopePeriod, LuckyElements
 from .kundli import Kundli, BirthDetails, PlanetPosition, House, Dosha, DoshaType
+from .dasha import DashaPeriod, DashaTimeline
 from .panchang import Panchang, Tithi, Yoga, Karana, TithiPaksha, Muhurta
+from .muhurat import MuhuratRule, MuhuratWindow
 
 __all__ = [
     "ZodiacSign",
@@ -22,10 +24,14 @@ __all__ = [
     "House",
     "Dosha",
     "DoshaType",
+    "DashaPeriod",
+    "DashaTimeline",
     "Panchang",
     "Tithi",
     "Yoga",
     "Karana",
     "TithiPaksha",
     "Muhurta",
+    "MuhuratRule",
+    "MuhuratWindow",
 ]
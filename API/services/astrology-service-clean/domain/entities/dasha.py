@@ -0,0 +1,186 @@
+"""
+Vimshottari Dasha Domain Entities.
+
+The 120-year cycle of planetary periods, started from the Moon's
+nakshatra at birth. Each mahadasha divides into nine antardashas and
+each antardasha into nine pratyantardashas, in the same order and
+proportions.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterator, List, Optional, Tuple
+
+from .zodiac import Planet
+
+# Dasha lords in cycle order and their mahadasha lengths in years
+DASHA_LORDS = (
+    Planet.KETU, Planet.VENUS, Planet.SUN, Planet.MOON, Planet.MARS,
+    Planet.RAHU, Planet.JUPITER, Planet.SATURN, Planet.MERCURY,
+)
+DASHA_YEARS = (7, 20, 6, 10, 7, 18, 16, 19, 17)
+CYCLE_YEARS = 120
+YEAR_DAYS = 365.25
+
+LEVEL_NAMES = {1: "Mahadasha", 2: "Antardasha", 3: "Pratyantardasha"}
+MAX_LEVEL = len(LEVEL_NAMES)
+
+NAKSHATRA_SPAN = 360.0 / 27
+
+# Precomputed per lord: the nine sub-period lords, starting from the
+# lord itself, and cumulative fractions of the period at which each
+# sub-period starts (10 entries, 0.0 ... 1.0)
+_SEQUENCE: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple((start + k) % 9 for k in range(9)) for start in range(9)
+)
+_FRACTIONS: Tuple[Tuple[float, ...], ...] = tuple(
+    tuple(sum(DASHA_YEARS[j] for j in seq[:k]) / CYCLE_YEARS for k in range(10))
+    for seq in _SEQUENCE
+)
+
+# Precomputed per nakshatra: index of its mahadasha lord
+NAKSHATRA_LORD = tuple(n % 9 for n in range(27))
+
+
+@dataclass(frozen=True)
+class DashaPeriod:
+    """One period of the timeline."""
+    lord: Planet
+    level: int  # 1 = mahadasha, 2 = antardasha, 3 = pratyantardasha
+    start: datetime
+    end: datetime
+    lords: Tuple[Planet, ...]  # Path from mahadasha lord down to this one
+
+    @property
+    def level_name(self) -> str:
+        return LEVEL_NAMES[self.level]
+
+    def contains(self, moment: datetime) -> bool:
+        return self.start <= moment < self.end
+
+
+class DashaTimeline:
+    """
+    Vimshottari timeline for one birth.
+
+    Periods are computed on demand from the precomputed tables, so a
+    page of periods or the current period never needs the full tree
+    (9 + 81 + 729 periods) to be built.
+    """
+
+    def __init__(self, moon_longitude: float, birth: datetime):
+        """
+        Args:
+            moon_longitude: Sidereal longitude of the Moon at birth
+            birth: Birth date and time
+        """
+        position = (moon_longitude % 360.0) / NAKSHATRA_SPAN
+        self.nakshatra_index = int(position) % 27
+        first = NAKSHATRA_LORD[self.nakshatra_index]
+
+        # Portion of the first mahadasha already elapsed at birth
+        self.elapsed_fraction = position - int(position)
+        self.birth = birth
+
+        self._maha = _SEQUENCE[first]
+        elapsed_days = self.elapsed_fraction * DASHA_YEARS[first] * YEAR_DAYS
+        self._origin = birth - timedelta(days=elapsed_days)
+
+        # Mahadasha boundaries in days from origin
+        self._bounds: List[float] = [0.0]
+        for lord in self._maha:
+            self._bounds.append(self._bounds[-1] + DASHA_YEARS[lord] * YEAR_DAYS)
+
+    @property
+    def balance_at_birth(self) -> timedelta:
+        """Remaining part of the first mahadasha at birth."""
+        return self._at(self._bounds[1]) - self.birth
+
+    def count(self, level: int) -> int:
+        """Number of periods at a level over the whole cycle."""
+        return 9 ** level
+
+    def period(self, level: int, index: int) -> DashaPeriod:
+        """
+        Get the index-th period (chronologically) at a level.
+
+        Args:
+            level: 1-3
+            index: 0 <= index < count(level)
+        """
+        if not 1 <= level <= MAX_LEVEL:
+            raise ValueError(f"Dasha level must be 1-{MAX_LEVEL}")
+        if not 0 <= index < self.count(level):
+            raise IndexError(f"No period {index} at level {level}")
+
+        digits = []
+        for _ in range(level):
+            index, digit = divmod(index, 9)
+            digits.append(digit)
+        digits.reverse()
+
+        lord = self._maha[digits[0]]
+        start = self._bounds[digits[0]]
+        length = DASHA_YEARS[lord] * YEAR_DAYS
+        path = [lord]
+
+        for digit in digits[1:]:
+            start += length * _FRACTIONS[lord][digit]
+            lord = _SEQUENCE[lord][digit]
+            length *= DASHA_YEARS[lord] / CYCLE_YEARS
+            path.append(lord)
+
+        return self._period(path, start, length)
+
+    def periods(
+        self,
+        level: int = 1,
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> Iterator[DashaPeriod]:
+        """Lazily iterate periods at a level in chronological order."""
+        stop = self.count(level) if limit is None else min(offset + limit, self.count(level))
+        return (self.period(level, i) for i in range(offset, stop))
+
+    def current(self, moment: datetime, depth: int = MAX_LEVEL) -> List[DashaPeriod]:
+        """
+        Get the running periods at a moment, from mahadasha down.
+
+        Returns:
+            One period per level up to depth, or [] outside the cycle
+        """
+        days = (moment - self._origin) / timedelta(days=1)
+        i = bisect_right(self._bounds, days) - 1
+        if not 0 <= i < 9:
+            return []
+
+        lord = self._maha[i]
+        start = self._bounds[i]
+        length = DASHA_YEARS[lord] * YEAR_DAYS
+        path = [lord]
+        result = [self._period(path, start, length)]
+
+        for _ in range(depth - 1):
+            fraction = (days - start) / length
+            k = min(bisect_right(_FRACTIONS[lord], fraction) - 1, 8)
+            start += length * _FRACTIONS[lord][k]
+            lord = _SEQUENCE[lord][k]
+            length *= DASHA_YEARS[lord] / CYCLE_YEARS
+            path.append(lord)
+            result.append(self._period(path, start, length))
+
+        return result
+
+    def _at(self, days: float) -> datetime:
+        return self._origin + timedelta(days=days)
+
+    def _period(self, path: List[int], start: float, length: float) -> DashaPeriod:
+        return DashaPeriod(
+            lord=DASHA_LORDS[path[-1]],
+            level=len(path),
+            start=self._at(start),
+            end=self._at(start + length),
+            lords=tuple(DASHA_LORDS[p] for p in path),
+        )
+
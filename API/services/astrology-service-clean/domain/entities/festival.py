@@ -0,0 +1,100 @@
+"""
+Festival Domain Entities.
+
+Rules deriving Hindu festivals from the lunar calendar. A lunar
+festival is kept on the first day whose tithi at its observance time
+(sunrise, morning, midday, afternoon, pradosh or midnight) has
+reached the festival's tithi - which also settles skipped (kshaya) and
+repeated (vriddhi) tithis. Months are amanta (new moon to new moon),
+and festivals fall in the regular month, never an adhik one. Solar
+festivals are kept on the first day whose observance time is at or
+after the Sun's entry into a sidereal sign (sankranti).
+
+Bhadra (Vishti karana) is not considered, so Holika Dahan and Raksha
+Bandhan can differ from almanacs that move them out of it.
+"""
+
+import re
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional, Tuple, Union
+
+from .zodiac import ZodiacSign
+
+
+class Observance(Enum):
+    """Time of day at which a festival's tithi must prevail."""
+    SUNRISE = "sunrise"  # Udaya tithi
+    MORNING = "morning"  # Purvahna
+    MIDDAY = "midday"  # Madhyahna
+    AFTERNOON = "afternoon"  # Aparahna
+    PRADOSH = "pradosh"  # Sunset
+    MIDNIGHT = "midnight"  # Nishita, midway between sunset and sunrise
+
+
+@dataclass(frozen=True)
+class LunarFestival:
+    """Festival on a tithi of an amanta month."""
+    name: str
+    hindi_name: str
+    tithi: int  # 1-30: Shukla 1-15, then Krishna 1-15 (30 = Amavasya)
+    month: Optional[int] = None  # Index into HINDU_MONTHS; None = every month
+    observance: Observance = Observance.SUNRISE
+    offset_days: int = 0  # Kept this many days after the tithi day
+    category: str = "festival"
+
+
+@dataclass(frozen=True)
+class SolarFestival:
+    """Festival on the Sun's entry into a sidereal sign."""
+    name: str
+    hindi_name: str
+    sign: ZodiacSign
+    observance: Observance = Observance.PRADOSH  # After sunset: the next day
+    category: str = "festival"
+
+
+FestivalRule = Union[LunarFestival, SolarFestival]
+
+_CHAITRA, _VAISHAKHA, _ASHADHA, _SHRAVANA, _BHADRAPADA, _ASHWINA, _KARTIKA = 0, 1, 3, 4, 5, 6, 7
+_MAGHA, _PHALGUNA = 10, 11
+
+FESTIVAL_RULES: Tuple[FestivalRule, ...] = (
+    SolarFestival("Makar Sankranti", "मकर संक्रांति", ZodiacSign.CAPRICORN),
+    SolarFestival("Baisakhi", "बैसाखी", ZodiacSign.ARIES, Observance.MIDNIGHT),
+    LunarFestival("Vasant Panchami", "वसंत पंचमी", 5, _MAGHA, Observance.MORNING),
+    LunarFestival("Maha Shivaratri", "महाशिवरात्रि", 29, _MAGHA, Observance.MIDNIGHT),
+    LunarFestival("Holika Dahan", "होलिका दहन", 15, _PHALGUNA, Observance.PRADOSH),
+    LunarFestival("Holi", "होली", 15, _PHALGUNA, Observance.PRADOSH, offset_days=1),
+    LunarFestival("Ugadi", "उगादि", 1, _CHAITRA),
+    LunarFestival("Ram Navami", "राम नवमी", 9, _CHAITRA, Observance.MIDDAY),
+    LunarFestival("Hanuman Jayanti", "हनुमान जयंती", 15, _CHAITRA),
+    LunarFestival("Akshaya Tritiya", "अक्षय तृतीया", 3, _VAISHAKHA, Observance.MORNING),
+    LunarFestival("Buddha Purnima", "बुद्ध पूर्णिमा", 15, _VAISHAKHA),
+    LunarFestival("Guru Purnima", "गुरु पूर्णिमा", 15, _ASHADHA),
+    LunarFestival("Raksha Bandhan", "रक्षा बंधन", 15, _SHRAVANA),
+    LunarFestival("Krishna Janmashtami", "कृष्ण जन्माष्टमी", 23, _SHRAVANA, Observance.MIDNIGHT),
+    LunarFestival("Ganesh Chaturthi", "गणेश चतुर्थी", 4, _BHADRAPADA, Observance.MIDDAY),
+    LunarFestival("Sharad Navratri", "शारदीय नवरात्रि", 1, _ASHWINA),
+    LunarFestival("Dussehra", "दशहरा", 10, _ASHWINA, Observance.AFTERNOON),
+    LunarFestival("Dhanteras", "धनतेरस", 28, _ASHWINA, Observance.PRADOSH),
+    LunarFestival("Diwali", "दीवाली", 30, _ASHWINA, Observance.PRADOSH),
+    LunarFestival("Govardhan Puja", "गोवर्धन पूजा", 1, _KARTIKA),
+    LunarFestival("Bhai Dooj", "भाई दूज", 2, _KARTIKA, Observance.AFTERNOON),
+    LunarFestival("Chhath Puja", "छठ पूजा", 6, _KARTIKA),
+    LunarFestival("Dev Uthani Ekadashi", "देवउठनी एकादशी", 11, _KARTIKA),
+    LunarFestival("Kartik Purnima", "कार्तिक पूर्णिमा", 15, _KARTIKA),
+    # Monthly observances, adhik months included
+    LunarFestival("Ekadashi Vrat", "एकादशी व्रत", 11, category="vrat"),
+    LunarFestival("Ekadashi Vrat", "एकादशी व्रत", 26, category="vrat"),
+    LunarFestival("Purnima", "पूर्णिमा", 15, category="vrat"),
+    LunarFestival("Amavasya", "अमावस्या", 30, category="vrat"),
+)
+
+
+def festival_key(name: str) -> str:
+    """Lookup key for a festival name: "Raksha-Bandhan" finds "Raksha Bandhan"."""
+    return re.sub(r"[^a-z0-9]", "", name.casefold())
+
+
+FESTIVAL_NAMES = {festival_key(rule.name): rule.name for rule in FESTIVAL_RULES}
@@ -10,6 +10,7 @@ from datetime import datetime
 from enum import Enum
 
 from .zodiac import ZodiacSign, Planet, Nakshatra
+from .dasha import DashaTimeline
 
 
 @dataclass(frozen=True)
@@ -173,6 +174,28 @@ class Kundli:
                 return pos
         return None
 
+    def dasha_timeline(self) -> Optional[DashaTimeline]:
+        """Get Vimshottari timeline from the Moon's position at birth."""
+        moon = self.get_planet_position(Planet.MOON)
+        if moon is None:
+            return None
+        return DashaTimeline(moon.absolute_degree, self.birth_details.date_time)
+
+    def update_current_dasha(self, at: datetime) -> None:
+        """Set current mahadasha/antardasha fields for a moment."""
+        timeline = self.dasha_timeline()
+        current = timeline.current(at, depth=2) if timeline else []
+        if len(current) < 2:
+            self.current_mahadasha = None
+            self.current_antardasha = None
+            self.mahadasha_end_date = None
+            return
+
+        maha, antar = current
+        self.current_mahadasha = maha.lord.english
+        self.current_antardasha = antar.lord.english
+        self.mahadasha_end_date = maha.end
+
     def get_house(self, number: int) -> Optional[House]:
         """Get a specific house."""
         for house in self.houses:
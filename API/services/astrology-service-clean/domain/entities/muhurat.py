@@ -0,0 +1,149 @@
+"""
+Muhurat Domain Entities.
+
+Rule tables for choosing an auspicious time (muhurat) for an
+undertaking, and the ranked time windows a search returns. A window
+qualifies when the tithi, nakshatra, weekday and rising sign (lagna)
+all suit the purpose, no inauspicious yoga or karana is running, and
+it falls outside Rahu Kaal and Yamaganda.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, FrozenSet, Optional
+
+from .panchang import TithiPaksha
+from .zodiac import ZodiacSign
+
+# Score components, summing to 100 for a perfect window
+NAKSHATRA_POINTS = 40
+TITHI_POINTS = 25
+LAGNA_POINTS = 20
+DURATION_POINTS = 15
+FULL_DURATION_MINUTES = 120  # Windows this long get all duration points
+
+# Krishna paksha tithis count for less than the same Shukla ones
+PAKSHA_WEIGHT = {TithiPaksha.SHUKLA: 1.0, TithiPaksha.KRISHNA: 0.7}
+
+
+@dataclass(frozen=True)
+class MuhuratRule:
+    """
+    What makes a time suitable for one purpose.
+
+    Nakshatras and lagnas map to weights in (0, 1]; anything missing
+    is unsuitable. Tithis are numbered 1-15 within each paksha.
+    """
+    purpose: str
+    name: str
+    hindi_name: str
+    shukla_tithis: FrozenSet[int]
+    krishna_tithis: FrozenSet[int]
+    nakshatras: Dict[str, float]
+    weekdays: FrozenSet[int]  # 0 = Monday
+    lagnas: Dict[ZodiacSign, float]
+    daytime_only: bool = True  # Otherwise sunrise to the next sunrise
+    min_minutes: int = 30
+
+    def allows_tithi(self, number: int, paksha: TithiPaksha) -> bool:
+        tithis = self.shukla_tithis if paksha == TithiPaksha.SHUKLA else self.krishna_tithis
+        return number in tithis
+
+
+@dataclass(frozen=True)
+class MuhuratWindow:
+    """A suitable time window; times are local to the search location."""
+    start: datetime
+    end: datetime
+    score: float  # 0-100
+    tithi: str
+    paksha: TithiPaksha
+    nakshatra: str
+    vara: str
+    lagna: Optional[ZodiacSign] = None  # None when the lagna wasn't evaluated
+
+    @property
+    def minutes(self) -> int:
+        return int((self.end - self.start).total_seconds() // 60)
+
+
+def muhurat_score(
+    nakshatra_weight: float,
+    tithi_weight: float,
+    lagna_weight: float,
+    minutes: float
+) -> float:
+    """Score (0-100) of a window from its limb weights and length."""
+    return round(
+        NAKSHATRA_POINTS * nakshatra_weight
+        + TITHI_POINTS * tithi_weight
+        + LAGNA_POINTS * lagna_weight
+        + DURATION_POINTS * min(1.0, minutes / FULL_DURATION_MINUTES),
+        1
+    )
+
+
+_FIXED = {ZodiacSign.TAURUS: 1.0, ZodiacSign.LEO: 1.0,
+          ZodiacSign.SCORPIO: 1.0, ZodiacSign.AQUARIUS: 1.0}
+_DUAL = {ZodiacSign.GEMINI: 1.0, ZodiacSign.VIRGO: 1.0,
+         ZodiacSign.SAGITTARIUS: 1.0, ZodiacSign.PISCES: 1.0}
+
+MUHURAT_RULES: Dict[str, MuhuratRule] = {
+    rule.purpose: rule for rule in (
+        MuhuratRule(
+            purpose="marriage",
+            name="Vivah",
+            hindi_name="विवाह",
+            shukla_tithis=frozenset({2, 3, 5, 7, 10, 11, 13, 15}),
+            krishna_tithis=frozenset({1, 2, 3, 5, 7}),
+            nakshatras={
+                "Rohini": 1.0, "Uttara Phalguni": 1.0, "Hasta": 1.0,
+                "Uttara Ashadha": 1.0, "Uttara Bhadrapada": 1.0, "Revati": 1.0,
+                "Mrigashira": 0.8, "Magha": 0.8, "Swati": 0.8, "Anuradha": 0.8,
+                "Mula": 0.6,
+            },
+            weekdays=frozenset({0, 2, 3, 4}),
+            lagnas={
+                ZodiacSign.GEMINI: 1.0, ZodiacSign.VIRGO: 1.0, ZodiacSign.LIBRA: 1.0,
+                ZodiacSign.TAURUS: 0.7, ZodiacSign.CANCER: 0.7,
+                ZodiacSign.SAGITTARIUS: 0.7, ZodiacSign.PISCES: 0.7,
+            },
+            daytime_only=False,  # Wedding lagnas are often at night
+            min_minutes=30,
+        ),
+        MuhuratRule(
+            purpose="griha_pravesh",
+            name="Griha Pravesh",
+            hindi_name="गृह प्रवेश",
+            shukla_tithis=frozenset({2, 3, 5, 7, 10, 11, 13}),
+            krishna_tithis=frozenset({2, 3, 5}),
+            nakshatras={
+                "Rohini": 1.0, "Uttara Phalguni": 1.0, "Uttara Ashadha": 1.0,
+                "Uttara Bhadrapada": 1.0, "Mrigashira": 0.9, "Chitra": 0.8,
+                "Anuradha": 0.9, "Revati": 0.9, "Dhanishta": 0.7, "Shatabhisha": 0.7,
+            },
+            weekdays=frozenset({0, 2, 3, 4}),
+            lagnas={**_FIXED, **{sign: 0.6 for sign in _DUAL}},  # Fixed signs: a lasting home
+            min_minutes=30,
+        ),
+        MuhuratRule(
+            purpose="vehicle_purchase",
+            name="Vahan Kharid",
+            hindi_name="वाहन खरीद",
+            shukla_tithis=frozenset({1, 2, 3, 5, 6, 7, 10, 11, 12, 13, 15}),
+            krishna_tithis=frozenset({1, 2, 3, 5, 6, 7, 10, 11, 12}),
+            nakshatras={
+                "Ashwini": 1.0, "Pushya": 1.0, "Hasta": 1.0, "Revati": 1.0,
+                "Punarvasu": 0.9, "Chitra": 0.9, "Swati": 0.9, "Shravana": 0.9,
+                "Mrigashira": 0.8, "Anuradha": 0.8, "Dhanishta": 0.8, "Shatabhisha": 0.7,
+            },
+            weekdays=frozenset({0, 2, 3, 4, 6}),
+            lagnas={
+                **_DUAL,
+                ZodiacSign.ARIES: 0.8, ZodiacSign.CANCER: 0.8,
+                ZodiacSign.LIBRA: 0.8, ZodiacSign.CAPRICORN: 0.8,
+            },
+            min_minutes=30,
+        ),
+    )
+}
@@ -16,6 +16,100 @@ class TithiPaksha(Enum):
     KRISHNA = "Krishna"  # Dark/Waning
 
 
+# Tithis 1-14 of either paksha; the 15th is Purnima or Amavasya
+TITHIS = [
+    ("Pratipada", "प्रतिपदा"),
+    ("Dwitiya", "द्वितीया"),
+    ("Tritiya", "तृतीया"),
+    ("Chaturthi", "चतुर्थी"),
+    ("Panchami", "पंचमी"),
+    ("Shashthi", "षष्ठी"),
+    ("Saptami", "सप्तमी"),
+    ("Ashtami", "अष्टमी"),
+    ("Navami", "नवमी"),
+    ("Dashami", "दशमी"),
+    ("Ekadashi", "एकादशी"),
+    ("Dwadashi", "द्वादशी"),
+    ("Trayodashi", "त्रयोदशी"),
+    ("Chaturdashi", "चतुर्दशी"),
+]
+PURNIMA = ("Purnima", "पूर्णिमा")
+AMAVASYA = ("Amavasya", "अमावस्या")
+INAUSPICIOUS_TITHIS = (4, 8, 14)
+
+# 27 yogas: (name, hindi, is_auspicious)
+YOGAS = [
+    ("Vishkumbha", "विष्कुम्भ", False),
+    ("Priti", "प्रीति", True),
+    ("Ayushman", "आयुष्मान", True),
+    ("Saubhagya", "सौभाग्य", True),
+    ("Shobhana", "शोभन", True),
+    ("Atiganda", "अतिगण्ड", False),
+    ("Sukarma", "सुकर्मा", True),
+    ("Dhriti", "धृति", True),
+    ("Shoola", "शूल", False),
+    ("Ganda", "गण्ड", False),
+    ("Vriddhi", "वृद्धि", True),
+    ("Dhruva", "ध्रुव", True),
+    ("Vyaghata", "व्याघात", False),
+    ("Harshana", "हर्षण", True),
+    ("Vajra", "वज्र", False),
+    ("Siddhi", "सिद्धि", True),
+    ("Vyatipata", "व्यतीपात", False),
+    ("Variyana", "वरीयान", True),
+    ("Parigha", "परिघ", False),
+    ("Shiva", "शिव", True),
+    ("Siddha", "सिद्ध", True),
+    ("Sadhya", "साध्य", True),
+    ("Shubha", "शुभ", True),
+    ("Shukla", "शुक्ल", True),
+    ("Brahma", "ब्रह्म", True),
+    ("Indra", "इन्द्र", True),
+    ("Vaidhriti", "वैधृति", False),
+]
+
+# 11 karanas: 7 movable (1-7) then 4 fixed (8-11)
+KARANAS = [
+    ("Bava", "बव", True),
+    ("Balava", "बालव", True),
+    ("Kaulava", "कौलव", True),
+    ("Taitila", "तैतिल", True),
+    ("Garaja", "गरज", True),
+    ("Vanija", "वणिज", True),
+    ("Vishti", "विष्टि", False),  # Bhadra
+    ("Shakuni", "शकुनि", False),
+    ("Chatushpada", "चतुष्पाद", False),
+    ("Naga", "नाग", False),
+    ("Kimstughna", "किंस्तुघ्न", True),
+]
+
+# Monday first, like date.weekday()
+VARAS = [
+    ("Monday", "सोमवार"),
+    ("Tuesday", "मंगलवार"),
+    ("Wednesday", "बुधवार"),
+    ("Thursday", "गुरुवार"),
+    ("Friday", "शुक्रवार"),
+    ("Saturday", "शनिवार"),
+    ("Sunday", "रविवार"),
+]
+
+HINDU_MONTHS = [
+    ("Chaitra", "चैत्र"),
+    ("Vaishakha", "वैशाख"),
+    ("Jyeshtha", "ज्येष्ठ"),
+    ("Ashadha", "आषाढ़"),
+    ("Shravana", "श्रावण"),
+    ("Bhadrapada", "भाद्रपद"),
+    ("Ashwina", "आश्विन"),
+    ("Kartika", "कार्तिक"),
+    ("Margashirsha", "मार्गशीर्ष"),
+    ("Pausha", "पौष"),
+    ("Magha", "माघ"),
+    ("Phalguna", "फाल्गुन"),
+]
+
+
 @dataclass(frozen=True)
 class Tithi:
     """
@@ -8,9 +8,11 @@ Infrastructure layer provides implementations.
 from .horoscope_repository import HoroscopeRepository
 from .kundli_repository import KundliRepository
 from .panchang_repository import PanchangRepository
+from .chart_image_repository import ChartImageRepository
 
 __all__ = [
     "HoroscopeRepository",
     "KundliRepository",
     "PanchangRepository",
+    "ChartImageRepository",
 ]
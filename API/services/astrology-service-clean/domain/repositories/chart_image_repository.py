@@ -0,0 +1,46 @@
+"""
+Chart Image Repository Interface.
+
+Abstract interface for storing rendered chart images.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class ChartImageRepository(ABC):
+    """
+    Abstract store of rendered chart images.
+
+    Images are content-addressed: a name is derived from what the
+    image shows, so a stored image never goes stale and needs no
+    invalidation.
+
+    Implementations may use:
+    - Local disk
+    - Object storage
+    """
+
+    @abstractmethod
+    async def get_image(self, name: str) -> Optional[bytes]:
+        """
+        Get a stored image.
+
+        Args:
+            name: Image name, e.g. "<content hash>.svg"
+
+        Returns:
+            Image bytes or None if not stored
+        """
+        pass
+
+    @abstractmethod
+    async def save_image(self, name: str, data: bytes) -> None:
+        """
+        Store an image under a name.
+
+        Args:
+            name: Image name
+            data: Image bytes
+        """
+        pass
@@ -4,8 +4,9 @@ Kundli Repository Interface.
 Abstract interface for birth chart calculations.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Sequence
 
 from domain.entities import Kundli, BirthDetails, Dosha
 
@@ -36,6 +37,26 @@ class KundliRepository(ABC):
         """
         pass
 
+    async def generate_kundlis(
+        self,
+        births: Sequence[BirthDetails]
+    ) -> List[Optional[Kundli]]:
+        """
+        Generate several birth charts.
+
+        Default runs generate_kundli concurrently; implementations
+        that can compute charts in bulk override this.
+
+        Args:
+            births: Birth details
+
+        Returns:
+            Kundlis (or None) in the same order
+        """
+        return list(await asyncio.gather(
+            *(self.generate_kundli(b) for b in births)
+        ))
+
     @abstractmethod
     async def get_doshas(
         self,
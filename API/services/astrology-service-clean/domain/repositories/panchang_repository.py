@@ -6,9 +6,11 @@ Abstract interface for Hindu calendar data.
 
 from abc import ABC, abstractmethod
 from typing import Optional, List
-from datetime import date
+from datetime import date, datetime, timedelta
 
-from domain.entities import Panchang
+from domain.entities import Panchang, MuhuratRule, MuhuratWindow
+from domain.entities.festival import festival_key
+from domain.entities.muhurat import PAKSHA_WEIGHT, muhurat_score
 
 
 class PanchangRepository(ABC):
@@ -43,6 +45,29 @@ class PanchangRepository(ABC):
         """
         pass
 
+    async def get_panchang_range(
+        self,
+        start_date: date,
+        end_date: date,
+        city: str,
+        latitude: float,
+        longitude: float
+    ) -> List[Optional[Panchang]]:
+        """
+        Get panchang for each day of an inclusive date range.
+
+        The default fetches day by day; implementations that can
+        compute a range in one pass should override this.
+
+        Returns:
+            One entry per day, in order
+        """
+        days = (end_date - start_date).days + 1
+        return [
+            await self.get_panchang(start_date + timedelta(days=i), city, latitude, longitude)
+            for i in range(days)
+        ]
+
     @abstractmethod
     async def get_festivals(
         self,
@@ -61,6 +86,34 @@ class PanchangRepository(ABC):
         """
         pass
 
+    async def get_next_festival(
+        self,
+        name: str,
+        after: date
+    ) -> Optional[dict]:
+        """
+        Get the first occurrence of a festival after a date.
+
+        The default scans the following months; implementations that
+        index festivals by name should override this.
+
+        Args:
+            name: Festival name, matched ignoring case and punctuation
+            after: Date to search after (exclusive)
+
+        Returns:
+            Festival with its date, or None if not found within a year
+        """
+        key = festival_key(name)
+        year, month = after.year, after.month
+        for _ in range(13):
+            for festival in await self.get_festivals(month, year):
+                if (festival_key(festival["name"]) == key
+                        and date.fromisoformat(festival["date"]) > after):
+                    return festival
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return None
+
     @abstractmethod
     async def get_auspicious_dates(
         self,
@@ -80,3 +133,47 @@ class PanchangRepository(ABC):
             List of auspicious dates
         """
         pass
+
+    async def find_muhurats(
+        self,
+        rule: MuhuratRule,
+        start_date: date,
+        end_date: date,
+        latitude: float,
+        longitude: float
+    ) -> List[MuhuratWindow]:
+        """
+        Find time windows suiting a purpose in an inclusive date range.
+
+        The default judges each day by its limbs at sunrise and offers
+        the whole daylight as one window, without lagna; implementations
+        that can follow the limbs through the day should override this.
+
+        Returns:
+            Windows, best score first
+        """
+        days = await self.get_panchang_range(start_date, end_date, "", latitude, longitude)
+        windows = []
+        for panchang in days:
+            if panchang is None or panchang.date.weekday() not in rule.weekdays:
+                continue
+            tithi = panchang.tithi
+            nakshatra_weight = rule.nakshatras.get(panchang.nakshatra_name, 0.0)
+            if not rule.allows_tithi(tithi.number, tithi.paksha) or nakshatra_weight == 0:
+                continue
+
+            start = datetime.combine(panchang.date, panchang.sunrise)
+            end = datetime.combine(panchang.date, panchang.sunset)
+            minutes = (end - start).total_seconds() / 60
+            windows.append(MuhuratWindow(
+                start=start,
+                end=end,
+                score=muhurat_score(nakshatra_weight, PAKSHA_WEIGHT[tithi.paksha], 0.0, minutes),
+                tithi=tithi.name,
+                paksha=tithi.paksha,
+                nakshatra=panchang.nakshatra_name,
+                vara=panchang.vara
+            ))
+
+        windows.sort(key=lambda window: (-window.score, window.start))
+        return windows
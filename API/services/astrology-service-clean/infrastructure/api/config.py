@@ -27,10 +27,33 @@ class Settings(BaseSettings):
     ASTROLOGY_API_URL: str = ""
     ASTROLOGY_API_KEY: str = ""
 
+    # Compute kundlis from the built-in ephemeris instead of mock data
+    KUNDLI_EPHEMERIS_ENABLED: bool = True
+    KUNDLI_PROCESS_WORKERS: int = 0  # 0 = compute charts on the event loop
+    KUNDLI_CACHE_MAX_ENTRIES: int = 10000
+
+    # Bulk kundli matching
+    MATCH_BULK_MAX_CANDIDATES: int = 5000
+
+    # Compute panchang from the built-in ephemeris instead of mock data
+    PANCHANG_EPHEMERIS_ENABLED: bool = True
+    PANCHANG_TIMEZONE: str = "Asia/Kolkata"
+    PANCHANG_CACHE_MAX_ENTRIES: int = 4096  # (date, city) days kept in memory
+    PANCHANG_PROCESS_WORKERS: int = 0  # 0 = compute ranges on the event loop
+    PANCHANG_RANGE_MAX_DAYS: int = 366
+
+    # Rendered chart images, content-addressed on disk
+    CHART_CACHE_DIR: str = ""  # Default: <tmp>/astrology-charts
+    CHART_PNG_SIZES: list = [256, 512, 1024]  # PNG needs cairosvg installed
+
     # Cache settings
     REDIS_URL: str = ""
     CACHE_TTL_SECONDS: int = 3600
 
+    # Precomputed daily horoscope table (shared by workers via mmap)
+    HOROSCOPE_TABLE_ENABLED: bool = True
+    HOROSCOPE_TABLE_DIR: str = ""  # Default: <tmp>/astrology-horoscope
+
     # CORS
     CORS_ORIGINS: list = ["*"]
 
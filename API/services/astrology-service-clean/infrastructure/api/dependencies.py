@@ -4,23 +4,40 @@ Dependency Injection.
 Wire up repositories and use cases for FastAPI.
 """
 
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from functools import lru_cache
+from pathlib import Path
+from typing import Optional
 
 from domain.repositories import (
     HoroscopeRepository,
     KundliRepository,
-    PanchangRepository
+    PanchangRepository,
+    ChartImageRepository
 )
 from infrastructure.repositories import (
     MockHoroscopeRepository,
     MockKundliRepository,
-    MockPanchangRepository
+    MockPanchangRepository,
+    EphemerisKundliRepository,
+    EphemerisPanchangRepository,
+    CachedKundliRepository,
+    PrecomputedHoroscopeRepository,
+    DiskChartImageRepository,
+    load_rasterizer
 )
 from application.use_cases import (
     GetHoroscopeUseCase,
     GenerateKundliUseCase,
     MatchKundliUseCase,
-    GetPanchangUseCase
+    GetPanchangUseCase,
+    GetPanchangRangeUseCase,
+    GetDashaUseCase,
+    BulkMatchKundliUseCase,
+    FindMuhuratUseCase,
+    GetFestivalsUseCase,
+    RenderChartUseCase
 )
 from infrastructure.api.config import get_settings
 
@@ -33,32 +50,75 @@ from infrastructure.api.config import get_settings
 def get_horoscope_repository() -> HoroscopeRepository:
     """Get horoscope repository instance."""
     settings = get_settings()
-    if settings.USE_MOCK_DATA:
-        return MockHoroscopeRepository()
-    # Production: return HoroscopeRepositoryImpl(...)
-    return MockHoroscopeRepository()
+    source = MockHoroscopeRepository()
+    # Production: source = HoroscopeRepositoryImpl(...)
+
+    if settings.HOROSCOPE_TABLE_ENABLED:
+        table_dir = settings.HOROSCOPE_TABLE_DIR or (
+            Path(tempfile.gettempdir()) / "astrology-horoscope"
+        )
+        return PrecomputedHoroscopeRepository(source=source, table_dir=table_dir)
+    return source
+
+
+@lru_cache()
+def get_kundli_executor() -> Optional[ProcessPoolExecutor]:
+    """Get process pool for chart computation, if configured."""
+    workers = get_settings().KUNDLI_PROCESS_WORKERS
+    return ProcessPoolExecutor(max_workers=workers) if workers > 0 else None
 
 
 @lru_cache()
 def get_kundli_repository() -> KundliRepository:
     """Get kundli repository instance."""
     settings = get_settings()
+    if settings.KUNDLI_EPHEMERIS_ENABLED:
+        # Ephemeris charts depend only on moment and place, so people
+        # born together share a cached chart. Mock charts are seeded
+        # from the name too, so they are not cached.
+        return CachedKundliRepository(
+            EphemerisKundliRepository(executor=get_kundli_executor()),
+            ttl_seconds=settings.CACHE_TTL_SECONDS,
+            max_entries=settings.KUNDLI_CACHE_MAX_ENTRIES
+        )
     if settings.USE_MOCK_DATA:
         return MockKundliRepository()
     # Production: return KundliRepositoryImpl(...)
     return MockKundliRepository()
 
 
+@lru_cache()
+def get_panchang_executor() -> Optional[ProcessPoolExecutor]:
+    """Get process pool for panchang range computation, if configured."""
+    workers = get_settings().PANCHANG_PROCESS_WORKERS
+    return ProcessPoolExecutor(max_workers=workers) if workers > 0 else None
+
+
 @lru_cache()
 def get_panchang_repository() -> PanchangRepository:
     """Get panchang repository instance."""
     settings = get_settings()
+    if settings.PANCHANG_EPHEMERIS_ENABLED:
+        return EphemerisPanchangRepository(
+            timezone_name=settings.PANCHANG_TIMEZONE,
+            max_entries=settings.PANCHANG_CACHE_MAX_ENTRIES,
+            executor=get_panchang_executor()
+        )
     if settings.USE_MOCK_DATA:
         return MockPanchangRepository()
     # Production: return PanchangRepositoryImpl(...)
     return MockPanchangRepository()
 
 
+@lru_cache()
+def get_chart_image_repository() -> ChartImageRepository:
+    """Get rendered chart image store."""
+    directory = get_settings().CHART_CACHE_DIR or (
+        Path(tempfile.gettempdir()) / "astrology-charts"
+    )
+    return DiskChartImageRepository(directory)
+
+
 # =============================================================================
 # Use Case Providers
 # =============================================================================
@@ -84,8 +144,61 @@ def get_matching_use_case() -> MatchKundliUseCase:
     )
 
 
+def get_bulk_matching_use_case() -> BulkMatchKundliUseCase:
+    """Get bulk kundli matching use case."""
+    return BulkMatchKundliUseCase(
+        kundli_repository=get_kundli_repository(),
+        max_candidates=get_settings().MATCH_BULK_MAX_CANDIDATES
+    )
+
+
+def get_dasha_use_case() -> GetDashaUseCase:
+    """Get dasha timeline use case."""
+    return GetDashaUseCase(
+        kundli_repository=get_kundli_repository()
+    )
+
+
 def get_panchang_use_case() -> GetPanchangUseCase:
     """Get panchang use case."""
     return GetPanchangUseCase(
         panchang_repository=get_panchang_repository()
     )
+
+
+def get_panchang_range_use_case() -> GetPanchangRangeUseCase:
+    """Get panchang range use case."""
+    settings = get_settings()
+    repository = get_panchang_repository()
+    # ETags must change with anything that changes the data: the
+    # repository serving it (mock or ephemeris) and its timezone
+    return GetPanchangRangeUseCase(
+        panchang_repository=repository,
+        max_days=settings.PANCHANG_RANGE_MAX_DAYS,
+        version=f"{settings.SERVICE_VERSION}:{type(repository).__name__}:{settings.PANCHANG_TIMEZONE}"
+    )
+
+
+def get_muhurat_use_case() -> FindMuhuratUseCase:
+    """Get muhurat search use case."""
+    return FindMuhuratUseCase(
+        panchang_repository=get_panchang_repository(),
+        max_days=get_settings().PANCHANG_RANGE_MAX_DAYS
+    )
+
+
+def get_festivals_use_case() -> GetFestivalsUseCase:
+    """Get festivals use case."""
+    return GetFestivalsUseCase(
+        panchang_repository=get_panchang_repository()
+    )
+
+
+def get_chart_use_case() -> RenderChartUseCase:
+    """Get chart rendering use case."""
+    return RenderChartUseCase(
+        kundli_repository=get_kundli_repository(),
+        image_repository=get_chart_image_repository(),
+        rasterizer=load_rasterizer(),
+        png_sizes=tuple(get_settings().CHART_PNG_SIZES)
+    )
@@ -0,0 +1,32 @@
+"""
+JSON Document Responses.
+
+Encodes response documents (plain dicts from application.documents)
+directly to JSON bytes, bypassing response_model validation. Uses
+orjson when installed, else the standard library encoder.
+"""
+
+import json
+from typing import Any
+
+from fastapi.responses import Response
+
+try:
+    import orjson
+except ImportError:  # Optional: ~5x faster encoding
+    orjson = None
+
+
+def encode_json(content: Any) -> bytes:
+    """Encode a document of JSON-native values to UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+class DocumentResponse(Response):
+    """JSON response for a pre-built document; the content is not validated."""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return encode_json(content)
@@ -7,9 +7,11 @@ HTTP endpoints organized by feature.
 from .horoscope_router import router as horoscope_router
 from .kundli_router import router as kundli_router
 from .panchang_router import router as panchang_router
+from .festival_router import router as festival_router
 
 __all__ = [
     "horoscope_router",
     "kundli_router",
     "panchang_router",
+    "festival_router",
 ]
@@ -0,0 +1,68 @@
+"""
+Festival API Router.
+
+Hindu festival calendar endpoints.
+"""
+
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from typing import Annotated, Optional
+
+from application.dto import FestivalsResponse, NextFestivalResponse
+from application.use_cases import GetFestivalsUseCase
+from application.use_cases.get_panchang import (
+    PanchangValidationError,
+    PanchangNotFoundError
+)
+from infrastructure.api.dependencies import get_festivals_use_case
+
+router = APIRouter(prefix="/festivals", tags=["Festivals"])
+
+# Festival dates of a year never change
+_CACHE_CONTROL = "public, max-age=86400"
+
+
+@router.get(
+    "",
+    response_model=FestivalsResponse,
+    summary="Get Festivals",
+    description="Get Hindu festivals and vrats for a month or a year"
+)
+async def get_festivals(
+    response: Response,
+    year: int = Query(..., description="Year"),
+    month: Optional[int] = Query(None, description="Month (1-12), default the whole year"),
+    use_case: Annotated[GetFestivalsUseCase, Depends(get_festivals_use_case)] = None
+):
+    """
+    Get festivals.
+
+    Dates follow the lunar month and tithi rules of each festival,
+    computed for New Delhi.
+    """
+    try:
+        result = await use_case.execute(year, month)
+    except PanchangValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    response.headers["Cache-Control"] = _CACHE_CONTROL
+    return result
+
+
+@router.get(
+    "/next",
+    response_model=NextFestivalResponse,
+    summary="Next Festival Occurrence",
+    description="Get the next date of a festival, e.g. ?name=diwali"
+)
+async def get_next_festival(
+    name: str = Query(..., description="Festival name, e.g. Diwali or raksha-bandhan"),
+    after: Optional[str] = Query(None, description="Search after this date (YYYY-MM-DD), default today"),
+    use_case: Annotated[GetFestivalsUseCase, Depends(get_festivals_use_case)] = None
+):
+    """Get the next occurrence of a festival."""
+    try:
+        return await use_case.next_occurrence(name, after)
+    except PanchangValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except PanchangNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
@@ -4,26 +4,52 @@ Kundli API Router.
 Birth chart and matching endpoints.
 """
 
-from fastapi import APIRouter, HTTPException, Depends
-from typing import Annotated
+import json
+
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Response
+from fastapi.responses import StreamingResponse
+from typing import Annotated, Optional
 
 from application.dto import (
     KundliRequest, KundliResponse,
-    MatchingRequest, MatchingResponse
+    MatchingRequest, MatchingResponse,
+    DashaRequest, DashaResponse,
+    BulkMatchRequest, BulkMatchResponse
+)
+from application.use_cases import (
+    GenerateKundliUseCase,
+    MatchKundliUseCase,
+    GetDashaUseCase,
+    BulkMatchKundliUseCase,
+    RenderChartUseCase
 )
-from application.use_cases import GenerateKundliUseCase, MatchKundliUseCase
 from application.use_cases.generate_kundli import (
     KundliValidationError,
     KundliGenerationError
 )
 from application.use_cases.match_kundli import MatchingError
+from application.use_cases.match_kundli_bulk import BulkMatchValidationError
+from application.use_cases.render_chart import (
+    ChartValidationError,
+    ChartNotFoundError,
+    ChartFormatUnavailableError
+)
+from infrastructure.api.json_response import DocumentResponse
 from infrastructure.api.dependencies import (
     get_kundli_use_case,
-    get_matching_use_case
+    get_matching_use_case,
+    get_dasha_use_case,
+    get_bulk_matching_use_case,
+    get_chart_use_case
 )
 
 router = APIRouter(prefix="/kundli", tags=["Kundli"])
 
+# Content-addressed: a chart's ETag changes only if its drawing does
+_CHART_CACHE_CONTROL = "public, max-age=86400"
+
+_NDJSON = "application/x-ndjson"
+
 
 @router.post(
     "",
@@ -45,7 +71,7 @@ async def generate_kundli(
     - **latitude/longitude**: Coordinates
     """
     try:
-        return await use_case.execute(request)
+        return DocumentResponse(await use_case.execute_document(request))
     except KundliValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except KundliGenerationError as e:
@@ -75,3 +101,142 @@ async def match_kundlis(
         raise HTTPException(status_code=400, detail=str(e))
     except MatchingError as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post(
+    "/match/bulk",
+    response_model=BulkMatchResponse,
+    summary="Bulk Match Kundlis",
+    description="Rank many candidates against one profile by Guna Milan",
+    responses={200: {"content": {_NDJSON: {}}}}
+)
+async def match_kundlis_bulk(
+    request: BulkMatchRequest,
+    use_case: Annotated[BulkMatchKundliUseCase, Depends(get_bulk_matching_use_case)],
+    stream: bool = Query(False, description="Return NDJSON lines instead of one JSON object"),
+    accept: Optional[str] = Header(None)
+):
+    """
+    One-to-many kundli matching, best match first.
+
+    - **profile**: Birth details of the person being matched
+    - **profile_is_groom**: Direction for the asymmetric kootas
+    - **candidates**: Each with birth details, or moon_nakshatra + moon_sign
+    - **min_points/limit**: Filter the ranked list
+
+    Returns a BulkMatchResponse unless the client asks for NDJSON with
+    `Accept: application/x-ndjson` or `stream=true`. The stream is one
+    JSON object per line, each tagged by `type`: a `header` line with
+    the profile and totals, then one `result` line per ranked candidate
+    and one `error` line per failed candidate.
+    """
+    try:
+        response = await use_case.execute(request)
+    except (BulkMatchValidationError, KundliValidationError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except KundliGenerationError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    if stream or _NDJSON in (accept or ""):
+        return StreamingResponse(_bulk_match_lines(response), media_type=_NDJSON)
+    return response
+
+
+def _bulk_match_lines(response: BulkMatchResponse):
+    header = response.model_dump(mode="json", exclude={"results", "errors"})
+    yield json.dumps({"type": "header", **header}) + "\n"
+    for kind, items in (("result", response.results), ("error", response.errors)):
+        for item in items:
+            yield json.dumps({"type": kind, **item.model_dump(mode="json")}) + "\n"
+
+
+@router.post(
+    "/dasha",
+    response_model=DashaResponse,
+    summary="Vimshottari Dasha",
+    description="Current dasha periods and a page of the dasha timeline"
+)
+async def get_dasha(
+    request: DashaRequest,
+    use_case: Annotated[GetDashaUseCase, Depends(get_dasha_use_case)]
+):
+    """
+    Vimshottari dasha timeline from the Moon's nakshatra at birth.
+
+    - Birth details as for **/kundli**
+    - **depth**: 1 (Mahadasha), 2 (Antardasha) or 3 (Pratyantardasha)
+    - **offset/limit**: Page of periods at that depth
+    - **at**: Date for the running periods (default today)
+    """
+    try:
+        return await use_case.execute(request)
+    except KundliValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except KundliGenerationError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get(
+    "/{kundli_id}/chart.svg",
+    summary="Birth Chart SVG",
+    description="Draw the birth chart of a kundli_id from POST /kundli",
+    response_class=Response,
+    responses={200: {"content": {"image/svg+xml": {}}}, 304: {}}
+)
+async def get_chart_svg(
+    kundli_id: str,
+    style: str = Query("north", description="Chart style: north or south"),
+    lang: str = Query("en", description="Planet labels: en or hi"),
+    if_none_match: Optional[str] = Header(None),
+    use_case: Annotated[RenderChartUseCase, Depends(get_chart_use_case)] = None
+):
+    """
+    Birth chart as SVG.
+
+    - **style**: north (fixed houses) or south (fixed signs)
+    - **lang**: en or hi planet abbreviations
+    """
+    return await _chart(use_case, kundli_id, "svg", style, lang, None, if_none_match)
+
+
+@router.get(
+    "/{kundli_id}/chart.png",
+    summary="Birth Chart PNG",
+    description="Draw the birth chart of a kundli_id as a PNG of a fixed size",
+    response_class=Response,
+    responses={200: {"content": {"image/png": {}}}, 304: {}}
+)
+async def get_chart_png(
+    kundli_id: str,
+    size: int = Query(512, description="Width and height in pixels: 256, 512 or 1024"),
+    style: str = Query("north", description="Chart style: north or south"),
+    lang: str = Query("en", description="Planet labels: en or hi"),
+    if_none_match: Optional[str] = Header(None),
+    use_case: Annotated[RenderChartUseCase, Depends(get_chart_use_case)] = None
+):
+    """Birth chart as PNG, where the server has a rasterizer installed."""
+    return await _chart(use_case, kundli_id, "png", style, lang, size, if_none_match)
+
+
+async def _chart(
+    use_case: RenderChartUseCase,
+    kundli_id: str,
+    image_format: str,
+    style: str,
+    lang: str,
+    size: Optional[int],
+    if_none_match: Optional[str]
+) -> Response:
+    try:
+        image = await use_case.execute(kundli_id, image_format, style, lang, size, if_none_match)
+    except ChartValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ChartNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ChartFormatUnavailableError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+
+    headers = {"ETag": image.etag, "Cache-Control": _CHART_CACHE_CONTROL}
+    if image.content is None:
+        return Response(status_code=304, headers=headers)
+    return Response(content=image.content, media_type=image.media_type, headers=headers)
@@ -4,16 +4,27 @@ Panchang API Router.
 Hindu calendar endpoints.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Header, Response
 from typing import Annotated, Optional
 
-from application.dto import PanchangRequest, PanchangResponse
-from application.use_cases import GetPanchangUseCase
+from application.dto import (
+    PanchangRequest, PanchangResponse,
+    PanchangRangeRequest, PanchangRangeResponse,
+    MuhuratRequest, MuhuratSearchResponse
+)
+from application.use_cases import (
+    GetPanchangUseCase, GetPanchangRangeUseCase, FindMuhuratUseCase
+)
 from application.use_cases.get_panchang import (
     PanchangValidationError,
     PanchangNotFoundError
 )
-from infrastructure.api.dependencies import get_panchang_use_case
+from infrastructure.api.dependencies import (
+    get_panchang_use_case,
+    get_panchang_range_use_case,
+    get_muhurat_use_case
+)
+from infrastructure.api.json_response import DocumentResponse
 
 router = APIRouter(prefix="/panchang", tags=["Panchang"])
 
@@ -50,7 +61,7 @@ async def get_panchang(
             latitude=latitude,
             longitude=longitude
         )
-        return await use_case.execute(request)
+        return DocumentResponse(await use_case.execute_document(request))
     except PanchangValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except PanchangNotFoundError as e:
@@ -69,8 +80,94 @@ async def get_panchang_post(
 ):
     """Get panchang using POST request."""
     try:
-        return await use_case.execute(request)
+        return DocumentResponse(await use_case.execute_document(request))
+    except PanchangValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except PanchangNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.get(
+    "/range",
+    response_model=PanchangRangeResponse,
+    summary="Get Panchang Range",
+    description="Get Hindu calendar for every day of a date range (columnar)"
+)
+async def get_panchang_range(
+    response: Response,
+    from_date: str = Query(..., alias="from", description="First date (YYYY-MM-DD)"),
+    to_date: str = Query(..., alias="to", description="Last date (YYYY-MM-DD)"),
+    city: str = Query(default="Delhi"),
+    latitude: float = Query(default=28.6139),
+    longitude: float = Query(default=77.2090),
+    if_none_match: Optional[str] = Header(None),
+    use_case: Annotated[GetPanchangRangeUseCase, Depends(get_panchang_range_use_case)] = None
+):
+    """
+    Get Panchang for a month or year view.
+
+    Each field is a column with one entry per date, e.g.
+    `columns.tithi[i]` is the tithi on `columns.date[i]`.
+
+    Responses carry an ETag; send it back in If-None-Match to get
+    304 Not Modified without recomputing.
+    """
+    try:
+        request = PanchangRangeRequest(
+            from_date=from_date,
+            to_date=to_date,
+            city=city,
+            latitude=latitude,
+            longitude=longitude
+        )
+        etag = use_case.etag(request)
+        headers = {"ETag": etag, "Cache-Control": "public, max-age=86400"}
+        if if_none_match == etag:
+            return Response(status_code=304, headers=headers)
+
+        result = await use_case.execute(request)
     except PanchangValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except PanchangNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
+
+    response.headers.update(headers)
+    return result
+
+
+@router.get(
+    "/muhurat",
+    response_model=MuhuratSearchResponse,
+    summary="Find Muhurat",
+    description="Find ranked auspicious time windows for a purpose"
+)
+async def find_muhurat(
+    purpose: str = Query(..., description="marriage, griha_pravesh or vehicle_purchase"),
+    from_date: str = Query(..., alias="from", description="First date (YYYY-MM-DD)"),
+    to_date: str = Query(..., alias="to", description="Last date (YYYY-MM-DD)"),
+    city: str = Query(default="Delhi"),
+    latitude: float = Query(default=28.6139),
+    longitude: float = Query(default=77.2090),
+    limit: int = Query(default=20, description="Maximum windows to return"),
+    use_case: Annotated[FindMuhuratUseCase, Depends(get_muhurat_use_case)] = None
+):
+    """
+    Find muhurats (auspicious times).
+
+    Tithi, nakshatra, weekday and lagna are checked against the
+    purpose's rules; inauspicious yogas and karanas, Rahu Kaal and
+    Yamaganda are avoided. Windows are ranked by score (0-100).
+    """
+    try:
+        request = MuhuratRequest(
+            purpose=purpose,
+            from_date=from_date,
+            to_date=to_date,
+            city=city,
+            latitude=latitude,
+            longitude=longitude,
+            limit=limit
+        )
+        return await use_case.execute(request)
+    except PanchangValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -7,9 +7,24 @@ Concrete implementations of domain repository interfaces.
 from .mock_horoscope_repository import MockHoroscopeRepository
 from .mock_kundli_repository import MockKundliRepository
 from .mock_panchang_repository import MockPanchangRepository
+from .ephemeris_kundli_repository import EphemerisKundliRepository
+from .ephemeris_panchang_repository import EphemerisPanchangRepository
+from .cached_kundli_repository import CachedKundliRepository
+from .disk_chart_image_repository import DiskChartImageRepository, load_rasterizer
+from .precomputed_horoscope_repository import (
+    HoroscopeTable,
+    PrecomputedHoroscopeRepository
+)
 
 __all__ = [
     "MockHoroscopeRepository",
     "MockKundliRepository",
     "MockPanchangRepository",
+    "EphemerisKundliRepository",
+    "EphemerisPanchangRepository",
+    "CachedKundliRepository",
+    "DiskChartImageRepository",
+    "load_rasterizer",
+    "HoroscopeTable",
+    "PrecomputedHoroscopeRepository",
 ]
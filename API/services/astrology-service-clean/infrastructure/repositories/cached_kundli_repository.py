@@ -0,0 +1,123 @@
+"""
+Cached Kundli Repository.
+
+Decorator that keeps recently computed charts in memory, keyed by
+the birth moment and place, so repeated matches against the same
+person don't recompute their chart.
+"""
+
+from dataclasses import replace
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+import time
+
+from domain.repositories import KundliRepository
+from domain.entities import Kundli, BirthDetails, Dosha
+
+ChartKey = Tuple[datetime, float, float, str]
+
+
+def chart_key(birth: BirthDetails) -> ChartKey:
+    """Cache key for a chart: the birth moment and place, not the name."""
+    return (birth.date_time, round(birth.latitude, 4), round(birth.longitude, 4), birth.timezone)
+
+
+class CachedKundliRepository(KundliRepository):
+    """
+    In-memory TTL cache of charts in front of another kundli repository.
+
+    Only wrap repositories whose charts depend on the birth moment and
+    place alone, such as the ephemeris: one cached chart serves every
+    name born then and there. The mock seeds charts from the name as
+    well, so it must not be wrapped.
+
+    Cached charts are returned with the caller's birth details (name,
+    place label) attached. Doshas and matching are not cached.
+    """
+
+    def __init__(
+        self,
+        repository: KundliRepository,
+        ttl_seconds: int = 3600,
+        max_entries: int = 10000
+    ):
+        self._repository = repository
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: Dict[ChartKey, Tuple[float, Kundli]] = {}
+
+    async def generate_kundli(
+        self,
+        birth_details: BirthDetails
+    ) -> Optional[Kundli]:
+        """Get chart from cache, falling back to the wrapped repository."""
+        kundlis = await self.generate_kundlis([birth_details])
+        return kundlis[0]
+
+    async def generate_kundlis(
+        self,
+        births: Sequence[BirthDetails]
+    ) -> List[Optional[Kundli]]:
+        """Get charts, computing all cache misses in one wrapped call."""
+        results: List[Optional[Kundli]] = [self._get(b) for b in births]
+
+        # Identical births in one call are computed once
+        missing: Dict[ChartKey, BirthDetails] = {}
+        for birth, result in zip(births, results):
+            if result is None:
+                missing.setdefault(chart_key(birth), birth)
+
+        if missing:
+            computed = dict(zip(
+                missing, await self._repository.generate_kundlis(list(missing.values()))
+            ))
+            for key, kundli in computed.items():
+                if kundli is not None:
+                    self._store(key, kundli)
+
+            # Fill from the computed charts, not the cache: storing a batch
+            # larger than max_entries (or with a zero TTL) drops some of them
+            for i, birth in enumerate(births):
+                if results[i] is None:
+                    kundli = computed[chart_key(birth)]
+                    if kundli is not None:
+                        results[i] = replace(kundli, birth_details=birth, doshas=[])
+
+        return results
+
+    async def get_doshas(
+        self,
+        kundli: Kundli
+    ) -> List[Dosha]:
+        """Doshas are not cached - delegate to wrapped repository."""
+        return await self._repository.get_doshas(kundli)
+
+    async def match_kundlis(
+        self,
+        kundli1: Kundli,
+        kundli2: Kundli
+    ) -> dict:
+        """Matching is not cached - delegate to wrapped repository."""
+        return await self._repository.match_kundlis(kundli1, kundli2)
+
+    def _get(self, birth: BirthDetails) -> Optional[Kundli]:
+        """Get a fresh cached chart stamped with these birth details."""
+        key = chart_key(birth)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, kundli = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        # Copy so callers attaching doshas don't touch the cached chart
+        return replace(kundli, birth_details=birth, doshas=[])
+
+    def _store(self, key: ChartKey, kundli: Kundli) -> None:
+        """Store a chart, evicting the oldest entry when full."""
+        if key not in self._entries and len(self._entries) >= self._max_entries:
+            # Dicts keep insertion order, so the first key is the oldest
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + self._ttl_seconds, kundli)
@@ -0,0 +1,73 @@
+"""
+Disk Chart Image Repository.
+
+Stores rendered chart images as files named by their content hash,
+fanned out into subdirectories by the first two characters of the
+name. Files are written under a temporary name and renamed into
+place, so workers sharing the directory never read a partial image.
+
+PNG images come from an optional rasterizer (cairosvg); without it
+only SVG is available.
+"""
+
+import asyncio
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Optional
+
+from domain.repositories import ChartImageRepository
+
+# Converts an SVG document to a PNG of a width and height in pixels
+Rasterizer = Callable[[bytes, int], bytes]
+
+
+class DiskChartImageRepository(ChartImageRepository):
+    """Chart images in a content-addressed directory."""
+
+    def __init__(self, directory: Path):
+        self._directory = Path(directory)
+
+    async def get_image(self, name: str) -> Optional[bytes]:
+        # File I/O runs in a thread so it never blocks the event loop
+        return await asyncio.to_thread(self._read, self._path(name))
+
+    async def save_image(self, name: str, data: bytes) -> None:
+        await asyncio.to_thread(self._write, self._path(name), data)
+
+    @staticmethod
+    def _read(path: Path) -> Optional[bytes]:
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def _path(self, name: str) -> Path:
+        if not name or os.sep in name or name.startswith("."):
+            raise ValueError(f"Invalid image name: {name}")
+        return self._directory / name[:2] / name
+
+
+def load_rasterizer() -> Optional[Rasterizer]:
+    """Get the SVG to PNG rasterizer, or None if cairosvg is not installed."""
+    try:
+        import cairosvg
+    except ImportError:
+        return None
+
+    def rasterize(svg: bytes, size: int) -> bytes:
+        return cairosvg.svg2png(bytestring=svg, output_width=size, output_height=size)
+
+    return rasterize
@@ -0,0 +1,333 @@
+"""
+Closed-form Ephemeris.
+
+Sidereal (Lahiri) longitudes of the nine grahas and the ascendant,
+evaluated in NumPy over many instants at once.
+
+- Planets: JPL Keplerian elements with secular rates (Standish,
+  "Approximate Positions of the Planets", 1800-2050 table) - the
+  secular part of VSOP87. Good to a few arcminutes in that range.
+- Moon: the principal periodic terms of ELP-2000/82 (Meeus, ch. 47).
+  Good to about 0.05 degrees.
+- Rahu/Ketu: mean lunar node.
+- Ascendant: from local sidereal time and obliquity of date.
+- Altitudes of the Sun and Moon for rise/set times (Moon latitude
+  from the principal ELP-2000/82 latitude terms).
+
+All angles are in degrees. Times are Julian days (UT; the difference
+to dynamical time is below this model's precision).
+"""
+
+from datetime import datetime, timezone
+
+import numpy as np
+
+J2000 = 2451545.0
+UNIX_EPOCH_JD = 2440587.5
+
+# Lahiri (Chitrapaksha) ayanamsa at J2000
+AYANAMSA_J2000 = 23.857092
+
+# Column order of longitudes() output - matches the Planet enum
+GRAHAS = ("Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Rahu", "Ketu")
+
+# Keplerian elements at J2000 and rates per Julian century:
+# a (AU), e, I, L, long. perihelion, long. ascending node
+_BODIES = ("Mercury", "Venus", "EMB", "Mars", "Jupiter", "Saturn")
+_ELEMENTS = np.array([
+    [0.38709927, 0.20563593, 7.00497902, 252.25032350, 77.45779628, 48.33076593],
+    [0.72333566, 0.00677672, 3.39467605, 181.97909950, 131.60246718, 76.67984255],
+    [1.00000261, 0.01671123, -0.00001531, 100.46457166, 102.93768193, 0.0],
+    [1.52371034, 0.09339410, 1.84969142, -4.55343205, -23.94362959, 49.55953891],
+    [5.20288700, 0.04838624, 1.30439695, 34.39644051, 14.72847983, 100.47390909],
+    [9.53667594, 0.05386179, 2.48599187, 49.95424423, 92.59887831, 113.66242448],
+])
+_RATES = np.array([
+    [0.00000037, 0.00001906, -0.00594749, 149472.67411175, 0.16047689, -0.12534081],
+    [0.00000390, -0.00004107, -0.00078890, 58517.81538729, 0.00268329, -0.27769418],
+    [0.00000562, -0.00004392, -0.01294668, 35999.37244981, 0.32327364, 0.0],
+    [0.00001847, 0.00007882, -0.00813131, 19140.30268499, 0.44441088, -0.29257343],
+    [-0.00011607, -0.00013253, -0.00183714, 3034.74612775, 0.21252668, 0.20469106],
+    [-0.00125060, -0.00050991, 0.00193609, 1222.49362201, -0.41897216, -0.28867794],
+])
+
+# Moon longitude terms: multiples of D, M, M', F and amplitude (1e-6 deg)
+_MOON_TERMS = np.array([
+    [0, 0, 1, 0, 6288774], [2, 0, -1, 0, 1274027], [2, 0, 0, 0, 658314],
+    [0, 0, 2, 0, 213618], [0, 1, 0, 0, -185116], [0, 0, 0, 2, -114332],
+    [2, 0, -2, 0, 58793], [2, -1, -1, 0, 57066], [2, 0, 1, 0, 53322],
+    [2, -1, 0, 0, 45758], [0, 1, -1, 0, -40923], [1, 0, 0, 0, -34720],
+    [0, 1, 1, 0, -30383], [2, 0, 0, -2, 15327], [0, 0, 1, 2, -12528],
+    [0, 0, 1, -2, 10980], [4, 0, -1, 0, 10675], [0, 0, 3, 0, 10034],
+    [4, 0, -2, 0, 8548], [2, 1, -1, 0, -7888], [2, 1, 0, 0, -6766],
+    [1, 0, -1, 0, -5163], [1, 1, 0, 0, 4987], [2, -1, 1, 0, 4036],
+    [2, 0, 2, 0, 3994], [4, 0, 0, 0, 3861], [2, 0, -3, 0, 3665],
+    [0, 1, -2, 0, -2689], [2, 0, -1, 2, -2602], [2, -1, -2, 0, 2390],
+    [1, 0, 1, 0, -2348], [2, -2, 0, 0, 2236], [0, 1, 2, 0, -2120],
+    [0, 2, 0, 0, -2069],
+], dtype=float)
+_MOON_ARGS = _MOON_TERMS[:, :4]
+_MOON_AMPLITUDES = _MOON_TERMS[:, 4] * 1e-6
+_MOON_E_POWER = np.abs(_MOON_TERMS[:, 1])
+
+# Moon latitude terms, same layout
+_MOON_LAT_TERMS = np.array([
+    [0, 0, 0, 1, 5128122], [0, 0, 1, 1, 280602], [0, 0, 1, -1, 277693],
+    [2, 0, 0, -1, 173237], [2, 0, -1, 1, 55413], [2, 0, -1, -1, 46271],
+    [2, 0, 0, 1, 32573], [0, 0, 2, 1, 17198], [2, 0, 1, -1, 9266],
+    [0, 0, 2, -1, 8822], [2, -1, 0, -1, 8216], [2, 0, -2, -1, 4324],
+    [2, 0, 1, 1, 4200],
+], dtype=float)
+_MOON_LAT_ARGS = _MOON_LAT_TERMS[:, :4]
+_MOON_LAT_AMPLITUDES = _MOON_LAT_TERMS[:, 4] * 1e-6
+_MOON_LAT_E_POWER = np.abs(_MOON_LAT_TERMS[:, 1])
+
+# Half-interval (days) for finite-difference speeds
+_SPEED_STEP = 0.25
+
+
+def julian_day(moment: datetime) -> float:
+    """Julian day of a datetime (naive values are taken as UTC)."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return UNIX_EPOCH_JD + moment.timestamp() / 86400.0
+
+
+def wrap(degrees):
+    """Normalize angles to [0, 360)."""
+    return np.mod(degrees, 360.0)
+
+
+def _centuries(jd):
+    return (np.asarray(jd, dtype=float) - J2000) / 36525.0
+
+
+def general_precession(t):
+    """Precession in longitude since J2000 for centuries t."""
+    return (5029.0966 * t + 1.11113 * t * t) / 3600.0
+
+
+def lahiri_ayanamsa(jd):
+    """Lahiri ayanamsa for Julian days."""
+    return AYANAMSA_J2000 + general_precession(_centuries(jd))
+
+
+def _heliocentric(t):
+    """Heliocentric ecliptic J2000 coordinates, shape (n, bodies, 3)."""
+    elements = _ELEMENTS + _RATES * t[:, None, None]
+    a, e = elements[..., 0], elements[..., 1]
+    incl, mean_long, peri, node = np.radians(elements[..., 2:]).transpose(2, 0, 1)
+
+    mean_anomaly = np.mod(mean_long - peri + np.pi, 2 * np.pi) - np.pi
+    ecc_anomaly = mean_anomaly + e * np.sin(mean_anomaly)
+    for _ in range(6):
+        ecc_anomaly -= (
+            (ecc_anomaly - e * np.sin(ecc_anomaly) - mean_anomaly)
+            / (1 - e * np.cos(ecc_anomaly))
+        )
+
+    x_orb = a * (np.cos(ecc_anomaly) - e)
+    y_orb = a * np.sqrt(1 - e * e) * np.sin(ecc_anomaly)
+
+    arg_peri = peri - node
+    cw, sw = np.cos(arg_peri), np.sin(arg_peri)
+    cn, sn = np.cos(node), np.sin(node)
+    ci, si = np.cos(incl), np.sin(incl)
+
+    x = (cw * cn - sw * sn * ci) * x_orb + (-sw * cn - cw * sn * ci) * y_orb
+    y = (cw * sn + sw * cn * ci) * x_orb + (-sw * sn + cw * cn * ci) * y_orb
+    z = (sw * si) * x_orb + (cw * si) * y_orb
+    return np.stack([x, y, z], axis=-1)
+
+
+def _moon_arguments(t):
+    """Moon's mean longitude, fundamental arguments (radians) and eccentricity factor."""
+    t2, t3, t4 = t * t, t ** 3, t ** 4
+    mean_long = 218.3164477 + 481267.88123421 * t - 0.0015786 * t2 + t3 / 538841 - t4 / 65194000
+    d = 297.8501921 + 445267.1114034 * t - 0.0018819 * t2 + t3 / 545868 - t4 / 113065000
+    m = 357.5291092 + 35999.0502909 * t - 0.0001536 * t2 + t3 / 24490000
+    mp = 134.9633964 + 477198.8675055 * t + 0.0087414 * t2 + t3 / 69699 - t4 / 14712000
+    f = 93.2720950 + 483202.0175233 * t - 0.0036539 * t2 - t3 / 3526000 + t4 / 863310000
+    ecc = 1 - 0.002516 * t - 0.0000074 * t2
+    return mean_long, np.radians(np.stack([d, m, mp, f], axis=-1)), ecc
+
+
+def _moon_tropical(t):
+    """Moon's longitude (mean equinox of date)."""
+    mean_long, fundamentals, ecc = _moon_arguments(t)
+    f = np.degrees(fundamentals[:, 3])
+
+    angles = fundamentals @ _MOON_ARGS.T
+    amplitudes = _MOON_AMPLITUDES * ecc[:, None] ** _MOON_E_POWER
+    periodic = (amplitudes * np.sin(angles)).sum(axis=1)
+
+    a1 = np.radians(119.75 + 131.849 * t)
+    a2 = np.radians(53.09 + 479264.290 * t)
+    periodic += (
+        3958 * np.sin(a1)
+        + 1962 * np.sin(np.radians(mean_long - f))
+        + 318 * np.sin(a2)
+    ) * 1e-6
+
+    return mean_long + periodic
+
+
+def _moon_latitude(t):
+    """Moon's ecliptic latitude."""
+    mean_long, fundamentals, ecc = _moon_arguments(t)
+    l_rad = np.radians(mean_long)
+    mp, f = fundamentals[:, 2], fundamentals[:, 3]
+
+    angles = fundamentals @ _MOON_LAT_ARGS.T
+    amplitudes = _MOON_LAT_AMPLITUDES * ecc[:, None] ** _MOON_LAT_E_POWER
+    periodic = (amplitudes * np.sin(angles)).sum(axis=1)
+
+    a1 = np.radians(119.75 + 131.849 * t)
+    a3 = np.radians(313.45 + 481266.484 * t)
+    periodic += (
+        -2235 * np.sin(l_rad) + 382 * np.sin(a3)
+        + 175 * np.sin(a1 - f) + 175 * np.sin(a1 + f)
+        + 127 * np.sin(l_rad - mp) - 115 * np.sin(l_rad + mp)
+    ) * 1e-6
+
+    return periodic
+
+
+def _mean_node_tropical(t):
+    """Mean ascending lunar node (mean equinox of date)."""
+    return (125.0445479 - 1934.1362891 * t + 0.0020754 * t * t
+            + t ** 3 / 467441 - t ** 4 / 60616000)
+
+
+def longitudes(jd) -> np.ndarray:
+    """
+    Sidereal longitudes of the nine grahas.
+
+    Args:
+        jd: Julian days, shape (n,)
+
+    Returns:
+        Array of shape (n, 9), columns in GRAHAS order
+    """
+    t = np.atleast_1d(_centuries(jd))
+    precession = general_precession(t)
+    ayanamsa = AYANAMSA_J2000 + precession
+
+    helio = _heliocentric(t)
+    earth = helio[:, _BODIES.index("EMB")]
+    geo = helio - earth[:, None, :]
+    geo[:, _BODIES.index("EMB")] = -earth  # Sun as seen from Earth
+    # Planets are J2000-ecliptic: sidereal = J2000 longitude - ayanamsa at J2000
+    body_long = np.degrees(np.arctan2(geo[..., 1], geo[..., 0])) - AYANAMSA_J2000
+
+    rahu = _mean_node_tropical(t) - ayanamsa
+    out = np.empty((t.shape[0], len(GRAHAS)))
+    out[:, 0] = body_long[:, _BODIES.index("EMB")]
+    out[:, 1] = _moon_tropical(t) - ayanamsa
+    out[:, 2] = body_long[:, _BODIES.index("Mars")]
+    out[:, 3] = body_long[:, _BODIES.index("Mercury")]
+    out[:, 4] = body_long[:, _BODIES.index("Jupiter")]
+    out[:, 5] = body_long[:, _BODIES.index("Venus")]
+    out[:, 6] = body_long[:, _BODIES.index("Saturn")]
+    out[:, 7] = rahu
+    out[:, 8] = rahu + 180.0
+    return wrap(out)
+
+
+def speeds(jd) -> np.ndarray:
+    """
+    Daily motion of the nine grahas (negative when retrograde).
+
+    Returns:
+        Array of shape (n, 9) in degrees per day
+    """
+    jd = np.atleast_1d(np.asarray(jd, dtype=float))
+    both = longitudes(np.concatenate([jd - _SPEED_STEP, jd + _SPEED_STEP]))
+    before, after = both[:jd.shape[0]], both[jd.shape[0]:]
+    return (np.mod(after - before + 180.0, 360.0) - 180.0) / (2 * _SPEED_STEP)
+
+
+def sidereal_time(jd):
+    """Greenwich mean sidereal time in degrees."""
+    jd = np.asarray(jd, dtype=float)
+    t = _centuries(jd)
+    return (280.46061837 + 360.98564736629 * (jd - J2000)
+            + 0.000387933 * t * t - t ** 3 / 38710000)
+
+
+def _obliquity(t):
+    """Mean obliquity of the ecliptic in radians."""
+    return np.radians(23.4392911 - 0.0130042 * t)
+
+
+def ascendants(jd, latitude, longitude) -> np.ndarray:
+    """
+    Sidereal ascendant (lagna) longitudes.
+
+    Args:
+        jd: Julian days (UT), shape (n,)
+        latitude: Geographic latitudes, north positive
+        longitude: Geographic longitudes, east positive
+
+    Returns:
+        Array of shape (n,)
+    """
+    jd = np.atleast_1d(np.asarray(jd, dtype=float))
+    ramc = np.radians(sidereal_time(jd) + np.asarray(longitude, dtype=float))
+    obliquity = _obliquity(_centuries(jd))
+    phi = np.radians(np.asarray(latitude, dtype=float))
+
+    tropical = np.degrees(np.arctan2(
+        np.cos(ramc),
+        -(np.sin(ramc) * np.cos(obliquity) + np.tan(phi) * np.sin(obliquity)),
+    ))
+    return wrap(tropical - lahiri_ayanamsa(jd))
+
+
+def sun_moon(jd) -> np.ndarray:
+    """
+    Sidereal longitudes of the Sun and Moon only (cheaper than longitudes()).
+
+    Returns:
+        Array of shape (n, 2)
+    """
+    t = np.atleast_1d(_centuries(jd))
+    earth = _heliocentric(t)[:, _BODIES.index("EMB")]
+    sun = np.degrees(np.arctan2(-earth[:, 1], -earth[:, 0])) - AYANAMSA_J2000
+    moon = _moon_tropical(t) - AYANAMSA_J2000 - general_precession(t)
+    return wrap(np.stack([sun, moon], axis=-1))
+
+
+def altitudes(jd, latitude, longitude, body: str = "Sun") -> np.ndarray:
+    """
+    Geometric altitude of the Sun or Moon above the horizon.
+
+    Args:
+        jd: Julian days (UT), shape (n,)
+        latitude: Geographic latitude, north positive
+        longitude: Geographic longitude, east positive
+        body: "Sun" or "Moon"
+
+    Returns:
+        Altitudes in degrees, shape (n,)
+    """
+    jd = np.atleast_1d(np.asarray(jd, dtype=float))
+    t = _centuries(jd)
+    column = ("Sun", "Moon").index(body)
+    tropical = np.radians(sun_moon(jd)[:, column] + lahiri_ayanamsa(jd))
+    beta = np.radians(_moon_latitude(t)) if body == "Moon" else np.zeros_like(t)
+
+    eps = _obliquity(t)
+    ra = np.arctan2(
+        np.sin(tropical) * np.cos(eps) - np.tan(beta) * np.sin(eps),
+        np.cos(tropical),
+    )
+    dec = np.arcsin(
+        np.sin(beta) * np.cos(eps) + np.cos(beta) * np.sin(eps) * np.sin(tropical)
+    )
+
+    hour_angle = np.radians(sidereal_time(jd) + float(longitude)) - ra
+    phi = np.radians(float(latitude))
+    return np.degrees(np.arcsin(
+        np.sin(phi) * np.sin(dec) + np.cos(phi) * np.cos(dec) * np.cos(hour_angle)
+    ))
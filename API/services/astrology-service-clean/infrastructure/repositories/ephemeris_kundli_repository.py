@@ -0,0 +1,292 @@
+"""
+Ephemeris Kundli Repository.
+
+Computes birth charts from planetary positions instead of calling
+an external astrology API. Positions come from the closed-form
+ephemeris in `ephemeris`, evaluated for whole batches of charts at
+once; houses use the whole-sign system.
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from datetime import datetime, timezone
+from typing import Callable, List, Optional, Sequence
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from domain.repositories import KundliRepository
+from domain.entities import (
+    Kundli, BirthDetails, PlanetPosition, House,
+    ZodiacSign, Planet, Dosha, DoshaType
+)
+from domain.entities.zodiac import NAKSHATRAS
+from application import ashtakoot
+from . import ephemeris
+
+
+NAKSHATRA_SPAN = 360.0 / 27
+PADA_SPAN = NAKSHATRA_SPAN / 4
+
+# Signs of exaltation; debilitation is the opposite sign
+EXALTATION = {
+    Planet.SUN: ZodiacSign.ARIES,
+    Planet.MOON: ZodiacSign.TAURUS,
+    Planet.MARS: ZodiacSign.CAPRICORN,
+    Planet.MERCURY: ZodiacSign.VIRGO,
+    Planet.JUPITER: ZodiacSign.CANCER,
+    Planet.VENUS: ZodiacSign.PISCES,
+    Planet.SATURN: ZodiacSign.LIBRA,
+    Planet.RAHU: ZodiacSign.TAURUS,
+    Planet.KETU: ZodiacSign.SCORPIO,
+}
+
+# Combustion orbs from the Sun: (direct, retrograde)
+COMBUSTION_ORB = {
+    Planet.MOON: (12.0, 12.0),
+    Planet.MARS: (17.0, 17.0),
+    Planet.MERCURY: (14.0, 12.0),
+    Planet.JUPITER: (11.0, 11.0),
+    Planet.VENUS: (10.0, 8.0),
+    Planet.SATURN: (15.0, 15.0),
+}
+
+MANGLIK_HOUSES = (1, 4, 7, 8, 12)
+
+_SIGNS = list(ZodiacSign)
+_PLANETS = list(Planet)
+
+
+def _sign(longitude: float) -> ZodiacSign:
+    return _SIGNS[int(longitude // 30) % 12]
+
+
+def _nakshatra(longitude: float):
+    """Get (nakshatra name, pada) for a sidereal longitude."""
+    index = int(longitude // NAKSHATRA_SPAN) % 27
+    pada = int((longitude % NAKSHATRA_SPAN) // PADA_SPAN) + 1
+    return NAKSHATRAS[index][0], pada
+
+
+def _separation(a: float, b: float) -> float:
+    """Smallest angle between two longitudes."""
+    diff = abs(a - b) % 360.0
+    return min(diff, 360.0 - diff)
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _build_kundlis(births: Sequence[BirthDetails], now: datetime) -> List[Kundli]:
+    """Compute kundlis in a worker process (module-level so it pickles)."""
+    return EphemerisKundliRepository(now=lambda: now).build_kundlis(births)
+
+
+class EphemerisKundliRepository(KundliRepository):
+    """
+    Kundli repository computing charts from an ephemeris.
+
+    build_kundli/build_kundlis are pure and synchronous. Given an
+    executor (e.g. a process pool), async generation runs them there
+    instead of on the event loop.
+    """
+
+    def __init__(
+        self,
+        now: Callable[[], datetime] = _utc_now,
+        executor: Optional[Executor] = None
+    ):
+        self._now = now
+        self._executor = executor
+
+    async def generate_kundli(
+        self,
+        birth_details: BirthDetails
+    ) -> Optional[Kundli]:
+        """Compute kundli from birth details."""
+        kundlis = await self.generate_kundlis([birth_details])
+        return kundlis[0]
+
+    async def generate_kundlis(
+        self,
+        births: Sequence[BirthDetails]
+    ) -> List[Optional[Kundli]]:
+        """Compute several kundlis in one vectorized batch."""
+        if self._executor is None:
+            return self.build_kundlis(births)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, _build_kundlis, list(births), self._now()
+        )
+
+    def build_kundli(self, birth_details: BirthDetails) -> Kundli:
+        """Compute one kundli."""
+        return self.build_kundlis([birth_details])[0]
+
+    def build_kundlis(self, births: Sequence[BirthDetails]) -> List[Kundli]:
+        """
+        Compute many kundlis with one vectorized ephemeris evaluation.
+
+        Args:
+            births: Birth details
+
+        Returns:
+            Kundlis in the same order
+        """
+        if not births:
+            return []
+
+        jd = np.array([ephemeris.julian_day(self._utc(b)) for b in births])
+        lat = np.array([b.latitude for b in births])
+        lon = np.array([b.longitude for b in births])
+
+        longitudes = ephemeris.longitudes(jd)
+        speeds = ephemeris.speeds(jd)
+        lagnas = ephemeris.ascendants(jd, lat, lon)
+
+        return [
+            self._to_kundli(birth, longitudes[i].tolist(), speeds[i].tolist(), float(lagnas[i]))
+            for i, birth in enumerate(births)
+        ]
+
+    async def get_doshas(
+        self,
+        kundli: Kundli
+    ) -> List[Dosha]:
+        """Analyze doshas from planet positions."""
+        doshas = []
+
+        # Manglik: Mars in 1, 4, 7, 8 or 12 from lagna
+        mars = kundli.get_planet_position(Planet.MARS)
+        is_manglik = mars is not None and mars.house in MANGLIK_HOUSES
+        doshas.append(Dosha(
+            dosha_type=DoshaType.MANGLIK,
+            is_present=is_manglik,
+            severity="Moderate" if is_manglik else "None",
+            description=(f"Mars in house {mars.house}" if is_manglik
+                         else "No Manglik dosha"),
+            remedies=["Kumbh Vivah", "Hanuman Chalisa recitation"] if is_manglik else []
+        ))
+
+        # Kaal Sarp: all seven planets on one side of the Rahu-Ketu axis
+        is_kaal_sarp = self._is_kaal_sarp(kundli)
+        doshas.append(Dosha(
+            dosha_type=DoshaType.KAAL_SARP,
+            is_present=is_kaal_sarp,
+            severity="Severe" if is_kaal_sarp else "None",
+            description="All planets between Rahu-Ketu" if is_kaal_sarp else "No Kaal Sarp dosha",
+            remedies=["Rahu-Ketu shanti puja", "Visit Trimbakeshwar"] if is_kaal_sarp else []
+        ))
+
+        # Sade Sati: transiting Saturn in the 12th, 1st or 2nd from the Moon
+        saturn_now = ephemeris.longitudes([ephemeris.julian_day(self._now())])[0, 6]
+        offset = (_sign(saturn_now).number - kundli.moon_sign.number) % 12
+        is_sade_sati = offset in (11, 0, 1)
+        doshas.append(Dosha(
+            dosha_type=DoshaType.SADE_SATI,
+            is_present=is_sade_sati,
+            severity="Mild" if is_sade_sati else "None",
+            description="Saturn transiting Moon sign" if is_sade_sati else "Not in Sade Sati period",
+            remedies=["Shani puja on Saturdays", "Donate black items"] if is_sade_sati else []
+        ))
+
+        return doshas
+
+    async def match_kundlis(
+        self,
+        kundli1: Kundli,
+        kundli2: Kundli
+    ) -> dict:
+        """Ashtakoot matching of Moon positions (kundli1 is the groom)."""
+        return ashtakoot.match_details(
+            ashtakoot.nakshatra_index(kundli1.moon_nakshatra),
+            ashtakoot.sign_index(kundli1.moon_sign),
+            ashtakoot.nakshatra_index(kundli2.moon_nakshatra),
+            ashtakoot.sign_index(kundli2.moon_sign),
+        )
+
+    def _utc(self, birth: BirthDetails) -> datetime:
+        """Birth moment in UTC (naive birth times are in the birth timezone)."""
+        moment = birth.date_time
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=ZoneInfo(birth.timezone))
+        return moment.astimezone(timezone.utc)
+
+    def _local_now(self, birth: BirthDetails) -> datetime:
+        """Current time as naive wall time in the birth timezone."""
+        return self._now().astimezone(ZoneInfo(birth.timezone)).replace(tzinfo=None)
+
+    def _to_kundli(
+        self,
+        birth: BirthDetails,
+        longitudes: List[float],
+        speeds: List[float],
+        lagna_longitude: float
+    ) -> Kundli:
+        """Build the kundli entity for one chart."""
+        lagna = _sign(lagna_longitude)
+        sun_longitude = longitudes[0]
+
+        planets = []
+        for planet, longitude, speed in zip(_PLANETS, longitudes, speeds):
+            sign = _sign(longitude)
+            nakshatra, pada = _nakshatra(longitude)
+            retrograde = speed < 0
+            orb = COMBUSTION_ORB.get(planet)
+
+            planets.append(PlanetPosition(
+                planet=planet,
+                sign=sign,
+                house=(sign.number - lagna.number) % 12 + 1,
+                degree=round(longitude % 30, 4),
+                nakshatra=nakshatra,
+                nakshatra_pada=pada,
+                is_retrograde=retrograde,
+                is_combust=(orb is not None and
+                            _separation(longitude, sun_longitude) < orb[retrograde]),
+                is_exalted=sign == EXALTATION[planet],
+                is_debilitated=sign.number == (EXALTATION[planet].number + 5) % 12 + 1,
+            ))
+
+        houses = [
+            House(
+                number=i + 1,
+                sign=_SIGNS[(lagna.number - 1 + i) % 12],
+                degree=0.0,
+                planets=[p.planet for p in planets if p.house == i + 1]
+            )
+            for i in range(12)
+        ]
+
+        moon = planets[_PLANETS.index(Planet.MOON)]
+        lagna_nakshatra, _ = _nakshatra(lagna_longitude)
+
+        kundli = Kundli(
+            birth_details=birth,
+            lagna=lagna,
+            lagna_degree=round(lagna_longitude % 30, 4),
+            lagna_nakshatra=lagna_nakshatra,
+            moon_sign=moon.sign,
+            moon_nakshatra=moon.nakshatra,
+            moon_nakshatra_pada=moon.nakshatra_pada,
+            sun_sign=_sign(sun_longitude),
+            planets=planets,
+            houses=houses,
+        )
+        kundli.update_current_dasha(self._local_now(birth))
+        return kundli
+
+    def _is_kaal_sarp(self, kundli: Kundli) -> bool:
+        """Check if all seven planets lie within one Rahu-Ketu half."""
+        rahu = kundli.get_planet_position(Planet.RAHU)
+        if rahu is None:
+            return False
+
+        offsets = [
+            (p.absolute_degree - rahu.absolute_degree) % 360.0
+            for p in kundli.planets
+            if p.planet not in (Planet.RAHU, Planet.KETU)
+        ]
+        return all(o < 180.0 for o in offsets) or all(o > 180.0 for o in offsets)
@@ -0,0 +1,473 @@
+"""
+Ephemeris Panchang Repository.
+
+Computes the panchang from Sun and Moon positions. Sunrise, sunset,
+moonrise and moonset come from altitude crossings at the location;
+tithi, nakshatra, yoga and karana are taken at sunrise and their end
+times found by solving for the next boundary of the underlying angle.
+Rahu Kaal, Yamaganda, Gulika and Abhijit are fractions of the actual
+day length.
+
+Days are computed a range at a time on a RangeTimeline, so each limb
+boundary is solved once and shared by every day it ends.
+"""
+
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import Executor
+from dataclasses import replace
+from datetime import date, time, timedelta
+from typing import Awaitable, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from domain.repositories import PanchangRepository
+from domain.entities import (
+    Panchang, Tithi, TithiPaksha, Yoga, Karana, Muhurta, MuhuratRule, MuhuratWindow
+)
+from domain.entities.muhurat import MUHURAT_RULES
+from domain.entities.panchang import (
+    TITHIS, PURNIMA, AMAVASYA, INAUSPICIOUS_TITHIS,
+    YOGAS, KARANAS, VARAS, HINDU_MONTHS
+)
+from domain.entities.zodiac import NAKSHATRAS
+from . import ephemeris
+from .festival_calendar import FestivalCalendar, build_festival_calendar
+from .muhurat_search import find_muhurats
+from .panchang_timeline import (
+    MONTH_KARANAS, NAKSHATRA_SPAN, RAHU_KAAL_PART, YAMAGANDA_PART, GULIKA_PART,
+    RangeTimeline, _karana_number, local_datetime
+)
+
+
+# Location for month-level queries that don't take one
+DEFAULT_CITY = ("Delhi", 28.6139, 77.2090)
+
+# Festival years kept computed
+FESTIVAL_YEARS_CACHED = 8
+
+CacheKey = Tuple[date, float, float]
+
+
+def _build_range(
+    timezone_name: str,
+    start: date,
+    end: date,
+    city: str,
+    latitude: float,
+    longitude: float
+) -> List[Optional[Panchang]]:
+    """Compute a range in a worker process (module-level so it pickles)."""
+    return EphemerisPanchangRepository(timezone_name).build_range(
+        start, end, city, latitude, longitude
+    )
+
+
+def _months(start: date, end: date) -> List[Tuple[date, date]]:
+    """Split an inclusive date range at calendar month boundaries."""
+    chunks = []
+    while start <= end:
+        next_month = (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+        chunks.append((start, min(end, next_month - timedelta(days=1))))
+        start = next_month
+    return chunks
+
+
+class EphemerisPanchangRepository(PanchangRepository):
+    """
+    Panchang repository computing each day from the ephemeris.
+
+    Days are cached per (date, lat/lon rounded to 0.01 degrees) - about
+    a kilometre, which moves sunrise by a few seconds - so each popular
+    city is computed once a day. Given an executor (e.g. a process
+    pool), ranges are computed there one calendar month per task.
+    Festivals are computed a year at a time and kept indexed.
+    """
+
+    def __init__(
+        self,
+        timezone_name: str = "Asia/Kolkata",
+        max_entries: int = 4096,
+        executor: Optional[Executor] = None
+    ):
+        self._timezone_name = timezone_name
+        self._tz = ZoneInfo(timezone_name)
+        self._max_entries = max_entries
+        self._executor = executor
+        self._cache: "OrderedDict[CacheKey, Optional[Panchang]]" = OrderedDict()
+        self._festival_years: "OrderedDict[int, FestivalCalendar]" = OrderedDict()
+
+    async def get_panchang(
+        self,
+        target_date: date,
+        city: str,
+        latitude: float,
+        longitude: float
+    ) -> Optional[Panchang]:
+        """Get panchang, computing it on a cache miss."""
+        key = (target_date, round(latitude, 2), round(longitude, 2))
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            panchang = self._cache[key]
+        else:
+            panchang = self.build_panchang(target_date, city, key[1], key[2])
+            self._store(key, panchang)
+
+        return self._located(panchang, city, latitude, longitude)
+
+    async def get_panchang_range(
+        self,
+        start_date: date,
+        end_date: date,
+        city: str,
+        latitude: float,
+        longitude: float
+    ) -> List[Optional[Panchang]]:
+        """Get panchang for each day, computing uncached months in parallel."""
+        lat, lon = round(latitude, 2), round(longitude, 2)
+        months: List[List[Optional[Panchang]]] = []
+        missing: List[Tuple[int, date, date]] = []
+        for first, last in _months(start_date, end_date):
+            keys = [(first + timedelta(days=i), lat, lon) for i in range((last - first).days + 1)]
+            if all(key in self._cache for key in keys):
+                months.append([self._cache[key] for key in keys])
+            else:
+                missing.append((len(months), first, last))
+                months.append([])
+
+        computed = await asyncio.gather(*[
+            self._compute_range(first, last, city, lat, lon) for _, first, last in missing
+        ])
+        for (slot, first, _), days in zip(missing, computed):
+            months[slot] = days
+            for offset, panchang in enumerate(days):
+                self._store((first + timedelta(days=offset), lat, lon), panchang)
+
+        return [
+            self._located(panchang, city, latitude, longitude)
+            for days in months for panchang in days
+        ]
+
+    async def get_festivals(
+        self,
+        month: int,
+        year: int
+    ) -> List[dict]:
+        """Get festivals for a month (at the default city)."""
+        first = date(year, month, 1)
+        last = (first.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+        return [entry.to_dict() for entry in self.festival_calendar(year).between(first, last)]
+
+    async def get_next_festival(
+        self,
+        name: str,
+        after: date
+    ) -> Optional[dict]:
+        """Get the first occurrence of a festival after a date."""
+        for year in (after.year, after.year + 1):
+            entry = self.festival_calendar(year).next(name, after)
+            if entry is not None:
+                return entry.to_dict()
+        return None
+
+    def festival_calendar(self, year: int) -> FestivalCalendar:
+        """Festivals of a year, computed once and kept for later queries."""
+        if year in self._festival_years:
+            self._festival_years.move_to_end(year)
+            return self._festival_years[year]
+
+        _, latitude, longitude = DEFAULT_CITY
+        calendar = build_festival_calendar(year, self._tz, latitude, longitude)
+        self._festival_years[year] = calendar
+        if len(self._festival_years) > FESTIVAL_YEARS_CACHED:
+            self._festival_years.popitem(last=False)
+        return calendar
+
+    async def get_auspicious_dates(
+        self,
+        purpose: str,
+        start_date: date,
+        end_date: date
+    ) -> List[date]:
+        """
+        Get days with a muhurat for the purpose (at the default city).
+
+        Purposes without a rule table fall back to days whose tithi,
+        yoga and karana at sunrise are all auspicious.
+        """
+        city, latitude, longitude = DEFAULT_CITY
+        rule = MUHURAT_RULES.get(purpose)
+        if rule is not None:
+            windows = await self.find_muhurats(rule, start_date, end_date, latitude, longitude)
+            return sorted({window.start.date() for window in windows})
+
+        dates = []
+        day = start_date
+        while day <= end_date:
+            panchang = await self.get_panchang(day, city, latitude, longitude)
+            if panchang is not None and panchang.is_auspicious_day:
+                dates.append(day)
+            day += timedelta(days=1)
+        return dates
+
+    async def find_muhurats(
+        self,
+        rule: MuhuratRule,
+        start_date: date,
+        end_date: date,
+        latitude: float,
+        longitude: float
+    ) -> List[MuhuratWindow]:
+        """Find ranked windows, following limbs and lagna through each day."""
+        return find_muhurats(rule, start_date, end_date, self._tz, latitude, longitude)
+
+    def build_panchang(
+        self,
+        target_date: date,
+        city: str,
+        latitude: float,
+        longitude: float
+    ) -> Optional[Panchang]:
+        """
+        Compute the panchang for one local day.
+
+        Returns:
+            Panchang, or None where the Sun doesn't rise or set that day
+        """
+        return self.build_range(target_date, target_date, city, latitude, longitude)[0]
+
+    def build_range(
+        self,
+        start: date,
+        end: date,
+        city: str,
+        latitude: float,
+        longitude: float
+    ) -> List[Optional[Panchang]]:
+        """
+        Compute the panchang for each local day of an inclusive range.
+
+        Returns:
+            One entry per day; None where the Sun doesn't rise or set
+        """
+        timeline = RangeTimeline(start, end, self._tz, latitude, longitude)
+        elongation, moon, yoga = timeline.elongation, timeline.moon, timeline.yoga
+        elongations, moons, yogas = timeline.elongations, timeline.moons, timeline.yogas
+        karana_index = (elongation // 6).astype(int)
+        tithi_index = karana_index // 2
+        nakshatra_index = (moon // NAKSHATRA_SPAN).astype(int)
+        yoga_index = (yoga // NAKSHATRA_SPAN).astype(int)
+        new_moon = (elongation // 360.0).astype(int) * MONTH_KARANAS
+
+        tithi_end = elongations.at(2 * (tithi_index + 1))
+        karana_end = elongations.at(karana_index + 1)
+        nakshatra_end = moons.at(nakshatra_index + 1)
+        yoga_end = yogas.at(yoga_index + 1)
+
+        # Amanta months run new moon to new moon and are named for the
+        # Sun's sign at the opening one (Pisces opens Chaitra). With no
+        # sankranti inside, the sign is the same at both ends: adhik month
+        month_bounds = np.stack([
+            elongations.at(new_moon), elongations.at(new_moon + MONTH_KARANAS)
+        ])
+        sun_signs = (ephemeris.sun_moon(month_bounds.ravel())[:, 0] // 30).astype(int)
+        start_sign, end_sign = sun_signs.reshape(month_bounds.shape)
+
+        return [
+            self._to_panchang(
+                day, city, latitude, longitude,
+                sunrise=float(timeline.sunrise[i]), sunset=float(timeline.sunset[i]),
+                moonrise=float(timeline.moonrise[i]), moonset=float(timeline.moonset[i]),
+                tithi=(int(tithi_index[i]) % 30, float(tithi_end[i])),
+                nakshatra=(int(nakshatra_index[i]) % 27, float(nakshatra_end[i])),
+                yoga=(int(yoga_index[i]) % 27, float(yoga_end[i])),
+                karana=(int(karana_index[i]) % 60, float(karana_end[i])),
+                month=(int(start_sign[i]) + 1) % 12,
+                is_adhik=bool(start_sign[i] == end_sign[i])
+            ) if timeline.valid[i] else None
+            for i, day in enumerate(timeline.days)
+        ]
+
+    def _to_panchang(
+        self,
+        target_date: date,
+        city: str,
+        latitude: float,
+        longitude: float,
+        *,
+        sunrise: float,
+        sunset: float,
+        moonrise: float,
+        moonset: float,
+        tithi: Tuple[int, float],
+        nakshatra: Tuple[int, float],
+        yoga: Tuple[int, float],
+        karana: Tuple[int, float],
+        month: int,
+        is_adhik: bool
+    ) -> Panchang:
+        """
+        Build the panchang entity for one day.
+
+        Limbs are (index, end time) pairs; times are Julian days, NaN
+        where the Moon doesn't rise or set.
+        """
+        weekday = target_date.weekday()
+        month_name, month_hindi = HINDU_MONTHS[month]
+        if is_adhik:
+            month_name, month_hindi = f"Adhik {month_name}", f"अधिक {month_hindi}"
+
+        tithi_entity = self._tithi(*tithi)
+        is_ekadashi = tithi_entity.number == 11
+        is_purnima = tithi_entity.number == 15 and tithi_entity.paksha == TithiPaksha.SHUKLA
+        is_amavasya = tithi_entity.number == 15 and tithi_entity.paksha == TithiPaksha.KRISHNA
+
+        festivals = []
+        if is_ekadashi:
+            festivals.append("Ekadashi Vrat")
+        if is_purnima:
+            festivals.append("Purnima")
+        if is_amavasya:
+            festivals.append("Amavasya")
+
+        nakshatra_index, nakshatra_end = nakshatra
+        yoga_index, yoga_end = yoga
+        yoga_name, yoga_hindi, yoga_auspicious = YOGAS[yoga_index]
+        karana_number = _karana_number(karana[0])
+        karana_name, karana_hindi, karana_auspicious = KARANAS[karana_number - 1]
+
+        return Panchang(
+            date=target_date,
+            city=city,
+            latitude=latitude,
+            longitude=longitude,
+            tithi=tithi_entity,
+            nakshatra_name=NAKSHATRAS[nakshatra_index][0],
+            nakshatra_hindi=NAKSHATRAS[nakshatra_index][1],
+            nakshatra_end_time=self._local_time(nakshatra_end),
+            yoga=Yoga(
+                number=yoga_index + 1,
+                name=yoga_name,
+                hindi_name=yoga_hindi,
+                end_time=self._local_time(yoga_end),
+                is_auspicious=yoga_auspicious
+            ),
+            karana=Karana(
+                number=karana_number,
+                name=karana_name,
+                hindi_name=karana_hindi,
+                end_time=self._local_time(karana[1]),
+                is_auspicious=karana_auspicious
+            ),
+            vara=VARAS[weekday][0],
+            vara_hindi=VARAS[weekday][1],
+            sunrise=self._local_time(sunrise),
+            sunset=self._local_time(sunset),
+            moonrise=None if np.isnan(moonrise) else self._local_time(moonrise),
+            moonset=None if np.isnan(moonset) else self._local_time(moonset),
+            hindu_month=month_name,
+            hindu_month_hindi=month_hindi,
+            hindu_year=self._vikram_samvat(target_date, month),
+            abhijit_muhurta=self._abhijit(sunrise, sunset),
+            rahukaal=self._day_part("Rahu Kaal", sunrise, sunset, RAHU_KAAL_PART[weekday]),
+            yamaganda=self._day_part("Yamaganda", sunrise, sunset, YAMAGANDA_PART[weekday]),
+            gulika=self._day_part("Gulika", sunrise, sunset, GULIKA_PART[weekday]),
+            is_ekadashi=is_ekadashi,
+            is_pradosh=tithi_entity.number == 13,
+            is_amavasya=is_amavasya,
+            is_purnima=is_purnima,
+            festivals=festivals
+        )
+
+    def _compute_range(
+        self,
+        start: date,
+        end: date,
+        city: str,
+        latitude: float,
+        longitude: float
+    ) -> Awaitable[List[Optional[Panchang]]]:
+        """Compute a range on the executor, or inline without one."""
+        if self._executor is None:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(self.build_range(start, end, city, latitude, longitude))
+            return future
+
+        return asyncio.get_running_loop().run_in_executor(
+            self._executor, _build_range,
+            self._timezone_name, start, end, city, latitude, longitude
+        )
+
+    def _store(self, key: CacheKey, panchang: Optional[Panchang]) -> None:
+        """Cache a day, evicting the least recently used when full."""
+        self._cache[key] = panchang
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+
+    def _located(
+        self,
+        panchang: Optional[Panchang],
+        city: str,
+        latitude: float,
+        longitude: float
+    ) -> Optional[Panchang]:
+        """Copy of a cached day labelled with the caller's location."""
+        if panchang is None:
+            return None
+        return replace(
+            panchang, city=city, latitude=latitude, longitude=longitude,
+            festivals=list(panchang.festivals)
+        )
+
+    def _tithi(self, index: int, end_jd: float) -> Tithi:
+        """Build the tithi entity for the index-th tithi (0-29) of the month."""
+        number = index % 15 + 1
+        paksha = TithiPaksha.SHUKLA if index < 15 else TithiPaksha.KRISHNA
+        if number < 15:
+            name, hindi_name = TITHIS[number - 1]
+        else:
+            name, hindi_name = PURNIMA if paksha == TithiPaksha.SHUKLA else AMAVASYA
+
+        return Tithi(
+            number=number,
+            name=name,
+            hindi_name=hindi_name,
+            paksha=paksha,
+            end_time=self._local_time(end_jd),
+            is_auspicious=number not in INAUSPICIOUS_TITHIS
+        )
+
+    def _vikram_samvat(self, target_date: date, month_index: int) -> int:
+        """Vikram Samvat year; it starts with Chaitra around March/April."""
+        if target_date.month <= 4 and month_index >= 9:
+            return target_date.year + 56  # Pausha-Phalguna of the previous year
+        return target_date.year + 57
+
+    def _abhijit(self, sunrise: float, sunset: float) -> Muhurta:
+        """Abhijit: the 8th of the day's 15 muhurtas, centred on local noon."""
+        noon = (sunrise + sunset) / 2
+        half = (sunset - sunrise) / 30
+        return Muhurta(
+            name="Abhijit",
+            start_time=self._local_time(noon - half),
+            end_time=self._local_time(noon + half),
+            is_auspicious=True,
+            suitable_for=["Travel", "New ventures", "Important decisions"]
+        )
+
+    def _day_part(self, name: str, sunrise: float, sunset: float, part: int) -> Muhurta:
+        """Inauspicious period occupying one eighth of the day."""
+        eighth = (sunset - sunrise) / 8
+        return Muhurta(
+            name=name,
+            start_time=self._local_time(sunrise + (part - 1) * eighth),
+            end_time=self._local_time(sunrise + part * eighth),
+            is_auspicious=False,
+            suitable_for=[]
+        )
+
+    def _local_time(self, jd: float) -> time:
+        """Local wall time of a Julian day, to the nearest minute."""
+        return local_datetime(jd, self._tz).time()
@@ -0,0 +1,162 @@
+"""
+Festival Calendar.
+
+Derives a year's festivals from the rule tables in one pass over a
+RangeTimeline, and stores them sorted by date with a per-name index,
+so month listings and next-occurrence queries are binary searches.
+"""
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import date, timedelta, tzinfo
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from domain.entities.festival import (
+    FESTIVAL_RULES, LunarFestival, Observance, SolarFestival, festival_key
+)
+from . import ephemeris
+from .panchang_timeline import MONTH_KARANAS, RangeTimeline, _unwrap
+
+# Days computed either side of the year, so festivals whose tithi
+# starts just before 1 January (or is shifted past 31 December) land
+# on the right side of the boundary
+_PAD_DAYS = 3
+
+# Fraction of the daytime, sunrise to sunset, at each observance
+_DAYTIME = {
+    Observance.SUNRISE: 0.0,
+    Observance.MORNING: 0.3,
+    Observance.MIDDAY: 0.5,
+    Observance.AFTERNOON: 0.7,
+    Observance.PRADOSH: 1.0,
+}
+
+
+@dataclass(frozen=True)
+class FestivalEntry:
+    """One dated festival."""
+    date: date
+    name: str
+    hindi_name: str
+    category: str
+
+    def to_dict(self) -> dict:
+        return {
+            "date": self.date.isoformat(),
+            "name": self.name,
+            "name_hindi": self.hindi_name,
+            "category": self.category,
+        }
+
+
+class FestivalCalendar:
+    """
+    Festivals of one year.
+
+    Entries are sorted by date, and indexed by festival key as
+    parallel sorted lists of entries and their dates.
+    """
+
+    def __init__(self, year: int, entries: List[FestivalEntry]):
+        self.year = year
+        self.entries = sorted(entries, key=lambda entry: entry.date)
+        self.dates = [entry.date for entry in self.entries]
+        self._by_name: Dict[str, List[FestivalEntry]] = {}
+        for entry in self.entries:
+            self._by_name.setdefault(festival_key(entry.name), []).append(entry)
+        self._name_dates = {
+            key: [entry.date for entry in entries] for key, entries in self._by_name.items()
+        }
+
+    def between(self, first: date, last: date) -> List[FestivalEntry]:
+        """Festivals from first to last, inclusive."""
+        return self.entries[bisect_left(self.dates, first):bisect_right(self.dates, last)]
+
+    def next(self, name: str, after: date) -> Optional[FestivalEntry]:
+        """First occurrence of a festival strictly after a date."""
+        key = festival_key(name)
+        if key not in self._by_name:
+            return None
+        index = bisect_right(self._name_dates[key], after)
+        entries = self._by_name[key]
+        return entries[index] if index < len(entries) else None
+
+
+def build_festival_calendar(
+    year: int,
+    tz: tzinfo,
+    latitude: float,
+    longitude: float
+) -> FestivalCalendar:
+    """Compute every festival of a Gregorian year at a location."""
+    start = date(year, 1, 1) - timedelta(days=_PAD_DAYS)
+    end = date(year, 12, 31) + timedelta(days=_PAD_DAYS)
+    # One extra day: midnight observances need the following sunrise
+    timeline = RangeTimeline(start, end + timedelta(days=1), tz, latitude, longitude,
+                             with_moon=False)
+    days = timeline.days[:-1]
+    sunrise, sunset = timeline.sunrise[:-1], timeline.sunset[:-1]
+
+    # Tithi (unwrapped: 30 per lunar month) prevailing at each observance
+    moments = {
+        observance: sunrise + fraction * (sunset - sunrise)
+        for observance, fraction in _DAYTIME.items()
+    }
+    moments[Observance.MIDNIGHT] = (sunset + timeline.sunrise[1:]) / 2
+    tithis = {
+        observance: timeline.elongations.index_at(jd) // 2
+        for observance, jd in moments.items()
+    }
+
+    # Amanta months are named for the Sun's sign at the opening new
+    # moon (Pisces opens Chaitra); with no sankranti inside, adhik
+    first_month = int(min(t[0] for t in tithis.values())) // 30
+    last_month = int(max(t[-1] for t in tithis.values())) // 30
+    months = np.arange(first_month, last_month + 1)
+    new_moons = timeline.elongations.at(np.arange(first_month, last_month + 2) * MONTH_KARANAS)
+    signs = (ephemeris.sun_moon(new_moons)[:, 0] // 30).astype(int)
+    names = (signs[:-1] + 1) % 12
+    regular = signs[:-1] != signs[1:]
+
+    entries = []
+    for rule in FESTIVAL_RULES:
+        if isinstance(rule, SolarFestival):
+            found = _sankrantis(rule, moments[rule.observance])
+        else:
+            found = _lunar(rule, tithis[rule.observance], months, names, regular)
+        for index in found:
+            day = days[index] + timedelta(days=getattr(rule, "offset_days", 0))
+            if day.year == year:
+                entries.append(FestivalEntry(day, rule.name, rule.hindi_name, rule.category))
+
+    return FestivalCalendar(year, entries)
+
+
+def _lunar(
+    rule: LunarFestival,
+    tithis: np.ndarray,
+    months: np.ndarray,
+    names: np.ndarray,
+    regular: np.ndarray
+) -> np.ndarray:
+    """Day indices of a lunar festival: the first day its tithi is reached."""
+    if rule.month is None:
+        chosen = months
+    else:
+        chosen = months[(names == rule.month) & regular]
+    targets = chosen * 30 + rule.tithi - 1
+    found = np.searchsorted(tithis, targets, side="left")
+    # Drop targets reached before the first day or after the last
+    return found[(found > 0) & (found < tithis.shape[0])]
+
+
+def _sankrantis(rule: SolarFestival, moments: np.ndarray) -> np.ndarray:
+    """Day indices of a solar festival: the first day the sign is reached."""
+    sun = _unwrap(ephemeris.sun_moon(moments)[:, 0])
+    target = (rule.sign.number - 1) * 30.0
+    targets = target + 360.0 * np.arange(np.ceil((sun[0] - target) / 360.0),
+                                         np.floor((sun[-1] - target) / 360.0) + 1)
+    found = np.searchsorted(sun, targets, side="left")
+    return found[(found > 0) & (found < sun.shape[0])]
@@ -12,6 +12,7 @@ from domain.repositories import HoroscopeRepository
 from domain.entities import (
     Horoscope, ZodiacSign, HoroscopePeriod, LuckyElements
 )
+from .seeding import stable_seed
 
 
 class MockHoroscopeRepository(HoroscopeRepository):
@@ -53,26 +54,37 @@ class MockHoroscopeRepository(HoroscopeRepository):
         target_date: Optional[date] = None
     ) -> Optional[Horoscope]:
         """Get mock horoscope."""
-        target_date = target_date or date.today()
+        return self.build_horoscope(sign, period, target_date or date.today())
 
+    def build_horoscope(
+        self,
+        sign: ZodiacSign,
+        period: HoroscopePeriod,
+        target_date: date
+    ) -> Horoscope:
+        """
+        Generate the horoscope for a sign, period and date.
+
+        Deterministic: the same inputs give the same horoscope in
+        every process.
+        """
         # Generate deterministic but varied scores based on sign and date
-        seed = hash((sign.number, target_date.toordinal(), period.value))
-        random.seed(seed)
+        rng = random.Random(stable_seed(sign.number, target_date.toordinal(), period.value))
 
         predictions = self.PREDICTIONS.get(period.value, self.PREDICTIONS["daily"])
-        prediction = random.choice(predictions)
+        prediction = rng.choice(predictions)
 
-        love_score = random.randint(50, 95)
-        career_score = random.randint(50, 95)
-        health_score = random.randint(50, 95)
-        finance_score = random.randint(50, 95)
+        love_score = rng.randint(50, 95)
+        career_score = rng.randint(50, 95)
+        health_score = rng.randint(50, 95)
+        finance_score = rng.randint(50, 95)
 
         lucky = LuckyElements(
-            numbers=[random.randint(1, 9) for _ in range(3)],
-            colors=[random.choice(["Red", "Blue", "Green", "Yellow", "Orange", "Purple"])
+            numbers=[rng.randint(1, 9) for _ in range(3)],
+            colors=[rng.choice(["Red", "Blue", "Green", "Yellow", "Orange", "Purple"])
                     for _ in range(2)],
-            time=f"{random.randint(1, 12)}:00 PM - {random.randint(1, 12) + 2}:00 PM",
-            day=random.choice(["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"])
+            time=f"{rng.randint(1, 12)}:00 PM - {rng.randint(1, 12) + 2}:00 PM",
+            day=rng.choice(["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"])
         )
 
         # Compatible signs (same element + 1)
@@ -95,8 +107,8 @@ class MockHoroscopeRepository(HoroscopeRepository):
             career_prediction=f"Career prospects are strong at {career_score}%",
             health_prediction=f"Health remains stable at {health_score}%",
             finance_prediction=f"Financial outlook is at {finance_score}%",
-            mood=random.choice(self.MOODS),
-            health_tip=random.choice(self.HEALTH_TIPS),
+            mood=rng.choice(self.MOODS),
+            health_tip=rng.choice(self.HEALTH_TIPS),
             lucky=lucky,
             compatible_signs=compatible
         )
@@ -107,11 +119,15 @@ class MockHoroscopeRepository(HoroscopeRepository):
         sign2: ZodiacSign
     ) -> dict:
         """Get mock compatibility."""
+        # Seed on the unordered pair so (a, b) and (b, a) agree
+        pair = sorted((sign1.number, sign2.number))
+        rng = random.Random(stable_seed("compatibility", *pair))
+
         # Same element = high compatibility
         if sign1.element == sign2.element:
-            score = random.randint(75, 95)
+            score = rng.randint(75, 95)
         else:
-            score = random.randint(45, 75)
+            score = rng.randint(45, 75)
 
         return {
             "sign1": sign1.english,
@@ -5,7 +5,7 @@ Returns sample birth chart data for testing and development.
 """
 
 import random
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime
 
 from domain.repositories import KundliRepository
@@ -13,6 +13,7 @@ from domain.entities import (
     Kundli, BirthDetails, PlanetPosition, House,
     ZodiacSign, Planet, Dosha, DoshaType
 )
+from .seeding import stable_seed
 
 
 class MockKundliRepository(KundliRepository):
@@ -32,16 +33,24 @@ class MockKundliRepository(KundliRepository):
         birth_details: BirthDetails
     ) -> Optional[Kundli]:
         """Generate mock kundli."""
+        return self.build_kundli(birth_details)
+
+    def build_kundli(self, birth_details: BirthDetails) -> Kundli:
+        """
+        Generate the kundli for birth details.
+
+        Pure and deterministic (no shared random state), so it is
+        safe to run concurrently or in a worker process.
+        """
         # Use birth time to seed random for consistent results
-        seed = hash((birth_details.name, birth_details.date_time.timestamp()))
-        random.seed(seed)
+        rng = self._rng(birth_details.name, *self._moment(birth_details))
 
         signs = list(ZodiacSign)
         planets = list(Planet)
 
         # Generate lagna (ascendant)
-        lagna = random.choice(signs)
-        lagna_nakshatra = random.choice(self.NAKSHATRAS)
+        lagna = rng.choice(signs)
+        lagna_nakshatra = rng.choice(self.NAKSHATRAS)
 
         # Generate planet positions
         planet_positions = []
@@ -53,12 +62,12 @@ class MockKundliRepository(KundliRepository):
                 planet=planet,
                 sign=sign,
                 house=house,
-                degree=random.uniform(0, 30),
-                nakshatra=random.choice(self.NAKSHATRAS),
-                nakshatra_pada=random.randint(1, 4),
-                is_retrograde=random.random() < 0.2,
-                is_exalted=random.random() < 0.1,
-                is_debilitated=random.random() < 0.1
+                degree=rng.uniform(0, 30),
+                nakshatra=rng.choice(self.NAKSHATRAS),
+                nakshatra_pada=rng.randint(1, 4),
+                is_retrograde=rng.random() < 0.2,
+                is_exalted=rng.random() < 0.1,
+                is_debilitated=rng.random() < 0.1
             ))
 
         # Generate houses
@@ -75,39 +84,35 @@ class MockKundliRepository(KundliRepository):
 
         # Moon sign and nakshatra
         moon_pos = next((p for p in planet_positions if p.planet == Planet.MOON), None)
-        moon_sign = moon_pos.sign if moon_pos else random.choice(signs)
-        moon_nakshatra = moon_pos.nakshatra if moon_pos else random.choice(self.NAKSHATRAS)
+        moon_sign = moon_pos.sign if moon_pos else rng.choice(signs)
+        moon_nakshatra = moon_pos.nakshatra if moon_pos else rng.choice(self.NAKSHATRAS)
 
         # Sun sign
         sun_pos = next((p for p in planet_positions if p.planet == Planet.SUN), None)
-        sun_sign = sun_pos.sign if sun_pos else random.choice(signs)
-
-        # Current dasha
-        dasha_planets = ["Sun", "Moon", "Mars", "Rahu", "Jupiter", "Saturn", "Mercury", "Ketu", "Venus"]
-        current_mahadasha = random.choice(dasha_planets)
-        current_antardasha = random.choice(dasha_planets)
+        sun_sign = sun_pos.sign if sun_pos else rng.choice(signs)
 
-        return Kundli(
+        kundli = Kundli(
             birth_details=birth_details,
             lagna=lagna,
-            lagna_degree=random.uniform(0, 30),
+            lagna_degree=rng.uniform(0, 30),
             lagna_nakshatra=lagna_nakshatra,
             moon_sign=moon_sign,
             moon_nakshatra=moon_nakshatra,
-            moon_nakshatra_pada=random.randint(1, 4),
+            moon_nakshatra_pada=rng.randint(1, 4),
             sun_sign=sun_sign,
             planets=planet_positions,
-            houses=houses,
-            current_mahadasha=current_mahadasha,
-            current_antardasha=current_antardasha,
-            mahadasha_end_date=datetime(2030, 1, 1)
+            houses=houses
         )
+        kundli.update_current_dasha(datetime.now())
+        return kundli
 
     async def get_doshas(
         self,
         kundli: Kundli
     ) -> List[Dosha]:
         """Analyze mock doshas."""
+        birth = kundli.birth_details
+        rng = self._rng(birth.name, *self._moment(birth), "doshas")
         doshas = []
 
         # Check Manglik dosha (Mars in 1, 4, 7, 8, 12)
@@ -126,7 +131,7 @@ class MockKundliRepository(KundliRepository):
         # Kaal Sarp dosha (all planets between Rahu-Ketu)
         rahu_pos = next((p for p in kundli.planets if p.planet == Planet.RAHU), None)
         ketu_pos = next((p for p in kundli.planets if p.planet == Planet.KETU), None)
-        is_kaal_sarp = random.random() < 0.15  # 15% chance
+        is_kaal_sarp = rng.random() < 0.15  # 15% chance
 
         doshas.append(Dosha(
             dosha_type=DoshaType.KAAL_SARP,
@@ -137,7 +142,7 @@ class MockKundliRepository(KundliRepository):
         ))
 
         # Sade Sati (Saturn transit over Moon)
-        is_sade_sati = random.random() < 0.22  # ~7.5 years out of 30
+        is_sade_sati = rng.random() < 0.22  # ~7.5 years out of 30
 
         doshas.append(Dosha(
             dosha_type=DoshaType.SADE_SATI,
@@ -172,9 +177,8 @@ class MockKundliRepository(KundliRepository):
 
         for guna in gunas:
             # Random but deterministic score
-            seed = hash((kundli1.birth_details.name, kundli2.birth_details.name, guna["name"]))
-            random.seed(seed)
-            obtained = random.uniform(0, guna["max_points"])
+            rng = self._rng(kundli1.birth_details.name, kundli2.birth_details.name, guna["name"])
+            obtained = rng.uniform(0, guna["max_points"])
             obtained = round(obtained, 1)
             total += obtained
 
@@ -187,7 +191,7 @@ class MockKundliRepository(KundliRepository):
             })
 
         # Nadi dosha check (same nadi = dosha)
-        nadi_dosha = random.random() < 0.33  # 1/3 chance
+        nadi_dosha = rng.random() < 0.33  # 1/3 chance
 
         recommendations = []
         if total < 18:
@@ -206,3 +210,17 @@ class MockKundliRepository(KundliRepository):
             "nadi_dosha": nadi_dosha,
             "recommendations": recommendations
         }
+
+    @staticmethod
+    def _moment(birth: BirthDetails) -> Tuple[str, str]:
+        """
+        Birth moment as seed values: the wall-clock time and its zone.
+
+        Not timestamp(), which reads a naive datetime in the process's
+        TZ and would change the chart from one server to another.
+        """
+        return birth.date_time.isoformat(), birth.timezone
+
+    def _rng(self, *values) -> random.Random:
+        """Create a generator seeded from a stable digest of values."""
+        return random.Random(stable_seed(*values))
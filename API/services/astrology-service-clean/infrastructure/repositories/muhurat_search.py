@@ -0,0 +1,220 @@
+"""
+Muhurat Search.
+
+Finds time windows suiting a purpose over a range of days. The search
+works in three passes, each on fewer days than the last:
+
+1. Day masks: boolean arrays over the range drop days whose weekday
+   is unsuitable or during which no allowed tithi or nakshatra runs
+   at all (checked with prefix sums over the limb boundaries).
+2. Change points: on the remaining days, the times at which any limb,
+   the lagna, or Rahu Kaal / Yamaganda changes split each day into
+   segments over which nothing changes.
+3. Segments are judged at their midpoints in one array evaluation;
+   consecutive good ones with the same tithi, nakshatra and lagna
+   merge into windows, which are scored and ranked.
+"""
+
+from datetime import date, timedelta, tzinfo
+from typing import List
+
+import numpy as np
+
+from domain.entities import MuhuratRule, MuhuratWindow, TithiPaksha, ZodiacSign
+from domain.entities.muhurat import PAKSHA_WEIGHT, muhurat_score
+from domain.entities.panchang import TITHIS, PURNIMA, AMAVASYA, YOGAS, KARANAS, VARAS
+from domain.entities.zodiac import NAKSHATRAS
+from . import ephemeris
+from .panchang_timeline import (
+    MONTH_KARANAS, RAHU_KAAL_PART, YAMAGANDA_PART,
+    Boundaries, RangeTimeline, _karana_number, local_datetime
+)
+
+# Ascendant sample spacing for finding lagna changes; a sign takes
+# 1.5-3 hours to rise at Indian latitudes
+_LAGNA_STEP = 10.0 / 1440
+
+_SIGNS = list(ZodiacSign)
+_YOGA_OK = np.array([auspicious for _, _, auspicious in YOGAS])
+_KARANA_OK = np.array([KARANAS[_karana_number(i) - 1][2] for i in range(MONTH_KARANAS)])
+
+
+def find_muhurats(
+    rule: MuhuratRule,
+    start: date,
+    end: date,
+    tz: tzinfo,
+    latitude: float,
+    longitude: float
+) -> List[MuhuratWindow]:
+    """
+    Find windows suiting a rule on each local day of an inclusive range.
+
+    A day's windows run from its sunrise to sunset, or to the next
+    sunrise when the rule allows night-time muhurats.
+
+    Returns:
+        Windows, best score first
+    """
+    # The following day's sunrise closes the last day's window
+    timeline = RangeTimeline(start, end + timedelta(days=1), tz, latitude, longitude,
+                             with_moon=False)
+    n = len(timeline.days) - 1
+    sunrise, sunset = timeline.sunrise[:n], timeline.sunset[:n]
+    opens = sunrise
+    closes = sunset if rule.daytime_only else np.where(
+        timeline.valid[1:], timeline.sunrise[1:], sunset
+    )
+    weekdays = np.array([day.weekday() for day in timeline.days[:n]])
+
+    tithi_weight = np.array([
+        PAKSHA_WEIGHT[paksha] if rule.allows_tithi(i % 15 + 1, paksha) else 0.0
+        for i in range(30)
+        for paksha in [TithiPaksha.SHUKLA if i < 15 else TithiPaksha.KRISHNA]
+    ])
+    nakshatra_weight = np.array([rule.nakshatras.get(name, 0.0) for name, _, _ in NAKSHATRAS])
+    lagna_weight = np.array([rule.lagnas.get(sign, 0.0) for sign in _SIGNS])
+
+    # 1. Day masks
+    days = np.flatnonzero(timeline.valid[:n] & np.isin(weekdays, list(rule.weekdays)))
+    for boundaries, allowed in (
+        (timeline.elongations, np.repeat(tithi_weight > 0, 2)),  # Two karanas per tithi
+        (timeline.moons, nakshatra_weight > 0),
+    ):
+        days = days[_occurs(boundaries, allowed, opens[days], closes[days])]
+    if days.size == 0:
+        return []
+
+    opens, closes, weekdays = opens[days], closes[days], weekdays[days]
+    daylight = sunset[days] - sunrise[days]
+    excluded = [
+        (sunrise[days] + (part[weekdays] - 1) * daylight / 8,
+         sunrise[days] + part[weekdays] * daylight / 8)
+        for part in (np.array(RAHU_KAAL_PART), np.array(YAMAGANDA_PART))
+    ]
+
+    # 2. Change points
+    points = np.unique(np.concatenate([
+        opens, closes, *(t for span in excluded for t in span),
+        timeline.elongations.times, timeline.moons.times, timeline.yogas.times,
+        _lagna_changes(opens, closes, latitude, longitude),
+    ]))
+    starts, ends = points[:-1], points[1:]
+    middles = (starts + ends) / 2
+    day = np.searchsorted(opens, middles, side="right") - 1
+    inside = (day >= 0) & (middles < closes[day.clip(0)])
+    starts, ends, middles, day = starts[inside], ends[inside], middles[inside], day[inside]
+
+    # 3. Judge segments, then merge them into windows
+    karana = timeline.elongations.index_at(middles) % MONTH_KARANAS
+    tithi = karana // 2
+    nakshatra = timeline.moons.index_at(middles) % 27
+    yoga = timeline.yogas.index_at(middles) % 27
+    lagna = (ephemeris.ascendants(middles, latitude, longitude) // 30).astype(int) % 12
+
+    good = (
+        (tithi_weight[tithi] > 0) & (nakshatra_weight[nakshatra] > 0)
+        & (lagna_weight[lagna] > 0) & _YOGA_OK[yoga] & _KARANA_OK[karana]
+    )
+    for begin, finish in excluded:
+        good &= ~((middles >= begin[day]) & (middles < finish[day]))
+
+    same = np.zeros(good.shape, dtype=bool)
+    same[1:] = (
+        good[1:] & good[:-1] & (day[1:] == day[:-1]) & (tithi[1:] == tithi[:-1])
+        & (nakshatra[1:] == nakshatra[:-1]) & (lagna[1:] == lagna[:-1])
+    )
+    first = np.flatnonzero(good & ~same)
+    last = np.flatnonzero(good & ~np.append(same[1:], False))
+    minutes = (ends[last] - starts[first]) * 1440
+
+    windows = [
+        _window(
+            float(starts[i]), float(ends[j]), tz,
+            tithi=int(tithi[i]),
+            nakshatra=int(nakshatra[i]),
+            lagna=int(lagna[i]),
+            weekday=int(weekdays[day[i]]),
+            score=muhurat_score(
+                float(nakshatra_weight[nakshatra[i]]), float(tithi_weight[tithi[i]]),
+                float(lagna_weight[lagna[i]]), float(length)
+            )
+        )
+        for i, j, length in zip(first, last, minutes)
+        if length >= rule.min_minutes
+    ]
+    windows.sort(key=lambda window: (-window.score, window.start))
+    return windows
+
+
+def _occurs(
+    boundaries: Boundaries,
+    allowed: np.ndarray,
+    opens: np.ndarray,
+    closes: np.ndarray
+) -> np.ndarray:
+    """
+    Whether an allowed limb runs at any time in each window.
+
+    Counts allowed limbs between the ones prevailing at the window's
+    open and close with a prefix sum, so each window is O(1).
+    """
+    base = boundaries.first - 1
+    indices = np.arange(base, boundaries.indices[-1] + 1)
+    counts = np.concatenate([[0], np.cumsum(allowed[indices % allowed.shape[0]])])
+    low = boundaries.index_at(opens) - base
+    high = boundaries.index_at(closes) - base
+    return counts[high + 1] > counts[low]
+
+
+def _lagna_changes(
+    opens: np.ndarray,
+    closes: np.ndarray,
+    latitude: float,
+    longitude: float
+) -> np.ndarray:
+    """Times at which the rising sign changes within the windows."""
+    samples = np.ceil((closes - opens) / _LAGNA_STEP).astype(int) + 1
+    window = np.repeat(np.arange(opens.shape[0]), samples)
+    step = np.arange(samples.sum()) - np.repeat(np.cumsum(samples) - samples, samples)
+    jd = np.minimum(opens[window] + step * _LAGNA_STEP, closes[window])
+
+    ascendant = ephemeris.ascendants(jd, latitude, longitude)
+    sign = ascendant // 30
+    change = np.flatnonzero((sign[1:] != sign[:-1]) & (window[1:] == window[:-1]))
+
+    # The ascendant is close to linear over a sample step
+    travelled = np.mod(ascendant[change + 1] - ascendant[change], 360.0)
+    fraction = ((sign[change] + 1) * 30 - ascendant[change]) / travelled
+    return jd[change] + fraction * (jd[change + 1] - jd[change])
+
+
+def _window(
+    start: float,
+    end: float,
+    tz: tzinfo,
+    *,
+    tithi: int,
+    nakshatra: int,
+    lagna: int,
+    weekday: int,
+    score: float
+) -> MuhuratWindow:
+    """Build a window entity; tithi is the index (0-29) in the month."""
+    number = tithi % 15 + 1
+    paksha = TithiPaksha.SHUKLA if tithi < 15 else TithiPaksha.KRISHNA
+    if number < 15:
+        tithi_name = TITHIS[number - 1][0]
+    else:
+        tithi_name = (PURNIMA if paksha == TithiPaksha.SHUKLA else AMAVASYA)[0]
+
+    return MuhuratWindow(
+        start=local_datetime(start, tz),
+        end=local_datetime(end, tz),
+        score=score,
+        tithi=tithi_name,
+        paksha=paksha,
+        nakshatra=NAKSHATRAS[nakshatra][0],
+        vara=VARAS[weekday][0],
+        lagna=_SIGNS[lagna]
+    )
@@ -0,0 +1,265 @@
+"""
+Precomputed Horoscope Repository.
+
+Serves horoscopes from a table generated once per day for every
+sign and period, instead of generating each prediction per request.
+
+The table is written to a file that every worker process maps
+read-only, so all replicas serve identical, immutable data and the
+day's table is generated once per host rather than once per worker.
+
+File layout:
+    header   "<4sIH"  magic, date ordinal, slot count
+    slots    "<II"    (offset, length) per slot
+    payload           UTF-8 JSON record per slot
+"""
+
+import asyncio
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from domain.repositories import HoroscopeRepository
+from domain.entities import (
+    Horoscope, ZodiacSign, HoroscopePeriod, LuckyElements
+)
+from .mock_horoscope_repository import MockHoroscopeRepository
+
+logger = logging.getLogger(__name__)
+
+
+# Periods precomputed into the table; others go to the source
+TABLE_PERIODS = (HoroscopePeriod.DAILY, HoroscopePeriod.WEEKLY, HoroscopePeriod.MONTHLY)
+
+_MAGIC = b"HTB1"
+_HEADER = struct.Struct("<4sIH")
+_SLOT = struct.Struct("<II")
+_SLOT_COUNT = len(ZodiacSign) * len(TABLE_PERIODS)
+_PERIOD_INDEX = {period: i for i, period in enumerate(TABLE_PERIODS)}
+
+
+def _slot(sign: ZodiacSign, period: HoroscopePeriod) -> int:
+    """Get table slot for a sign and period."""
+    return (sign.number - 1) * len(TABLE_PERIODS) + _PERIOD_INDEX[period]
+
+
+def _encode(horoscope: Horoscope) -> bytes:
+    """Serialize a horoscope to a table record."""
+    lucky = horoscope.lucky
+    return json.dumps({
+        "prediction": horoscope.prediction,
+        "love_score": horoscope.love_score,
+        "career_score": horoscope.career_score,
+        "health_score": horoscope.health_score,
+        "finance_score": horoscope.finance_score,
+        "love_prediction": horoscope.love_prediction,
+        "career_prediction": horoscope.career_prediction,
+        "health_prediction": horoscope.health_prediction,
+        "finance_prediction": horoscope.finance_prediction,
+        "mood": horoscope.mood,
+        "health_tip": horoscope.health_tip,
+        "lucky": None if lucky is None else {
+            "numbers": lucky.numbers,
+            "colors": lucky.colors,
+            "time": lucky.time,
+            "day": lucky.day,
+        },
+        "compatible_signs": [s.number for s in horoscope.compatible_signs],
+    }, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _decode(
+    record: bytes,
+    sign: ZodiacSign,
+    period: HoroscopePeriod,
+    table_date: date
+) -> Horoscope:
+    """Rebuild a horoscope from a table record."""
+    data = json.loads(record)
+    signs = {s.number: s for s in ZodiacSign}
+    lucky = data.pop("lucky")
+    compatible = data.pop("compatible_signs")
+    return Horoscope(
+        sign=sign,
+        period=period,
+        date=table_date,
+        lucky=LuckyElements(**lucky) if lucky else None,
+        compatible_signs=[signs[n] for n in compatible],
+        **data
+    )
+
+
+class HoroscopeTable:
+    """
+    Read-only, memory-mapped horoscope table for one day.
+
+    Lookups index the slot table directly - O(1) per request.
+    Decoded entries are kept per process, so each record is parsed
+    at most once.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, ordinal, count = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC or count != _SLOT_COUNT:
+            self._mmap.close()
+            raise ValueError(f"Not a horoscope table: {path}")
+
+        self.date = date.fromordinal(ordinal)
+        self._decoded: List[Optional[Horoscope]] = [None] * _SLOT_COUNT
+
+    @classmethod
+    def build(
+        cls,
+        path: Path,
+        table_date: date,
+        generate: Callable[[ZodiacSign, HoroscopePeriod, date], Horoscope]
+    ) -> "HoroscopeTable":
+        """
+        Generate all signs and periods for a date and write the table.
+
+        The file is written under a temporary name and renamed into
+        place, so concurrent builders never expose a partial table.
+        """
+        records = [b""] * _SLOT_COUNT
+        for sign in ZodiacSign:
+            for period in TABLE_PERIODS:
+                records[_slot(sign, period)] = _encode(generate(sign, period, table_date))
+
+        offset = _HEADER.size + _SLOT.size * _SLOT_COUNT
+        index = bytearray(_HEADER.pack(_MAGIC, table_date.toordinal(), _SLOT_COUNT))
+        for record in records:
+            index += _SLOT.pack(offset, len(record))
+            offset += len(record)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(index)
+                f.write(b"".join(records))
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+        return cls(path)
+
+    def get(self, sign: ZodiacSign, period: HoroscopePeriod) -> Horoscope:
+        """Get the horoscope for a sign and period."""
+        i = _slot(sign, period)
+        horoscope = self._decoded[i]
+        if horoscope is None:
+            offset, length = _SLOT.unpack_from(self._mmap, _HEADER.size + i * _SLOT.size)
+            horoscope = _decode(self._mmap[offset:offset + length], sign, period, self.date)
+            self._decoded[i] = horoscope
+        return horoscope
+
+    def close(self) -> None:
+        """Unmap the table file."""
+        self._mmap.close()
+
+
+class PrecomputedHoroscopeRepository(HoroscopeRepository):
+    """
+    Horoscope repository backed by a daily precomputed table.
+
+    Today's daily/weekly/monthly horoscopes come from the table.
+    Other dates and periods are generated by the source on demand.
+    """
+
+    def __init__(
+        self,
+        source: MockHoroscopeRepository,
+        table_dir: Path,
+        keep_days: int = 2,
+        today: Callable[[], date] = date.today
+    ):
+        self._source = source
+        self._table_dir = Path(table_dir)
+        self._keep_days = keep_days
+        self._today = today
+        self._table: Optional[HoroscopeTable] = None
+
+    def load(self, table_date: Optional[date] = None) -> HoroscopeTable:
+        """
+        Load the table for a date, generating it if no worker has yet.
+
+        Returns:
+            The loaded table
+        """
+        table_date = table_date or self._today()
+        path = self._table_dir / f"horoscope-{table_date.isoformat()}.bin"
+
+        table = None
+        if path.exists():
+            try:
+                table = HoroscopeTable(path)
+            except (OSError, ValueError, struct.error) as e:
+                logger.warning(f"Rebuilding unreadable horoscope table {path}: {e}")
+
+        if table is None:
+            table = HoroscopeTable.build(path, table_date, self._source.build_horoscope)
+            logger.info(f"Horoscope table generated for {table_date}")
+            self._prune(table_date)
+
+        previous, self._table = self._table, table
+        if previous is not None:
+            previous.close()
+        return table
+
+    async def run(self) -> None:
+        """Regenerate the table shortly after each midnight, until cancelled."""
+        while True:
+            now = datetime.now()
+            midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+            await asyncio.sleep((midnight - now).total_seconds() + 1)
+            try:
+                self.load()
+            except Exception as e:
+                logger.error(f"Nightly horoscope table generation failed: {e}")
+
+    async def get_horoscope(
+        self,
+        sign: ZodiacSign,
+        period: HoroscopePeriod,
+        target_date: Optional[date] = None
+    ) -> Optional[Horoscope]:
+        """Get horoscope, from the table when it covers the request."""
+        today = self._today()
+        target_date = target_date or today
+
+        if target_date != today or period not in _PERIOD_INDEX:
+            return await self._source.get_horoscope(sign, period, target_date)
+
+        if self._table is None or self._table.date != today:
+            self.load(today)
+
+        return self._table.get(sign, period)
+
+    async def get_compatibility(
+        self,
+        sign1: ZodiacSign,
+        sign2: ZodiacSign
+    ) -> dict:
+        """Get compatibility from the source."""
+        return await self._source.get_compatibility(sign1, sign2)
+
+    def _prune(self, table_date: date) -> None:
+        """Delete tables older than keep_days."""
+        cutoff = (table_date - timedelta(days=self._keep_days)).isoformat()
+        for path in self._table_dir.glob("horoscope-*.bin"):
+            if path.stem[len("horoscope-"):] < cutoff:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
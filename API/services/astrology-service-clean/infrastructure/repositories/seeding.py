@@ -0,0 +1,15 @@
+"""
+Stable Seeding.
+
+Seeds derived from a digest of the input values, so generated data
+is the same in every worker process and across restarts (unlike the
+builtin hash(), which is randomized per process).
+"""
+
+import hashlib
+
+
+def stable_seed(*values) -> int:
+    """Derive a 64-bit seed from values via their string form."""
+    key = "|".join(str(v) for v in values).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "big")
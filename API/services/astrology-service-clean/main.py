@@ -4,7 +4,10 @@ Astrology Service - Main Entry Point.
 Clean Architecture implementation for astrology APIs.
 """
 
+import asyncio
 import sys
+from contextlib import asynccontextmanager
+from datetime import date
 from pathlib import Path
 
 # Add project root to path for imports
@@ -14,14 +17,52 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from infrastructure.api.config import get_settings
+from infrastructure.api.dependencies import (
+    get_horoscope_repository,
+    get_kundli_executor,
+    get_panchang_executor,
+    get_panchang_repository
+)
+from infrastructure.repositories import (
+    EphemerisPanchangRepository,
+    PrecomputedHoroscopeRepository
+)
 from infrastructure.api.routers import (
     horoscope_router,
     kundli_router,
-    panchang_router
+    panchang_router,
+    festival_router
 )
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan."""
+    nightly = None
+    horoscopes = get_horoscope_repository()
+    if isinstance(horoscopes, PrecomputedHoroscopeRepository):
+        # Generate (or map another worker's) table for today, then
+        # regenerate after each midnight
+        horoscopes.load()
+        nightly = asyncio.create_task(horoscopes.run())
+
+    panchang = get_panchang_repository()
+    if isinstance(panchang, EphemerisPanchangRepository):
+        # Festival queries peak ahead of festivals; have this year ready
+        panchang.festival_calendar(date.today().year)
+
+    yield
+
+    if nightly is not None:
+        nightly.cancel()
+
+    for executor in (get_kundli_executor(), get_panchang_executor()):
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
 app = FastAPI(
     title="Astrology Service",
     description="""
@@ -30,14 +71,17 @@ app = FastAPI(
     Features:
     - **Horoscope**: Daily/Weekly/Monthly predictions for all zodiac signs
     - **Kundli**: Birth chart generation with planet positions
+    - **Charts**: North/South Indian chart images (SVG, optional PNG)
     - **Matching**: Kundli matching for marriage compatibility (Guna Milan)
     - **Panchang**: Hindu calendar with Tithi, Nakshatra, Yoga, Karana
+    - **Festivals**: Festival dates from lunar month and tithi rules
 
     Supports both English and Hindi inputs/outputs.
     """,
     version=settings.SERVICE_VERSION,
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # CORS
@@ -53,6 +97,7 @@ app.add_middleware(
 app.include_router(horoscope_router)
 app.include_router(kundli_router)
 app.include_router(panchang_router)
+app.include_router(festival_router)
 
 
 @app.get("/health", tags=["Health"])
@@ -76,7 +121,13 @@ async def root():
             "horoscope": "/horoscope",
             "kundli": "/kundli",
             "matching": "/kundli/match",
-            "panchang": "/panchang"
+            "dasha": "/kundli/dasha",
+            "bulk_matching": "/kundli/match/bulk",
+            "chart": "/kundli/{kundli_id}/chart.svg",
+            "panchang": "/panchang",
+            "panchang_range": "/panchang/range",
+            "muhurat": "/panchang/muhurat",
+            "festivals": "/festivals"
         }
     }
 
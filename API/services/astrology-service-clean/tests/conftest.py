@@ -17,3 +17,23 @@ sys.path.insert(0, str(project_root))
 def anyio_backend():
     """Use asyncio for async tests."""
     return "asyncio"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--benchmark", action="store_true", default=False,
+        help="Run wall-clock benchmarks (marked 'benchmark'), skipped by default"
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: wall-clock timing check, run with --benchmark")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--benchmark"):
+        return
+    skip = pytest.mark.skip(reason="benchmark; run with --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
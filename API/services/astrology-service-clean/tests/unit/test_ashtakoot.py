@@ -0,0 +1,228 @@
+"""
+Unit Tests for Ashtakoot scoring.
+
+Tests for:
+- Koota lookup tables
+- BulkMatchKundliUseCase
+"""
+
+import json
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from domain.entities import ZodiacSign
+from application import ashtakoot
+from application.dto import BulkMatchRequest, KundliRequest, MatchCandidateDTO
+from application.use_cases import BulkMatchKundliUseCase
+from application.use_cases.match_kundli_bulk import BulkMatchValidationError
+from infrastructure.repositories import EphemerisKundliRepository
+from main import app
+
+
+ROHINI, MRIGASHIRA, ASHWINI = 3, 4, 0
+TAURUS, GEMINI, ARIES = 1, 2, 0
+
+
+class TestKootaTables:
+    """Test the koota lookup tables."""
+
+    def test_maximum_is_36(self):
+        assert ashtakoot.MAX_POINTS == 36
+        for name, _, max_points in ashtakoot.KOOTAS:
+            matrix = ashtakoot.SIGN_MATRICES.get(name, ashtakoot.NAKSHATRA_MATRICES.get(name))
+            assert matrix.min() >= 0
+            assert matrix.max() == max_points
+
+    def test_symmetric_kootas(self):
+        for name in ("Yoni", "Nadi", "Bhakoot"):
+            matrix = ashtakoot.SIGN_MATRICES.get(name, ashtakoot.NAKSHATRA_MATRICES.get(name))
+            assert np.array_equal(matrix, matrix.T)
+
+    def test_tables_read_only(self):
+        with pytest.raises(ValueError):
+            ashtakoot.NAKSHATRA_MATRICES["Nadi"][0, 0] = 8
+
+    def test_same_nadi_scores_zero(self):
+        points = ashtakoot.score(ROHINI, TAURUS, ROHINI, TAURUS)
+
+        assert points[7] == 0
+        assert ashtakoot.nadi_doshas([ROHINI], [ROHINI])[0]
+
+    def test_broadcast_matches_pairwise(self):
+        brides = np.arange(27)
+        signs = np.array([min(ashtakoot.NAKSHATRA_SIGNS[n]) for n in brides])
+        batch = ashtakoot.score(ROHINI, TAURUS, brides, signs)
+
+        assert batch.shape == (27, 8)
+        for n, s, row in zip(brides, signs, batch):
+            details = ashtakoot.match_details(ROHINI, TAURUS, int(n), int(s))
+            assert row.sum() == details["total_points"]
+
+    def test_nakshatra_signs(self):
+        assert ashtakoot.NAKSHATRA_SIGNS[ASHWINI] == {ARIES}
+        # Krittika straddles Aries and Taurus
+        assert ashtakoot.NAKSHATRA_SIGNS[2] == {ARIES, TAURUS}
+
+
+class TestBulkMatchKundliUseCase:
+    """Test suite for bulk matching."""
+
+    @pytest.fixture
+    def use_case(self):
+        return BulkMatchKundliUseCase(
+            kundli_repository=EphemerisKundliRepository(), max_candidates=10
+        )
+
+    @pytest.fixture
+    def profile(self):
+        return KundliRequest(
+            name="Rahul", date="1990-05-15", time="10:30", place="Delhi",
+            latitude=28.6139, longitude=77.2090
+        )
+
+    def _known(self, id: str, nakshatra: str, sign: str) -> MatchCandidateDTO:
+        return MatchCandidateDTO(id=id, moon_nakshatra=nakshatra, moon_sign=sign)
+
+    @pytest.mark.asyncio
+    async def test_ranked_best_first(self, use_case, profile):
+        candidates = [
+            self._known("a", "Ashwini", "Aries"),
+            self._known("b", "Rohini", "Taurus"),
+            self._known("c", "Hasta", "Virgo"),
+            MatchCandidateDTO(id="d", birth=KundliRequest(
+                name="Priya", date="1992-08-20", time="14:00", place="Mumbai",
+                latitude=19.0760, longitude=72.8777
+            )),
+        ]
+        result = await use_case.execute(BulkMatchRequest(profile=profile, candidates=candidates))
+
+        assert result.total == 4
+        assert result.ranked == 4
+        assert [r.rank for r in result.results] == [1, 2, 3, 4]
+        totals = [r.total_points for r in result.results]
+        assert totals == sorted(totals, reverse=True)
+        assert all(sum(r.guna_points.values()) == r.total_points for r in result.results)
+
+    @pytest.mark.asyncio
+    async def test_matches_single_pair(self, use_case, profile):
+        result = await use_case.execute(BulkMatchRequest(
+            profile=profile, candidates=[self._known("b", "Mrigashira", "Gemini")]
+        ))
+        details = ashtakoot.match_details(
+            ashtakoot.nakshatra_index(result.profile_nakshatra),
+            ashtakoot.sign_index(ZodiacSign.from_string(result.profile_moon_sign)),
+            MRIGASHIRA, GEMINI
+        )
+
+        assert result.results[0].total_points == details["total_points"]
+        assert result.results[0].nadi_dosha == details["nadi_dosha"]
+
+    @pytest.mark.asyncio
+    async def test_orientation(self, use_case, profile):
+        candidates = [self._known(n, n, s) for n, s in (
+            ("Ashwini", "Aries"), ("Magha", "Leo"), ("Shravana", "Capricorn"),
+        )]
+        as_groom = await use_case.execute(BulkMatchRequest(
+            profile=profile, candidates=candidates, profile_is_groom=True
+        ))
+        as_bride = await use_case.execute(BulkMatchRequest(
+            profile=profile, candidates=candidates, profile_is_groom=False
+        ))
+
+        groom = {r.id: r.guna_points for r in as_groom.results}
+        bride = {r.id: r.guna_points for r in as_bride.results}
+        # Symmetric kootas agree; the directional ones may not
+        for id in groom:
+            assert groom[id]["Nadi"] == bride[id]["Nadi"]
+            assert groom[id]["Yoni"] == bride[id]["Yoni"]
+        assert groom != bride
+
+    @pytest.mark.asyncio
+    async def test_per_candidate_errors(self, use_case, profile):
+        candidates = [
+            self._known("ok", "Rohini", "Taurus"),
+            self._known("wrong-sign", "Rohini", "Leo"),
+            self._known("unknown", "Nowhere", "Leo"),
+            MatchCandidateDTO(id="empty"),
+            MatchCandidateDTO(id="bad-date", birth=KundliRequest(
+                name="X", date="20-08-1992", time="14:00", place="Mumbai",
+                latitude=19.0760, longitude=72.8777
+            )),
+        ]
+        result = await use_case.execute(BulkMatchRequest(profile=profile, candidates=candidates))
+
+        assert [r.id for r in result.results] == ["ok"]
+        assert {e.id for e in result.errors} == {"wrong-sign", "unknown", "empty", "bad-date"}
+        assert all(not e.success and e.error for e in result.errors)
+
+    @pytest.mark.asyncio
+    async def test_min_points_and_limit(self, use_case, profile):
+        candidates = [self._known(str(i), name, sign) for i, (name, sign) in enumerate((
+            ("Ashwini", "Aries"), ("Rohini", "Taurus"), ("Magha", "Leo"),
+            ("Hasta", "Virgo"), ("Shravana", "Capricorn"), ("Revati", "Pisces"),
+        ))]
+        full = await use_case.execute(BulkMatchRequest(profile=profile, candidates=candidates))
+        threshold = full.results[2].total_points
+
+        filtered = await use_case.execute(BulkMatchRequest(
+            profile=profile, candidates=candidates, min_points=threshold
+        ))
+        limited = await use_case.execute(BulkMatchRequest(
+            profile=profile, candidates=candidates, limit=2
+        ))
+
+        assert all(r.total_points >= threshold for r in filtered.results)
+        assert len(filtered.results) >= 3
+        assert limited.results == full.results[:2]
+
+    @pytest.mark.asyncio
+    async def test_batch_limits(self, use_case, profile):
+        with pytest.raises(BulkMatchValidationError):
+            await use_case.execute(BulkMatchRequest(profile=profile, candidates=[]))
+
+        too_many = [self._known(str(i), "Rohini", "Taurus") for i in range(11)]
+        with pytest.raises(BulkMatchValidationError):
+            await use_case.execute(BulkMatchRequest(profile=profile, candidates=too_many))
+
+
+class TestBulkMatchRoute:
+    """Test the bulk matching response formats."""
+
+    @pytest.fixture
+    def body(self):
+        return {
+            "profile": {
+                "name": "Rahul", "date": "1990-05-15", "time": "10:30", "place": "Delhi",
+                "latitude": 28.6139, "longitude": 77.2090
+            },
+            "candidates": [
+                {"id": "a", "moon_nakshatra": "Ashwini", "moon_sign": "Aries"},
+                {"id": "b", "moon_nakshatra": "Rohini", "moon_sign": "Taurus"},
+                {"id": "x", "moon_nakshatra": "Rohini", "moon_sign": "Aries"},
+            ]
+        }
+
+    def test_json_by_default(self, body):
+        response = TestClient(app).post("/kundli/match/bulk", json=body)
+
+        assert response.headers["content-type"] == "application/json"
+        result = response.json()
+        assert (result["total"], result["ranked"]) == (3, 2)
+        assert [r["id"] for r in result["errors"]] == ["x"]
+
+    @pytest.mark.parametrize("options", [
+        {"headers": {"Accept": "application/x-ndjson"}},
+        {"params": {"stream": "true"}},
+    ])
+    def test_ndjson_on_request(self, body, options):
+        client = TestClient(app)
+        response = client.post("/kundli/match/bulk", json=body, **options)
+        expected = client.post("/kundli/match/bulk", json=body).json()
+
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line.pop("type") for line in lines] == ["header", "result", "result", "error"]
+        assert lines[0] == {k: v for k, v in expected.items() if k not in ("results", "errors")}
+        assert lines[1:] == expected["results"] + expected["errors"]
@@ -0,0 +1,152 @@
+"""
+Unit Tests for CachedKundliRepository.
+
+Tests chart caching and batching in front of the ephemeris repository.
+"""
+
+import pytest
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from domain.entities import BirthDetails
+from infrastructure.api import dependencies
+from infrastructure.api.config import get_settings
+from infrastructure.repositories import (
+    CachedKundliRepository, EphemerisKundliRepository, MockKundliRepository
+)
+
+
+class CountingEphemerisRepository(EphemerisKundliRepository):
+    """Ephemeris repository that records each batch it computes."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    async def generate_kundlis(self, births):
+        self.batches.append([b.name for b in births])
+        return await super().generate_kundlis(births)
+
+
+def _birth(name: str, hour: int = 10) -> BirthDetails:
+    return BirthDetails(
+        name=name,
+        date_time=datetime(1990, 5, 15, hour, 30),
+        place="Delhi",
+        latitude=28.6139,
+        longitude=77.2090,
+    )
+
+
+class TestCachedKundliRepository:
+    """Test suite for cached kundli repository."""
+
+    @pytest.fixture
+    def inner(self):
+        return CountingEphemerisRepository()
+
+    @pytest.fixture
+    def repository(self, inner):
+        return CachedKundliRepository(inner, ttl_seconds=60, max_entries=2)
+
+    @pytest.mark.asyncio
+    async def test_same_moment_and_place_cached(self, repository, inner):
+        """Test that a second person born at the same time and place reuses the chart."""
+        first = await repository.generate_kundli(_birth("A"))
+        second = await repository.generate_kundli(_birth("B"))
+
+        assert inner.batches == [["A"]]
+        assert second.birth_details.name == "B"
+        assert second.lagna == first.lagna
+        assert second.planets == first.planets
+
+    @pytest.mark.asyncio
+    async def test_misses_computed_in_one_batch(self, repository, inner):
+        await repository.generate_kundli(_birth("A", 10))
+
+        kundlis = await repository.generate_kundlis([
+            _birth("A", 10), _birth("B", 22), _birth("C", 22)
+        ])
+
+        assert inner.batches == [["A"], ["B"]]
+        assert [k.birth_details.name for k in kundlis] == ["A", "B", "C"]
+
+    @pytest.mark.asyncio
+    async def test_cached_chart_not_mutated_by_callers(self, repository):
+        kundli = await repository.generate_kundli(_birth("A"))
+        kundli.doshas = await repository.get_doshas(kundli)
+
+        again = await repository.generate_kundli(_birth("A"))
+
+        assert again.doshas == []
+
+    @pytest.mark.asyncio
+    async def test_eviction(self, repository, inner):
+        for hour in (1, 2, 3):
+            await repository.generate_kundli(_birth("A", hour))
+
+        await repository.generate_kundli(_birth("A", 1))
+
+        assert len(inner.batches) == 4
+
+    @pytest.mark.asyncio
+    async def test_batch_larger_than_cache(self, repository, inner):
+        births = [_birth(name, hour) for name, hour in zip("ABCDE", (1, 2, 3, 4, 5))]
+
+        kundlis = await repository.generate_kundlis(births)
+
+        assert inner.batches == [list("ABCDE")]
+        assert [k.birth_details.name for k in kundlis] == list("ABCDE")
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_still_returns_charts(self, inner):
+        repository = CachedKundliRepository(inner, ttl_seconds=0)
+
+        kundlis = await repository.generate_kundlis([_birth("A", 1), _birth("B", 1), _birth("C", 2)])
+
+        assert inner.batches == [["A", "C"]]
+        assert [k.birth_details.name for k in kundlis] == ["A", "B", "C"]
+        assert kundlis[0] is not kundlis[1]
+
+
+class TestKundliRepositoryWiring:
+    """Test which repositories the chart cache wraps."""
+
+    @pytest.fixture
+    def settings(self, monkeypatch):
+        def configure(ephemeris: bool):
+            monkeypatch.setenv("KUNDLI_EPHEMERIS_ENABLED", str(ephemeris).lower())
+            get_settings.cache_clear()
+            dependencies.get_kundli_repository.cache_clear()
+            return dependencies.get_kundli_repository()
+
+        yield configure
+        monkeypatch.delenv("KUNDLI_EPHEMERIS_ENABLED", raising=False)
+        get_settings.cache_clear()
+        dependencies.get_kundli_repository.cache_clear()
+
+    def test_ephemeris_is_cached(self, settings):
+        assert isinstance(settings(ephemeris=True), CachedKundliRepository)
+
+    @pytest.mark.asyncio
+    async def test_mock_chart_does_not_depend_on_who_asked_first(self, settings):
+        repository = settings(ephemeris=False)
+        alone = await MockKundliRepository().generate_kundli(_birth("Ravi"))
+
+        await repository.generate_kundli(_birth("Asha"))
+        after = await repository.generate_kundli(_birth("Ravi"))
+
+        assert not isinstance(repository, CachedKundliRepository)
+        assert (after.lagna, after.moon_sign) == (alone.lagna, alone.moon_sign)
+
+
+class TestEphemerisProcessPool:
+    """Test chart computation on a process pool."""
+
+    @pytest.mark.asyncio
+    async def test_pool_matches_inline(self):
+        births = [_birth("A", 10), _birth("B", 22)]
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            pooled = await EphemerisKundliRepository(executor=pool).generate_kundlis(births)
+
+        assert pooled == EphemerisKundliRepository().build_kundlis(births)
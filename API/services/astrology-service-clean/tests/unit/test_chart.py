@@ -0,0 +1,169 @@
+"""
+Unit Tests for birth chart images.
+"""
+
+import asyncio
+import pytest
+from datetime import datetime
+
+from application.chart_svg import chart_key, render_chart_svg
+from application.dto import KundliRequest
+from application.kundli_id import decode_kundli_id, encode_kundli_id
+from application.use_cases import GenerateKundliUseCase, RenderChartUseCase
+from application.use_cases.render_chart import (
+    ChartFormatUnavailableError,
+    ChartNotFoundError,
+    ChartValidationError
+)
+from domain.entities import BirthDetails
+from infrastructure.repositories import DiskChartImageRepository, EphemerisKundliRepository
+
+BIRTH = BirthDetails(
+    name="Test Person",
+    date_time=datetime(1990, 5, 15, 10, 30),
+    place="Delhi",
+    latitude=28.6139,
+    longitude=77.2090
+)
+
+
+class CountingImageRepository(DiskChartImageRepository):
+    """Disk image store that counts saved images."""
+
+    def __init__(self, directory):
+        super().__init__(directory)
+        self.saved = 0
+
+    async def save_image(self, name, data):
+        self.saved += 1
+        await super().save_image(name, data)
+
+
+@pytest.fixture(scope="module")
+def kundli():
+    return asyncio.run(EphemerisKundliRepository().generate_kundli(BIRTH))
+
+
+class TestKundliId:
+    """Test stateless kundli ids."""
+
+    def test_round_trip(self):
+        birth = decode_kundli_id(encode_kundli_id(BIRTH))
+
+        assert birth.date_time == BIRTH.date_time
+        assert (birth.latitude, birth.longitude) == (BIRTH.latitude, BIRTH.longitude)
+        assert birth.timezone == BIRTH.timezone
+
+    def test_invalid(self):
+        for kundli_id in ("", "not-an-id!", encode_kundli_id(BIRTH)[:-4]):
+            with pytest.raises(ValueError):
+                decode_kundli_id(kundli_id)
+
+    @pytest.mark.asyncio
+    async def test_kundli_response_has_id(self):
+        use_case = GenerateKundliUseCase(kundli_repository=EphemerisKundliRepository())
+        response = await use_case.execute(KundliRequest(
+            name="Test Person", date="1990-05-15", time="10:30", place="Delhi",
+            latitude=28.6139, longitude=77.2090
+        ))
+
+        assert response.kundli_id == encode_kundli_id(BIRTH)
+
+
+class TestChartSvg:
+    """Test chart drawing."""
+
+    def test_north(self, kundli):
+        svg = render_chart_svg(kundli, "north")
+
+        assert svg.startswith("<svg") and svg.endswith("</svg>")
+        assert svg.count("<text") == 12 + sum(
+            (len(house.planets) + 1) // 2 for house in kundli.houses
+        )
+        assert ">Sa(R) Ra<" in svg
+
+    def test_south_marks_lagna(self, kundli):
+        svg = render_chart_svg(kundli, "south", "hi")
+
+        assert svg.count("लग्न") == 1
+        assert "श(व) रा" in svg
+
+    @pytest.mark.asyncio
+    async def test_key_follows_content(self, kundli):
+        other = await EphemerisKundliRepository().generate_kundli(
+            BirthDetails("Other", datetime(1990, 5, 15, 10, 31), "Delhi", 28.6139, 77.2090)
+        )
+
+        assert chart_key(kundli, "north") == chart_key(other, "north")
+        assert chart_key(kundli, "north") != chart_key(kundli, "south")
+
+
+class TestRenderChartUseCase:
+    """Test chart rendering use case."""
+
+    @pytest.fixture
+    def images(self, tmp_path):
+        return CountingImageRepository(tmp_path)
+
+    def use_case(self, images, rasterizer=None):
+        return RenderChartUseCase(
+            kundli_repository=EphemerisKundliRepository(),
+            image_repository=images,
+            rasterizer=rasterizer
+        )
+
+    @pytest.mark.asyncio
+    async def test_stored_once(self, images):
+        use_case = self.use_case(images)
+        kundli_id = encode_kundli_id(BIRTH)
+
+        first = await use_case.execute(kundli_id)
+        second = await use_case.execute(kundli_id)
+
+        assert images.saved == 1
+        assert first.content == second.content
+        assert first.etag == second.etag
+        assert first.media_type == "image/svg+xml"
+
+    @pytest.mark.asyncio
+    async def test_not_modified(self, images):
+        use_case = self.use_case(images)
+        image = await use_case.execute(encode_kundli_id(BIRTH), style="south")
+
+        current = await use_case.execute(
+            encode_kundli_id(BIRTH), style="south", if_none_match=f'"x", {image.etag}'
+        )
+        stale = await use_case.execute(encode_kundli_id(BIRTH), if_none_match=image.etag)
+
+        assert current.content is None
+        assert stale.content is not None
+
+    @pytest.mark.asyncio
+    async def test_png(self, images):
+        calls = []
+
+        def rasterize(svg, size):
+            calls.append(size)
+            return b"PNG" + svg[:4]
+
+        use_case = self.use_case(images, rasterize)
+        for _ in range(2):
+            image = await use_case.execute(encode_kundli_id(BIRTH), "png", size=256)
+
+        assert calls == [256]
+        assert image.content == b"PNG<svg"
+        assert image.media_type == "image/png"
+
+    @pytest.mark.asyncio
+    async def test_invalid(self, images):
+        use_case = self.use_case(images)
+        kundli_id = encode_kundli_id(BIRTH)
+
+        with pytest.raises(ChartValidationError):
+            await use_case.execute(kundli_id, style="east")
+        with pytest.raises(ChartValidationError):
+            await use_case.execute(kundli_id, "png", size=300)
+        with pytest.raises(ChartFormatUnavailableError):
+            await use_case.execute(kundli_id, "png", size=512)
+        with pytest.raises(ChartNotFoundError):
+            await use_case.execute("bogus")
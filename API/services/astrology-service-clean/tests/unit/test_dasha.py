@@ -0,0 +1,128 @@
+"""
+Unit Tests for Vimshottari dasha.
+
+Tests for:
+- DashaTimeline
+- GetDashaUseCase
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+from domain.entities import BirthDetails, DashaTimeline, Planet
+from application.dto import DashaRequest
+from application.use_cases import GetDashaUseCase
+from application.use_cases.generate_kundli import KundliValidationError
+from infrastructure.repositories import EphemerisKundliRepository, MockKundliRepository
+
+
+BIRTH = datetime(2000, 1, 1, 17, 30)
+# Moon at 200 deg: Swati (Rahu), 0.75 of the way through
+MOON = 186.6667 + 0.75 * 13.3333
+
+
+class TestDashaTimeline:
+    """Test timeline computation."""
+
+    @pytest.fixture
+    def timeline(self):
+        return DashaTimeline(MOON, BIRTH)
+
+    def test_first_mahadasha_and_balance(self, timeline):
+        first = timeline.period(1, 0)
+
+        assert first.lord == Planet.RAHU
+        assert first.contains(BIRTH)
+        # A quarter of Rahu's 18 years remains
+        assert timeline.balance_at_birth / timedelta(days=365.25) == pytest.approx(4.5, abs=0.01)
+
+    def test_mahadasha_order(self, timeline):
+        lords = [p.lord for p in timeline.periods(1)]
+
+        assert lords == [
+            Planet.RAHU, Planet.JUPITER, Planet.SATURN, Planet.MERCURY, Planet.KETU,
+            Planet.VENUS, Planet.SUN, Planet.MOON, Planet.MARS,
+        ]
+
+    def test_periods_contiguous_and_cover_cycle(self, timeline):
+        for level in (1, 2, 3):
+            periods = list(timeline.periods(level))
+
+            assert len(periods) == 9 ** level
+            for a, b in zip(periods, periods[1:]):
+                assert abs((b.start - a.end).total_seconds()) < 1
+            assert (periods[-1].end - periods[0].start) / timedelta(days=365.25) == pytest.approx(120)
+
+    def test_antardasha_starts_with_own_lord(self, timeline):
+        antar = timeline.period(2, 9)  # First antardasha of Jupiter
+
+        assert antar.lords == (Planet.JUPITER, Planet.JUPITER)
+        # Jupiter-Jupiter is 16 * 16 / 120 years
+        assert (antar.end - antar.start) / timedelta(days=365.25) == pytest.approx(16 * 16 / 120)
+
+    def test_current_matches_scan(self, timeline):
+        """Test that binary search finds the same periods as a linear scan."""
+        for moment in (BIRTH, datetime(2026, 10, 18), datetime(2090, 3, 1)):
+            current = timeline.current(moment)
+
+            assert len(current) == 3
+            for level, period in enumerate(current, start=1):
+                scanned = [p for p in timeline.periods(level) if p.contains(moment)]
+                assert scanned == [period]
+
+    def test_current_outside_cycle(self, timeline):
+        assert timeline.current(datetime(2200, 1, 1)) == []
+
+    def test_pagination(self, timeline):
+        page = list(timeline.periods(3, offset=700, limit=50))
+
+        assert len(page) == 29
+        assert page[0] == timeline.period(3, 700)
+
+
+class TestKundliDasha:
+    """Test dasha fields on generated kundlis."""
+
+    @pytest.mark.asyncio
+    async def test_current_dasha_not_hardcoded(self):
+        repository = MockKundliRepository()
+        kundli = await repository.generate_kundli(BirthDetails(
+            name="A", date_time=datetime(1990, 5, 15, 10, 30), place="Delhi",
+            latitude=28.6, longitude=77.2,
+        ))
+
+        current = kundli.dasha_timeline().current(datetime.now(), depth=2)
+        assert kundli.current_mahadasha == current[0].lord.english
+        assert kundli.current_antardasha == current[1].lord.english
+        assert kundli.mahadasha_end_date == current[0].end
+
+
+class TestGetDashaUseCase:
+    """Test suite for dasha use case."""
+
+    @pytest.fixture
+    def use_case(self):
+        return GetDashaUseCase(kundli_repository=EphemerisKundliRepository())
+
+    def _request(self, **kwargs):
+        return DashaRequest(
+            name="Test", date="2000-01-01", time="17:30", place="Delhi",
+            latitude=28.6139, longitude=77.2090, **kwargs
+        )
+
+    @pytest.mark.asyncio
+    async def test_dasha_page(self, use_case):
+        result = await use_case.execute(self._request(depth=2, offset=9, limit=5, at="2026-10-18"))
+
+        assert result.moon_nakshatra == "Swati"
+        assert result.total == 81
+        assert len(result.periods) == 5
+        assert result.periods[0].lords == ["Jupiter", "Jupiter"]
+        assert [p.level_name for p in result.current] == [
+            "Mahadasha", "Antardasha", "Pratyantardasha"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_invalid_at(self, use_case):
+        with pytest.raises(KundliValidationError):
+            await use_case.execute(self._request(at="18-10-2026"))
@@ -0,0 +1,90 @@
+"""
+Unit Tests for response documents.
+
+Documents must serialize exactly as the response DTOs do.
+"""
+
+import asyncio
+import json
+import time
+import pytest
+from datetime import date, datetime
+
+from fastapi.encoders import jsonable_encoder
+
+from application.documents import kundli_document, panchang_document
+from application.dto import KundliResponse, PanchangResponse
+from domain.entities import BirthDetails
+from infrastructure.api.json_response import encode_json
+from infrastructure.repositories import (
+    EphemerisKundliRepository,
+    EphemerisPanchangRepository,
+    MockKundliRepository
+)
+
+BIRTH = BirthDetails(
+    name="Test Person",
+    date_time=datetime(1990, 5, 15, 10, 30),
+    place="Delhi",
+    latitude=28.6139,
+    longitude=77.2090
+)
+
+
+async def _kundli(repository):
+    kundli = await repository.generate_kundli(BIRTH)
+    kundli.doshas = await repository.get_doshas(kundli)
+    return kundli
+
+
+@pytest.fixture(scope="module")
+def kundli():
+    return asyncio.run(_kundli(EphemerisKundliRepository()))
+
+
+def _dto_json(model) -> bytes:
+    """Encode a DTO the way FastAPI serializes a response_model."""
+    return json.dumps(jsonable_encoder(model), ensure_ascii=False, separators=(",", ":")).encode()
+
+
+class TestDocuments:
+    """Test documents against their DTOs."""
+
+    def test_kundli_matches_dto(self, kundli):
+        mock = asyncio.run(_kundli(MockKundliRepository()))
+        for chart in (kundli, mock):
+            document = kundli_document(chart, "id")
+            dto = KundliResponse.model_validate(document)
+
+            assert list(document) == list(KundliResponse.model_fields)
+            assert encode_json(document) == _dto_json(dto)
+
+    @pytest.mark.asyncio
+    async def test_panchang_matches_dto(self):
+        repository = EphemerisPanchangRepository()
+        for day in (date(2024, 1, 1), date(2024, 11, 1), date(2025, 6, 21)):
+            panchang = await repository.get_panchang(day, "Delhi", 28.6139, 77.2090)
+            document = panchang_document(panchang)
+            dto = PanchangResponse.model_validate(document)
+
+            assert list(document) == list(PanchangResponse.model_fields)
+            assert json.loads(encode_json(document)) == json.loads(_dto_json(dto))
+
+    @pytest.mark.benchmark
+    def test_serialization_time_per_kundli(self, kundli):
+        """Fast path vs building the DTO and serializing it as FastAPI does."""
+        rounds = 200
+
+        started = time.perf_counter()
+        for _ in range(rounds):
+            encode_json(kundli_document(kundli, "id"))
+        fast = (time.perf_counter() - started) / rounds
+
+        started = time.perf_counter()
+        for _ in range(rounds):
+            _dto_json(KundliResponse.model_validate(kundli_document(kundli, "id")))
+        dto = (time.perf_counter() - started) / rounds
+
+        print(f"fast path {fast * 1e6:.0f} us, DTO {dto * 1e6:.0f} us per kundli")
+        assert fast < 0.5e-3
+        assert fast * 3 < dto
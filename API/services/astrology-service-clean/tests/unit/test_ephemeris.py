@@ -0,0 +1,127 @@
+"""
+Unit Tests for the ephemeris and ephemeris kundli repository.
+
+Reference events are published almanac times.
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from domain.entities import BirthDetails, Planet, ZodiacSign, DoshaType
+from infrastructure.repositories import EphemerisKundliRepository
+from infrastructure.repositories import ephemeris
+
+IST = timezone(timedelta(hours=5, minutes=30))
+
+
+def _longitudes(moment: datetime):
+    return ephemeris.longitudes([ephemeris.julian_day(moment)])[0]
+
+
+class TestEphemeris:
+    """Test planetary positions against known events."""
+
+    def test_makar_sankranti_2024(self):
+        """Sun entered sidereal Capricorn at 02:54 IST on 15 Jan 2024."""
+        assert _longitudes(datetime(2024, 1, 15, 2, 30, tzinfo=IST))[0] < 270.0
+        assert _longitudes(datetime(2024, 1, 15, 3, 20, tzinfo=IST))[0] > 270.0
+
+    def test_full_moon(self):
+        """Full moon at 23:24 IST on 25 Jan 2024."""
+        sun, moon = _longitudes(datetime(2024, 1, 25, 23, 24, tzinfo=IST))[:2]
+        assert abs((moon - sun) % 360.0 - 180.0) < 0.5
+
+    def test_jupiter_retrograde(self):
+        """Jupiter was retrograde from Sep to Dec 2023."""
+        jd = [ephemeris.julian_day(datetime(2023, 10, 15)),
+              ephemeris.julian_day(datetime(2024, 3, 1))]
+        jupiter = ephemeris.speeds(jd)[:, ephemeris.GRAHAS.index("Jupiter")]
+
+        assert jupiter[0] < 0
+        assert jupiter[1] > 0
+
+    def test_nodes_opposite(self):
+        longitudes = _longitudes(datetime(2024, 6, 1))
+        assert abs((longitudes[8] - longitudes[7]) % 360.0 - 180.0) < 1e-9
+
+    def test_vectorized_matches_scalar(self):
+        moments = [datetime(1990, 5, 15, 5), datetime(2010, 8, 1, 17)]
+        batch = ephemeris.longitudes([ephemeris.julian_day(m) for m in moments])
+
+        for row, moment in zip(batch, moments):
+            assert row == pytest.approx(_longitudes(moment))
+
+
+class TestEphemerisKundliRepository:
+    """Test suite for ephemeris kundli repository."""
+
+    @pytest.fixture
+    def repository(self):
+        return EphemerisKundliRepository(now=lambda: datetime(2024, 6, 1, tzinfo=timezone.utc))
+
+    @pytest.fixture
+    def birth(self):
+        # 17:30 IST on 1 Jan 2000 - Sun in Sagittarius, setting in Delhi
+        return BirthDetails(
+            name="Test",
+            date_time=datetime(2000, 1, 1, 17, 30),
+            place="Delhi",
+            latitude=28.6139,
+            longitude=77.2090,
+        )
+
+    @pytest.mark.asyncio
+    async def test_generate_kundli(self, repository, birth):
+        kundli = await repository.generate_kundli(birth)
+
+        assert kundli.sun_sign == ZodiacSign.SAGITTARIUS
+        assert kundli.moon_sign == ZodiacSign.LIBRA
+        assert kundli.moon_nakshatra == "Swati"
+        # Sun setting, so lagna is opposite the Sun
+        assert kundli.lagna == ZodiacSign.GEMINI
+        assert kundli.get_planet_position(Planet.SUN).house == 7
+        assert kundli.validate() == []
+
+    @pytest.mark.asyncio
+    async def test_houses_hold_planets(self, repository, birth):
+        kundli = await repository.generate_kundli(birth)
+
+        assert sum(len(h.planets) for h in kundli.houses) == 9
+        for position in kundli.planets:
+            assert position.planet in kundli.get_house(position.house).planets
+            assert 0 <= position.degree < 30
+            assert 1 <= position.nakshatra_pada <= 4
+
+    @pytest.mark.asyncio
+    async def test_timezone_applied(self, repository, birth):
+        """Test that the same wall time in another timezone gives another chart."""
+        utc_birth = BirthDetails(
+            name=birth.name, date_time=birth.date_time, place=birth.place,
+            latitude=birth.latitude, longitude=birth.longitude, timezone="UTC",
+        )
+
+        ist = await repository.generate_kundli(birth)
+        utc = await repository.generate_kundli(utc_birth)
+
+        assert ist.lagna != utc.lagna
+
+    def test_batch_matches_single(self, repository, birth):
+        births = [
+            BirthDetails(name=str(i), date_time=birth.date_time + timedelta(days=37 * i),
+                         place="Delhi", latitude=birth.latitude, longitude=birth.longitude)
+            for i in range(20)
+        ]
+
+        batch = repository.build_kundlis(births)
+
+        assert batch == [repository.build_kundli(b) for b in births]
+
+    @pytest.mark.asyncio
+    async def test_doshas(self, repository, birth):
+        kundli = await repository.generate_kundli(birth)
+        doshas = {d.dosha_type: d for d in await repository.get_doshas(kundli)}
+
+        mars = kundli.get_planet_position(Planet.MARS)
+        assert doshas[DoshaType.MANGLIK].is_present == (mars.house in (1, 4, 7, 8, 12))
+        # Saturn in Aquarius (mid 2024) is 5th from a Libra Moon
+        assert doshas[DoshaType.SADE_SATI].is_present is False
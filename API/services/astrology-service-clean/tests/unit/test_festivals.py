@@ -0,0 +1,136 @@
+"""
+Unit Tests for the festival calendar.
+
+Reference dates are published almanac dates for New Delhi.
+"""
+
+import pytest
+from datetime import date
+from zoneinfo import ZoneInfo
+
+from application.use_cases import GetFestivalsUseCase
+from application.use_cases.get_panchang import PanchangNotFoundError, PanchangValidationError
+from infrastructure.repositories import EphemerisPanchangRepository, MockPanchangRepository
+from infrastructure.repositories.festival_calendar import build_festival_calendar
+
+FESTIVALS_2024 = {
+    "Makar Sankranti": date(2024, 1, 15),
+    "Maha Shivaratri": date(2024, 3, 8),
+    "Holi": date(2024, 3, 25),
+    "Ram Navami": date(2024, 4, 17),
+    "Baisakhi": date(2024, 4, 13),
+    "Raksha Bandhan": date(2024, 8, 19),
+    "Krishna Janmashtami": date(2024, 8, 26),
+    "Ganesh Chaturthi": date(2024, 9, 7),
+    "Dussehra": date(2024, 10, 12),
+    "Diwali": date(2024, 10, 31),
+    "Bhai Dooj": date(2024, 11, 3),
+}
+
+
+class CountingPanchangRepository(EphemerisPanchangRepository):
+    """Panchang repository that counts computed festival years."""
+
+    def __init__(self):
+        super().__init__()
+        self.years = 0
+
+    def festival_calendar(self, year):
+        if year not in self._festival_years:
+            self.years += 1
+        return super().festival_calendar(year)
+
+
+@pytest.fixture(scope="module")
+def calendar():
+    return build_festival_calendar(2024, ZoneInfo("Asia/Kolkata"), 28.6139, 77.2090)
+
+
+class TestFestivalCalendar:
+    """Test festival dates against almanac values."""
+
+    def test_published_dates(self, calendar):
+        for name, expected in FESTIVALS_2024.items():
+            assert calendar.next(name, date(2023, 12, 31)).date == expected, name
+
+    def test_observance_time_decides_the_day(self):
+        """Panchami began after sunrise on 2 Feb 2025 and ended before the next."""
+        calendar = build_festival_calendar(2025, ZoneInfo("Asia/Kolkata"), 28.6139, 77.2090)
+
+        assert calendar.next("Vasant Panchami", date(2025, 1, 1)).date == date(2025, 2, 2)
+
+    def test_monthly_vrats(self, calendar):
+        assert sum(entry.name == "Ekadashi Vrat" for entry in calendar.entries) in (24, 25, 26)
+        assert [entry.name for entry in calendar.between(date(2024, 11, 1), date(2024, 11, 1))] == [
+            "Amavasya"
+        ]
+
+    def test_sorted_lookup(self, calendar):
+        october = calendar.between(date(2024, 10, 1), date(2024, 10, 31))
+
+        assert [entry.date for entry in october] == sorted(entry.date for entry in october)
+        assert {"Dussehra", "Dhanteras", "Diwali"} <= {entry.name for entry in october}
+        assert calendar.next("raksha-bandhan", date(2024, 8, 19)) is None
+
+
+class TestRepositoryFestivals:
+    """Test festival queries through the repository."""
+
+    @pytest.mark.asyncio
+    async def test_year_computed_once(self):
+        repository = CountingPanchangRepository()
+
+        for month in range(1, 13):
+            await repository.get_festivals(month, 2024)
+        await repository.get_next_festival("Diwali", date(2024, 1, 1))
+
+        assert repository.years == 1
+
+    @pytest.mark.asyncio
+    async def test_next_crosses_year(self):
+        festival = await EphemerisPanchangRepository().get_next_festival("Holi", date(2024, 6, 1))
+
+        assert festival["date"] == "2025-03-14"
+
+    @pytest.mark.asyncio
+    async def test_default_scan(self):
+        """The interface default scans months of get_festivals."""
+        festival = await MockPanchangRepository().get_next_festival(
+            "Full Moon Day", date(2024, 1, 20)
+        )
+
+        assert festival == {"date": "2024-02-15", "name": "Full Moon Day"}
+
+
+class TestGetFestivalsUseCase:
+    """Test festivals use case."""
+
+    @pytest.fixture
+    def use_case(self):
+        return GetFestivalsUseCase(panchang_repository=EphemerisPanchangRepository())
+
+    @pytest.mark.asyncio
+    async def test_month_and_year(self, use_case):
+        month = await use_case.execute(2024, 10)
+        year = await use_case.execute(2024)
+
+        assert month.count == len(month.festivals) > 0
+        assert all(f.date.startswith("2024-10") for f in month.festivals)
+        assert year.count > month.count
+
+    @pytest.mark.asyncio
+    async def test_next_occurrence(self, use_case):
+        result = await use_case.next_occurrence("diwali", "2024-10-01")
+
+        assert result.festival.date == "2024-10-31"
+        assert result.festival.name_hindi == "दीवाली"
+        assert result.days_until == 30
+
+    @pytest.mark.asyncio
+    async def test_invalid(self, use_case):
+        with pytest.raises(PanchangValidationError):
+            await use_case.execute(2024, 13)
+        with pytest.raises(PanchangValidationError):
+            await use_case.execute(3000)
+        with pytest.raises(PanchangNotFoundError):
+            await use_case.next_occurrence("Christmas")
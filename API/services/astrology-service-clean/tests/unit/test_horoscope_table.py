@@ -0,0 +1,175 @@
+"""
+Unit Tests for the precomputed horoscope table.
+
+Tests for:
+- HoroscopeTable
+- PrecomputedHoroscopeRepository
+"""
+
+import os
+import subprocess
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from domain.entities import ZodiacSign, HoroscopePeriod
+from infrastructure.repositories import (
+    HoroscopeTable,
+    MockHoroscopeRepository,
+    PrecomputedHoroscopeRepository
+)
+from infrastructure.repositories.seeding import stable_seed
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+TODAY = date(2026, 2, 4)
+
+
+class CountingHoroscopeRepository(MockHoroscopeRepository):
+    """Mock repository that counts generated horoscopes."""
+
+    def __init__(self):
+        self.generated = 0
+
+    def build_horoscope(self, sign, period, target_date):
+        self.generated += 1
+        return super().build_horoscope(sign, period, target_date)
+
+
+class TestStableSeed:
+    """Test digest seeding."""
+
+    def test_same_values_same_seed(self):
+        assert stable_seed(1, 739000, "daily") == stable_seed(1, 739000, "daily")
+
+    def test_different_values_different_seed(self):
+        assert stable_seed(1, 739000, "daily") != stable_seed(2, 739000, "daily")
+
+    def test_stable_across_processes(self):
+        """Test that the seed doesn't depend on the process hash salt."""
+        code = (
+            "from infrastructure.repositories.seeding import stable_seed;"
+            "print(stable_seed(1, 739000, 'daily'))"
+        )
+        outputs = {
+            subprocess.run(
+                [sys.executable, "-c", code],
+                cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+                env={**os.environ, "PYTHONHASHSEED": hash_seed},
+            ).stdout.strip()
+            for hash_seed in ("1", "2")
+        }
+
+        assert outputs == {str(stable_seed(1, 739000, "daily"))}
+
+
+class TestHoroscopeTable:
+    """Test table build and lookup."""
+
+    @pytest.fixture
+    def source(self):
+        return MockHoroscopeRepository()
+
+    @pytest.fixture
+    def table(self, tmp_path, source):
+        table = HoroscopeTable.build(
+            tmp_path / "table.bin", TODAY, source.build_horoscope
+        )
+        yield table
+        table.close()
+
+    def test_round_trip(self, table, source):
+        """Test that every entry matches the generator."""
+        for sign in ZodiacSign:
+            for period in (HoroscopePeriod.DAILY, HoroscopePeriod.WEEKLY,
+                           HoroscopePeriod.MONTHLY):
+                assert table.get(sign, period) == source.build_horoscope(sign, period, TODAY)
+
+    def test_hindi_text_preserved(self, table):
+        horoscope = table.get(ZodiacSign.ARIES, HoroscopePeriod.DAILY)
+        assert horoscope.sign.hindi == "मेष"
+        assert horoscope.date == TODAY
+
+    def test_reopen_from_file(self, table):
+        """Test that another worker mapping the file sees the same data."""
+        other = HoroscopeTable(table.path)
+        try:
+            assert other.date == TODAY
+            assert (other.get(ZodiacSign.LEO, HoroscopePeriod.WEEKLY)
+                    == table.get(ZodiacSign.LEO, HoroscopePeriod.WEEKLY))
+        finally:
+            other.close()
+
+    def test_rejects_foreign_file(self, tmp_path):
+        path = tmp_path / "junk.bin"
+        path.write_bytes(b"not a table at all")
+
+        with pytest.raises(ValueError):
+            HoroscopeTable(path)
+
+
+class TestPrecomputedHoroscopeRepository:
+    """Test suite for precomputed repository."""
+
+    @pytest.fixture
+    def source(self):
+        return CountingHoroscopeRepository()
+
+    @pytest.fixture
+    def repository(self, tmp_path, source):
+        return PrecomputedHoroscopeRepository(
+            source=source, table_dir=tmp_path, today=lambda: TODAY
+        )
+
+    @pytest.mark.asyncio
+    async def test_today_served_from_table(self, repository, source):
+        """Test that the table is generated once, then only looked up."""
+        first = await repository.get_horoscope(ZodiacSign.ARIES, HoroscopePeriod.DAILY)
+        generated = source.generated
+
+        again = await repository.get_horoscope(ZodiacSign.ARIES, HoroscopePeriod.DAILY)
+        await repository.get_horoscope(ZodiacSign.PISCES, HoroscopePeriod.MONTHLY)
+
+        assert generated == 36
+        assert source.generated == generated
+        assert again is first
+
+    @pytest.mark.asyncio
+    async def test_other_date_falls_back(self, repository, source):
+        repository.load()
+        generated = source.generated
+
+        result = await repository.get_horoscope(
+            ZodiacSign.ARIES, HoroscopePeriod.DAILY, date(2026, 2, 5)
+        )
+
+        assert result.date == date(2026, 2, 5)
+        assert source.generated == generated + 1
+
+    @pytest.mark.asyncio
+    async def test_workers_share_table_file(self, tmp_path, repository, source):
+        """Test that a second worker maps the existing table instead of rebuilding."""
+        repository.load()
+        other_source = CountingHoroscopeRepository()
+        other = PrecomputedHoroscopeRepository(
+            source=other_source, table_dir=tmp_path, today=lambda: TODAY
+        )
+
+        result = await other.get_horoscope(ZodiacSign.VIRGO, HoroscopePeriod.DAILY)
+
+        assert other_source.generated == 0
+        assert result == source.build_horoscope(ZodiacSign.VIRGO, HoroscopePeriod.DAILY, TODAY)
+
+    def test_old_tables_pruned(self, tmp_path, source):
+        old = tmp_path / "horoscope-2026-01-01.bin"
+        old.write_bytes(b"")
+        repository = PrecomputedHoroscopeRepository(
+            source=source, table_dir=tmp_path, today=lambda: TODAY
+        )
+
+        repository.load()
+
+        assert not old.exists()
+        assert (tmp_path / "horoscope-2026-02-04.bin").exists()
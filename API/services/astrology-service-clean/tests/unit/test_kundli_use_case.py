@@ -195,3 +195,72 @@ class TestMatchKundliUseCase:
 
         assert result.verdict in ["Excellent", "Good", "Average", "Below Average"]
         assert isinstance(result.is_recommended, bool)
+
+
+class CountingKundliRepository(MockKundliRepository):
+    """Mock repository that counts chart computations."""
+
+    def __init__(self):
+        self.generated = []
+
+    async def generate_kundli(self, birth_details):
+        self.generated.append(birth_details.name)
+        return await super().generate_kundli(birth_details)
+
+
+class TestMatchKundliComputation:
+    """Test that matching computes each chart once."""
+
+    @pytest.fixture
+    def repository(self):
+        return CountingKundliRepository()
+
+    @pytest.fixture
+    def request_pair(self):
+        return MatchingRequest(
+            person1=KundliRequest(
+                name="Person 1", date="1990-05-15", time="10:30", place="Delhi",
+                latitude=28.6139, longitude=77.2090
+            ),
+            person2=KundliRequest(
+                name="Person 2", date="1992-08-20", time="14:45", place="Mumbai",
+                latitude=19.0760, longitude=72.8777
+            ),
+        )
+
+    @pytest.mark.asyncio
+    async def test_each_chart_computed_once(self, repository, request_pair):
+        use_case = MatchKundliUseCase(kundli_repository=repository)
+
+        await use_case.execute(request_pair)
+
+        assert sorted(repository.generated) == ["Person 1", "Person 2"]
+
+    @pytest.mark.asyncio
+    async def test_manglik_status_uses_doshas(self, repository, request_pair):
+        """Test that Manglik status reflects the computed doshas."""
+        use_case = MatchKundliUseCase(kundli_repository=repository)
+        births = [
+            KundliRequest(**request_pair.person1.model_dump()),
+            KundliRequest(**request_pair.person2.model_dump()),
+        ]
+        generate = GenerateKundliUseCase(kundli_repository=MockKundliRepository())
+        manglik = [(await generate.execute(b)).has_manglik for b in births]
+
+        result = await use_case.execute(request_pair)
+
+        expected = {
+            (True, True): "Both are Manglik - Compatible",
+            (False, False): "Neither is Manglik - Compatible",
+        }.get(tuple(manglik), "One is Manglik - Needs remedies")
+        assert result.manglik_status == expected
+
+    @pytest.mark.asyncio
+    async def test_invalid_person_fails_before_computing(self, repository, request_pair):
+        request_pair.person2.date = "20-08-1992"
+        use_case = MatchKundliUseCase(kundli_repository=repository)
+
+        with pytest.raises(KundliValidationError):
+            await use_case.execute(request_pair)
+
+        assert repository.generated == []
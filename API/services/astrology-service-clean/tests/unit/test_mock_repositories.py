@@ -0,0 +1,125 @@
+"""
+Unit Tests for mock repository determinism.
+
+Mock data must be reproducible across calls, processes and restarts,
+and must not touch the global random generator.
+"""
+
+import asyncio
+import os
+import random
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from domain.entities import BirthDetails, ZodiacSign
+from infrastructure.repositories import MockHoroscopeRepository, MockKundliRepository
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+
+def _birth(name: str, hour: int) -> BirthDetails:
+    return BirthDetails(
+        name=name,
+        date_time=datetime(1990, 5, 15, hour, 30),
+        place="Delhi",
+        latitude=28.6139,
+        longitude=77.2090,
+    )
+
+
+class TestMockKundliRepository:
+    """Test kundli mock determinism."""
+
+    @pytest.fixture
+    def repository(self):
+        return MockKundliRepository()
+
+    @pytest.mark.asyncio
+    async def test_same_birth_same_kundli(self, repository):
+        first = await repository.generate_kundli(_birth("A", 10))
+        second = await MockKundliRepository().generate_kundli(_birth("A", 10))
+
+        assert first == second
+        assert await repository.get_doshas(first) == await repository.get_doshas(second)
+
+    @pytest.mark.asyncio
+    async def test_global_random_untouched(self, repository):
+        state = random.getstate()
+
+        kundli = await repository.generate_kundli(_birth("A", 10))
+        await repository.get_doshas(kundli)
+        await repository.match_kundlis(kundli, kundli)
+
+        assert random.getstate() == state
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_independent(self, repository):
+        """Test that interleaved calls give the same results as serial ones."""
+        births = [_birth(name, hour) for name in "ABCD" for hour in (6, 18)]
+        serial = [repository.build_kundli(b) for b in births]
+
+        concurrent = await asyncio.gather(*(repository.generate_kundli(b) for b in births))
+
+        assert list(concurrent) == serial
+
+    def test_process_pool_matches_inline(self, repository):
+        """Test that generation in a worker process matches this process."""
+        births = [_birth("A", 10), _birth("B", 22)]
+
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            pooled = list(pool.map(repository.build_kundli, births))
+
+        assert pooled == [repository.build_kundli(b) for b in births]
+
+    def test_independent_of_process_timezone(self):
+        """Test that the server's TZ setting doesn't change the mock data."""
+        code = (
+            "import asyncio\n"
+            "from datetime import date, datetime\n"
+            "from domain.entities import BirthDetails, HoroscopePeriod, ZodiacSign\n"
+            "from infrastructure.repositories import MockHoroscopeRepository, MockKundliRepository\n"
+            "repository = MockKundliRepository()\n"
+            "birth = BirthDetails('Ravi', datetime(1990, 5, 15, 10, 30), 'Delhi', 28.6139, 77.2090)\n"
+            "kundli = repository.build_kundli(birth)\n"
+            "doshas = asyncio.run(repository.get_doshas(kundli))\n"
+            "horoscope = MockHoroscopeRepository().build_horoscope(\n"
+            "    ZodiacSign.LEO, HoroscopePeriod.DAILY, date(2026, 2, 4))\n"
+            "print(kundli.lagna, kundli.moon_sign, [d.is_present for d in doshas], horoscope)\n"
+        )
+        outputs = {
+            subprocess.run(
+                [sys.executable, "-c", code],
+                cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+                env={**os.environ, "TZ": tz},
+            ).stdout
+            for tz in ("UTC", "Asia/Kolkata", "America/New_York")
+        }
+
+        assert len(outputs) == 1
+
+    @pytest.mark.asyncio
+    async def test_match_deterministic(self, repository):
+        k1 = await repository.generate_kundli(_birth("A", 10))
+        k2 = await repository.generate_kundli(_birth("B", 22))
+
+        assert await repository.match_kundlis(k1, k2) == await repository.match_kundlis(k1, k2)
+
+
+class TestMockHoroscopeRepository:
+    """Test horoscope mock determinism."""
+
+    @pytest.mark.asyncio
+    async def test_compatibility_symmetric_and_stable(self):
+        repository = MockHoroscopeRepository()
+
+        ab = await repository.get_compatibility(ZodiacSign.ARIES, ZodiacSign.LEO)
+        ba = await repository.get_compatibility(ZodiacSign.LEO, ZodiacSign.ARIES)
+        again = await repository.get_compatibility(ZodiacSign.ARIES, ZodiacSign.LEO)
+
+        assert ab["score"] == ba["score"] == again["score"]
+        assert 75 <= ab["score"] <= 95
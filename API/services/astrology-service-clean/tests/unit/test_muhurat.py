@@ -0,0 +1,158 @@
+"""
+Unit Tests for muhurat search.
+"""
+
+import time
+from dataclasses import replace
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from domain.entities import TithiPaksha, ZodiacSign
+from domain.entities.muhurat import MUHURAT_RULES
+from domain.entities.zodiac import NAKSHATRAS
+from application.dto import MuhuratRequest
+from application.use_cases import FindMuhuratUseCase
+from application.use_cases.get_panchang import PanchangValidationError
+from infrastructure.repositories import EphemerisPanchangRepository, MockPanchangRepository
+from infrastructure.repositories import ephemeris
+from infrastructure.repositories.panchang_timeline import NAKSHATRA_SPAN, _angles
+
+IST = ZoneInfo("Asia/Kolkata")
+DELHI = (28.6139, 77.2090)
+
+
+def _julian_day(moment: datetime) -> float:
+    return ephemeris.julian_day(moment.replace(tzinfo=IST))
+
+
+class TestMuhuratSearch:
+    """Test the ephemeris muhurat search."""
+
+    @pytest.fixture
+    def repository(self):
+        return EphemerisPanchangRepository()
+
+    @pytest.mark.asyncio
+    async def test_windows_satisfy_rules(self, repository):
+        rule = MUHURAT_RULES["marriage"]
+        windows = await repository.find_muhurats(rule, date(2024, 1, 1), date(2024, 3, 31), *DELHI)
+
+        assert windows
+        for window in windows:
+            middle = _julian_day(window.start + (window.end - window.start) / 2)
+            elongation, moon, _ = _angles(middle)[0]
+            tithi = int(elongation // 12)
+            paksha = TithiPaksha.SHUKLA if tithi < 15 else TithiPaksha.KRISHNA
+            lagna = int(ephemeris.ascendants(middle, *DELHI)[0] // 30)
+
+            assert rule.allows_tithi(tithi % 15 + 1, paksha)
+            assert window.paksha == paksha
+            assert NAKSHATRAS[int(moon // NAKSHATRA_SPAN)][0] == window.nakshatra
+            assert window.nakshatra in rule.nakshatras
+            assert list(ZodiacSign)[lagna] == window.lagna
+            assert window.lagna in rule.lagnas
+            assert window.minutes >= rule.min_minutes
+            assert 0 < window.score <= 100
+
+    @pytest.mark.asyncio
+    async def test_ranked_and_disjoint(self, repository):
+        windows = await repository.find_muhurats(
+            MUHURAT_RULES["vehicle_purchase"], date(2024, 4, 1), date(2024, 6, 30), *DELHI
+        )
+        scores = [window.score for window in windows]
+        by_start = sorted(windows, key=lambda window: window.start)
+
+        assert scores == sorted(scores, reverse=True)
+        assert all(a.end <= b.start for a, b in zip(by_start, by_start[1:]))
+
+    @pytest.mark.asyncio
+    async def test_daytime_windows_avoid_rahu_kaal(self, repository):
+        rule = MUHURAT_RULES["griha_pravesh"]
+        windows = await repository.find_muhurats(rule, date(2024, 1, 1), date(2024, 6, 30), *DELHI)
+
+        assert windows
+        for window in windows:
+            panchang = await repository.get_panchang(window.start.date(), "Delhi", *DELHI)
+            rahu, yama = panchang.rahukaal, panchang.yamaganda
+            assert panchang.sunrise <= window.start.time() and window.end.time() <= panchang.sunset
+            assert window.end.time() <= rahu.start_time or window.start.time() >= rahu.end_time
+            assert window.end.time() <= yama.start_time or window.start.time() >= yama.end_time
+            assert window.start.weekday() in rule.weekdays
+
+    @pytest.mark.asyncio
+    async def test_pruned_to_weekdays(self, repository):
+        rule = replace(MUHURAT_RULES["vehicle_purchase"], weekdays=frozenset({3}))
+        windows = await repository.find_muhurats(rule, date(2024, 1, 1), date(2024, 12, 31), *DELHI)
+
+        assert windows
+        assert {window.vara for window in windows} == {"Thursday"}
+
+    @pytest.mark.benchmark
+    @pytest.mark.asyncio
+    async def test_year_under_a_second(self, repository):
+        started = time.perf_counter()
+        for rule in MUHURAT_RULES.values():
+            await repository.find_muhurats(rule, date(2024, 1, 1), date(2024, 12, 31), *DELHI)
+
+        per_rule = (time.perf_counter() - started) / len(MUHURAT_RULES)
+        print(f"{per_rule * 1e3:.0f} ms per rule-year")
+        assert per_rule < 1.0
+
+    @pytest.mark.asyncio
+    async def test_auspicious_dates_from_windows(self, repository):
+        dates = await repository.get_auspicious_dates("griha_pravesh", date(2024, 5, 1), date(2024, 5, 31))
+        windows = await repository.find_muhurats(
+            MUHURAT_RULES["griha_pravesh"], date(2024, 5, 1), date(2024, 5, 31), *DELHI
+        )
+
+        assert dates == sorted({window.start.date() for window in windows})
+
+
+class TestDefaultMuhuratSearch:
+    """Test the whole-day fallback of the repository interface."""
+
+    @pytest.mark.asyncio
+    async def test_daylight_windows_without_lagna(self):
+        rule = replace(MUHURAT_RULES["marriage"], weekdays=frozenset(range(7)),
+                       shukla_tithis=frozenset(range(1, 16)), krishna_tithis=frozenset(range(1, 16)),
+                       nakshatras={name: 1.0 for name, _, _ in NAKSHATRAS})
+        windows = await MockPanchangRepository().find_muhurats(
+            rule, date(2024, 1, 1), date(2024, 1, 7), *DELHI
+        )
+
+        assert len(windows) == 7
+        assert all(window.lagna is None for window in windows)
+
+
+class TestFindMuhuratUseCase:
+    """Test muhurat use case."""
+
+    @pytest.fixture
+    def use_case(self):
+        return FindMuhuratUseCase(panchang_repository=EphemerisPanchangRepository(), max_days=62)
+
+    @pytest.mark.asyncio
+    async def test_response(self, use_case):
+        response = await use_case.execute(MuhuratRequest(
+            purpose="marriage", from_date="2024-01-01", to_date="2024-02-29", limit=5
+        ))
+
+        assert response.purpose_name == "Vivah"
+        assert len(response.windows) == 5
+        assert response.total >= 5
+        assert response.windows[0].score >= response.windows[-1].score
+        assert response.windows[0].lagna in ("Gemini", "Virgo", "Libra", "Taurus",
+                                             "Cancer", "Sagittarius", "Pisces")
+
+    @pytest.mark.asyncio
+    async def test_invalid_requests(self, use_case):
+        for kwargs in (
+            dict(purpose="travel", from_date="2024-01-01", to_date="2024-01-31"),
+            dict(purpose="marriage", from_date="2024-01-31", to_date="2024-01-01"),
+            dict(purpose="marriage", from_date="2024-01-01", to_date="2024-06-01"),
+            dict(purpose="marriage", from_date="2024-01-01", to_date="2024-01-31", limit=0),
+        ):
+            with pytest.raises(PanchangValidationError):
+                await use_case.execute(MuhuratRequest(**kwargs))
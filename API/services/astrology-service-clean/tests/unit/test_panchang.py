@@ -0,0 +1,233 @@
+"""
+Unit Tests for the ephemeris panchang.
+
+Reference values are published almanac times for New Delhi (IST).
+"""
+
+import pytest
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, time, timedelta
+
+from domain.entities import TithiPaksha
+from application.dto import PanchangRequest, PanchangRangeRequest
+from application.use_cases import GetPanchangUseCase, GetPanchangRangeUseCase
+from application.use_cases.get_panchang import PanchangNotFoundError, PanchangValidationError
+from infrastructure.repositories import EphemerisPanchangRepository
+from infrastructure.repositories import ephemeris
+from infrastructure.repositories.ephemeris_panchang_repository import _karana_number
+from infrastructure.repositories.panchang_timeline import _angles, solve_boundaries
+
+DELHI = ("Delhi", 28.6139, 77.2090)
+DIWALI_2024 = date(2024, 11, 1)
+
+
+def _minutes(value: time) -> int:
+    return value.hour * 60 + value.minute
+
+
+class CountingPanchangRepository(EphemerisPanchangRepository):
+    """Panchang repository that counts computed days."""
+
+    def __init__(self):
+        super().__init__()
+        self.computed = 0
+
+    def build_range(self, start, end, *args):
+        self.computed += (end - start).days + 1
+        return super().build_range(start, end, *args)
+
+
+class TestEphemerisPanchang:
+    """Test computed panchang against almanac values."""
+
+    @pytest.fixture
+    def repository(self):
+        return EphemerisPanchangRepository()
+
+    @pytest.mark.asyncio
+    async def test_sunrise_sunset(self, repository):
+        winter = await repository.get_panchang(date(2024, 1, 15), *DELHI)
+        summer = await repository.get_panchang(date(2024, 6, 21), *DELHI)
+
+        assert abs(_minutes(winter.sunrise) - _minutes(time(7, 15))) <= 2
+        assert abs(_minutes(winter.sunset) - _minutes(time(17, 46))) <= 2
+        assert abs(_minutes(summer.sunrise) - _minutes(time(5, 24))) <= 2
+        assert abs(_minutes(summer.sunset) - _minutes(time(19, 22))) <= 2
+
+    @pytest.mark.asyncio
+    async def test_amavasya_end_time(self, repository):
+        """Amavasya ended at 18:16 IST on Diwali 2024."""
+        panchang = await repository.get_panchang(DIWALI_2024, *DELHI)
+
+        assert panchang.tithi.name == "Amavasya"
+        assert panchang.tithi.paksha == TithiPaksha.KRISHNA
+        assert panchang.is_amavasya
+        assert abs(_minutes(panchang.tithi.end_time) - _minutes(time(18, 16))) <= 6
+        assert panchang.hindu_month == "Ashwina"
+        assert panchang.hindu_year == 2081
+
+    @pytest.mark.asyncio
+    async def test_periods_follow_day_length(self, repository):
+        panchang = await repository.get_panchang(DIWALI_2024, *DELHI)  # A Friday
+        day = _minutes(panchang.sunset) - _minutes(panchang.sunrise)
+
+        rahu_start = _minutes(panchang.rahukaal.start_time) - _minutes(panchang.sunrise)
+        assert rahu_start == pytest.approx(3 * day / 8, abs=1)
+        assert (_minutes(panchang.rahukaal.end_time) - _minutes(panchang.rahukaal.start_time)
+                == pytest.approx(day / 8, abs=1))
+        noon = (_minutes(panchang.sunrise) + _minutes(panchang.sunset)) / 2
+        abhijit = panchang.abhijit_muhurta
+        assert (_minutes(abhijit.start_time) + _minutes(abhijit.end_time)) / 2 == pytest.approx(noon, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_polar_day(self, repository):
+        assert await repository.get_panchang(date(2024, 6, 21), "Tromso", 69.65, 18.95) is None
+
+    @pytest.mark.asyncio
+    async def test_cached_per_rounded_location(self):
+        repository = CountingPanchangRepository()
+
+        first = await repository.get_panchang(DIWALI_2024, *DELHI)
+        second = await repository.get_panchang(DIWALI_2024, "New Delhi", 28.6141, 77.2088)
+
+        assert repository.computed == 1
+        assert second.city == "New Delhi"
+        assert second.latitude == 28.6141
+        assert second.sunrise == first.sunrise
+
+
+class TestBoundarySolver:
+    """Test limb boundary solving."""
+
+    def test_boundaries_hit_targets(self):
+        start = ephemeris.julian_day(datetime(2024, 3, 1))
+        targets = [96.0, 40.0, 200.0]
+        found = solve_boundaries([start, start, start], [0, 1, 2], targets)
+
+        angles = _angles(found)
+        for row, target in enumerate(targets):
+            assert angles[row, row] == pytest.approx(target, abs=1e-4)
+
+    def test_karanas_of_a_month(self):
+        numbers = [_karana_number(i) for i in range(60)]
+
+        assert numbers[0] == 11
+        assert numbers[1:8] == [1, 2, 3, 4, 5, 6, 7]
+        assert numbers[-3:] == [8, 9, 10]
+        assert numbers.count(7) == 8  # Vishti
+
+
+class TestGetPanchangUseCase:
+    """Test panchang use case with the ephemeris repository."""
+
+    @pytest.mark.asyncio
+    async def test_not_found_for_polar_day(self):
+        use_case = GetPanchangUseCase(panchang_repository=EphemerisPanchangRepository())
+
+        with pytest.raises(PanchangNotFoundError):
+            await use_case.execute(PanchangRequest(
+                date="2024-06-21", city="Tromso", latitude=69.65, longitude=18.95
+            ))
+
+    @pytest.mark.asyncio
+    async def test_response(self):
+        use_case = GetPanchangUseCase(panchang_repository=EphemerisPanchangRepository())
+        response = await use_case.execute(PanchangRequest(date="2024-11-01"))
+
+        assert response.day == "Friday"
+        assert response.tithi.name == "Amavasya"
+        assert response.festivals == ["Amavasya"]
+        assert response.rahukaal.start_time < response.rahukaal.end_time
+        assert response.sunrise < response.sunset
+
+
+class TestPanchangRange:
+    """Test range computation."""
+
+    @pytest.mark.asyncio
+    async def test_range_matches_single_days(self):
+        repository = EphemerisPanchangRepository()
+        start = date(2024, 1, 20)
+        days = repository.build_range(start, start + timedelta(days=39), *DELHI)
+
+        assert len(days) == 40
+        for offset in (0, 11, 12, 25, 39):
+            assert days[offset] == repository.build_panchang(start + timedelta(days=offset), *DELHI)
+
+    @pytest.mark.asyncio
+    async def test_months_cached(self):
+        repository = CountingPanchangRepository()
+
+        await repository.get_panchang_range(date(2024, 1, 1), date(2024, 1, 31), *DELHI)
+        days = await repository.get_panchang_range(date(2024, 1, 10), date(2024, 2, 5), *DELHI)
+
+        assert repository.computed == 31 + 5  # January reused, only February days computed
+        assert [d.date for d in days] == [
+            date(2024, 1, 10) + timedelta(days=i) for i in range(27)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_process_pool(self):
+        inline = EphemerisPanchangRepository()
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            pooled = EphemerisPanchangRepository(executor=executor)
+            result = await pooled.get_panchang_range(date(2024, 1, 25), date(2024, 3, 5), *DELHI)
+
+        assert result == await inline.get_panchang_range(date(2024, 1, 25), date(2024, 3, 5), *DELHI)
+
+    @pytest.mark.asyncio
+    async def test_polar_days_are_empty(self):
+        repository = EphemerisPanchangRepository()
+        days = await repository.get_panchang_range(
+            date(2024, 6, 20), date(2024, 6, 21), "Tromso", 69.65, 18.95
+        )
+
+        assert days == [None, None]
+
+
+class TestGetPanchangRangeUseCase:
+    """Test columnar range use case."""
+
+    @pytest.fixture
+    def use_case(self):
+        return GetPanchangRangeUseCase(
+            panchang_repository=EphemerisPanchangRepository(), max_days=62, version="1"
+        )
+
+    def _request(self, start: str, end: str, **kwargs) -> PanchangRangeRequest:
+        return PanchangRangeRequest(from_date=start, to_date=end, **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_columns(self, use_case):
+        result = await use_case.execute(self._request("2024-10-30", "2024-11-02"))
+        columns = result.columns
+
+        assert result.days == 4
+        assert columns.date == ["2024-10-30", "2024-10-31", "2024-11-01", "2024-11-02"]
+        assert columns.day[2] == "Friday"
+        assert columns.tithi[2] == "Amavasya"
+        assert columns.festivals[2] == ["Amavasya"]
+        assert all(len(values) == 4 for values in columns.model_dump().values())
+
+    @pytest.mark.asyncio
+    async def test_polar_rows_null(self, use_case):
+        result = await use_case.execute(self._request(
+            "2024-06-20", "2024-06-21", city="Tromso", latitude=69.65, longitude=18.95
+        ))
+
+        assert result.columns.day == ["Thursday", "Friday"]
+        assert result.columns.sunrise == [None, None]
+
+    def test_etag(self, use_case):
+        etag = use_case.etag(self._request("2024-01-01", "2024-01-31"))
+
+        assert etag == use_case.etag(self._request("2024-01-01", "2024-01-31"))
+        assert etag != use_case.etag(self._request("2024-01-01", "2024-01-30"))
+        assert etag != use_case.etag(self._request("2024-01-01", "2024-01-31", city="Mumbai"))
+
+    @pytest.mark.asyncio
+    async def test_invalid_ranges(self, use_case):
+        for start, end in (("2024-02-01", "2024-01-01"), ("2024-01-01", "2024-06-01"),
+                           ("01-01-2024", "2024-01-02")):
+            with pytest.raises(PanchangValidationError):
+                await use_case.execute(self._request(start, end))
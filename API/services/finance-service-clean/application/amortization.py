@@ -0,0 +1,220 @@
+"""
+EMI Amortization Schedules.
+
+A schedule is a run of segments with a constant rate and EMI, split at
+prepayments and rate resets. Within a segment the balance after k
+EMIs has the closed form
+
+    B_k = B_0 g_k - E (g_k - 1) / r,    g_k = (1 + r)^k
+
+with g_k a cumulative product, so every column of a segment is one
+array expression; only the (few) segment boundaries are a Python loop.
+Schedules are columnar and cached, so paging through a 360-month loan
+is slicing.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from math import ceil, log
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from domain.entities import EMIBreakdown, Prepayment, RateReset
+
+# Balances below this (one paisa) count as repaid
+_EPSILON = 0.005
+
+
+def monthly_emi(principal: float, annual_rate: float, months: int) -> float:
+    """EMI repaying a principal over a number of months."""
+    r = annual_rate / 12 / 100
+    if r == 0:
+        return principal / months
+    return principal * r / (1 - (1 + r) ** -months)
+
+
+@dataclass(frozen=True)
+class AmortizationSchedule:
+    """Month-wise schedule as read-only columns, one entry per month."""
+    month: np.ndarray
+    emi: np.ndarray  # Scheduled payment (the last one can be smaller)
+    principal: np.ndarray
+    interest: np.ndarray
+    prepayment: np.ndarray
+    balance: np.ndarray  # After the EMI and any prepayment
+
+    @property
+    def months(self) -> int:
+        return int(self.month.shape[0])
+
+    @property
+    def total_interest(self) -> float:
+        return float(self.interest.sum())
+
+    @property
+    def total_amount(self) -> float:
+        return float(self.emi.sum() + self.prepayment.sum())
+
+    def rows(self, offset: int = 0, limit: int = None) -> List[dict]:
+        """A page of months, rounded to paise."""
+        end = self.months if limit is None else offset + limit
+        return _rows(
+            ("month", self.month[offset:end]),
+            ("emi", self.emi[offset:end]),
+            ("principal", self.principal[offset:end]),
+            ("interest", self.interest[offset:end]),
+            ("prepayment", self.prepayment[offset:end]),
+            ("balance", self.balance[offset:end]),
+        )
+
+    def yearly(self) -> List[dict]:
+        """Totals per loan year (12 EMIs), with the balance at its end."""
+        starts = np.arange(0, self.months, 12)
+        ends = np.minimum(starts + 11, self.months - 1)
+        return _rows(
+            ("year", starts // 12 + 1),
+            ("emi", np.add.reduceat(self.emi, starts)),
+            ("principal", np.add.reduceat(self.principal, starts)),
+            ("interest", np.add.reduceat(self.interest, starts)),
+            ("prepayment", np.add.reduceat(self.prepayment, starts)),
+            ("balance", self.balance[ends]),
+        )
+
+    def breakdown(self) -> List[EMIBreakdown]:
+        """Schedule as EMIBreakdown entities."""
+        return [EMIBreakdown(**row) for row in self.rows()]
+
+
+def _rows(*columns: Tuple[str, np.ndarray]) -> List[dict]:
+    names = [name for name, _ in columns]
+    values = [
+        column.tolist() if column.dtype.kind == "i" else np.round(column, 2).tolist()
+        for _, column in columns
+    ]
+    return [dict(zip(names, row)) for row in zip(*values)]
+
+
+def amortize(
+    principal: float,
+    annual_rate: float,
+    tenure_months: int,
+    prepayments: Sequence[Prepayment] = (),
+    rate_resets: Sequence[RateReset] = (),
+    reduce_emi: bool = False
+) -> AmortizationSchedule:
+    """
+    Amortization schedule of a loan.
+
+    A prepayment is paid after its month's EMI and shortens the tenure
+    at the same EMI, or with reduce_emi keeps the end date and lowers
+    the EMI. A rate reset recomputes the EMI for the remaining tenure.
+    Events after the loan is repaid are ignored.
+    """
+    return _amortize(
+        float(principal), float(annual_rate), int(tenure_months),
+        tuple(sorted((p.month, float(p.amount)) for p in prepayments)),
+        tuple(sorted((r.month, float(r.annual_rate)) for r in rate_resets)),
+        bool(reduce_emi)
+    )
+
+
+@lru_cache(maxsize=1024)
+def _amortize(
+    principal: float,
+    annual_rate: float,
+    tenure_months: int,
+    prepayments: Tuple[Tuple[int, float], ...],
+    rate_resets: Tuple[Tuple[int, float], ...],
+    reduce_emi: bool
+) -> AmortizationSchedule:
+    # Events by months elapsed: a prepayment after month p and a reset
+    # from month q both apply once p (or q - 1) EMIs are paid
+    lumps = {}
+    for month, amount in prepayments:
+        lumps[month] = lumps.get(month, 0.0) + amount
+    resets = {month - 1: rate for month, rate in rate_resets}
+    boundaries = sorted(set(lumps) | set(resets))
+
+    rate, balance, elapsed, end = annual_rate / 1200, principal, 0, tenure_months
+    emi = monthly_emi(principal, annual_rate, tenure_months)
+    segments = []
+    for boundary in boundaries + [None]:
+        stop = end if boundary is None else min(boundary, end)
+        segment = _segment(balance, rate, emi, stop - elapsed)
+        segments.append(segment)
+        elapsed += segment[0].shape[0]
+        balance = float(segment[4][-1]) if segment[0].shape[0] else balance
+        if balance <= _EPSILON or boundary is None or elapsed < boundary:
+            break
+
+        lump = min(lumps.get(boundary, 0.0), balance)
+        if lump:
+            segment[3][-1] = lump
+            segment[4][-1] = balance = balance - lump
+            if balance <= _EPSILON:
+                break
+            if reduce_emi:
+                emi = _annuity(balance, rate, end - elapsed)
+            else:
+                end = elapsed + _months_to_repay(balance, rate, emi)
+        if boundary in resets:
+            rate = resets[boundary] / 1200
+            emi = _annuity(balance, rate, end - elapsed)
+
+    emis, principals, interests, lumps_paid, balances = (
+        np.concatenate([segment[i] for segment in segments]) for i in range(5)
+    )
+    # Float residue of the closed form goes into the final EMI
+    emis[-1] += balances[-1]
+    principals[-1] += balances[-1]
+    balances[-1] = 0.0
+
+    columns = (np.arange(1, emis.shape[0] + 1), emis, principals, interests, lumps_paid, balances)
+    for column in columns:
+        column.setflags(write=False)
+    return AmortizationSchedule(*columns)
+
+
+def _annuity(balance: float, rate: float, months: int) -> float:
+    """EMI for a monthly rate."""
+    return monthly_emi(balance, rate * 1200, months)
+
+
+def _months_to_repay(balance: float, rate: float, emi: float) -> int:
+    """EMIs needed to repay a balance (the last one partial)."""
+    if rate == 0:
+        return ceil(balance / emi - 1e-9)
+    return ceil(-log(1 - balance * rate / emi) / log(1 + rate) - 1e-9)
+
+
+def _segment(
+    balance: float,
+    rate: float,
+    emi: float,
+    months: int
+) -> Tuple[np.ndarray, ...]:
+    """(emi, principal, interest, prepayment, balance) columns of a segment."""
+    if months <= 0:
+        return tuple(np.zeros(0) for _ in range(5))
+
+    growth = np.cumprod(np.full(months, 1 + rate))
+    if rate > 0:
+        balances = balance * growth - emi * (growth - 1) / rate
+    else:
+        balances = balance - emi * np.arange(1, months + 1)
+
+    # Repaid early: the first month whose balance reaches zero is the
+    # last, and its EMI is whatever is left
+    repaid = np.flatnonzero(balances <= _EPSILON)
+    emis = np.full(months, emi)
+    if repaid.shape[0]:
+        months = int(repaid[0]) + 1
+        balances, emis = balances[:months], emis[:months]
+        balances[-1] = 0.0
+
+    opening = np.concatenate(([balance], balances[:-1]))
+    interest = opening * rate
+    principal = opening - balances
+    emis[-1] = principal[-1] + interest[-1]
+    return emis, principal, interest, np.zeros(months), balances
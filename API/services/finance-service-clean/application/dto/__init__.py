@@ -1,10 +1,26 @@
 """Application DTOs for Finance Service."""
-from .emi_dto import EMIRequest, EMIResponse
-from .stock_dto import StockPriceRequest, StockPriceResponse, StockSearchRequest
-from .sip_dto import SIPRequest, SIPResponse
+from .emi_dto import (
+    EMIRequest, EMIResponse, EMIScheduleRequest, EMIScheduleResponse,
+    EMISweepRequest, EMISweepResponse
+)
+from .stock_dto import (
+    StockPriceRequest, StockPriceResponse, StockQuotesRequest, StockQuotesResponse,
+    StockSearchRequest, StockSearchResponse, TopMoversRequest, TopMoversResponse,
+    StockHistoryRequest, StockHistoryResponse
+)
+from .sip_dto import (
+    SIPRequest, SIPResponse, SIPSweepRequest, SIPSweepResponse,
+    SIPGoalRequest, SIPGoalResponse, StepUpSIPRequest, StepUpSIPResponse,
+    XIRRRequest, XIRRResponse
+)
 
 __all__ = [
-    "EMIRequest", "EMIResponse",
-    "StockPriceRequest", "StockPriceResponse", "StockSearchRequest",
-    "SIPRequest", "SIPResponse"
+    "EMIRequest", "EMIResponse", "EMIScheduleRequest", "EMIScheduleResponse",
+    "EMISweepRequest", "EMISweepResponse",
+    "StockPriceRequest", "StockPriceResponse", "StockQuotesRequest", "StockQuotesResponse",
+    "StockSearchRequest", "StockSearchResponse", "TopMoversRequest", "TopMoversResponse",
+    "StockHistoryRequest", "StockHistoryResponse",
+    "SIPRequest", "SIPResponse", "SIPSweepRequest", "SIPSweepResponse",
+    "SIPGoalRequest", "SIPGoalResponse", "StepUpSIPRequest", "StepUpSIPResponse",
+    "XIRRRequest", "XIRRResponse",
 ]
@@ -2,6 +2,7 @@
 from pydantic import BaseModel, Field
 from typing import Optional, List
 from enum import Enum
+from .sweep_dto import SweepAxis
 
 
 class LoanTypeDTO(str, Enum):
@@ -17,6 +18,26 @@ class EMIBreakdownDTO(BaseModel):
     principal: float
     interest: float
     balance: float
+    prepayment: float = 0
+
+
+class EMIYearDTO(BaseModel):
+    year: int
+    emi: float
+    principal: float
+    interest: float
+    prepayment: float
+    balance: float
+
+
+class PrepaymentDTO(BaseModel):
+    month: int = Field(..., gt=0, le=360, description="Paid after this month's EMI")
+    amount: float = Field(..., gt=0)
+
+
+class RateResetDTO(BaseModel):
+    month: int = Field(..., gt=1, le=360, description="First EMI at the new rate")
+    annual_rate: float = Field(..., ge=0, le=50)
 
 
 class EMIRequest(BaseModel):
@@ -24,6 +45,34 @@ class EMIRequest(BaseModel):
     annual_rate: float = Field(..., ge=0, le=50, description="Annual interest rate percentage")
     tenure_months: int = Field(..., gt=0, le=360, description="Loan tenure in months")
     loan_type: LoanTypeDTO = LoanTypeDTO.PERSONAL
+    include_breakdown: bool = Field(False, description="Add the month-wise breakup")
+
+
+class EMIScheduleRequest(BaseModel):
+    principal: float = Field(..., gt=0, description="Loan principal amount")
+    annual_rate: float = Field(..., ge=0, le=50, description="Annual interest rate percentage")
+    tenure_months: int = Field(..., gt=0, le=360, description="Loan tenure in months")
+    prepayments: List[PrepaymentDTO] = Field(default_factory=list, max_length=360)
+    rate_resets: List[RateResetDTO] = Field(default_factory=list, max_length=360)
+    reduce_emi: bool = Field(False, description="Prepayments lower the EMI instead of the tenure")
+    period: str = Field("monthly", pattern="^(monthly|yearly)$", description="monthly or yearly rows")
+    offset: int = Field(0, ge=0, description="First row to return")
+    limit: int = Field(120, gt=0, le=360, description="Rows to return")
+
+
+class EMIScheduleResponse(BaseModel):
+    success: bool = True
+    principal: float
+    annual_rate: float
+    monthly_emi: float  # Initial EMI
+    tenure_months: int  # Actual, after prepayments
+    total_interest: float
+    total_amount: float
+    period: str
+    total_rows: int
+    offset: int
+    breakdown: Optional[List[EMIBreakdownDTO]] = None
+    yearly_breakdown: Optional[List[EMIYearDTO]] = None
 
 
 class EMIResponse(BaseModel):
@@ -36,3 +85,19 @@ class EMIResponse(BaseModel):
     total_interest: float
     total_amount: float
     breakdown: Optional[List[EMIBreakdownDTO]] = None
+
+
+class EMISweepRequest(BaseModel):
+    principal: SweepAxis = Field(..., description="Amount, list of amounts or {start, stop, step}")
+    annual_rate: SweepAxis = Field(..., description="Rate, list of rates or {start, stop, step}")
+    tenure_months: SweepAxis = Field(..., description="Months, list of months or {start, stop, step}")
+
+
+class EMISweepResponse(BaseModel):
+    success: bool = True
+    principal: List[float]
+    annual_rate: List[float]
+    tenure_months: List[int]
+    # Indexed [principal][annual_rate][tenure_months]
+    monthly_emi: List[List[List[float]]]
+    total_interest: List[List[List[float]]]
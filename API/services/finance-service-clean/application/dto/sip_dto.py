@@ -1,5 +1,8 @@
 """SIP DTOs."""
 from pydantic import BaseModel, Field
+from datetime import date
+from typing import List, Optional
+from .sweep_dto import SweepAxis
 
 
 class SIPRequest(BaseModel):
@@ -16,3 +19,78 @@ class SIPResponse(BaseModel):
     total_invested: float
     estimated_returns: float
     maturity_value: float
+
+
+class SIPSweepRequest(BaseModel):
+    monthly_investment: SweepAxis = Field(..., description="Amount, list of amounts or {start, stop, step}")
+    expected_return_rate: SweepAxis = Field(..., description="Rate, list of rates or {start, stop, step}")
+    duration_years: SweepAxis = Field(..., description="Years, list of years or {start, stop, step}")
+
+
+class SIPSweepResponse(BaseModel):
+    success: bool = True
+    monthly_investment: List[float]
+    expected_return_rate: List[float]
+    duration_years: List[int]
+    # Indexed [monthly_investment][expected_return_rate][duration_years]
+    maturity_value: List[List[List[float]]]
+    estimated_returns: List[List[List[float]]]
+
+
+class SIPGoalRequest(BaseModel):
+    target_amount: float = Field(..., gt=0, description="Amount to accumulate")
+    duration_years: int = Field(..., gt=0, le=40, description="Investment duration in years")
+    expected_return_rate: float = Field(..., ge=0, le=30, description="Expected annual return rate percentage")
+    annual_step_up: float = Field(0, ge=0, le=50, description="Yearly SIP increase percentage")
+
+
+class SIPGoalResponse(BaseModel):
+    success: bool = True
+    target_amount: float
+    duration_years: int
+    expected_return_rate: float
+    annual_step_up: float
+    monthly_investment: float  # First year's SIP
+    total_invested: float
+    estimated_returns: float
+
+
+class StepUpSIPRequest(BaseModel):
+    monthly_investment: float = Field(..., gt=0, description="First year's monthly SIP")
+    duration_years: int = Field(..., gt=0, le=40, description="Investment duration in years")
+    expected_return_rate: float = Field(..., ge=0, le=30, description="Expected annual return rate percentage")
+    annual_step_up: float = Field(10, ge=0, le=50, description="Yearly SIP increase percentage")
+
+
+class StepUpYearDTO(BaseModel):
+    year: int
+    monthly_investment: float
+    total_invested: float
+    value: float
+
+
+class StepUpSIPResponse(BaseModel):
+    success: bool = True
+    monthly_investment: float
+    duration_years: int
+    expected_return_rate: float
+    annual_step_up: float
+    total_invested: float
+    estimated_returns: float
+    maturity_value: float
+    yearly: List[StepUpYearDTO]
+
+
+class CashFlowDTO(BaseModel):
+    date: date
+    amount: float = Field(..., description="Negative for investments, positive for redemptions or current value")
+
+
+class XIRRRequest(BaseModel):
+    portfolios: List[List[CashFlowDTO]] = Field(..., min_length=1, max_length=10000)
+
+
+class XIRRResponse(BaseModel):
+    success: bool = True
+    # Annual percentage per portfolio, in request order; None without a solution
+    xirr: List[Optional[float]]
@@ -1,7 +1,7 @@
 """Stock DTOs."""
 from pydantic import BaseModel, Field
-from typing import Optional, List
-from datetime import datetime
+from typing import Dict, Optional, List
+from datetime import date, datetime
 from enum import Enum
 
 
@@ -15,8 +15,21 @@ class StockPriceRequest(BaseModel):
     exchange: ExchangeDTO = ExchangeDTO.NSE
 
 
+class StockQuotesRequest(BaseModel):
+    symbols: List[str]
+    exchange: ExchangeDTO = ExchangeDTO.NSE
+
+
+class TopMoversRequest(BaseModel):
+    exchange: ExchangeDTO = ExchangeDTO.NSE
+    limit: int = Field(default=10, ge=1, le=50)
+    include_gainers: bool = True
+    include_losers: bool = True
+
+
 class StockSearchRequest(BaseModel):
     query: str = Field(..., min_length=1, max_length=50)
+    limit: int = Field(default=10, ge=1, le=50)
 
 
 class StockDTO(BaseModel):
@@ -51,6 +64,12 @@ class StockPriceResponse(BaseModel):
     error: Optional[str] = None
 
 
+class StockQuotesResponse(BaseModel):
+    success: bool = True
+    data: List[StockPriceDTO] = []
+    not_found: List[str] = []
+
+
 class StockSearchResponse(BaseModel):
     success: bool = True
     results: List[StockDTO] = []
@@ -58,5 +77,45 @@ class StockSearchResponse(BaseModel):
 
 class TopMoversResponse(BaseModel):
     success: bool = True
-    gainers: List[StockPriceDTO] = []
-    losers: List[StockPriceDTO] = []
+    # None when the request left that side out
+    gainers: Optional[List[StockPriceDTO]] = None
+    losers: Optional[List[StockPriceDTO]] = None
+
+
+class TickDTO(BaseModel):
+    symbol: str
+    exchange: str
+    price: float
+    change: float
+    change_percent: float
+    volume: int
+    timestamp: datetime
+
+
+class CandleDTO(BaseModel):
+    date: date
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: int
+
+
+class StockHistoryRequest(BaseModel):
+    symbol: str = Field(..., min_length=1, max_length=20)
+    exchange: ExchangeDTO = ExchangeDTO.NSE
+    start: Optional[date] = None
+    end: Optional[date] = None
+    sma: Optional[int] = Field(default=None, ge=2, le=500)
+    ema: Optional[int] = Field(default=None, ge=2, le=500)
+    rsi: Optional[int] = Field(default=None, ge=2, le=500)
+
+
+class StockHistoryResponse(BaseModel):
+    success: bool = True
+    symbol: str
+    exchange: str
+    candles: List[CandleDTO] = []
+    indicators: Dict[str, List[Optional[float]]] = {}
+    week_52_high: Optional[float] = None
+    week_52_low: Optional[float] = None
@@ -0,0 +1,29 @@
+"""Sweep DTOs shared by the EMI and SIP calculators."""
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Union
+from application.sweeps import MAX_AXIS_VALUES
+
+
+class SweepRangeDTO(BaseModel):
+    start: float
+    stop: float = Field(..., description="Inclusive")
+    step: float = Field(..., gt=0)
+
+    @model_validator(mode="after")
+    def check_order(self):
+        if self.stop < self.start:
+            raise ValueError("stop must not be below start")
+        # Checked here so an oversized range is never expanded
+        if (self.stop - self.start) / self.step + 1e-9 >= MAX_AXIS_VALUES:
+            raise ValueError(f"range has more than {MAX_AXIS_VALUES} values")
+        return self
+
+    def count(self) -> int:
+        return int((self.stop - self.start) / self.step + 1e-9) + 1
+
+    def values(self) -> List[float]:
+        return [round(self.start + i * self.step, 10) for i in range(self.count())]
+
+
+# One value, a list of values, or an inclusive range
+SweepAxis = Union[float, List[float], SweepRangeDTO]
@@ -0,0 +1,79 @@
+"""
+Technical Indicators.
+
+Vectorized indicators over a column of daily closes, aligned with it:
+entries without enough history are NaN.
+
+EMA and Wilder's RSI smoothing are recursive. They are evaluated a
+block at a time with the closed form
+
+    y_j = b^(j+1) y_(-1) + a sum_(k<=j) b^(j-k) x_k,    b = 1 - a
+
+where the block length keeps b^-j within 1e12, so each block is a
+cumulative sum and only the blocks are a Python loop.
+"""
+
+from math import floor, log
+
+import numpy as np
+
+# Largest b^-j a smoothing block may reach
+_BLOCK_RANGE = 1e12
+
+
+def sma(values: np.ndarray, period: int) -> np.ndarray:
+    """Simple moving average."""
+    values = np.asarray(values, dtype=float)
+    result = np.full(values.shape[0], np.nan)
+    if values.shape[0] >= period:
+        sums = np.cumsum(np.concatenate(([0.0], values)))
+        result[period - 1:] = (sums[period:] - sums[:-period]) / period
+    return result
+
+
+def _smooth(values: np.ndarray, alpha: float, seed: float) -> np.ndarray:
+    """Exponential smoothing y_j = b y_(j-1) + a x_j from y_(-1) = seed, 0 < a < 1."""
+    decay = 1 - alpha
+    block = max(1, floor(log(_BLOCK_RANGE) / -log(decay)))
+    result = np.empty(values.shape[0])
+    last = seed
+    for start in range(0, values.shape[0], block):
+        chunk = values[start:start + block]
+        powers = decay ** np.arange(1, chunk.shape[0] + 1)  # b^(j+1)
+        # sum_k b^(j-k) x_k = b^(j+1) * sum_k x_k / b^(k+1)
+        result[start:start + chunk.shape[0]] = powers * (last + alpha * np.cumsum(chunk / powers))
+        last = result[start + chunk.shape[0] - 1]
+    return result
+
+
+def ema(values: np.ndarray, period: int) -> np.ndarray:
+    """Exponential moving average (alpha 2 / (period + 1)), seeded with the first SMA."""
+    values = np.asarray(values, dtype=float)
+    result = np.full(values.shape[0], np.nan)
+    if values.shape[0] >= period:
+        seed = values[:period].mean()
+        result[period - 1] = seed
+        result[period:] = _smooth(values[period:], 2 / (period + 1), seed)
+    return result
+
+
+def rsi(values: np.ndarray, period: int = 14) -> np.ndarray:
+    """Relative strength index with Wilder's smoothing."""
+    values = np.asarray(values, dtype=float)
+    result = np.full(values.shape[0], np.nan)
+    if values.shape[0] <= period:
+        return result
+    change = np.diff(values)
+    gain = _wilder(np.maximum(change, 0), period)
+    loss = _wilder(np.maximum(-change, 0), period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        strength = 100 - 100 / (1 + gain / loss)
+    result[period:] = np.where(loss == 0, np.where(gain == 0, 50.0, 100.0), strength)
+    return result
+
+
+def _wilder(values: np.ndarray, period: int) -> np.ndarray:
+    """Wilder's average from the period-th value on, seeded with the first mean."""
+    seed = values[:period].mean()
+    return np.concatenate(([seed], _smooth(values[period:], 1 / period, seed)))
+
@@ -0,0 +1,157 @@
+"""
+Quote Hub.
+
+Fans one upstream quote feed out to many subscribers. The hub reads
+the feed once, keeps the last few ticks of each symbol in a ring
+buffer, and hands each tick only to subscriptions watching its symbol.
+
+A subscription holds at most one pending tick per symbol: a consumer
+that falls behind skips to the latest price instead of queueing every
+intermediate tick, so a slow client costs bounded memory and never
+holds up the others.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Sequence, Set
+
+from domain.entities import Tick
+from domain.repositories import QuoteFeed
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait before reopening a feed that closed or failed
+_RECONNECT_DELAY = 1.0
+
+
+class Subscription:
+    """A consumer's view of the hub: the latest pending tick per watched symbol."""
+
+    def __init__(self, hub: "QuoteHub"):
+        self._hub = hub
+        self._pending: Dict[str, Tick] = {}
+        self._ready = asyncio.Event()
+        self.symbols: Set[str] = set()
+        self.closed = False
+
+    def add(self, symbols: Iterable[str]) -> None:
+        """Watch more symbols."""
+        self._hub._watch(self, symbols)
+
+    def remove(self, symbols: Iterable[str]) -> None:
+        """Stop watching symbols and drop their pending ticks."""
+        symbols = list(symbols)
+        self._hub._unwatch(self, symbols)
+        for symbol in symbols:
+            self._pending.pop(symbol, None)
+
+    def close(self) -> None:
+        """Stop watching everything."""
+        self.remove(list(self.symbols))
+        self.closed = True
+        self._ready.set()
+
+    async def next(self) -> List[Tick]:
+        """Wait for updates; returns the latest tick of every symbol that changed."""
+        while not self._pending and not self.closed:
+            self._ready.clear()
+            await self._ready.wait()
+        ticks = list(self._pending.values())
+        self._pending.clear()
+        return ticks
+
+    def _offer(self, tick: Tick) -> None:
+        # Conflate: a newer tick replaces one the consumer has not read
+        self._pending[tick.symbol] = tick
+        self._ready.set()
+
+
+class QuoteHub:
+    """One upstream feed, many per-symbol subscriptions."""
+
+    def __init__(
+        self,
+        feed: QuoteFeed,
+        history: int = 100,
+        listeners: Sequence[Callable[[Tick], None]] = ()
+    ):
+        self._feed = feed
+        self._history = history
+        self._listeners = list(listeners)  # Told of every tick, watched or not
+        self._ticks: Dict[str, Deque[Tick]] = {}
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def subscribe(self, symbols: Iterable[str] = ()) -> Subscription:
+        """Open a subscription, starting the upstream feed if it is not running."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+        subscription = Subscription(self)
+        subscription.add(symbols)
+        return subscription
+
+    def subscriber_count(self, symbol: str) -> int:
+        return len(self._subscribers.get(symbol, ()))
+
+    def recent(self, symbol: str, limit: Optional[int] = None) -> List[Tick]:
+        """Most recent ticks of a symbol, oldest first."""
+        ticks = list(self._ticks.get(symbol, ()))
+        if limit is not None:
+            ticks = ticks[-limit:] if limit > 0 else []
+        return ticks
+
+    def latest(self, symbol: str) -> Optional[Tick]:
+        ticks = self._ticks.get(symbol)
+        return ticks[-1] if ticks else None
+
+    def publish(self, tick: Tick) -> None:
+        """Record a tick and offer it to the symbol's subscribers."""
+        ticks = self._ticks.get(tick.symbol)
+        if ticks is None:
+            ticks = self._ticks[tick.symbol] = deque(maxlen=self._history)
+        ticks.append(tick)
+        for listener in self._listeners:
+            listener(tick)
+        for subscription in self._subscribers.get(tick.symbol, ()):
+            subscription._offer(tick)
+
+    async def stop(self) -> None:
+        """Close the upstream feed."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                async for tick in self._feed.ticks():
+                    self.publish(tick)
+                logger.warning("Quote feed closed; reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Quote feed failed; reconnecting")
+            await asyncio.sleep(_RECONNECT_DELAY)
+
+    def _watch(self, subscription: Subscription, symbols: Iterable[str]) -> None:
+        for symbol in symbols:
+            subscription.symbols.add(symbol)
+            self._subscribers.setdefault(symbol, set()).add(subscription)
+
+    def _unwatch(self, subscription: Subscription, symbols: Iterable[str]) -> None:
+        for symbol in symbols:
+            subscription.symbols.discard(symbol)
+            subscribers = self._subscribers.get(symbol)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[symbol]
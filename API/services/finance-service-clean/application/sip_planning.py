@@ -0,0 +1,143 @@
+"""
+SIP Planning.
+
+Closed-form SIP goal solving and step-up projections, and XIRR for
+irregular cash flows. Every function takes arrays and broadcasts, so
+a planner can evaluate many goals or portfolios in one call.
+
+SIP instalments are paid at the start of each month, as in
+SIPCalculation. A step-up SIP raises the instalment once a year by a
+percentage; with G = (1 + r)^12 the value of year y's twelve
+instalments after Y years is P s^y A G^(Y-1-y), where A is the value
+of twelve unit instalments at the end of their year, so the whole
+plan sums geometrically:
+
+    FV = P A (G^Y - s^Y) / (G - s),    s = 1 + step-up
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+_MAX_NEWTON_STEPS = 50
+_BISECTION_STEPS = 200
+_TOLERANCE = 1e-10
+# XIRR search range: -99.99% to +10000% a year
+_LOWEST_RATE, _HIGHEST_RATE = -0.9999, 100.0
+
+
+def _year_factors(annual_rate: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(A, G): year-end value of 12 unit instalments, and a year's growth."""
+    r = np.asarray(annual_rate, dtype=float) / 12 / 100
+    zero = r == 0
+    safe = np.where(zero, 1.0, r)
+    growth = (1 + r) ** 12
+    year = np.where(zero, 12.0, (growth - 1) / safe * (1 + r))
+    return year, growth
+
+
+def step_up_factor(annual_rate, years, step_up_percent=0.0) -> np.ndarray:
+    """Future value of a step-up SIP per unit of its first instalment."""
+    year, growth = _year_factors(annual_rate)
+    years = np.asarray(years, dtype=float)
+    step = 1 + np.asarray(step_up_percent, dtype=float) / 100
+    equal = np.isclose(growth, step)
+    gap = np.where(equal, 1.0, growth - step)
+    return year * np.where(
+        equal,
+        years * growth ** (years - 1),
+        (growth ** years - step ** years) / gap
+    )
+
+
+def required_sip(target, annual_rate, years, step_up_percent=0.0) -> np.ndarray:
+    """First monthly instalment reaching a target amount."""
+    return np.asarray(target, dtype=float) / step_up_factor(annual_rate, years, step_up_percent)
+
+
+def total_invested(monthly, years, step_up_percent=0.0) -> np.ndarray:
+    """Sum of the instalments of a step-up SIP."""
+    years = np.asarray(years, dtype=float)
+    s = np.asarray(step_up_percent, dtype=float) / 100
+    zero = s == 0
+    safe = np.where(zero, 1.0, s)
+    return 12 * np.asarray(monthly, dtype=float) * np.where(
+        zero, years, ((1 + s) ** years - 1) / safe
+    )
+
+
+def step_up_projection(
+    monthly: float,
+    annual_rate: float,
+    years: int,
+    step_up_percent: float
+) -> Tuple[np.ndarray, ...]:
+    """(year, monthly instalment, total invested, value) at the end of each year."""
+    year = np.arange(1, int(years) + 1)
+    instalment = monthly * (1 + step_up_percent / 100) ** (year - 1)
+    invested = total_invested(monthly, year, step_up_percent)
+    value = monthly * step_up_factor(annual_rate, year, step_up_percent)
+    return year, instalment, invested, value
+
+
+def xirr(amounts: np.ndarray, years: np.ndarray) -> np.ndarray:
+    """
+    Annual internal rate of return of each row of cash flows.
+
+    amounts and years are (portfolios, flows) arrays; years are times
+    from the first flow, and zero-amount padding is ignored. Rows are
+    solved together with Newton-Raphson; rows it does not settle are
+    bisected within a bracket. Rows without a sign change are NaN.
+    """
+    amounts = np.asarray(amounts, dtype=float)
+    years = np.asarray(years, dtype=float)
+
+    def npv(rate: np.ndarray) -> np.ndarray:
+        return (amounts * np.exp(-years * np.log1p(rate)[:, None])).sum(axis=1)
+
+    def slope(rate: np.ndarray) -> np.ndarray:
+        log = np.log1p(rate)[:, None]
+        return (-years * amounts * np.exp(-(years + 1) * log)).sum(axis=1)
+
+    solvable = (amounts > 0).any(axis=1) & (amounts < 0).any(axis=1)
+    rate = np.full(amounts.shape[0], 0.1)
+    done = ~solvable
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        for _ in range(_MAX_NEWTON_STEPS):
+            active = ~done
+            if not active.any():
+                break
+            value, derivative = npv(rate), slope(rate)
+            step = np.where(active & (derivative != 0), value / derivative, 0.0)
+            rate = np.clip(rate - step, _LOWEST_RATE, _HIGHEST_RATE)
+            done |= np.abs(step) < _TOLERANCE
+
+        # Bisection for rows Newton left unsettled or on a boundary
+        residual = np.abs(npv(rate))
+        scale = np.abs(amounts).sum(axis=1)
+        settled = done & np.isfinite(residual) & (residual <= 1e-7 * scale)
+        pending = solvable & ~settled
+        if pending.any():
+            rate[pending] = _bisect(amounts[pending], years[pending])
+
+    rate[~solvable] = np.nan
+    return rate
+
+
+def _bisect(amounts: np.ndarray, years: np.ndarray) -> np.ndarray:
+    """Bisection between the XIRR search limits; NaN without a sign change."""
+    def npv(rate: np.ndarray) -> np.ndarray:
+        return (amounts * np.exp(-years * np.log1p(rate)[:, None])).sum(axis=1)
+
+    low = np.full(amounts.shape[0], _LOWEST_RATE)
+    high = np.full(amounts.shape[0], _HIGHEST_RATE)
+    low_value = npv(low)
+    bracketed = np.sign(low_value) != np.sign(npv(high))
+    for _ in range(_BISECTION_STEPS):
+        middle = (low + high) / 2
+        middle_value = npv(middle)
+        left = np.sign(middle_value) == np.sign(low_value)
+        low = np.where(left, middle, low)
+        low_value = np.where(left, middle_value, low_value)
+        high = np.where(left, high, middle)
+    return np.where(bracketed, (low + high) / 2, np.nan)
@@ -0,0 +1,81 @@
+"""
+Calculator Sweeps.
+
+Evaluate the EMI and SIP formulas over every combination of their
+inputs at once: each axis becomes an array shaped to broadcast along
+its own dimension, so a (principal x rate x tenure) grid is a handful
+of array operations instead of one calculation per cell.
+"""
+
+from typing import List, Sequence, Tuple, Union
+
+import numpy as np
+
+MAX_AXIS_VALUES = 200
+MAX_CELLS = 20000
+
+
+def axis_values(axis: Union[float, Sequence[float], object], name: str) -> List[float]:
+    """
+    Values of a sweep axis: one value, a list, or a range with values().
+
+    Raises:
+        ValueError: If the axis is empty or too long
+    """
+    if isinstance(axis, (int, float)):
+        values = [float(axis)]
+    elif hasattr(axis, "values"):
+        values = axis.values()
+    else:
+        values = [float(value) for value in axis]
+    if not values:
+        raise ValueError(f"{name} needs at least one value")
+    if len(values) > MAX_AXIS_VALUES:
+        raise ValueError(f"{name} has more than {MAX_AXIS_VALUES} values")
+    return values
+
+
+def check_cells(*axes: Sequence[float]) -> None:
+    """Raise ValueError if a grid would have more than MAX_CELLS cells."""
+    cells = int(np.prod([len(axis) for axis in axes]))
+    if cells > MAX_CELLS:
+        raise ValueError(f"Sweep has {cells} combinations, more than {MAX_CELLS}")
+
+
+def _grid(*axes: Sequence[float]) -> Tuple[np.ndarray, ...]:
+    """Axes as arrays broadcasting along dimensions 0, 1, 2, ..."""
+    return tuple(
+        np.asarray(axis, dtype=float).reshape([-1 if i == j else 1 for j in range(len(axes))])
+        for i, axis in enumerate(axes)
+    )
+
+
+def emi_grid(
+    principals: Sequence[float],
+    annual_rates: Sequence[float],
+    tenure_months: Sequence[int]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """(monthly EMI, total interest), each shaped (principals, rates, tenures)."""
+    principal, rate, months = _grid(principals, annual_rates, tenure_months)
+    zero = rate == 0
+    # Zero-rate cells divide evenly; a placeholder rate keeps the
+    # discarded branch finite
+    r = np.where(zero, 1.0, rate / 12 / 100)
+    growth = (1 + r) ** months
+    emi = np.where(zero, principal / months, principal * r * growth / (growth - 1))
+    return emi, emi * months - principal
+
+
+def sip_grid(
+    monthly_investments: Sequence[float],
+    annual_rates: Sequence[float],
+    duration_years: Sequence[int]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """(maturity value, total invested), each shaped (investments, rates, durations)."""
+    investment, rate, years = _grid(monthly_investments, annual_rates, duration_years)
+    months = years * 12
+    zero = rate == 0
+    r = np.where(zero, 1.0, rate / 12 / 100)
+    factor = np.where(zero, months, ((1 + r) ** months - 1) / r * (1 + r))
+    maturity = investment * factor
+    return maturity, np.broadcast_to(investment * months, maturity.shape)
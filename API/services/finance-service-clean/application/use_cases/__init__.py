@@ -2,5 +2,21 @@
 from .calculate_emi import CalculateEMIUseCase
 from .get_stock_price import GetStockPriceUseCase
 from .calculate_sip import CalculateSIPUseCase
+from .get_emi_schedule import GetEMIScheduleUseCase
+from .sweep_emi import SweepEMIUseCase
+from .sweep_sip import SweepSIPUseCase
+from .plan_sip_goal import PlanSIPGoalUseCase
+from .project_step_up_sip import ProjectStepUpSIPUseCase
+from .calculate_xirr import CalculateXIRRUseCase
+from .get_stock_quotes import GetStockQuotesUseCase
+from .search_stocks import SearchStocksUseCase
+from .get_top_movers import GetTopMoversUseCase
+from .get_stock_history import GetStockHistoryUseCase
 
-__all__ = ["CalculateEMIUseCase", "GetStockPriceUseCase", "CalculateSIPUseCase"]
+__all__ = [
+    "CalculateEMIUseCase", "GetStockPriceUseCase", "CalculateSIPUseCase",
+    "GetEMIScheduleUseCase", "SweepEMIUseCase", "SweepSIPUseCase",
+    "PlanSIPGoalUseCase", "ProjectStepUpSIPUseCase", "CalculateXIRRUseCase",
+    "GetStockQuotesUseCase", "SearchStocksUseCase", "GetTopMoversUseCase",
+    "GetStockHistoryUseCase",
+]
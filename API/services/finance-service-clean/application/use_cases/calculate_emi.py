@@ -1,8 +1,9 @@
 """Calculate EMI Use Case."""
 from domain.entities import EMICalculation, LoanType
 from domain.repositories import EMIRepository
+from application.amortization import amortize
 from application.dto import EMIRequest, EMIResponse
-from application.dto.emi_dto import LoanTypeDTO
+from application.dto.emi_dto import EMIBreakdownDTO, LoanTypeDTO
 
 
 class EMIValidationError(Exception):
@@ -42,6 +43,10 @@ class CalculateEMIUseCase:
             loan_type=loan_type
         )
         calculation.calculate()
+        if request.include_breakdown:
+            calculation.breakdown = amortize(
+                calculation.principal, calculation.annual_rate, calculation.tenure_months
+            ).breakdown()
 
         return EMIResponse(
             success=True,
@@ -51,5 +56,8 @@ class CalculateEMIUseCase:
             loan_type=calculation.loan_type.value,
             monthly_emi=round(calculation.monthly_emi, 2),
             total_interest=round(calculation.total_interest, 2),
-            total_amount=round(calculation.total_amount, 2)
+            total_amount=round(calculation.total_amount, 2),
+            breakdown=[
+                EMIBreakdownDTO(**vars(row)) for row in calculation.breakdown
+            ] if request.include_breakdown else None
         )
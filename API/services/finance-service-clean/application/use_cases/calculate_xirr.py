@@ -0,0 +1,38 @@
+"""Calculate XIRR Use Case."""
+import numpy as np
+from application.dto import XIRRRequest, XIRRResponse
+from application.sip_planning import xirr
+from .calculate_sip import SIPValidationError
+
+# Largest (portfolios x longest portfolio) matrix solved in one call
+MAX_CELLS = 2_000_000
+
+
+class CalculateXIRRUseCase:
+    """Use case for the annualized return of irregular cash flows."""
+
+    async def execute(self, request: XIRRRequest) -> XIRRResponse:
+        """Solve every portfolio together, padded to a common length."""
+        lengths = np.array([len(flows) for flows in request.portfolios])
+        if lengths.min() < 2:
+            raise SIPValidationError("Each portfolio needs at least two cash flows")
+        if lengths.size * lengths.max() > MAX_CELLS:
+            raise SIPValidationError("Too many cash flows in one request")
+
+        flows = [flow for portfolio in request.portfolios for flow in portfolio]
+        rows = np.repeat(np.arange(lengths.size), lengths)
+        columns = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        days = np.array([flow.date.toordinal() for flow in flows], dtype=float)
+        amounts = np.zeros((lengths.size, lengths.max()))
+        times = np.zeros_like(amounts)
+        amounts[rows, columns] = [flow.amount for flow in flows]
+        times[rows, columns] = days
+        # Years from each portfolio's earliest flow
+        first = np.where(amounts != 0, times, np.inf).min(axis=1, keepdims=True)
+        times = np.where(amounts != 0, (times - np.where(np.isfinite(first), first, 0)) / 365, 0)
+
+        rates = xirr(amounts, times)
+        return XIRRResponse(
+            success=True,
+            xirr=[None if np.isnan(rate) else round(rate * 100, 4) for rate in rates.tolist()]
+        )
@@ -0,0 +1,50 @@
+"""Get EMI Schedule Use Case."""
+from domain.entities import Prepayment, RateReset
+from application.amortization import amortize
+from application.dto import EMIScheduleRequest, EMIScheduleResponse
+from .calculate_emi import EMIValidationError
+
+
+class GetEMIScheduleUseCase:
+    """Use case for month-wise or yearly loan amortization schedules."""
+
+    async def execute(self, request: EMIScheduleRequest) -> EMIScheduleResponse:
+        """Build the schedule and return one page of rows."""
+        for event in [*request.prepayments, *request.rate_resets]:
+            if event.month > request.tenure_months:
+                raise EMIValidationError(
+                    f"Month {event.month} is beyond the tenure of {request.tenure_months} months"
+                )
+
+        schedule = amortize(
+            request.principal,
+            request.annual_rate,
+            request.tenure_months,
+            prepayments=[Prepayment(p.month, p.amount) for p in request.prepayments],
+            rate_resets=[RateReset(r.month, r.annual_rate) for r in request.rate_resets],
+            reduce_emi=request.reduce_emi
+        )
+
+        yearly = request.period == "yearly"
+        if yearly:
+            rows = schedule.yearly()
+            total_rows = len(rows)
+            page = rows[request.offset:request.offset + request.limit]
+        else:
+            total_rows = schedule.months
+            page = schedule.rows(request.offset, request.limit)
+
+        return EMIScheduleResponse(
+            success=True,
+            principal=request.principal,
+            annual_rate=request.annual_rate,
+            monthly_emi=round(float(schedule.emi[0]), 2),
+            tenure_months=schedule.months,
+            total_interest=round(schedule.total_interest, 2),
+            total_amount=round(schedule.total_amount, 2),
+            period=request.period,
+            total_rows=total_rows,
+            offset=request.offset,
+            breakdown=None if yearly else page,
+            yearly_breakdown=page if yearly else None
+        )
@@ -0,0 +1,79 @@
+"""Get Stock History Use Case."""
+from datetime import date, timedelta
+import numpy as np
+from domain.entities import Exchange
+from domain.repositories import CandleRepository
+from application.dto import StockHistoryRequest, StockHistoryResponse
+from application.dto.stock_dto import CandleDTO
+from application.indicators import ema, rsi, sma
+from application.use_cases.get_stock_price import StockNotFoundError
+
+INDICATORS = {"sma": sma, "ema": ema, "rsi": rsi}
+# Bars loaded before the range per indicator period, so recursive
+# indicators (EMA, RSI) have settled when the range starts
+WARMUP_PERIODS = 10
+
+
+class StockHistoryValidationError(Exception):
+    """Raised when a history request is invalid."""
+    pass
+
+
+class GetStockHistoryUseCase:
+    """Use case for daily bars of a stock, with indicators computed over them."""
+
+    def __init__(self, candle_repository: CandleRepository):
+        self.candle_repository = candle_repository
+
+    async def execute(self, request: StockHistoryRequest) -> StockHistoryResponse:
+        """Get bars from start to end (default: the last year) and the requested indicators."""
+        symbol = request.symbol.upper()
+        exchange = Exchange(request.exchange.value)
+        start = request.start or (request.end or date.today()) - timedelta(days=365)
+        if request.end and start > request.end:
+            raise StockHistoryValidationError("start must not be after end")
+
+        periods = {
+            name: getattr(request, name) for name in INDICATORS if getattr(request, name)
+        }
+        try:
+            series = await self.candle_repository.get_candles(
+                symbol, exchange, start, request.end,
+                lookback=max(periods.values(), default=0) * WARMUP_PERIODS
+            )
+        except ValueError as e:
+            raise StockHistoryValidationError(str(e))
+        first = int(np.searchsorted(series.dates, np.datetime64(start, "D")))
+        if first == len(series):
+            raise StockNotFoundError(f"No history for {symbol} on {exchange.value} in this range")
+
+        indicators = {}
+        for name, period in periods.items():
+            values = INDICATORS[name](series.close, period)[first:]
+            indicators[f"{name}_{period}"] = [
+                None if np.isnan(v) else round(v, 2) for v in values.tolist()
+            ]
+
+        high, low = await self.candle_repository.get_52_week_range(
+            symbol, exchange, series.dates[-1].item()
+        )
+        columns = zip(
+            series.dates[first:].tolist(),
+            np.round(series.open[first:], 2).tolist(),
+            np.round(series.high[first:], 2).tolist(),
+            np.round(series.low[first:], 2).tolist(),
+            np.round(series.close[first:], 2).tolist(),
+            np.asarray(series.volume[first:]).tolist()
+        )
+        return StockHistoryResponse(
+            success=True,
+            symbol=symbol,
+            exchange=exchange.value,
+            candles=[
+                CandleDTO(date=d, open=o, high=h, low=l, close=c, volume=v)
+                for d, o, h, l, c, v in columns
+            ],
+            indicators=indicators,
+            week_52_high=high,
+            week_52_low=low
+        )
@@ -1,5 +1,5 @@
 """Get Stock Price Use Case."""
-from domain.entities import Exchange
+from domain.entities import Exchange, StockPrice
 from domain.repositories import StockRepository
 from application.dto import StockPriceRequest, StockPriceResponse
 from application.dto.stock_dto import StockPriceDTO, ExchangeDTO
@@ -10,6 +10,28 @@ class StockNotFoundError(Exception):
     pass
 
 
+def stock_price_dto(stock_price: StockPrice) -> StockPriceDTO:
+    """Map a stock price entity to its DTO."""
+    return StockPriceDTO(
+        symbol=stock_price.symbol,
+        name=stock_price.name,
+        exchange=stock_price.exchange.value,
+        price=stock_price.price,
+        change=stock_price.change,
+        change_percent=stock_price.change_percent,
+        open=stock_price.open,
+        high=stock_price.high,
+        low=stock_price.low,
+        close=stock_price.close,
+        volume=stock_price.volume,
+        market_cap=stock_price.market_cap,
+        pe_ratio=stock_price.pe_ratio,
+        week_52_high=stock_price.week_52_high,
+        week_52_low=stock_price.week_52_low,
+        timestamp=stock_price.timestamp
+    )
+
+
 class GetStockPriceUseCase:
     """Use case for getting stock price."""
 
@@ -34,24 +56,4 @@ class GetStockPriceUseCase:
         if not stock_price:
             raise StockNotFoundError(f"Stock {request.symbol} not found on {request.exchange.value}")
 
-        return StockPriceResponse(
-            success=True,
-            data=StockPriceDTO(
-                symbol=stock_price.symbol,
-                name=stock_price.name,
-                exchange=stock_price.exchange.value,
-                price=stock_price.price,
-                change=stock_price.change,
-                change_percent=stock_price.change_percent,
-                open=stock_price.open,
-                high=stock_price.high,
-                low=stock_price.low,
-                close=stock_price.close,
-                volume=stock_price.volume,
-                market_cap=stock_price.market_cap,
-                pe_ratio=stock_price.pe_ratio,
-                week_52_high=stock_price.week_52_high,
-                week_52_low=stock_price.week_52_low,
-                timestamp=stock_price.timestamp
-            )
-        )
+        return StockPriceResponse(success=True, data=stock_price_dto(stock_price))
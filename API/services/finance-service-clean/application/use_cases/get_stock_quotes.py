@@ -0,0 +1,35 @@
+"""Get Stock Quotes Use Case."""
+from domain.entities import Exchange
+from domain.repositories import StockRepository
+from application.dto import StockQuotesRequest, StockQuotesResponse
+from application.use_cases.get_stock_price import stock_price_dto
+
+
+class StockQuotesValidationError(Exception):
+    """Raised when a quotes request is invalid."""
+    pass
+
+
+class GetStockQuotesUseCase:
+    """Use case for getting the prices of a watchlist in one call."""
+
+    MAX_SYMBOLS = 100
+
+    def __init__(self, stock_repository: StockRepository):
+        self.stock_repository = stock_repository
+
+    async def execute(self, request: StockQuotesRequest) -> StockQuotesResponse:
+        """Get prices for the given symbols, in request order."""
+        symbols = list(dict.fromkeys(s.strip().upper() for s in request.symbols if s.strip()))
+        if not symbols:
+            raise StockQuotesValidationError("At least one symbol is required")
+        if len(symbols) > self.MAX_SYMBOLS:
+            raise StockQuotesValidationError(f"At most {self.MAX_SYMBOLS} symbols per request")
+
+        exchange = Exchange(request.exchange.value)
+        prices = await self.stock_repository.get_stock_prices(symbols, exchange)
+        return StockQuotesResponse(
+            success=True,
+            data=[stock_price_dto(prices[s]) for s in symbols if s in prices],
+            not_found=[s for s in symbols if s not in prices]
+        )
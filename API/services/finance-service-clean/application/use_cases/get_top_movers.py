@@ -0,0 +1,24 @@
+"""Get Top Movers Use Case."""
+from domain.entities import Exchange
+from domain.repositories import StockRepository
+from application.dto import TopMoversRequest, TopMoversResponse
+from application.use_cases.get_stock_price import stock_price_dto
+
+
+class GetTopMoversUseCase:
+    """Use case for getting the top gaining and losing stocks."""
+
+    def __init__(self, stock_repository: StockRepository):
+        self.stock_repository = stock_repository
+
+    async def execute(self, request: TopMoversRequest) -> TopMoversResponse:
+        """Get the largest rises and falls by change percent."""
+        exchange = Exchange(request.exchange.value)
+        response = TopMoversResponse(success=True)
+        if request.include_gainers:
+            gainers = await self.stock_repository.get_top_gainers(exchange, request.limit)
+            response.gainers = [stock_price_dto(s) for s in gainers]
+        if request.include_losers:
+            losers = await self.stock_repository.get_top_losers(exchange, request.limit)
+            response.losers = [stock_price_dto(s) for s in losers]
+        return response
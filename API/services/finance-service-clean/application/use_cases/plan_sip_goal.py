@@ -0,0 +1,26 @@
+"""Plan SIP Goal Use Case."""
+from application.dto import SIPGoalRequest, SIPGoalResponse
+from application.sip_planning import required_sip, total_invested
+
+
+class PlanSIPGoalUseCase:
+    """Use case for the monthly SIP that reaches a target amount."""
+
+    async def execute(self, request: SIPGoalRequest) -> SIPGoalResponse:
+        """Solve for the first monthly instalment in closed form."""
+        monthly = float(required_sip(
+            request.target_amount, request.expected_return_rate,
+            request.duration_years, request.annual_step_up
+        ))
+        invested = float(total_invested(monthly, request.duration_years, request.annual_step_up))
+
+        return SIPGoalResponse(
+            success=True,
+            target_amount=request.target_amount,
+            duration_years=request.duration_years,
+            expected_return_rate=request.expected_return_rate,
+            annual_step_up=request.annual_step_up,
+            monthly_investment=round(monthly, 2),
+            total_invested=round(invested, 2),
+            estimated_returns=round(request.target_amount - invested, 2)
+        )
@@ -0,0 +1,33 @@
+"""Project Step-Up SIP Use Case."""
+import numpy as np
+from application.dto import StepUpSIPRequest, StepUpSIPResponse
+from application.sip_planning import step_up_projection
+
+
+class ProjectStepUpSIPUseCase:
+    """Use case for SIPs that increase by a percentage every year."""
+
+    async def execute(self, request: StepUpSIPRequest) -> StepUpSIPResponse:
+        """Project the value at the end of every year."""
+        year, instalment, invested, value = step_up_projection(
+            request.monthly_investment, request.expected_return_rate,
+            request.duration_years, request.annual_step_up
+        )
+        maturity, total = float(value[-1]), float(invested[-1])
+
+        return StepUpSIPResponse(
+            success=True,
+            monthly_investment=request.monthly_investment,
+            duration_years=request.duration_years,
+            expected_return_rate=request.expected_return_rate,
+            annual_step_up=request.annual_step_up,
+            total_invested=round(total, 2),
+            estimated_returns=round(maturity - total, 2),
+            maturity_value=round(maturity, 2),
+            yearly=[
+                {"year": y, "monthly_investment": i, "total_invested": t, "value": v}
+                for y, i, t, v in zip(
+                    year.tolist(), *(np.round(c, 2).tolist() for c in (instalment, invested, value))
+                )
+            ]
+        )
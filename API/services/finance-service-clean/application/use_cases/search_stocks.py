@@ -0,0 +1,22 @@
+"""Search Stocks Use Case."""
+from domain.repositories import StockRepository
+from application.dto import StockSearchRequest, StockSearchResponse
+from application.dto.stock_dto import StockDTO
+
+
+class SearchStocksUseCase:
+    """Use case for searching listings by symbol or company name."""
+
+    def __init__(self, stock_repository: StockRepository):
+        self.stock_repository = stock_repository
+
+    async def execute(self, request: StockSearchRequest) -> StockSearchResponse:
+        """Find listings matching a query, best matches first."""
+        stocks = await self.stock_repository.search_stocks(request.query.strip(), request.limit)
+        return StockSearchResponse(
+            success=True,
+            results=[
+                StockDTO(symbol=s.symbol, name=s.name, sector=s.sector, exchange=s.exchange.value)
+                for s in stocks
+            ]
+        )
@@ -0,0 +1,37 @@
+"""Sweep EMI Use Case."""
+import numpy as np
+from application.dto import EMISweepRequest, EMISweepResponse
+from application.sweeps import axis_values, check_cells, emi_grid
+from .calculate_emi import EMIValidationError
+
+
+class SweepEMIUseCase:
+    """Use case for EMI over a principal x rate x tenure grid."""
+
+    async def execute(self, request: EMISweepRequest) -> EMISweepResponse:
+        """Evaluate every combination in one vectorized pass."""
+        try:
+            principals = axis_values(request.principal, "principal")
+            rates = axis_values(request.annual_rate, "annual_rate")
+            tenures = axis_values(request.tenure_months, "tenure_months")
+            check_cells(principals, rates, tenures)
+        except ValueError as e:
+            raise EMIValidationError(str(e))
+
+        if min(principals) <= 0:
+            raise EMIValidationError("Principal amount must be positive")
+        if min(rates) < 0 or max(rates) > 50:
+            raise EMIValidationError("Annual rate must be 0-50")
+        if any(t != int(t) or not 0 < t <= 360 for t in tenures):
+            raise EMIValidationError("Tenure must be whole months, 1-360")
+
+        emi, interest = emi_grid(principals, rates, tenures)
+
+        return EMISweepResponse(
+            success=True,
+            principal=principals,
+            annual_rate=rates,
+            tenure_months=[int(t) for t in tenures],
+            monthly_emi=np.round(emi, 2).tolist(),
+            total_interest=np.round(interest, 2).tolist()
+        )
@@ -0,0 +1,37 @@
+"""Sweep SIP Use Case."""
+import numpy as np
+from application.dto import SIPSweepRequest, SIPSweepResponse
+from application.sweeps import axis_values, check_cells, sip_grid
+from .calculate_sip import SIPValidationError
+
+
+class SweepSIPUseCase:
+    """Use case for SIP returns over an investment x rate x duration grid."""
+
+    async def execute(self, request: SIPSweepRequest) -> SIPSweepResponse:
+        """Evaluate every combination in one vectorized pass."""
+        try:
+            investments = axis_values(request.monthly_investment, "monthly_investment")
+            rates = axis_values(request.expected_return_rate, "expected_return_rate")
+            years = axis_values(request.duration_years, "duration_years")
+            check_cells(investments, rates, years)
+        except ValueError as e:
+            raise SIPValidationError(str(e))
+
+        if min(investments) <= 0:
+            raise SIPValidationError("Monthly investment must be positive")
+        if min(rates) < 0 or max(rates) > 30:
+            raise SIPValidationError("Expected return rate must be 0-30")
+        if any(y != int(y) or not 0 < y <= 40 for y in years):
+            raise SIPValidationError("Duration must be whole years, 1-40")
+
+        maturity, invested = sip_grid(investments, rates, years)
+
+        return SIPSweepResponse(
+            success=True,
+            monthly_investment=investments,
+            expected_return_rate=rates,
+            duration_years=[int(y) for y in years],
+            maturity_value=np.round(maturity, 2).tolist(),
+            estimated_returns=np.round(maturity - invested, 2).tolist()
+        )
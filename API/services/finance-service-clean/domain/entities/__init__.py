@@ -1,6 +1,11 @@
 """Domain Entities for Finance Service."""
-from .emi import EMICalculation, EMIBreakdown, LoanType
-from .stock import Stock, StockPrice, Exchange
+from .emi import EMICalculation, EMIBreakdown, LoanType, Prepayment, RateReset
+from .stock import Stock, StockPrice, Exchange, Tick
 from .sip import SIPCalculation
+from .candle import Candle, CandleSeries
 
-__all__ = ["EMICalculation", "EMIBreakdown", "LoanType", "Stock", "StockPrice", "Exchange", "SIPCalculation"]
+__all__ = [
+    "EMICalculation", "EMIBreakdown", "LoanType", "Prepayment", "RateReset",
+    "Stock", "StockPrice", "Exchange", "Tick", "SIPCalculation",
+    "Candle", "CandleSeries",
+]
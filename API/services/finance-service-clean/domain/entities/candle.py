@@ -0,0 +1,29 @@
+"""Candle Domain Entities."""
+from dataclasses import dataclass
+from datetime import date
+from typing import Sequence
+
+
+@dataclass(frozen=True)
+class Candle:
+    """One daily OHLCV bar."""
+    date: date
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: int
+
+
+@dataclass(frozen=True)
+class CandleSeries:
+    """Consecutive daily bars as columns, oldest first."""
+    dates: Sequence  # datetime64[D]
+    open: Sequence[float]
+    high: Sequence[float]
+    low: Sequence[float]
+    close: Sequence[float]
+    volume: Sequence[int]
+
+    def __len__(self) -> int:
+        return len(self.dates)
@@ -16,6 +16,19 @@ class EMIBreakdown:
     principal: float
     interest: float
     balance: float
+    prepayment: float = 0
+
+@dataclass(frozen=True)
+class Prepayment:
+    """Lump sum paid after the EMI of a month."""
+    month: int
+    amount: float
+
+@dataclass(frozen=True)
+class RateReset:
+    """New annual rate from a month's EMI onward (floating-rate loans)."""
+    month: int
+    annual_rate: float
 
 @dataclass
 class EMICalculation:
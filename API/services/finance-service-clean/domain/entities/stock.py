@@ -33,3 +33,14 @@ class Stock:
     name: str
     sector: str
     exchange: Exchange
+
+@dataclass(frozen=True)
+class Tick:
+    """One price update from a market data feed."""
+    symbol: str
+    exchange: Exchange
+    price: float
+    change: float
+    change_percent: float
+    volume: int
+    timestamp: datetime
@@ -2,5 +2,7 @@
 from .emi_repository import EMIRepository
 from .stock_repository import StockRepository
 from .sip_repository import SIPRepository
+from .quote_feed import QuoteFeed
+from .candle_repository import CandleRepository
 
-__all__ = ["EMIRepository", "StockRepository", "SIPRepository"]
+__all__ = ["EMIRepository", "StockRepository", "SIPRepository", "QuoteFeed", "CandleRepository"]
@@ -0,0 +1,35 @@
+"""Candle Repository Interface."""
+from abc import ABC, abstractmethod
+from datetime import date, timedelta
+from typing import Optional, Sequence, Tuple
+from domain.entities import Candle, CandleSeries, Exchange
+
+
+class CandleRepository(ABC):
+    """Abstract repository for historical daily bars."""
+
+    @abstractmethod
+    async def append_candles(self, symbol: str, exchange: Exchange, candles: Sequence[Candle]) -> int:
+        """Append bars dated after the last stored one; returns the number of stored bars."""
+        pass
+
+    @abstractmethod
+    async def get_candles(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        lookback: int = 0
+    ) -> CandleSeries:
+        """Bars dated start to end (inclusive), plus up to lookback earlier bars."""
+        pass
+
+    async def get_52_week_range(
+        self, symbol: str, exchange: Exchange, as_of: date
+    ) -> Tuple[Optional[float], Optional[float]]:
+        """(Highest high, lowest low) of the 52 weeks up to a date; (None, None) without history."""
+        series = await self.get_candles(symbol, exchange, as_of - timedelta(weeks=52), as_of)
+        if not len(series):
+            return None, None
+        return float(max(series.high)), float(min(series.low))
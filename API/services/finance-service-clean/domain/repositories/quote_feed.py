@@ -0,0 +1,13 @@
+"""Quote Feed Interface."""
+from abc import ABC, abstractmethod
+from typing import AsyncIterator
+from domain.entities import Tick
+
+
+class QuoteFeed(ABC):
+    """Abstract upstream market data feed."""
+
+    @abstractmethod
+    def ticks(self) -> AsyncIterator[Tick]:
+        """Open the upstream connection and yield ticks until it closes."""
+        pass
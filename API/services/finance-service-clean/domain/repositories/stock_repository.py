@@ -1,6 +1,6 @@
 """Stock Repository Interface."""
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 from domain.entities import Stock, StockPrice, Exchange
 
 
@@ -12,9 +12,20 @@ class StockRepository(ABC):
         """Get current stock price."""
         pass
 
+    async def get_stock_prices(
+        self, symbols: Sequence[str], exchange: Exchange
+    ) -> Dict[str, StockPrice]:
+        """Get current prices of several stocks, keyed by symbol; unknown symbols are left out."""
+        prices = {}
+        for symbol in symbols:
+            price = await self.get_stock_price(symbol, exchange)
+            if price:
+                prices[symbol] = price
+        return prices
+
     @abstractmethod
-    async def search_stocks(self, query: str) -> List[Stock]:
-        """Search stocks by name or symbol."""
+    async def search_stocks(self, query: str, limit: int = 10) -> List[Stock]:
+        """Search stocks by name or symbol, best matches first."""
         pass
 
     @abstractmethod
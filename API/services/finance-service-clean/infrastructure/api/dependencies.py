@@ -1,12 +1,42 @@
 """Dependency Injection for Finance Service API."""
-from infrastructure.repositories import MockEMIRepository, MockStockRepository, MockSIPRepository
-from application.use_cases import CalculateEMIUseCase, GetStockPriceUseCase, CalculateSIPUseCase
+import os
+from pathlib import Path
+from infrastructure.repositories import (
+    MockEMIRepository, MockStockRepository, MockSIPRepository, CachedStockRepository,
+    SimulatedQuoteFeed, MmapCandleStore, load_listing
+)
+from domain.entities import Exchange
+from application.quote_hub import QuoteHub
+from application.use_cases import (
+    CalculateEMIUseCase, GetStockPriceUseCase, CalculateSIPUseCase, GetEMIScheduleUseCase,
+    SweepEMIUseCase, SweepSIPUseCase, PlanSIPGoalUseCase, ProjectStepUpSIPUseCase,
+    CalculateXIRRUseCase, GetStockQuotesUseCase, SearchStocksUseCase,
+    GetTopMoversUseCase, GetStockHistoryUseCase
+)
 
 
 # Repository instances
 _emi_repository = MockEMIRepository()
-_stock_repository = MockStockRepository()
+_candle_repository = MmapCandleStore(Path(os.environ.get(
+    "CANDLE_DATA_DIR", Path(__file__).resolve().parents[2] / "data" / "candles"
+)))
+_listing_dir = Path(os.environ.get(
+    "STOCK_LISTING_DIR", Path(__file__).resolve().parents[2] / "data" / "listings"
+))
+# Exchange listings as <dir>/NSE.csv and <dir>/BSE.csv; the built-in stocks serve without them
+_listing = [
+    stock
+    for exchange in Exchange
+    if (_listing_dir / f"{exchange.value}.csv").exists()
+    for stock in load_listing(_listing_dir / f"{exchange.value}.csv", exchange)
+]
+_stock_source = MockStockRepository(listing=_listing, candle_repository=_candle_repository)
+_stock_repository = CachedStockRepository(_stock_source, ttl_seconds=5.0)
 _sip_repository = MockSIPRepository()
+_quote_hub = QuoteHub(
+    SimulatedQuoteFeed(_stock_repository, symbols=["RELIANCE", "TCS", "INFY"]),
+    listeners=[_stock_source.apply_tick]
+)
 
 
 def get_calculate_emi_use_case() -> CalculateEMIUseCase:
@@ -14,11 +44,66 @@ def get_calculate_emi_use_case() -> CalculateEMIUseCase:
     return CalculateEMIUseCase(emi_repository=_emi_repository)
 
 
+def get_emi_schedule_use_case() -> GetEMIScheduleUseCase:
+    """Get EMI amortization schedule use case instance."""
+    return GetEMIScheduleUseCase()
+
+
+def get_sweep_emi_use_case() -> SweepEMIUseCase:
+    """Get EMI sweep use case instance."""
+    return SweepEMIUseCase()
+
+
 def get_stock_price_use_case() -> GetStockPriceUseCase:
     """Get stock price use case instance."""
     return GetStockPriceUseCase(stock_repository=_stock_repository)
 
 
+def get_stock_quotes_use_case() -> GetStockQuotesUseCase:
+    """Get batch stock quotes use case instance."""
+    return GetStockQuotesUseCase(stock_repository=_stock_repository)
+
+
+def get_search_stocks_use_case() -> SearchStocksUseCase:
+    """Get stock search use case instance."""
+    return SearchStocksUseCase(stock_repository=_stock_repository)
+
+
+def get_top_movers_use_case() -> GetTopMoversUseCase:
+    """Get top gainers/losers use case instance."""
+    return GetTopMoversUseCase(stock_repository=_stock_repository)
+
+
+def get_stock_history_use_case() -> GetStockHistoryUseCase:
+    """Get stock history use case instance."""
+    return GetStockHistoryUseCase(candle_repository=_candle_repository)
+
+
+def get_quote_hub() -> QuoteHub:
+    """Get the live quote hub shared by all WebSocket subscribers."""
+    return _quote_hub
+
+
 def get_calculate_sip_use_case() -> CalculateSIPUseCase:
     """Get SIP calculation use case instance."""
     return CalculateSIPUseCase(sip_repository=_sip_repository)
+
+
+def get_sweep_sip_use_case() -> SweepSIPUseCase:
+    """Get SIP sweep use case instance."""
+    return SweepSIPUseCase()
+
+
+def get_plan_sip_goal_use_case() -> PlanSIPGoalUseCase:
+    """Get SIP goal planning use case instance."""
+    return PlanSIPGoalUseCase()
+
+
+def get_step_up_sip_use_case() -> ProjectStepUpSIPUseCase:
+    """Get step-up SIP projection use case instance."""
+    return ProjectStepUpSIPUseCase()
+
+
+def get_xirr_use_case() -> CalculateXIRRUseCase:
+    """Get XIRR use case instance."""
+    return CalculateXIRRUseCase()
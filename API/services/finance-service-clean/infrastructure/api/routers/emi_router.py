@@ -1,9 +1,14 @@
 """EMI API Router."""
 from fastapi import APIRouter, Depends, HTTPException
-from application.dto import EMIRequest, EMIResponse
-from application.use_cases import CalculateEMIUseCase
+from application.dto import (
+    EMIRequest, EMIResponse, EMIScheduleRequest, EMIScheduleResponse,
+    EMISweepRequest, EMISweepResponse
+)
+from application.use_cases import CalculateEMIUseCase, GetEMIScheduleUseCase, SweepEMIUseCase
 from application.use_cases.calculate_emi import EMIValidationError
-from infrastructure.api.dependencies import get_calculate_emi_use_case
+from infrastructure.api.dependencies import (
+    get_calculate_emi_use_case, get_emi_schedule_use_case, get_sweep_emi_use_case
+)
 
 router = APIRouter(prefix="/emi", tags=["EMI Calculator"])
 
@@ -20,3 +25,31 @@ async def calculate_emi(
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+
+
+@router.post("/schedule", response_model=EMIScheduleResponse)
+async def get_emi_schedule(
+    request: EMIScheduleRequest,
+    use_case: GetEMIScheduleUseCase = Depends(get_emi_schedule_use_case)
+) -> EMIScheduleResponse:
+    """Month-wise or yearly amortization, with prepayments and rate resets, one page at a time."""
+    try:
+        return await use_case.execute(request)
+    except EMIValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+
+
+@router.post("/sweep", response_model=EMISweepResponse)
+async def sweep_emi(
+    request: EMISweepRequest,
+    use_case: SweepEMIUseCase = Depends(get_sweep_emi_use_case)
+) -> EMISweepResponse:
+    """EMI and total interest for every principal x rate x tenure combination."""
+    try:
+        return await use_case.execute(request)
+    except EMIValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
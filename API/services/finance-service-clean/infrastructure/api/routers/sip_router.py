@@ -1,9 +1,19 @@
 """SIP API Router."""
 from fastapi import APIRouter, Depends, HTTPException
-from application.dto import SIPRequest, SIPResponse
-from application.use_cases import CalculateSIPUseCase
+from application.dto import (
+    SIPRequest, SIPResponse, SIPSweepRequest, SIPSweepResponse,
+    SIPGoalRequest, SIPGoalResponse, StepUpSIPRequest, StepUpSIPResponse,
+    XIRRRequest, XIRRResponse
+)
+from application.use_cases import (
+    CalculateSIPUseCase, SweepSIPUseCase, PlanSIPGoalUseCase, ProjectStepUpSIPUseCase,
+    CalculateXIRRUseCase
+)
 from application.use_cases.calculate_sip import SIPValidationError
-from infrastructure.api.dependencies import get_calculate_sip_use_case
+from infrastructure.api.dependencies import (
+    get_calculate_sip_use_case, get_sweep_sip_use_case, get_plan_sip_goal_use_case,
+    get_step_up_sip_use_case, get_xirr_use_case
+)
 
 router = APIRouter(prefix="/sip", tags=["SIP Calculator"])
 
@@ -20,3 +30,55 @@ async def calculate_sip(
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+
+
+@router.post("/sweep", response_model=SIPSweepResponse)
+async def sweep_sip(
+    request: SIPSweepRequest,
+    use_case: SweepSIPUseCase = Depends(get_sweep_sip_use_case)
+) -> SIPSweepResponse:
+    """Maturity value and returns for every investment x rate x duration combination."""
+    try:
+        return await use_case.execute(request)
+    except SIPValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+
+
+@router.post("/goal", response_model=SIPGoalResponse)
+async def plan_sip_goal(
+    request: SIPGoalRequest,
+    use_case: PlanSIPGoalUseCase = Depends(get_plan_sip_goal_use_case)
+) -> SIPGoalResponse:
+    """Monthly SIP needed to reach a target amount, optionally stepped up every year."""
+    try:
+        return await use_case.execute(request)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+
+
+@router.post("/step-up", response_model=StepUpSIPResponse)
+async def project_step_up_sip(
+    request: StepUpSIPRequest,
+    use_case: ProjectStepUpSIPUseCase = Depends(get_step_up_sip_use_case)
+) -> StepUpSIPResponse:
+    """Year-by-year projection of a SIP that increases every year."""
+    try:
+        return await use_case.execute(request)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+
+
+@router.post("/xirr", response_model=XIRRResponse)
+async def calculate_xirr(
+    request: XIRRRequest,
+    use_case: CalculateXIRRUseCase = Depends(get_xirr_use_case)
+) -> XIRRResponse:
+    """Annualized return (XIRR) of one or many portfolios of dated cash flows."""
+    try:
+        return await use_case.execute(request)
+    except SIPValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
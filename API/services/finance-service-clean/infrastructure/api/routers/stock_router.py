@@ -1,13 +1,192 @@
 """Stock API Router."""
-from fastapi import APIRouter, Depends, HTTPException
-from application.dto import StockPriceRequest, StockPriceResponse
-from application.dto.stock_dto import ExchangeDTO
-from application.use_cases import GetStockPriceUseCase
+import asyncio
+import json
+from datetime import date
+from typing import Iterable, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect
+from application.dto import (
+    StockPriceRequest, StockPriceResponse, StockQuotesRequest, StockQuotesResponse,
+    StockSearchRequest, StockSearchResponse, TopMoversRequest, TopMoversResponse,
+    StockHistoryRequest, StockHistoryResponse
+)
+from application.dto.stock_dto import ExchangeDTO, TickDTO
+from application.quote_hub import QuoteHub, Subscription
+from application.use_cases import (
+    GetStockPriceUseCase, GetStockQuotesUseCase, SearchStocksUseCase, GetTopMoversUseCase,
+    GetStockHistoryUseCase
+)
 from application.use_cases.get_stock_price import StockNotFoundError
-from infrastructure.api.dependencies import get_stock_price_use_case
+from application.use_cases.get_stock_quotes import StockQuotesValidationError
+from application.use_cases.get_stock_history import StockHistoryValidationError
+from infrastructure.api.dependencies import (
+    get_stock_price_use_case, get_stock_quotes_use_case, get_search_stocks_use_case,
+    get_top_movers_use_case, get_stock_history_use_case, get_quote_hub
+)
 
 router = APIRouter(prefix="/stocks", tags=["Stock Market"])
 
+MAX_STREAM_SYMBOLS = 100
+
+
+@router.get("/quotes", response_model=StockQuotesResponse)
+async def get_stock_quotes(
+    symbols: str = Query(..., description="Comma-separated symbols, e.g. RELIANCE,TCS,INFY"),
+    exchange: ExchangeDTO = ExchangeDTO.NSE,
+    use_case: GetStockQuotesUseCase = Depends(get_stock_quotes_use_case)
+) -> StockQuotesResponse:
+    """Get current prices of up to 100 stocks; unknown symbols are listed in not_found."""
+    try:
+        request = StockQuotesRequest(symbols=symbols.split(","), exchange=exchange)
+        return await use_case.execute(request)
+    except StockQuotesValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+
+
+@router.get("/search", response_model=StockSearchResponse)
+async def search_stocks(
+    q: str = Query(..., min_length=1, max_length=50),
+    limit: int = Query(10, ge=1, le=50),
+    use_case: SearchStocksUseCase = Depends(get_search_stocks_use_case)
+) -> StockSearchResponse:
+    """Search listings by symbol or company name, with prefix and typo-tolerant matching."""
+    try:
+        return await use_case.execute(StockSearchRequest(query=q, limit=limit))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+
+
+@router.get("/gainers", response_model=TopMoversResponse, response_model_exclude_unset=True)
+async def get_top_gainers(
+    exchange: ExchangeDTO = ExchangeDTO.NSE,
+    limit: int = Query(10, ge=1, le=50),
+    use_case: GetTopMoversUseCase = Depends(get_top_movers_use_case)
+) -> TopMoversResponse:
+    """Get the stocks with the largest rise today."""
+    try:
+        request = TopMoversRequest(exchange=exchange, limit=limit, include_losers=False)
+        return await use_case.execute(request)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+
+
+@router.get("/losers", response_model=TopMoversResponse, response_model_exclude_unset=True)
+async def get_top_losers(
+    exchange: ExchangeDTO = ExchangeDTO.NSE,
+    limit: int = Query(10, ge=1, le=50),
+    use_case: GetTopMoversUseCase = Depends(get_top_movers_use_case)
+) -> TopMoversResponse:
+    """Get the stocks with the largest fall today."""
+    try:
+        request = TopMoversRequest(exchange=exchange, limit=limit, include_gainers=False)
+        return await use_case.execute(request)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+
+
+def _tick_json(tick) -> dict:
+    return TickDTO(
+        symbol=tick.symbol,
+        exchange=tick.exchange.value,
+        price=tick.price,
+        change=tick.change,
+        change_percent=tick.change_percent,
+        volume=tick.volume,
+        timestamp=tick.timestamp
+    ).model_dump(mode="json")
+
+
+async def _watch(
+    websocket: WebSocket,
+    hub: QuoteHub,
+    subscription: Subscription,
+    symbols: Iterable[str],
+    history: int
+) -> None:
+    """Add symbols to a subscription and send each one's recent ticks."""
+    symbols = [s.strip().upper() for s in symbols if s.strip()]
+    if len(subscription.symbols | set(symbols)) > MAX_STREAM_SYMBOLS:
+        await websocket.send_json({
+            "type": "error", "message": f"At most {MAX_STREAM_SYMBOLS} symbols per connection"
+        })
+        return
+    subscription.add(symbols)
+    for symbol in symbols:
+        await websocket.send_json({
+            "type": "snapshot",
+            "symbol": symbol,
+            "data": [_tick_json(tick) for tick in hub.recent(symbol, history)]
+        })
+
+
+async def _control(
+    websocket: WebSocket,
+    hub: QuoteHub,
+    subscription: Subscription,
+    text: str,
+    history: int
+) -> None:
+    """Apply a client message: {"action": "subscribe" | "unsubscribe", "symbols": [...]}."""
+    try:
+        message = json.loads(text)
+        action, symbols = message["action"], message["symbols"]
+        if not isinstance(symbols, list):
+            raise ValueError
+    except (ValueError, KeyError, TypeError):
+        await websocket.send_json({
+            "type": "error",
+            "message": 'Expected {"action": "subscribe" | "unsubscribe", "symbols": [...]}'
+        })
+        return
+    if action == "subscribe":
+        await _watch(websocket, hub, subscription, map(str, symbols), history)
+    elif action == "unsubscribe":
+        subscription.remove(str(s).strip().upper() for s in symbols)
+    else:
+        await websocket.send_json({"type": "error", "message": f"Unknown action: {action}"})
+
+
+@router.websocket("/stream")
+async def stream_quotes(
+    websocket: WebSocket,
+    symbols: str = "",
+    history: int = Query(20, ge=0, le=100),
+    hub: QuoteHub = Depends(get_quote_hub)
+):
+    """
+    Live quotes over WebSocket.
+
+    Subscribe with ?symbols=A,B or {"action": "subscribe", "symbols": [...]}
+    messages. Each new symbol gets a "snapshot" of its recent ticks, then
+    "quotes" messages carry the latest tick of every watched symbol that
+    changed since the previous message.
+    """
+    await websocket.accept()
+    subscription = hub.subscribe()
+    receive = update = None
+    try:
+        await _watch(websocket, hub, subscription, symbols.split(","), history)
+        receive = asyncio.ensure_future(websocket.receive_text())
+        update = asyncio.ensure_future(subscription.next())
+        while True:
+            done, _ = await asyncio.wait({receive, update}, return_when=asyncio.FIRST_COMPLETED)
+            if update in done:
+                ticks = update.result()
+                if ticks:
+                    await websocket.send_json({"type": "quotes", "data": [_tick_json(t) for t in ticks]})
+                update = asyncio.ensure_future(subscription.next())
+            if receive in done:
+                await _control(websocket, hub, subscription, receive.result(), history)
+                receive = asyncio.ensure_future(websocket.receive_text())
+    except WebSocketDisconnect:
+        pass
+    finally:
+        for task in (receive, update):
+            if task is not None:
+                task.cancel()
+        subscription.close()
+
 
 @router.get("/{symbol}", response_model=StockPriceResponse)
 async def get_stock_price(
@@ -23,3 +202,28 @@ async def get_stock_price(
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+
+
+@router.get("/{symbol}/history", response_model=StockHistoryResponse)
+async def get_stock_history(
+    symbol: str,
+    exchange: ExchangeDTO = ExchangeDTO.NSE,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    sma: Optional[int] = Query(None, ge=2, le=500, description="SMA period"),
+    ema: Optional[int] = Query(None, ge=2, le=500, description="EMA period"),
+    rsi: Optional[int] = Query(None, ge=2, le=500, description="RSI period"),
+    use_case: GetStockHistoryUseCase = Depends(get_stock_history_use_case)
+) -> StockHistoryResponse:
+    """Get daily bars (default: the last year) with optional SMA, EMA and RSI."""
+    try:
+        request = StockHistoryRequest(
+            symbol=symbol, exchange=exchange, start=start, end=end, sma=sma, ema=ema, rsi=rsi
+        )
+        return await use_case.execute(request)
+    except StockHistoryValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except StockNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
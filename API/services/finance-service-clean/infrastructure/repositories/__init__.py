@@ -2,5 +2,14 @@
 from .mock_emi_repository import MockEMIRepository
 from .mock_stock_repository import MockStockRepository
 from .mock_sip_repository import MockSIPRepository
+from .cached_stock_repository import CachedStockRepository
+from .symbol_index import SymbolIndex, load_listing
+from .simulated_quote_feed import SimulatedQuoteFeed
+from .movers_index import MoversIndex
+from .mmap_candle_store import MmapCandleStore
 
-__all__ = ["MockEMIRepository", "MockStockRepository", "MockSIPRepository"]
+__all__ = [
+    "MockEMIRepository", "MockStockRepository", "MockSIPRepository",
+    "CachedStockRepository", "SymbolIndex", "load_listing", "SimulatedQuoteFeed",
+    "MoversIndex", "MmapCandleStore",
+]
@@ -0,0 +1,67 @@
+"""Cached Stock Repository Implementation."""
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from domain.entities import Stock, StockPrice, Exchange
+from domain.repositories import StockRepository
+
+
+class CachedStockRepository(StockRepository):
+    """
+    Stock repository keeping an in-memory quote table in front of another.
+
+    Quotes are served from the table for ttl_seconds after they are
+    fetched; a batch lookup fetches only the symbols that are missing or
+    stale, in one call to the wrapped repository. Searches and movers
+    go straight through.
+    """
+
+    def __init__(
+        self,
+        repository: StockRepository,
+        ttl_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self._repository = repository
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._quotes: Dict[Tuple[str, Exchange], Tuple[float, StockPrice]] = {}
+        self._evict_at = 1024
+
+    async def get_stock_price(self, symbol: str, exchange: Exchange) -> Optional[StockPrice]:
+        return (await self.get_stock_prices([symbol], exchange)).get(symbol)
+
+    async def get_stock_prices(
+        self, symbols: Sequence[str], exchange: Exchange
+    ) -> Dict[str, StockPrice]:
+        now = self._clock()
+        prices, missing = {}, []
+        for symbol in dict.fromkeys(symbols):
+            entry = self._quotes.get((symbol, exchange))
+            if entry and entry[0] > now:
+                prices[symbol] = entry[1]
+            else:
+                missing.append(symbol)
+
+        if missing:
+            fetched = await self._repository.get_stock_prices(missing, exchange)
+            expires = self._clock() + self._ttl
+            for symbol, price in fetched.items():
+                self._quotes[(symbol, exchange)] = (expires, price)
+            prices.update(fetched)
+            self._evict(now)
+        return prices
+
+    def _evict(self, now: float) -> None:
+        """Drop expired quotes once the table doubles past its live set."""
+        if len(self._quotes) > self._evict_at:
+            self._quotes = {key: entry for key, entry in self._quotes.items() if entry[0] > now}
+            self._evict_at = max(1024, 2 * len(self._quotes))
+
+    async def search_stocks(self, query: str, limit: int = 10) -> List[Stock]:
+        return await self._repository.search_stocks(query, limit)
+
+    async def get_top_gainers(self, exchange: Exchange, limit: int = 10) -> List[StockPrice]:
+        return await self._repository.get_top_gainers(exchange, limit)
+
+    async def get_top_losers(self, exchange: Exchange, limit: int = 10) -> List[StockPrice]:
+        return await self._repository.get_top_losers(exchange, limit)
@@ -0,0 +1,145 @@
+"""
+Memory-Mapped Candle Store.
+
+Daily bars live in one directory per symbol with a flat file per
+column (<dir>/<EXCHANGE>/<SYMBOL>/close.f8, ...), so the history is
+appended to, never rewritten, and read through memory maps: a range
+query binary-searches the date column and slices the others, and only
+the pages it touches are read from disk.
+
+The date column is written last, so its length is the row count and
+a torn append (other columns longer than it) is trimmed on the next
+write.
+"""
+
+import os
+import re
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from domain.entities import Candle, CandleSeries, Exchange
+from domain.repositories import CandleRepository
+
+# Column name -> on-disk dtype; dates are days since 1970-01-01
+_COLUMNS = (
+    ("open", np.dtype("<f8")),
+    ("high", np.dtype("<f8")),
+    ("low", np.dtype("<f8")),
+    ("close", np.dtype("<f8")),
+    ("volume", np.dtype("<i8")),
+)
+_DATE = np.dtype("<i4")
+_SYMBOL = re.compile(r"^[A-Z0-9&_-]{1,20}$")
+_EPOCH = date(1970, 1, 1)
+
+
+class CandleOrderError(ValueError):
+    """Raised when bars are not dated after the stored history."""
+    pass
+
+
+def _day(value: date) -> int:
+    return (value - _EPOCH).days
+
+
+def _file(name: str, dtype: np.dtype) -> str:
+    return f"{name}.{dtype.kind}{dtype.itemsize}"
+
+
+class MmapCandleStore(CandleRepository):
+    """Append-only columnar daily bars, read through memory maps."""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        # (symbol, exchange) -> (rows, {column: memmap}), valid while rows match
+        self._maps: Dict[Tuple[str, Exchange], Tuple[int, Dict[str, np.ndarray]]] = {}
+
+    def _path(self, symbol: str, exchange: Exchange) -> Path:
+        if not _SYMBOL.match(symbol):
+            raise ValueError(f"Invalid symbol: {symbol}")
+        return self.directory / exchange.value / symbol
+
+    async def append_candles(self, symbol: str, exchange: Exchange, candles: Sequence[Candle]) -> int:
+        path = self._path(symbol, exchange)
+        path.mkdir(parents=True, exist_ok=True)
+        rows = self._rows(path)
+        candles = sorted(candles, key=lambda c: c.date)
+        days = np.array([_day(c.date) for c in candles], dtype=_DATE)
+        if days.shape[0] == 0:
+            return rows
+        if np.any(np.diff(days) <= 0):
+            raise CandleOrderError("Bars must have distinct dates")
+        if rows:
+            last = int(np.fromfile(
+                path / _file("date", _DATE), dtype=_DATE, count=1, offset=(rows - 1) * _DATE.itemsize
+            )[0])
+            if days[0] <= last:
+                last_date = date.fromordinal(_EPOCH.toordinal() + last)
+                raise CandleOrderError(f"{symbol} already has bars up to {last_date}")
+
+        for name, dtype in _COLUMNS:
+            with open(path / _file(name, dtype), "ab") as f:
+                f.truncate(rows * dtype.itemsize)  # Drop a torn append
+                f.write(np.array([getattr(c, name) for c in candles], dtype=dtype).tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+        with open(path / _file("date", _DATE), "ab") as f:
+            f.write(days.tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        return rows + days.shape[0]
+
+    async def get_candles(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        lookback: int = 0
+    ) -> CandleSeries:
+        columns = self._columns(symbol, exchange)
+        dates = columns["date"]
+        lo = 0 if start is None else int(np.searchsorted(dates, _day(start), side="left"))
+        hi = dates.shape[0] if end is None else int(np.searchsorted(dates, _day(end), side="right"))
+        lo = max(0, min(lo, hi) - lookback)
+        return CandleSeries(
+            dates=dates[lo:hi].astype("datetime64[D]"),
+            **{name: columns[name][lo:hi] for name, _ in _COLUMNS}
+        )
+
+    async def get_52_week_range(
+        self, symbol: str, exchange: Exchange, as_of: date
+    ) -> Tuple[Optional[float], Optional[float]]:
+        series = await self.get_candles(symbol, exchange, as_of - timedelta(weeks=52), as_of)
+        if not len(series):
+            return None, None
+        return float(np.max(series.high)), float(np.min(series.low))
+
+    def _rows(self, path: Path) -> int:
+        try:
+            return (path / _file("date", _DATE)).stat().st_size // _DATE.itemsize
+        except FileNotFoundError:
+            return 0
+
+    def _columns(self, symbol: str, exchange: Exchange) -> Dict[str, np.ndarray]:
+        """Read-only maps of a symbol's columns, reopened when rows are appended."""
+        path = self._path(symbol, exchange)
+        rows = self._rows(path)
+        cached = self._maps.get((symbol, exchange))
+        if cached is not None and cached[0] == rows:
+            return cached[1]
+
+        if rows == 0:
+            columns = {name: np.zeros(0, dtype=dtype) for name, dtype in _COLUMNS}
+            columns["date"] = np.zeros(0, dtype=_DATE)
+        else:
+            columns = {
+                name: np.memmap(path / _file(name, dtype), dtype=dtype, mode="r", shape=(rows,))
+                for name, dtype in _COLUMNS
+            }
+            columns["date"] = np.memmap(path / _file("date", _DATE), dtype=_DATE, mode="r", shape=(rows,))
+        self._maps[(symbol, exchange)] = (rows, columns)
+        return columns
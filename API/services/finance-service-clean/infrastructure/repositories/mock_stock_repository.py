@@ -1,14 +1,27 @@
 """Mock Stock Repository Implementation."""
-from typing import List, Optional
-from datetime import datetime
-from domain.entities import Stock, StockPrice, Exchange
-from domain.repositories import StockRepository
+from dataclasses import replace
+from typing import Iterable, List, Optional
+from datetime import date, datetime
+from domain.entities import Stock, StockPrice, Exchange, Tick
+from domain.repositories import CandleRepository, StockRepository
+from .movers_index import MoversIndex
+from .symbol_index import SymbolIndex
 
 
 class MockStockRepository(StockRepository):
-    """Mock implementation of stock repository for testing."""
+    """
+    Mock implementation of stock repository for testing.
 
-    def __init__(self):
+    With a candle repository, 52-week highs and lows come from the
+    stored daily bars (and today's range) instead of the mock values.
+    """
+
+    def __init__(
+        self,
+        listing: Iterable[Stock] = (),
+        candle_repository: Optional[CandleRepository] = None
+    ):
+        self._candles = candle_repository
         self._stocks = {
             ("RELIANCE", Exchange.NSE): StockPrice(
                 symbol="RELIANCE",
@@ -73,21 +86,55 @@ class MockStockRepository(StockRepository):
             Stock(symbol="HDFCBANK", name="HDFC Bank Ltd", sector="Banking", exchange=Exchange.NSE),
             Stock(symbol="ICICIBANK", name="ICICI Bank Ltd", sector="Banking", exchange=Exchange.NSE),
         ]
+        known = {(stock.symbol, stock.exchange) for stock in self._stock_list}
+        self._stock_list.extend(
+            stock for stock in listing if (stock.symbol, stock.exchange) not in known
+        )
+        self._index = SymbolIndex(self._stock_list)
+        self._movers = {exchange: MoversIndex() for exchange in Exchange}
+        for (symbol, exchange), quote in self._stocks.items():
+            self._movers[exchange].update(symbol, quote.change_percent)
 
     async def get_stock_price(self, symbol: str, exchange: Exchange) -> Optional[StockPrice]:
-        return self._stocks.get((symbol, exchange))
+        return await self._with_history(self._stocks.get((symbol, exchange)))
 
-    async def search_stocks(self, query: str) -> List[Stock]:
-        query_lower = query.lower()
-        return [
-            stock for stock in self._stock_list
-            if query_lower in stock.symbol.lower() or query_lower in stock.name.lower()
-        ]
+    async def _with_history(self, quote: Optional[StockPrice]) -> Optional[StockPrice]:
+        if quote is None or self._candles is None:
+            return quote
+        high, low = await self._candles.get_52_week_range(quote.symbol, quote.exchange, date.today())
+        if high is None:
+            return quote
+        return replace(quote, week_52_high=max(high, quote.high), week_52_low=min(low, quote.low))
+
+    async def search_stocks(self, query: str, limit: int = 10) -> List[Stock]:
+        return self._index.search(query, limit)
+
+    def apply_tick(self, tick: Tick) -> None:
+        """Update a stock's quote, and its place among the movers, from a feed tick."""
+        key = (tick.symbol, tick.exchange)
+        quote = self._stocks.get(key)
+        if quote is None:
+            return
+        self._stocks[key] = replace(
+            quote,
+            price=tick.price,
+            change=tick.change,
+            change_percent=tick.change_percent,
+            high=max(quote.high, tick.price),
+            low=min(quote.low, tick.price),
+            volume=tick.volume,
+            timestamp=tick.timestamp
+        )
+        self._movers[tick.exchange].update(tick.symbol, tick.change_percent)
 
     async def get_top_gainers(self, exchange: Exchange, limit: int = 10) -> List[StockPrice]:
-        stocks = [s for s in self._stocks.values() if s.exchange == exchange and s.change_percent > 0]
-        return sorted(stocks, key=lambda x: x.change_percent, reverse=True)[:limit]
+        return [
+            await self._with_history(self._stocks[(s, exchange)])
+            for s in self._movers[exchange].gainers(limit)
+        ]
 
     async def get_top_losers(self, exchange: Exchange, limit: int = 10) -> List[StockPrice]:
-        stocks = [s for s in self._stocks.values() if s.exchange == exchange and s.change_percent < 0]
-        return sorted(stocks, key=lambda x: x.change_percent)[:limit]
+        return [
+            await self._with_history(self._stocks[(s, exchange)])
+            for s in self._movers[exchange].losers(limit)
+        ]
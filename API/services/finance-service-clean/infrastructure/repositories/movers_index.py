@@ -0,0 +1,55 @@
+"""
+Top Movers Index.
+
+Keeps an exchange's symbols ordered by change percent as quotes
+change, so the top gainers and losers are the two ends of one sorted
+list. An update is a bisect out and a bisect in; a top-K query reads
+K entries and never re-sorts the universe.
+"""
+
+from bisect import bisect_left, insort
+from typing import Dict, List, Tuple
+
+
+class MoversIndex:
+    """Symbols ordered by change percent."""
+
+    def __init__(self):
+        self._keys: Dict[str, float] = {}
+        self._order: List[Tuple[float, str]] = []  # Ascending (change_percent, symbol)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def update(self, symbol: str, change_percent: float) -> None:
+        """Set a symbol's change percent."""
+        old = self._keys.get(symbol)
+        if old == change_percent:
+            return
+        if old is not None:
+            del self._order[bisect_left(self._order, (old, symbol))]
+        self._keys[symbol] = change_percent
+        insort(self._order, (change_percent, symbol))
+
+    def remove(self, symbol: str) -> None:
+        old = self._keys.pop(symbol, None)
+        if old is not None:
+            del self._order[bisect_left(self._order, (old, symbol))]
+
+    def gainers(self, limit: int) -> List[str]:
+        """Symbols with a positive change, largest first."""
+        symbols = []
+        for change_percent, symbol in reversed(self._order):
+            if change_percent <= 0 or len(symbols) == limit:
+                break
+            symbols.append(symbol)
+        return symbols
+
+    def losers(self, limit: int) -> List[str]:
+        """Symbols with a negative change, largest fall first."""
+        symbols = []
+        for change_percent, symbol in self._order:
+            if change_percent >= 0 or len(symbols) == limit:
+                break
+            symbols.append(symbol)
+        return symbols
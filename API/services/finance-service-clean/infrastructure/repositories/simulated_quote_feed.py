@@ -0,0 +1,55 @@
+"""Simulated Quote Feed Implementation."""
+import asyncio
+import math
+import random
+from datetime import datetime
+from typing import AsyncIterator, Optional, Sequence
+from domain.entities import Exchange, Tick
+from domain.repositories import QuoteFeed, StockRepository
+
+
+class SimulatedQuoteFeed(QuoteFeed):
+    """
+    Local feed walking each stock's price randomly from its last quote.
+
+    Stands in for an exchange connection: every interval each symbol
+    gets one tick, with the change measured from the previous close.
+    """
+
+    def __init__(
+        self,
+        stock_repository: StockRepository,
+        symbols: Sequence[str],
+        exchange: Exchange = Exchange.NSE,
+        interval: float = 0.5,
+        volatility: float = 0.001,
+        seed: Optional[int] = None
+    ):
+        self._stock_repository = stock_repository
+        self._symbols = list(symbols)
+        self._exchange = exchange
+        self._interval = interval
+        self._volatility = volatility
+        self._random = random.Random(seed)
+
+    async def ticks(self) -> AsyncIterator[Tick]:
+        quotes = await self._stock_repository.get_stock_prices(self._symbols, self._exchange)
+        state = {
+            symbol: [quote.price, quote.close, quote.volume]
+            for symbol, quote in quotes.items()
+        }
+        while True:
+            for symbol, (price, close, volume) in state.items():
+                price = round(price * math.exp(self._random.gauss(0, self._volatility)), 2)
+                volume += self._random.randint(1, 500)
+                state[symbol] = [price, close, volume]
+                yield Tick(
+                    symbol=symbol,
+                    exchange=self._exchange,
+                    price=price,
+                    change=round(price - close, 2),
+                    change_percent=round((price - close) / close * 100, 2),
+                    volume=volume,
+                    timestamp=datetime.now()
+                )
+            await asyncio.sleep(self._interval)
@@ -0,0 +1,158 @@
+"""
+Stock Symbol Index.
+
+Search over a listing by symbol and company name without scanning it:
+
+- a trie over symbols and name words answers prefix queries
+  ("REL", "tata mot") in time proportional to the prefix and results
+- a trigram inverted index answers fuzzy queries ("relaince") by
+  Jaccard similarity, touching only listings that share a trigram
+
+Results rank exact symbols first, then symbol prefixes, name-word
+prefixes and fuzzy matches.
+"""
+
+import csv
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Set, Tuple
+
+from domain.entities import Exchange, Stock
+
+# Minimum Jaccard similarity of trigram sets for a fuzzy match
+FUZZY_THRESHOLD = 0.3
+
+_EXACT, _SYMBOL_PREFIX, _WORD_PREFIX, _FUZZY = range(4)
+_WORD = re.compile(r"[a-z0-9&]+")
+
+
+def _words(text: str) -> List[str]:
+    return _WORD.findall(text.lower())
+
+
+def _trigrams(key: str) -> Set[str]:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class _TrieNode:
+    __slots__ = ("children", "ids")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.ids: List[int] = []  # Every listing with a key through this node
+
+
+class SymbolIndex:
+    """Prefix and fuzzy search over stock listings."""
+
+    def __init__(self, stocks: Iterable[Stock] = ()):
+        self._stocks: List[Stock] = []
+        self._symbols = _TrieNode()
+        self._names = _TrieNode()
+        self._keys: List[Tuple[int, int]] = []  # (listing, trigram count) per fuzzy key
+        self._postings: Dict[str, List[int]] = {}  # trigram -> fuzzy keys
+        self.extend(stocks)
+
+    def __len__(self) -> int:
+        return len(self._stocks)
+
+    def extend(self, stocks: Iterable[Stock]) -> None:
+        """Add listings to the index."""
+        for stock in stocks:
+            listing = len(self._stocks)
+            self._stocks.append(stock)
+            symbol = stock.symbol.lower()
+            self._insert(self._symbols, symbol, listing)
+            words = _words(stock.name)
+            for word in set(words):
+                self._insert(self._names, word, listing)
+            for key in {symbol, *words}:
+                trigrams = _trigrams(key)
+                for trigram in trigrams:
+                    self._postings.setdefault(trigram, []).append(len(self._keys))
+                self._keys.append((listing, len(trigrams)))
+
+    def search(self, query: str, limit: int = 10) -> List[Stock]:
+        """Listings matching a query, best first."""
+        words = _words(query)
+        if not words:
+            return []
+        ranks: Dict[int, Tuple[int, float]] = {}
+
+        def rank(listing: int, tier: int, score: float = 0.0) -> None:
+            if listing not in ranks or (tier, -score) < ranks[listing]:
+                ranks[listing] = (tier, -score)
+
+        symbol = "".join(words)
+        for listing in self._find(self._symbols, symbol):
+            exact = self._stocks[listing].symbol.lower() == symbol
+            rank(listing, _EXACT if exact else _SYMBOL_PREFIX)
+
+        # Every query word must prefix some word of the name
+        matches = None
+        for word in words:
+            found = set(self._find(self._names, word))
+            matches = found if matches is None else matches & found
+        for listing in matches or ():
+            rank(listing, _WORD_PREFIX)
+
+        if len(ranks) < limit:
+            for listing, score in self._fuzzy(words):
+                rank(listing, _FUZZY, score)
+
+        ordered = sorted(
+            ranks, key=lambda i: (ranks[i], len(self._stocks[i].symbol), self._stocks[i].symbol)
+        )
+        return [self._stocks[listing] for listing in ordered[:limit]]
+
+    def _fuzzy(self, words: List[str]) -> Iterable[Tuple[int, float]]:
+        """(listing, similarity) of keys similar to any query word."""
+        best: Dict[int, float] = {}
+        for word in words:
+            trigrams = _trigrams(word)
+            hits = Counter(
+                key for trigram in trigrams for key in self._postings.get(trigram, ())
+            )
+            for key, shared in hits.items():
+                listing, size = self._keys[key]
+                similarity = shared / (len(trigrams) + size - shared)
+                if similarity >= FUZZY_THRESHOLD and similarity > best.get(listing, 0.0):
+                    best[listing] = similarity
+        return best.items()
+
+    @staticmethod
+    def _insert(root: _TrieNode, key: str, listing: int) -> None:
+        node = root
+        for char in key:
+            node = node.children.setdefault(char, _TrieNode())
+            node.ids.append(listing)
+
+    @staticmethod
+    def _find(root: _TrieNode, prefix: str) -> List[int]:
+        node = root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return node.ids
+
+
+def load_listing(path: Path, exchange: Exchange) -> List[Stock]:
+    """
+    Read an exchange listing CSV.
+
+    Accepts the NSE equity list (SYMBOL, NAME OF COMPANY) and the BSE
+    list (Security Id, Security Name, Industry) column names.
+    """
+    stocks = []
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            row = {key.strip().lower(): (value or "").strip() for key, value in row.items() if key}
+            symbol = row.get("symbol") or row.get("security id")
+            name = row.get("name of company") or row.get("security name")
+            if symbol and name:
+                sector = row.get("industry") or row.get("sector") or ""
+                stocks.append(Stock(symbol=symbol.upper(), name=name, sector=sector, exchange=exchange))
+    return stocks
@@ -3,13 +3,25 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from infrastructure.api.dependencies import get_quote_hub
 from infrastructure.api.routers import emi_router, stock_router, sip_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan."""
+    yield
+    # The quote feed starts with the first WebSocket subscriber
+    await get_quote_hub().stop()
+
+
 app = FastAPI(
     title="Finance Service",
     description="Financial calculators and stock market data with Clean Architecture",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 app.include_router(emi_router)
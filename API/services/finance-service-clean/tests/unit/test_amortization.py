@@ -0,0 +1,104 @@
+"""Unit tests for EMI amortization schedules."""
+import pytest
+from application.amortization import amortize, monthly_emi
+from application.use_cases import CalculateEMIUseCase, GetEMIScheduleUseCase
+from application.use_cases.calculate_emi import EMIValidationError
+from application.dto import EMIRequest, EMIScheduleRequest
+from domain.entities import Prepayment, RateReset
+from infrastructure.repositories import MockEMIRepository
+
+
+def _loop_balances(principal, annual_rate, months):
+    """Reference schedule, one month at a time."""
+    r, emi, balance, balances = annual_rate / 1200, monthly_emi(principal, annual_rate, months), principal, []
+    for _ in range(months):
+        balance = balance * (1 + r) - emi
+        balances.append(balance)
+    return balances
+
+
+class TestAmortize:
+    def test_matches_month_by_month(self):
+        schedule = amortize(5000000, 8.5, 240)
+        expected = _loop_balances(5000000, 8.5, 240)
+
+        assert schedule.months == 240
+        assert max(abs(a - b) for a, b in zip(schedule.balance[:-1], expected[:-1])) < 1e-3
+        assert schedule.balance[-1] == 0
+        assert abs(schedule.principal.sum() - 5000000) < 1e-3
+        assert abs(schedule.total_interest - (monthly_emi(5000000, 8.5, 240) * 240 - 5000000)) < 1e-3
+
+    def test_prepayment_shortens_tenure(self):
+        plain = amortize(5000000, 8.5, 240)
+        prepaid = amortize(5000000, 8.5, 240, prepayments=[Prepayment(12, 500000)])
+
+        assert prepaid.months < 240
+        assert prepaid.emi[0] == prepaid.emi[100] == plain.emi[0]
+        assert prepaid.prepayment[11] == 500000
+        assert prepaid.total_interest < plain.total_interest
+
+    def test_prepayment_reduces_emi(self):
+        prepaid = amortize(5000000, 8.5, 240, prepayments=[Prepayment(12, 500000)], reduce_emi=True)
+
+        assert prepaid.months == 240
+        assert prepaid.emi[12] < prepaid.emi[11]
+
+    def test_rate_reset_keeps_end_date(self):
+        schedule = amortize(1000000, 10, 120, rate_resets=[RateReset(61, 12)])
+        remaining = float(schedule.balance[59])
+
+        assert schedule.months == 120
+        assert abs(schedule.emi[60] - monthly_emi(remaining, 12, 60)) < 1e-6
+        assert abs(schedule.interest[60] - remaining * 0.01) < 1e-6
+
+    def test_oversized_prepayment_closes_loan(self):
+        schedule = amortize(100000, 12, 24, prepayments=[Prepayment(6, 10 ** 7)])
+
+        assert schedule.months == 6
+        assert schedule.balance[-1] == 0
+
+    def test_yearly(self):
+        schedule = amortize(1000000, 9, 30)
+        years = schedule.yearly()
+
+        assert [year["year"] for year in years] == [1, 2, 3]
+        assert abs(sum(year["principal"] for year in years) - 1000000) < 0.05
+        assert years[-1]["balance"] == 0
+
+
+class TestEMIScheduleUseCase:
+    @pytest.mark.asyncio
+    async def test_pages(self):
+        use_case = GetEMIScheduleUseCase()
+        request = EMIScheduleRequest(principal=5000000, annual_rate=8.5, tenure_months=360,
+                                     offset=350, limit=20)
+        result = await use_case.execute(request)
+
+        assert result.total_rows == 360
+        assert [row.month for row in result.breakdown] == list(range(351, 361))
+        assert result.yearly_breakdown is None
+
+    @pytest.mark.asyncio
+    async def test_yearly_and_validation(self):
+        use_case = GetEMIScheduleUseCase()
+        result = await use_case.execute(EMIScheduleRequest(
+            principal=5000000, annual_rate=8.5, tenure_months=240, period="yearly"
+        ))
+        assert result.total_rows == len(result.yearly_breakdown) == 20
+
+        with pytest.raises(EMIValidationError):
+            await use_case.execute(EMIScheduleRequest(
+                principal=100000, annual_rate=10, tenure_months=12,
+                prepayments=[{"month": 24, "amount": 1000}]
+            ))
+
+    @pytest.mark.asyncio
+    async def test_calculate_fills_breakdown(self):
+        use_case = CalculateEMIUseCase(emi_repository=MockEMIRepository())
+        result = await use_case.execute(EMIRequest(
+            principal=120000, annual_rate=12, tenure_months=12, include_breakdown=True
+        ))
+
+        assert len(result.breakdown) == 12
+        assert result.breakdown[0].emi == result.monthly_emi
+        assert result.breakdown[-1].balance == 0
@@ -0,0 +1,137 @@
+"""Unit tests for the candle store and indicators."""
+import asyncio
+from datetime import date, timedelta
+import numpy as np
+import pytest
+from application.indicators import ema, rsi, sma
+from application.use_cases import GetStockHistoryUseCase
+from application.use_cases.get_stock_history import StockHistoryValidationError
+from application.use_cases.get_stock_price import StockNotFoundError
+from application.dto import StockHistoryRequest
+from domain.entities import Candle, Exchange
+from infrastructure.repositories import MmapCandleStore, MockStockRepository
+from infrastructure.repositories.mmap_candle_store import CandleOrderError
+
+FIRST_DAY = date(2023, 1, 2)
+
+
+def _candles(days, start=FIRST_DAY, seed=0):
+    rnd = np.random.default_rng(seed)
+    closes = 1000 * np.exp(np.cumsum(rnd.normal(0, 0.01, days)))
+    return [
+        Candle(start + timedelta(days=i), c * 0.995, c * 1.01, c * 0.99, c, 1000 + i)
+        for i, c in enumerate(closes.tolist())
+    ]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = MmapCandleStore(tmp_path)
+    asyncio.run(store.append_candles("TCS", Exchange.NSE, _candles(600)))
+    return store
+
+
+class TestMmapCandleStore:
+    def test_range_query(self, store):
+        series = asyncio.run(store.get_candles("TCS", Exchange.NSE, date(2023, 3, 1), date(2023, 3, 31)))
+
+        assert len(series) == 31
+        assert series.dates[0] == np.datetime64("2023-03-01")
+        assert series.dates[-1] == np.datetime64("2023-03-31")
+        assert isinstance(series.close, np.memmap)
+
+        padded = asyncio.run(store.get_candles(
+            "TCS", Exchange.NSE, date(2023, 3, 1), date(2023, 3, 31), lookback=5
+        ))
+        assert len(padded) == 36
+        empty = asyncio.run(store.get_candles("INFY", Exchange.NSE))
+        assert len(empty) == 0
+
+    def test_append_only(self, store):
+        more = _candles(10, start=FIRST_DAY + timedelta(days=600), seed=1)
+        assert asyncio.run(store.append_candles("TCS", Exchange.NSE, more)) == 610
+        assert len(asyncio.run(store.get_candles("TCS", Exchange.NSE))) == 610
+
+        with pytest.raises(CandleOrderError):
+            asyncio.run(store.append_candles("TCS", Exchange.NSE, more[:1]))
+        with pytest.raises(ValueError):
+            asyncio.run(store.get_candles("../TCS", Exchange.NSE))
+
+    def test_torn_append_is_trimmed(self, store, tmp_path):
+        with open(tmp_path / "NSE" / "TCS" / "close.f8", "ab") as f:
+            f.write(b"\0" * 24)  # Crash after writing one column
+        more = _candles(2, start=FIRST_DAY + timedelta(days=600), seed=2)
+        asyncio.run(store.append_candles("TCS", Exchange.NSE, more))
+
+        series = asyncio.run(store.get_candles("TCS", Exchange.NSE, more[0].date))
+        assert series.close.tolist() == [c.close for c in more]
+
+    def test_52_week_range(self, store):
+        candles = _candles(600)
+        as_of = candles[-1].date
+        window = [c for c in candles if c.date >= as_of - timedelta(weeks=52)]
+        high, low = asyncio.run(store.get_52_week_range("TCS", Exchange.NSE, as_of))
+
+        assert high == max(c.high for c in window)
+        assert low == min(c.low for c in window)
+
+
+class TestIndicators:
+    closes = np.array([c.close for c in _candles(400)])
+
+    def test_against_loops(self):
+        n, alpha = 20, 2 / 21
+        expected, value = [], self.closes[:n].mean()
+        for close in self.closes[n:]:
+            value = alpha * close + (1 - alpha) * value
+            expected.append(value)
+
+        assert np.allclose(ema(self.closes, n)[n:], expected)
+        assert np.isnan(ema(self.closes, n)[:n - 1]).all()
+        assert np.allclose(sma(self.closes, 5)[4:], np.convolve(self.closes, np.ones(5) / 5, "valid"))
+
+    def test_rsi_bounds(self):
+        values = rsi(self.closes, 14)
+        assert np.isnan(values[:14]).all()
+        assert ((values[14:] >= 0) & (values[14:] <= 100)).all()
+        assert rsi(np.arange(30.0), 14)[-1] == 100
+
+
+class TestStockHistory:
+    @pytest.mark.asyncio
+    async def test_history_with_indicators(self, store):
+        use_case = GetStockHistoryUseCase(store)
+        result = await use_case.execute(StockHistoryRequest(
+            symbol="tcs", start=date(2024, 1, 1), end=date(2024, 1, 31), sma=20, rsi=14
+        ))
+
+        assert len(result.candles) == 31
+        assert result.candles[0].date == date(2024, 1, 1)
+        assert set(result.indicators) == {"sma_20", "rsi_14"}
+        assert None not in result.indicators["sma_20"]
+        assert result.week_52_high >= max(c.high for c in result.candles)
+
+    @pytest.mark.asyncio
+    async def test_errors(self, store):
+        use_case = GetStockHistoryUseCase(store)
+        with pytest.raises(StockNotFoundError):
+            await use_case.execute(StockHistoryRequest(symbol="INFY"))
+        with pytest.raises(StockHistoryValidationError):
+            await use_case.execute(StockHistoryRequest(
+                symbol="TCS", start=date(2024, 2, 1), end=date(2024, 1, 1)
+            ))
+
+    @pytest.mark.asyncio
+    async def test_quote_52_week_from_history(self, tmp_path):
+        store = MmapCandleStore(tmp_path)
+        today = date.today()
+        await store.append_candles("INFY", Exchange.NSE, [
+            Candle(today - timedelta(days=400), 1500, 9000, 10, 1500, 1),  # Older than 52 weeks
+            Candle(today - timedelta(days=30), 1500, 1800, 1400, 1500, 1),
+        ])
+        repository = MockStockRepository(candle_repository=store)
+
+        infy = await repository.get_stock_price("INFY", Exchange.NSE)
+        tcs = await repository.get_stock_price("TCS", Exchange.NSE)
+        assert (infy.week_52_high, infy.week_52_low) == (1800, 1400)
+        assert (tcs.week_52_high, tcs.week_52_low) == (3900.00, 3200.00)
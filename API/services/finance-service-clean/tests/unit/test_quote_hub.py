@@ -0,0 +1,101 @@
+"""Unit tests for the live quote hub."""
+import asyncio
+import json
+from datetime import datetime
+from fastapi.testclient import TestClient
+from application.quote_hub import QuoteHub
+from domain.entities import Exchange, Tick
+from domain.repositories import QuoteFeed
+from infrastructure.api.dependencies import get_quote_hub
+from infrastructure.repositories import MockStockRepository, SimulatedQuoteFeed
+from main import app
+
+
+def _tick(symbol, price):
+    return Tick(symbol, Exchange.NSE, price, 0.0, 0.0, 1, datetime(2024, 1, 1))
+
+
+class _LocalFeed(QuoteFeed):
+    """Feed pushing whatever the test puts on its queue."""
+
+    def __init__(self):
+        self.queue = asyncio.Queue()
+        self.connections = 0
+
+    async def ticks(self):
+        self.connections += 1
+        while True:
+            yield await self.queue.get()
+
+
+async def _drain(feed):
+    while not feed.queue.empty():
+        await asyncio.sleep(0)
+
+
+class TestQuoteHub:
+    def test_one_upstream_per_symbol_fan_out(self):
+        async def scenario():
+            feed = _LocalFeed()
+            hub = QuoteHub(feed)
+            watchers = [hub.subscribe(["RELIANCE"]) for _ in range(50)]
+            other = hub.subscribe(["TCS"])
+
+            feed.queue.put_nowait(_tick("RELIANCE", 2450.0))
+            feed.queue.put_nowait(_tick("TCS", 3650.0))
+            received = [await watcher.next() for watcher in watchers]
+
+            assert feed.connections == 1
+            assert all([t.price for t in ticks] == [2450.0] for ticks in received)
+            assert [t.symbol for t in await other.next()] == ["TCS"]
+            await hub.stop()
+
+        asyncio.run(scenario())
+
+    def test_slow_consumer_gets_latest_value(self):
+        async def scenario():
+            feed = _LocalFeed()
+            hub = QuoteHub(feed, history=10)
+            subscription = hub.subscribe(["TCS", "INFY"])
+            for i in range(100):
+                feed.queue.put_nowait(_tick("TCS", 3600.0 + i))
+            feed.queue.put_nowait(_tick("INFY", 1500.0))
+            await _drain(feed)
+
+            assert {t.symbol: t.price for t in await subscription.next()} == {"TCS": 3699.0, "INFY": 1500.0}
+            assert [t.price for t in hub.recent("TCS")] == [3690.0 + i for i in range(10)]
+            assert [t.price for t in hub.recent("TCS", 2)] == [3698.0, 3699.0]
+
+            subscription.remove(["TCS"])
+            feed.queue.put_nowait(_tick("TCS", 1.0))
+            await _drain(feed)
+            subscription.close()
+            assert await subscription.next() == []
+            assert hub.subscriber_count("INFY") == 0
+            await hub.stop()
+
+        asyncio.run(scenario())
+
+
+class TestQuoteStream:
+    def test_websocket_subscribe_and_stream(self):
+        repository = MockStockRepository()
+        hub = QuoteHub(SimulatedQuoteFeed(repository, ["RELIANCE", "TCS"], interval=0.01, seed=1))
+        app.dependency_overrides[get_quote_hub] = lambda: hub
+        try:
+            with TestClient(app) as client, client.websocket_connect("/stocks/stream?symbols=tcs") as ws:
+                assert ws.receive_json() == {"type": "snapshot", "symbol": "TCS", "data": []}
+                update = ws.receive_json()
+                assert update["type"] == "quotes"
+                assert {quote["symbol"] for quote in update["data"]} == {"TCS"}
+
+                ws.send_text(json.dumps({"action": "subscribe", "symbols": ["RELIANCE"]}))
+                messages = [ws.receive_json() for _ in range(5)]
+                snapshot = next(m for m in messages if m["type"] == "snapshot")
+                assert snapshot["symbol"] == "RELIANCE" and snapshot["data"]
+
+                ws.send_text("{}")
+                assert any(ws.receive_json()["type"] == "error" for _ in range(10))
+        finally:
+            app.dependency_overrides.clear()
+        assert not hub.running
@@ -0,0 +1,88 @@
+"""Unit tests for SIP goals, step-up SIPs and XIRR."""
+import numpy as np
+import pytest
+from datetime import date
+from application.sip_planning import required_sip, step_up_factor, xirr
+from application.use_cases import CalculateXIRRUseCase, PlanSIPGoalUseCase, ProjectStepUpSIPUseCase
+from application.use_cases.calculate_sip import SIPValidationError
+from application.dto import SIPGoalRequest, StepUpSIPRequest, XIRRRequest
+from domain.entities import SIPCalculation
+
+
+def _step_up_value(monthly, annual_rate, years, step_up):
+    """Reference value, one instalment at a time."""
+    r, value = annual_rate / 1200, 0.0
+    for _ in range(years):
+        for _ in range(12):
+            value = (value + monthly) * (1 + r)
+        monthly *= 1 + step_up / 100
+    return value
+
+
+class TestSIPPlanning:
+    def test_flat_factor_matches_sip(self):
+        for rate in (0, 8, 12):
+            expected = SIPCalculation(1000, 10, rate).calculate().maturity_value
+            assert abs(1000 * step_up_factor(rate, 10) - expected) < 1e-6
+
+    def test_step_up_factor(self):
+        for rate, years, step in [(12, 10, 10), (0, 5, 10), (8, 20, 5)]:
+            assert abs(1000 * step_up_factor(rate, years, step) - _step_up_value(1000, rate, years, step)) < 1e-6
+
+    def test_required_sip_is_vectorized(self):
+        monthly = required_sip(10000000, np.array([10, 12]), 15, np.array([[0], [10]]))
+
+        assert monthly.shape == (2, 2)
+        assert abs(_step_up_value(monthly[1, 1], 12, 15, 10) - 10000000) < 1e-3
+
+    def test_xirr_batch(self):
+        amounts = np.array([[-1000, 1100, 0], [-1000, -1000, 2200], [1000, 1000, 0], [-1000, 100, 0]])
+        years = np.array([[0, 1, 0], [0, 1, 2], [0, 1, 0], [0, 1, 0]])
+        rates = xirr(amounts, years)
+
+        assert abs(rates[0] - 0.1) < 1e-9
+        assert abs(1000 * (1 + rates[1]) ** 2 + 1000 * (1 + rates[1]) - 2200) < 1e-6
+        assert np.isnan(rates[2])
+        assert abs(rates[3] + 0.9) < 1e-9
+
+
+class TestSIPPlanningUseCases:
+    @pytest.mark.asyncio
+    async def test_goal(self):
+        result = await PlanSIPGoalUseCase().execute(SIPGoalRequest(
+            target_amount=10000000, duration_years=15, expected_return_rate=12
+        ))
+        projected = SIPCalculation(result.monthly_investment, 15, 12).calculate().maturity_value
+
+        assert abs(projected - 10000000) < 100
+        assert result.total_invested == round(result.monthly_investment * 180, 2)
+
+    @pytest.mark.asyncio
+    async def test_step_up(self):
+        result = await ProjectStepUpSIPUseCase().execute(StepUpSIPRequest(
+            monthly_investment=10000, duration_years=10, expected_return_rate=12, annual_step_up=10
+        ))
+
+        assert [year.year for year in result.yearly] == list(range(1, 11))
+        assert result.yearly[1].monthly_investment == 11000
+        assert result.maturity_value == round(_step_up_value(10000, 12, 10, 10), 2)
+
+    @pytest.mark.asyncio
+    async def test_xirr_portfolios(self):
+        result = await CalculateXIRRUseCase().execute(XIRRRequest(portfolios=[
+            [{"date": date(2023, 1, 1), "amount": -10000}, {"date": date(2024, 1, 1), "amount": 11000}],
+            [{"date": date(2023, 1, 1), "amount": 5000}, {"date": date(2023, 6, 1), "amount": 100}],
+            [
+                {"date": date(2022, 1, 1), "amount": -5000},
+                {"date": date(2022, 7, 1), "amount": -5000},
+                {"date": date(2023, 1, 1), "amount": -5000},
+                {"date": date(2024, 1, 1), "amount": 17500},
+            ],
+        ]))
+
+        assert result.xirr[0] == 10.0
+        assert result.xirr[1] is None
+        assert 5 < result.xirr[2] < 15
+
+        with pytest.raises(SIPValidationError):
+            await CalculateXIRRUseCase().execute(XIRRRequest(portfolios=[[{"date": date(2023, 1, 1), "amount": -1}]]))
@@ -0,0 +1,146 @@
+"""Unit tests for batch stock quotes and symbol search."""
+import asyncio
+import random
+import string
+import time
+import pytest
+from application.use_cases import GetStockQuotesUseCase, SearchStocksUseCase
+from application.use_cases.get_stock_quotes import StockQuotesValidationError
+from application.dto import StockQuotesRequest, StockSearchRequest
+from domain.entities import Exchange, Stock
+from infrastructure.repositories import CachedStockRepository, MockStockRepository, SymbolIndex, load_listing
+
+
+def _big_index() -> SymbolIndex:
+    """8000 random listings plus RELIANCE."""
+    rnd = random.Random(7)
+    words = ["".join(rnd.choices(string.ascii_lowercase, k=rnd.randint(3, 9))) for _ in range(2000)]
+    big = SymbolIndex(
+        Stock("".join(rnd.choices(string.ascii_uppercase, k=rnd.randint(3, 10))),
+              " ".join(rnd.choices(words, k=3)) + " Ltd", "", Exchange.NSE)
+        for _ in range(8000)
+    )
+    big.extend([Stock("RELIANCE", "Reliance Industries Ltd", "Energy", Exchange.NSE)])
+    return big
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _CountingRepository(MockStockRepository):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    async def get_stock_prices(self, symbols, exchange):
+        self.batches.append(list(symbols))
+        return await super().get_stock_prices(symbols, exchange)
+
+
+class TestCachedStockRepository:
+    def test_batches_misses_and_expires(self):
+        source, clock = _CountingRepository(), _Clock()
+        repository = CachedStockRepository(source, ttl_seconds=5, clock=clock)
+
+        prices = asyncio.run(repository.get_stock_prices(["TCS", "INFY", "NOPE"], Exchange.NSE))
+        assert set(prices) == {"TCS", "INFY"}
+        assert source.batches == [["TCS", "INFY", "NOPE"]]
+
+        clock.now = 4
+        asyncio.run(repository.get_stock_prices(["TCS", "RELIANCE"], Exchange.NSE))
+        assert source.batches[-1] == ["RELIANCE"]
+
+        clock.now = 6
+        asyncio.run(repository.get_stock_price("TCS", Exchange.NSE))
+        assert source.batches[-1] == ["TCS"]
+
+
+class TestGetStockQuotesUseCase:
+    @pytest.mark.asyncio
+    async def test_watchlist_in_order(self):
+        use_case = GetStockQuotesUseCase(CachedStockRepository(MockStockRepository()))
+        result = await use_case.execute(StockQuotesRequest(symbols=["infy", " TCS", "NOPE", "INFY"]))
+
+        assert [quote.symbol for quote in result.data] == ["INFY", "TCS"]
+        assert result.not_found == ["NOPE"]
+
+    @pytest.mark.asyncio
+    async def test_validation(self):
+        use_case = GetStockQuotesUseCase(MockStockRepository())
+        with pytest.raises(StockQuotesValidationError):
+            await use_case.execute(StockQuotesRequest(symbols=["", " "]))
+        with pytest.raises(StockQuotesValidationError):
+            await use_case.execute(StockQuotesRequest(symbols=[f"S{i}" for i in range(101)]))
+
+
+@pytest.fixture(scope="module")
+def index():
+    return SymbolIndex(MockStockRepository()._stock_list + [
+        Stock("TATAMOTORS", "Tata Motors Ltd", "Auto", Exchange.NSE),
+        Stock("RELINFRA", "Reliance Infrastructure Ltd", "Power", Exchange.NSE),
+    ])
+
+
+class TestSymbolIndex:
+    def test_ranking(self, index):
+        def symbols(query):
+            return [stock.symbol for stock in index.search(query, 5)]
+
+        assert symbols("RELIANCE") == ["RELIANCE", "RELINFRA"]
+        assert symbols("rel")[:2] == ["RELIANCE", "RELINFRA"]
+        assert symbols("tata mot")[0] == "TATAMOTORS"
+        assert symbols("bank") == ["HDFCBANK", "ICICIBANK"]
+        assert symbols("relaince")[0] == "RELIANCE"
+        assert symbols("infosys") == ["INFY"]
+        assert symbols("xyz") == []
+        assert symbols("  ") == []
+
+    def test_fuzzy_over_thousands(self):
+        results = _big_index().search("relaince")
+        assert results[0].symbol == "RELIANCE"
+
+    @pytest.mark.benchmark
+    def test_fast_over_thousands(self):
+        big = _big_index()
+
+        started = time.perf_counter()
+        for _ in range(20):
+            results = big.search("relaince")
+        per_search = (time.perf_counter() - started) / 20
+        print(f"{per_search * 1e3:.2f} ms per fuzzy search over {len(big)} listings")
+        assert per_search < 0.02
+        assert results[0].symbol == "RELIANCE"
+
+    def test_load_listing(self, tmp_path):
+        nse = tmp_path / "EQUITY_L.csv"
+        nse.write_text("SYMBOL,NAME OF COMPANY, SERIES\nTCS,Tata Consultancy Services Limited,EQ\n")
+        bse = tmp_path / "bse.csv"
+        bse.write_text("Security Code,Security Id,Security Name,Industry\n500325,RELIANCE,Reliance Industries Ltd,Refineries\n")
+
+        assert load_listing(nse, Exchange.NSE) == [
+            Stock("TCS", "Tata Consultancy Services Limited", "", Exchange.NSE)
+        ]
+        assert load_listing(bse, Exchange.BSE)[0].sector == "Refineries"
+
+    @pytest.mark.asyncio
+    async def test_repository_indexes_listing(self, tmp_path):
+        nse = tmp_path / "NSE.csv"
+        nse.write_text(
+            "SYMBOL,NAME OF COMPANY\nWIPRO,Wipro Limited\nRELIANCE,Reliance Industries Limited\n"
+        )
+        repository = MockStockRepository(listing=load_listing(nse, Exchange.NSE))
+
+        assert [s.symbol for s in await repository.search_stocks("wipro")] == ["WIPRO"]
+        assert [s.symbol for s in await repository.search_stocks("RELIANCE")].count("RELIANCE") == 1
+
+    @pytest.mark.asyncio
+    async def test_search_use_case(self):
+        use_case = SearchStocksUseCase(MockStockRepository())
+        result = await use_case.execute(StockSearchRequest(query="icici", limit=3))
+
+        assert [stock.symbol for stock in result.results] == ["ICICIBANK"]
@@ -0,0 +1,84 @@
+"""Unit tests for EMI and SIP sweeps."""
+import pytest
+from application.use_cases import SweepEMIUseCase, SweepSIPUseCase
+from application.use_cases.calculate_emi import EMIValidationError
+from application.use_cases.calculate_sip import SIPValidationError
+from pydantic import ValidationError
+from application.dto import EMISweepRequest, SIPSweepRequest
+from domain.entities import EMICalculation, LoanType, SIPCalculation
+
+
+class TestEMISweep:
+    @pytest.mark.asyncio
+    async def test_grid_matches_single_calculations(self):
+        request = EMISweepRequest(
+            principal=[1000000, 5000000],
+            annual_rate={"start": 0, "stop": 12, "step": 0.5},
+            tenure_months=[60, 120, 240]
+        )
+        result = await SweepEMIUseCase().execute(request)
+
+        assert len(result.annual_rate) == 25
+        assert result.annual_rate[-1] == 12
+        for i, principal in enumerate(result.principal):
+            for j, rate in enumerate(result.annual_rate):
+                for k, months in enumerate(result.tenure_months):
+                    single = EMICalculation(principal, rate, months, LoanType.HOME).calculate()
+                    assert result.monthly_emi[i][j][k] == round(single.monthly_emi, 2)
+
+    @pytest.mark.asyncio
+    async def test_single_values(self):
+        result = await SweepEMIUseCase().execute(
+            EMISweepRequest(principal=120000, annual_rate=0, tenure_months=12)
+        )
+        assert result.monthly_emi == [[[10000.0]]]
+        assert result.total_interest == [[[0.0]]]
+
+    @pytest.mark.asyncio
+    async def test_invalid(self):
+        use_case = SweepEMIUseCase()
+        with pytest.raises(EMIValidationError):
+            await use_case.execute(EMISweepRequest(principal=100000, annual_rate=10, tenure_months=[12.5]))
+        with pytest.raises(EMIValidationError):
+            await use_case.execute(EMISweepRequest(
+                principal={"start": 1, "stop": 200, "step": 1},
+                annual_rate={"start": 1, "stop": 20, "step": 1},
+                tenure_months={"start": 1, "stop": 120, "step": 1}
+            ))
+
+    def test_oversized_range_rejected_before_expanding(self):
+        for stop in (201, 3e6, 1e308):
+            with pytest.raises(ValidationError):
+                EMISweepRequest(
+                    principal={"start": 1, "stop": stop, "step": 1}, annual_rate=10, tenure_months=12
+                )
+        request = EMISweepRequest(
+            principal={"start": 1, "stop": 200, "step": 1}, annual_rate=10, tenure_months=12
+        )
+        assert len(request.principal.values()) == 200
+
+
+class TestSIPSweep:
+    @pytest.mark.asyncio
+    async def test_grid_matches_single_calculations(self):
+        request = SIPSweepRequest(
+            monthly_investment=[5000, 10000],
+            expected_return_rate=[0, 8, 12],
+            duration_years={"start": 5, "stop": 20, "step": 5}
+        )
+        result = await SweepSIPUseCase().execute(request)
+
+        assert result.duration_years == [5, 10, 15, 20]
+        for i, amount in enumerate(result.monthly_investment):
+            for j, rate in enumerate(result.expected_return_rate):
+                for k, years in enumerate(result.duration_years):
+                    single = SIPCalculation(amount, years, rate).calculate()
+                    assert result.maturity_value[i][j][k] == round(single.maturity_value, 2)
+                    assert abs(result.estimated_returns[i][j][k] - single.estimated_returns) <= 0.01
+
+    @pytest.mark.asyncio
+    async def test_invalid(self):
+        with pytest.raises(SIPValidationError):
+            await SweepSIPUseCase().execute(
+                SIPSweepRequest(monthly_investment=1000, expected_return_rate=45, duration_years=10)
+            )
@@ -0,0 +1,61 @@
+"""Unit tests for top gainers and losers."""
+import random
+from datetime import datetime
+import pytest
+from fastapi.testclient import TestClient
+from application.use_cases import GetTopMoversUseCase
+from application.dto import TopMoversRequest
+from domain.entities import Exchange, Tick
+from infrastructure.repositories import MockStockRepository, MoversIndex
+from main import app
+
+
+class TestMoversIndex:
+    def test_matches_sorting_under_updates(self):
+        rnd = random.Random(3)
+        index, changes = MoversIndex(), {}
+        for _ in range(5000):
+            symbol = f"S{rnd.randrange(300)}"
+            if rnd.random() < 0.05:
+                index.remove(symbol)
+                changes.pop(symbol, None)
+            else:
+                changes[symbol] = round(rnd.uniform(-10, 10), 2)
+                index.update(symbol, changes[symbol])
+
+        ranked = sorted(changes.items(), key=lambda item: (item[1], item[0]))
+        assert len(index) == len(changes)
+        assert index.gainers(10) == [s for s, c in reversed(ranked) if c > 0][:10]
+        assert index.losers(10) == [s for s, c in ranked if c < 0][:10]
+
+    def test_excludes_unchanged(self):
+        index = MoversIndex()
+        index.update("A", 0.0)
+        index.update("B", 1.0)
+        assert index.gainers(5) == ["B"]
+        assert index.losers(5) == []
+
+
+class TestTopMoversUseCase:
+    @pytest.mark.asyncio
+    async def test_follows_ticks(self):
+        repository = MockStockRepository()
+        use_case = GetTopMoversUseCase(repository)
+        result = await use_case.execute(TopMoversRequest())
+        assert [s.symbol for s in result.gainers] == ["RELIANCE", "INFY"]
+        assert [s.symbol for s in result.losers] == ["TCS"]
+
+        repository.apply_tick(Tick("INFY", Exchange.NSE, 1380.0, -127.75, -8.47, 4000000, datetime.now()))
+        result = await use_case.execute(TopMoversRequest(limit=1, include_gainers=False))
+        assert result.gainers is None
+        assert [(s.symbol, s.price) for s in result.losers] == [("INFY", 1380.0)]
+
+    def test_routes(self):
+        client = TestClient(app)
+        gainers = client.get("/stocks/gainers?limit=1").json()
+        losers = client.get("/stocks/losers").json()
+
+        assert len(gainers["gainers"]) == 1 and "losers" not in gainers
+        assert all(s["change_percent"] < 0 for s in losers["losers"]) and "gainers" not in losers
+        assert gainers["success"] is True
+        assert set(gainers["gainers"][0]) == set(losers["losers"][0])
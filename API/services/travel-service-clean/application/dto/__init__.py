@@ -6,16 +6,38 @@ They are different from domain entities - DTOs are for
 serialization/API responses, entities are for business logic.
 """
 
-from .pnr_dto import PNRResponse, PassengerDTO
+from .pnr_dto import (
+    PNRResponse,
+    PassengerDTO,
+    PNRBatchRequest,
+    PNRBatchItem,
+    PNRWatchRequest,
+    PNRWatchResponse,
+    PassengerChangeDTO,
+    PNRChangeEventDTO,
+    PNRChangeEventsResponse,
+)
+from .fare_dto import FareQueryDTO, FareBatchRequest, FareDTO, FareBatchResponse
 from .train_dto import TrainDTO, TrainScheduleResponse, TrainSearchResponse, StopDTO, StationDTO, LiveStatusDTO
 
 __all__ = [
     "PNRResponse",
     "PassengerDTO",
+    "PNRBatchRequest",
+    "PNRBatchItem",
+    "PNRWatchRequest",
+    "PNRWatchResponse",
+    "PassengerChangeDTO",
+    "PNRChangeEventDTO",
+    "PNRChangeEventsResponse",
     "TrainDTO",
     "TrainScheduleResponse",
     "TrainSearchResponse",
     "StopDTO",
     "StationDTO",
     "LiveStatusDTO",
+    "FareQueryDTO",
+    "FareBatchRequest",
+    "FareDTO",
+    "FareBatchResponse",
 ]
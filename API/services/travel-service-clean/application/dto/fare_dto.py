@@ -0,0 +1,47 @@
+"""
+Fare Data Transfer Objects.
+
+Pydantic models for fare API request/response serialization.
+"""
+
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+
+class FareQueryDTO(BaseModel):
+    """One fare query in a batch."""
+    train_number: str
+    from_station: str
+    to_station: str
+    travel_class: str = Field(..., description="Travel class (SL, 3A, 2A, 1A)")
+
+
+class FareBatchRequest(BaseModel):
+    """Batch fare request."""
+    queries: List[FareQueryDTO]
+    allow_estimate: bool = Field(
+        False,
+        description="Interpolate between cached fare slabs instead of calling upstream"
+    )
+
+
+class FareDTO(BaseModel):
+    """Fare result for one query."""
+    train_number: str
+    from_station: str
+    to_station: str
+    travel_class: str
+    success: bool
+    fare: Optional[float] = None
+    distance_km: Optional[int] = None
+    source: Optional[str] = None
+    is_estimate: bool = False
+    error: Optional[str] = None
+
+
+class FareBatchResponse(BaseModel):
+    """Batch fare response, in request order."""
+    success: bool = True
+    total: int
+    found: int
+    fares: List[FareDTO]
@@ -53,3 +53,63 @@ class PNRNotFoundResponse(BaseModel):
     pnr: str
     error: str = "PNR not found"
     message: str = "Please check the PNR number and try again"
+
+
+class PNRBatchRequest(BaseModel):
+    """Batch PNR status request."""
+    pnrs: List[str] = Field(..., description="10-digit PNR numbers")
+
+
+class PNRBatchItem(BaseModel):
+    """
+    One line of a batch PNR status response.
+
+    Streamed as NDJSON, so each item is self-contained.
+    """
+    pnr: str
+    success: bool
+    cached: bool = False
+    status: Optional[PNRResponse] = None
+    error: Optional[str] = None
+
+
+class PNRWatchRequest(BaseModel):
+    """Request to watch a PNR for status changes."""
+    subscriber_id: str = Field(..., description="Who to notify, e.g. a WhatsApp number")
+
+
+class PNRWatchResponse(BaseModel):
+    """PNR watch registration response."""
+    success: bool = True
+    pnr: str
+    watching: bool
+    subscribers: int
+    next_check_at: Optional[str] = None
+    message: Optional[str] = None
+
+
+class PassengerChangeDTO(BaseModel):
+    """One passenger's status change."""
+    number: int
+    previous_status: str
+    current_status: str
+    improved: bool
+
+
+class PNRChangeEventDTO(BaseModel):
+    """PNR status change notification."""
+    pnr: str
+    train_number: str
+    journey_date: str
+    subscribers: List[str]
+    changes: List[PassengerChangeDTO]
+    chart_prepared: bool
+    status_summary: str
+    detected_at: str
+
+
+class PNRChangeEventsResponse(BaseModel):
+    """Pending change notifications for the bot to deliver."""
+    success: bool = True
+    count: int
+    events: List[PNRChangeEventDTO]
@@ -0,0 +1,238 @@
+"""
+Fare Engine.
+
+Answers fare queries from per-train distance-slab tables so that
+search results can show fares without one upstream call per
+(train, from, to, class) combination.
+
+Segment distances come from the train schedule. Every fare fetched
+from upstream is recorded against its distance, and since slab fares
+depend only on distance, one fetch answers every segment of that
+train with the same length - and every length in between two points
+that share a fare.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from domain.entities import FareQuote, FareSlabTable, FareSource, TrainSchedule
+from domain.repositories import PNRRepository, TrainRepository
+
+logger = logging.getLogger(__name__)
+
+
+class FareEngine:
+    """
+    Cached fare lookup with bulk warming.
+
+    Schedules and slab tables are kept in memory per train, bounded
+    by max_trains (oldest train evicted first).
+    """
+
+    def __init__(
+        self,
+        pnr_repository: PNRRepository,
+        train_repository: TrainRepository,
+        upstream_semaphore: Optional[asyncio.Semaphore] = None,
+        max_trains: int = 5000,
+    ):
+        self._pnr_repository = pnr_repository
+        self._train_repository = train_repository
+        self._semaphore = upstream_semaphore or asyncio.Semaphore(5)
+        self._max_trains = max_trains
+        self._schedules: Dict[str, Optional[TrainSchedule]] = {}
+        self._tables: Dict[Tuple[str, str], FareSlabTable] = {}
+
+    async def get_fare(
+        self,
+        train_number: str,
+        from_station: str,
+        to_station: str,
+        travel_class: str,
+        allow_estimate: bool = False
+    ) -> Optional[FareQuote]:
+        """
+        Get fare for a journey segment.
+
+        Args:
+            train_number: Train number
+            from_station: Source station code
+            to_station: Destination station code
+            travel_class: Travel class (SL, 3A, 2A, 1A)
+            allow_estimate: Interpolate between cached slabs instead
+                of calling upstream when the fare isn't known exactly
+
+        Returns:
+            FareQuote, or None if upstream has no fare
+        """
+        distance = await self._segment_distance(train_number, from_station, to_station)
+
+        table = self._tables.get((train_number, travel_class))
+        if distance is not None and table is not None:
+            fare = table.lookup(distance)
+            if fare is not None:
+                return self._quote(
+                    train_number, from_station, to_station, travel_class,
+                    fare, FareSource.CACHE, distance,
+                )
+
+            if allow_estimate:
+                fare = table.estimate(distance)
+                if fare is not None:
+                    return self._quote(
+                        train_number, from_station, to_station, travel_class,
+                        fare, FareSource.ESTIMATE, distance,
+                    )
+
+        fare = await self._fetch(train_number, from_station, to_station, travel_class)
+        if fare is None:
+            return None
+
+        if distance is not None:
+            self._table(train_number, travel_class).add(distance, fare)
+
+        return self._quote(
+            train_number, from_station, to_station, travel_class,
+            fare, FareSource.UPSTREAM, distance,
+        )
+
+    async def warm(
+        self,
+        train_numbers: Iterable[str],
+        classes: Optional[List[str]] = None
+    ) -> int:
+        """
+        Pre-fill slab tables for trains.
+
+        Fetches the fare from the source station to every stop, for
+        each class the train runs (or the given classes).
+
+        Returns:
+            Number of fares fetched from upstream
+        """
+        fetches = []
+
+        for train_number in train_numbers:
+            schedule = await self._schedule(train_number)
+            if schedule is None or not schedule.stops:
+                continue
+
+            source = schedule.stops[0]
+            for travel_class in classes or schedule.train.classes:
+                table = self._table(train_number, travel_class)
+                for stop in schedule.stops[1:]:
+                    distance = stop.distance_km - source.distance_km
+                    if table.lookup(distance) is None:
+                        fetches.append(self._warm_one(
+                            table, source.station.code, stop.station.code, distance
+                        ))
+
+        results = await asyncio.gather(*fetches)
+        fetched = sum(results)
+        logger.info(f"Fare cache warmed with {fetched} fares")
+        return fetched
+
+    async def _warm_one(
+        self,
+        table: FareSlabTable,
+        from_station: str,
+        to_station: str,
+        distance: int
+    ) -> int:
+        """Fetch one fare into a table, returning 1 on success."""
+        fare = await self._fetch(
+            table.train_number, from_station, to_station, table.travel_class
+        )
+        if fare is None:
+            return 0
+        table.add(distance, fare)
+        return 1
+
+    async def _fetch(
+        self,
+        train_number: str,
+        from_station: str,
+        to_station: str,
+        travel_class: str
+    ) -> Optional[float]:
+        """Fetch fare from upstream under the shared semaphore."""
+        async with self._semaphore:
+            return await self._pnr_repository.get_fare(
+                train_number, from_station, to_station, travel_class
+            )
+
+    async def _segment_distance(
+        self,
+        train_number: str,
+        from_station: str,
+        to_station: str
+    ) -> Optional[int]:
+        """Get distance between two stops, or None if not on the route."""
+        schedule = await self._schedule(train_number)
+        if schedule is None:
+            return None
+
+        from_stop = schedule.get_stop(from_station)
+        to_stop = schedule.get_stop(to_station)
+        if from_stop is None or to_stop is None:
+            return None
+
+        distance = to_stop.distance_km - from_stop.distance_km
+        return distance if distance > 0 else None
+
+    async def _schedule(self, train_number: str) -> Optional[TrainSchedule]:
+        """Get train schedule, cached per train."""
+        if train_number in self._schedules:
+            return self._schedules[train_number]
+
+        try:
+            schedule = await self._train_repository.get_schedule(train_number)
+        except Exception as e:
+            # Don't cache failures - next query retries
+            logger.error(f"Could not load schedule for fare lookup: {e}")
+            return None
+
+        self._evict_if_full()
+        self._schedules[train_number] = schedule
+        return schedule
+
+    def _table(self, train_number: str, travel_class: str) -> FareSlabTable:
+        """Get or create the slab table for a train and class."""
+        key = (train_number, travel_class)
+        table = self._tables.get(key)
+        if table is None:
+            table = FareSlabTable(train_number=train_number, travel_class=travel_class)
+            self._tables[key] = table
+        return table
+
+    def _evict_if_full(self) -> None:
+        """Drop the oldest train's schedule and tables when at capacity."""
+        if len(self._schedules) < self._max_trains:
+            return
+
+        oldest = next(iter(self._schedules))
+        del self._schedules[oldest]
+        for key in [k for k in self._tables if k[0] == oldest]:
+            del self._tables[key]
+
+    def _quote(
+        self,
+        train_number: str,
+        from_station: str,
+        to_station: str,
+        travel_class: str,
+        fare: float,
+        source: FareSource,
+        distance: Optional[int]
+    ) -> FareQuote:
+        """Build a fare quote."""
+        return FareQuote(
+            train_number=train_number,
+            from_station=from_station,
+            to_station=to_station,
+            travel_class=travel_class,
+            fare=fare,
+            source=source,
+            distance_km=distance,
+        )
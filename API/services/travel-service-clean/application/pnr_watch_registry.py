@@ -0,0 +1,246 @@
+"""
+PNR Watch Registry.
+
+Keeps a set of watched PNRs and re-checks each one on a schedule
+that depends on how close the journey is. Many users asking about
+the same waitlisted PNR share one watch, so repeated polling turns
+into one scheduled upstream check per PNR.
+
+Detected changes are put on a local asyncio queue for the bot to
+deliver.
+"""
+
+import asyncio
+import heapq
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from domain.entities import PNR, PassengerStatusChange
+from domain.repositories import PNRRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PNRChangeEvent:
+    """Status change detected by a scheduled re-check."""
+    pnr: PNR
+    changes: List[PassengerStatusChange]
+    chart_just_prepared: bool
+    subscribers: List[str]
+    detected_at: datetime
+
+
+@dataclass
+class PNRWatch:
+    """A watched PNR and who to notify about it."""
+    snapshot: PNR
+    subscribers: Set[str] = field(default_factory=set)
+    next_check_at: Optional[datetime] = None
+
+
+class PNRWatchRegistry:
+    """
+    Registry of watched PNRs with a single scheduler loop.
+
+    Due checks are kept in a heap of (next_check_at, pnr_number).
+    Entries are invalidated lazily - a popped entry whose time no
+    longer matches its watch is simply skipped.
+    """
+
+    def __init__(
+        self,
+        pnr_repository: PNRRepository,
+        upstream_semaphore: Optional[asyncio.Semaphore] = None,
+        max_watches: int = 10000,
+        max_pending_events: int = 10000,
+        clock: Callable[[], datetime] = datetime.now,
+    ):
+        self._repository = pnr_repository
+        self._semaphore = upstream_semaphore or asyncio.Semaphore(5)
+        self._max_watches = max_watches
+        self._clock = clock
+        self._watches: Dict[str, PNRWatch] = {}
+        self._schedule: List[Tuple[datetime, str]] = []
+        self._wakeup = asyncio.Event()
+        self.events: asyncio.Queue = asyncio.Queue(maxsize=max_pending_events)
+
+    def __len__(self) -> int:
+        return len(self._watches)
+
+    def get(self, pnr_number: str) -> Optional[PNRWatch]:
+        """Get the watch for a PNR, if any."""
+        return self._watches.get(pnr_number)
+
+    async def watch(self, pnr_number: str, subscriber_id: str) -> Optional[PNRWatch]:
+        """
+        Start watching a PNR for a subscriber.
+
+        Joining an existing watch never calls upstream. A new watch
+        fetches the initial snapshot to diff against later.
+
+        Returns:
+            The watch, or None if the PNR was not found. A watch with
+            next_check_at None means the status is already final.
+
+        Raises:
+            OverflowError: If the registry is full
+        """
+        existing = self._watches.get(pnr_number)
+        if existing is not None:
+            existing.subscribers.add(subscriber_id)
+            return existing
+
+        if len(self._watches) >= self._max_watches:
+            raise OverflowError("Too many PNRs being watched")
+
+        snapshot = await self._fetch(pnr_number)
+        if snapshot is None:
+            return None
+
+        # Another request may have registered it while we were fetching
+        existing = self._watches.get(pnr_number)
+        if existing is not None:
+            existing.subscribers.add(subscriber_id)
+            return existing
+
+        watch = PNRWatch(snapshot=snapshot, subscribers={subscriber_id})
+        if self._schedule_next(pnr_number, watch):
+            self._watches[pnr_number] = watch
+        return watch
+
+    def unwatch(self, pnr_number: str, subscriber_id: str) -> bool:
+        """
+        Stop watching a PNR for a subscriber.
+
+        The watch itself is dropped once nobody is subscribed.
+
+        Returns:
+            True if the subscriber was watching the PNR
+        """
+        watch = self._watches.get(pnr_number)
+        if watch is None or subscriber_id not in watch.subscribers:
+            return False
+
+        watch.subscribers.discard(subscriber_id)
+        if not watch.subscribers:
+            del self._watches[pnr_number]
+        return True
+
+    def drain_events(self, max_events: int = 100) -> List[PNRChangeEvent]:
+        """Take up to max_events pending events without waiting."""
+        drained = []
+        while len(drained) < max_events and not self.events.empty():
+            drained.append(self.events.get_nowait())
+        return drained
+
+    async def check_due(self) -> int:
+        """
+        Re-check every PNR whose next check time has passed.
+
+        Returns:
+            Number of PNRs checked
+        """
+        now = self._clock()
+        due = []
+
+        while self._schedule and self._schedule[0][0] <= now:
+            check_at, pnr_number = heapq.heappop(self._schedule)
+            watch = self._watches.get(pnr_number)
+            if watch is not None and watch.next_check_at == check_at:
+                due.append(pnr_number)
+
+        await asyncio.gather(*(self._check(p) for p in due))
+        return len(due)
+
+    async def run(self, max_sleep_seconds: float = 300) -> None:
+        """Scheduler loop - run as a background task until cancelled."""
+        while True:
+            try:
+                await self.check_due()
+            except Exception as e:
+                logger.error(f"PNR watch check failed: {e}")
+
+            delay = max_sleep_seconds
+            if self._schedule:
+                until_next = (self._schedule[0][0] - self._clock()).total_seconds()
+                delay = min(max(until_next, 0), max_sleep_seconds)
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _check(self, pnr_number: str) -> None:
+        """Fetch a fresh snapshot, emit changes and reschedule."""
+        watch = self._watches.get(pnr_number)
+        # Unwatched after check_due picked it
+        if watch is None:
+            return
+
+        try:
+            current = await self._fetch(pnr_number)
+        except Exception as e:
+            # Keep the old snapshot and try again on the usual schedule
+            logger.error(f"PNR watch fetch failed for {pnr_number}: {e}")
+            self._schedule_next(pnr_number, watch)
+            return
+
+        # Unwatched while the fetch was in flight
+        if self._watches.get(pnr_number) is not watch:
+            return
+
+        if current is None:
+            logger.info(f"Watched PNR {pnr_number} no longer exists")
+            del self._watches[pnr_number]
+            return
+
+        previous = watch.snapshot
+        changes = current.status_changes(previous)
+        chart_just_prepared = current.chart_prepared and not previous.chart_prepared
+
+        if changes or chart_just_prepared:
+            self._emit(PNRChangeEvent(
+                pnr=current,
+                changes=changes,
+                chart_just_prepared=chart_just_prepared,
+                subscribers=sorted(watch.subscribers),
+                detected_at=self._clock(),
+            ))
+
+        watch.snapshot = current
+        if not self._schedule_next(pnr_number, watch):
+            del self._watches[pnr_number]
+
+    async def _fetch(self, pnr_number: str) -> Optional[PNR]:
+        """Fetch PNR from the repository under the upstream semaphore."""
+        async with self._semaphore:
+            return await self._repository.get_by_pnr(pnr_number)
+
+    def _schedule_next(self, pnr_number: str, watch: PNRWatch) -> bool:
+        """
+        Schedule the next check from the snapshot.
+
+        Returns:
+            False if the PNR no longer needs watching
+        """
+        now = self._clock()
+        interval = watch.snapshot.next_check_interval(now.date())
+        if interval is None:
+            watch.next_check_at = None
+            return False
+
+        watch.next_check_at = now + interval
+        heapq.heappush(self._schedule, (watch.next_check_at, pnr_number))
+        self._wakeup.set()
+        return True
+
+    def _emit(self, event: PNRChangeEvent) -> None:
+        """Queue an event, dropping the oldest one if nobody is draining."""
+        if self.events.full():
+            dropped = self.events.get_nowait()
+            logger.warning(f"PNR event queue full, dropped event for {dropped.pnr.pnr_number}")
+        self.events.put_nowait(event)
@@ -11,13 +11,19 @@ Use cases are:
 """
 
 from .get_pnr_status import GetPNRStatusUseCase
+from .get_pnr_batch_status import GetPNRBatchStatusUseCase
 from .get_train_schedule import GetTrainScheduleUseCase
 from .search_trains import SearchTrainsUseCase
 from .get_live_status import GetLiveStatusUseCase
+from .watch_pnr import WatchPNRUseCase
+from .get_fare_batch import GetFareBatchUseCase
 
 __all__ = [
     "GetPNRStatusUseCase",
+    "GetPNRBatchStatusUseCase",
     "GetTrainScheduleUseCase",
     "SearchTrainsUseCase",
     "GetLiveStatusUseCase",
+    "WatchPNRUseCase",
+    "GetFareBatchUseCase",
 ]
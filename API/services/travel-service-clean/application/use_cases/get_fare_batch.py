@@ -0,0 +1,154 @@
+"""
+Get Fare Batch Use Case.
+
+Single responsibility: Get fares for many journey segments at once.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from application.dto import FareQueryDTO, FareDTO, FareBatchResponse
+from application.fare_engine import FareEngine
+
+logger = logging.getLogger(__name__)
+
+
+class FareValidationError(Exception):
+    """Raised when a fare batch is invalid."""
+    pass
+
+
+@dataclass
+class GetFareBatchUseCase:
+    """
+    Use case for getting fares for many segments.
+
+    Identical queries are answered once. Invalid queries and missing
+    fares are reported per item; only batch-level problems raise.
+    """
+
+    fare_engine: FareEngine
+    max_batch_size: int = 100
+
+    async def execute(
+        self,
+        queries: List[FareQueryDTO],
+        allow_estimate: bool = False
+    ) -> FareBatchResponse:
+        """
+        Execute the use case.
+
+        Args:
+            queries: Fare queries
+            allow_estimate: Allow interpolated fares
+
+        Returns:
+            FareBatchResponse DTO with fares in request order
+
+        Raises:
+            FareValidationError: If the batch is empty or too large
+        """
+        # 1. Validate batch
+        if not queries:
+            raise FareValidationError("At least one fare query is required")
+
+        if len(queries) > self.max_batch_size:
+            raise FareValidationError(
+                f"At most {self.max_batch_size} fare queries allowed per batch"
+            )
+
+        # 2. Normalize and dedupe
+        keys = [self._normalize(q) for q in queries]
+        unique = list(dict.fromkeys(keys))
+
+        # 3. Look up unique segments concurrently
+        results = await asyncio.gather(
+            *(self._lookup(key, allow_estimate) for key in unique)
+        )
+        by_key: Dict[Tuple[str, str, str, str], FareDTO] = dict(zip(unique, results))
+
+        # 4. Transform to DTO
+        fares = [by_key[key] for key in keys]
+        return FareBatchResponse(
+            success=True,
+            total=len(fares),
+            found=sum(1 for f in fares if f.success),
+            fares=fares,
+        )
+
+    async def _lookup(
+        self,
+        key: Tuple[str, str, str, str],
+        allow_estimate: bool
+    ) -> FareDTO:
+        """Look up one segment, turning failures into an error item."""
+        train_number, from_station, to_station, travel_class = key
+
+        error = self._validate(key)
+        if error:
+            return self._error(key, error)
+
+        try:
+            quote = await self.fare_engine.get_fare(
+                train_number, from_station, to_station, travel_class,
+                allow_estimate=allow_estimate,
+            )
+        except Exception as e:
+            logger.error(f"Fare lookup failed for {key}: {e}")
+            return self._error(key, "Could not fetch fare")
+
+        if quote is None:
+            return self._error(key, "Fare not available")
+
+        return FareDTO(
+            train_number=train_number,
+            from_station=from_station,
+            to_station=to_station,
+            travel_class=travel_class,
+            success=True,
+            fare=quote.fare,
+            distance_km=quote.distance_km,
+            source=quote.source.value,
+            is_estimate=quote.is_estimate,
+        )
+
+    def _normalize(self, query: FareQueryDTO) -> Tuple[str, str, str, str]:
+        """Uppercase and strip query fields."""
+        return (
+            query.train_number.strip(),
+            query.from_station.strip().upper(),
+            query.to_station.strip().upper(),
+            query.travel_class.strip().upper(),
+        )
+
+    def _validate(self, key: Tuple[str, str, str, str]) -> str:
+        """Validate one query, returning an error message or ''."""
+        train_number, from_station, to_station, travel_class = key
+
+        if len(train_number) != 5 or not train_number.isdigit():
+            return "Train number must be 5 digits"
+
+        if not 2 <= len(from_station) <= 5 or not 2 <= len(to_station) <= 5:
+            return "Invalid station code"
+
+        if from_station == to_station:
+            return "Source and destination cannot be same"
+
+        if not travel_class:
+            return "Travel class is required"
+
+        return ""
+
+    def _error(self, key: Tuple[str, str, str, str], error: str) -> FareDTO:
+        """Build a failed fare item."""
+        train_number, from_station, to_station, travel_class = key
+        return FareDTO(
+            train_number=train_number,
+            from_station=from_station,
+            to_station=to_station,
+            travel_class=travel_class,
+            success=False,
+            error=error,
+        )
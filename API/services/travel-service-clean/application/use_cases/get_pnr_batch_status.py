@@ -0,0 +1,128 @@
+"""
+Get PNR Batch Status Use Case.
+
+Single responsibility: Get the status of many PNRs in one request.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import AsyncIterator, List
+
+from application.dto import PNRBatchItem
+from domain.repositories import PNRRepository
+from .get_pnr_status import (
+    GetPNRStatusUseCase,
+    PNRValidationError,
+    PNRNotFoundError,
+    validate_pnr_number,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class GetPNRBatchStatusUseCase:
+    """
+    Use case for getting the status of several PNRs at once.
+
+    This class:
+    - Validates the batch and dedupes PNR numbers
+    - Serves cached PNRs immediately
+    - Fetches the rest concurrently, bounded by the upstream semaphore
+    - Yields each result as soon as it is ready
+
+    The semaphore is shared across requests (see dependencies), so
+    concurrent batches together never exceed the upstream limit.
+    """
+
+    pnr_repository: PNRRepository
+    upstream_semaphore: asyncio.Semaphore = field(
+        default_factory=lambda: asyncio.Semaphore(5)
+    )
+    max_batch_size: int = 50
+
+    def __post_init__(self):
+        self._single = GetPNRStatusUseCase(pnr_repository=self.pnr_repository)
+
+    def execute(self, pnr_numbers: List[str]) -> AsyncIterator[PNRBatchItem]:
+        """
+        Execute the use case.
+
+        Batch-level validation happens eagerly, so errors are raised
+        before the caller starts streaming.
+
+        Args:
+            pnr_numbers: List of 10-digit PNR numbers (duplicates allowed)
+
+        Returns:
+            Async iterator of PNRBatchItem in completion order
+
+        Raises:
+            PNRValidationError: If the batch is empty or too large
+        """
+        unique = self._dedupe(pnr_numbers)
+
+        if not unique:
+            raise PNRValidationError("At least one PNR number is required")
+
+        if len(unique) > self.max_batch_size:
+            raise PNRValidationError(
+                f"At most {self.max_batch_size} PNRs allowed per batch"
+            )
+
+        return self._stream(unique)
+
+    async def _stream(self, pnr_numbers: List[str]) -> AsyncIterator[PNRBatchItem]:
+        """Yield cached and invalid PNRs first, then upstream results."""
+        pending = []
+
+        for pnr_number in pnr_numbers:
+            try:
+                validate_pnr_number(pnr_number)
+            except PNRValidationError as e:
+                yield PNRBatchItem(pnr=pnr_number, success=False, error=str(e))
+                continue
+
+            cached = await self.pnr_repository.get_cached(pnr_number)
+            if cached is not None:
+                yield PNRBatchItem(
+                    pnr=pnr_number,
+                    success=True,
+                    cached=True,
+                    status=self._single._to_response(cached),
+                )
+                continue
+
+            pending.append(pnr_number)
+
+        tasks = [asyncio.ensure_future(self._fetch(p)) for p in pending]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Client went away mid-stream - don't keep calling upstream
+            for task in tasks:
+                task.cancel()
+
+    async def _fetch(self, pnr_number: str) -> PNRBatchItem:
+        """Fetch one PNR from upstream under the shared semaphore."""
+        async with self.upstream_semaphore:
+            try:
+                status = await self._single.execute(pnr_number)
+                return PNRBatchItem(pnr=pnr_number, success=True, status=status)
+
+            except PNRNotFoundError as e:
+                return PNRBatchItem(pnr=pnr_number, success=False, error=str(e))
+
+            except Exception as e:
+                logger.error(f"Batch fetch failed for PNR {pnr_number}: {e}")
+                return PNRBatchItem(
+                    pnr=pnr_number,
+                    success=False,
+                    error="Could not fetch PNR status",
+                )
+
+    def _dedupe(self, pnr_numbers: List[str]) -> List[str]:
+        """Strip whitespace and drop duplicates, keeping first-seen order."""
+        return list(dict.fromkeys(p.strip() for p in pnr_numbers))
@@ -22,6 +22,23 @@ class PNRNotFoundError(Exception):
     pass
 
 
+def validate_pnr_number(pnr_number: str) -> None:
+    """
+    Validate PNR format.
+
+    Raises:
+        PNRValidationError: If PNR format is invalid
+    """
+    if not pnr_number:
+        raise PNRValidationError("PNR number is required")
+
+    if len(pnr_number) != 10:
+        raise PNRValidationError("PNR must be 10 digits")
+
+    if not pnr_number.isdigit():
+        raise PNRValidationError("PNR must contain only digits")
+
+
 @dataclass
 class GetPNRStatusUseCase:
     """
@@ -69,14 +86,7 @@ class GetPNRStatusUseCase:
 
     def _validate_pnr(self, pnr_number: str) -> None:
         """Validate PNR format."""
-        if not pnr_number:
-            raise PNRValidationError("PNR number is required")
-
-        if len(pnr_number) != 10:
-            raise PNRValidationError("PNR must be 10 digits")
-
-        if not pnr_number.isdigit():
-            raise PNRValidationError("PNR must contain only digits")
+        validate_pnr_number(pnr_number)
 
     def _to_response(self, pnr: PNR) -> PNRResponse:
         """Transform domain entity to response DTO."""
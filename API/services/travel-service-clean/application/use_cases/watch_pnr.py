@@ -0,0 +1,137 @@
+"""
+Watch PNR Use Case.
+
+Single responsibility: Subscribe to PNR status changes.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from application.dto import (
+    PNRWatchResponse,
+    PassengerChangeDTO,
+    PNRChangeEventDTO,
+    PNRChangeEventsResponse,
+)
+from application.pnr_watch_registry import PNRWatchRegistry, PNRChangeEvent, PNRWatch
+from .get_pnr_status import PNRNotFoundError, PNRValidationError, validate_pnr_number
+
+
+class PNRWatchLimitError(Exception):
+    """Raised when no more PNRs can be watched."""
+    pass
+
+
+@dataclass
+class WatchPNRUseCase:
+    """
+    Use case for watching PNRs for status changes.
+
+    The registry does the scheduling; this class validates input
+    and shapes registry state into DTOs.
+    """
+
+    registry: PNRWatchRegistry
+
+    async def execute(self, pnr_number: str, subscriber_id: str) -> PNRWatchResponse:
+        """
+        Execute the use case.
+
+        Args:
+            pnr_number: 10-digit PNR number
+            subscriber_id: Who to notify about changes
+
+        Returns:
+            PNRWatchResponse DTO
+
+        Raises:
+            PNRValidationError: If PNR format or subscriber is invalid
+            PNRNotFoundError: If PNR is not found
+            PNRWatchLimitError: If the registry is full
+        """
+        # 1. Validate input
+        validate_pnr_number(pnr_number)
+        if not subscriber_id or not subscriber_id.strip():
+            raise PNRValidationError("Subscriber ID is required")
+
+        # 2. Register watch
+        try:
+            watch = await self.registry.watch(pnr_number, subscriber_id.strip())
+        except OverflowError as e:
+            raise PNRWatchLimitError(str(e))
+
+        if watch is None:
+            raise PNRNotFoundError(f"PNR {pnr_number} not found")
+
+        # 3. Transform to DTO
+        if watch.next_check_at is None:
+            return self._to_response(
+                pnr_number,
+                watch,
+                message="Status is final - chart prepared or journey completed",
+            )
+        return self._to_response(pnr_number, watch)
+
+    def unwatch(self, pnr_number: str, subscriber_id: str) -> PNRWatchResponse:
+        """
+        Stop watching a PNR.
+
+        Raises:
+            PNRNotFoundError: If the subscriber was not watching the PNR
+        """
+        if not self.registry.unwatch(pnr_number, subscriber_id):
+            raise PNRNotFoundError(f"PNR {pnr_number} is not being watched")
+
+        watch = self.registry.get(pnr_number)
+        if watch is None:
+            return PNRWatchResponse(pnr=pnr_number, watching=False, subscribers=0)
+        return self._to_response(pnr_number, watch)
+
+    def pending_events(self, max_events: int = 100) -> PNRChangeEventsResponse:
+        """Take pending change events for delivery."""
+        events = [
+            self._to_event_dto(e)
+            for e in self.registry.drain_events(max_events)
+        ]
+        return PNRChangeEventsResponse(count=len(events), events=events)
+
+    def _to_response(
+        self,
+        pnr_number: str,
+        watch: PNRWatch,
+        message: Optional[str] = None
+    ) -> PNRWatchResponse:
+        """Transform watch to response DTO."""
+        return PNRWatchResponse(
+            success=True,
+            pnr=pnr_number,
+            watching=watch.next_check_at is not None,
+            subscribers=len(watch.subscribers),
+            next_check_at=(
+                watch.next_check_at.strftime("%d-%m-%Y %H:%M")
+                if watch.next_check_at else None
+            ),
+            message=message,
+        )
+
+    def _to_event_dto(self, event: PNRChangeEvent) -> PNRChangeEventDTO:
+        """Transform change event to DTO."""
+        pnr = event.pnr
+        return PNRChangeEventDTO(
+            pnr=pnr.pnr_number,
+            train_number=pnr.train_number,
+            journey_date=pnr.journey_date.strftime("%d-%m-%Y"),
+            subscribers=event.subscribers,
+            changes=[
+                PassengerChangeDTO(
+                    number=c.passenger_number,
+                    previous_status=c.previous_status.value,
+                    current_status=c.current_status.value,
+                    improved=c.improved,
+                )
+                for c in event.changes
+            ],
+            chart_prepared=pnr.chart_prepared,
+            status_summary=pnr.booking_status_summary,
+            detected_at=event.detected_at.strftime("%d-%m-%Y %H:%M"),
+        )
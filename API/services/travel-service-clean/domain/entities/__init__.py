@@ -5,16 +5,21 @@ Pure business objects with no external dependencies.
 These represent the core business concepts.
 """
 
-from .pnr import PNR, Passenger, BookingStatus
+from .pnr import PNR, Passenger, BookingStatus, PassengerStatusChange
 from .train import Train, Station, TrainSchedule, StationStop, TrainType
+from .fare import FareQuote, FareSlabTable, FareSource
 
 __all__ = [
     "PNR",
     "Passenger",
     "BookingStatus",
+    "PassengerStatusChange",
     "Train",
     "Station",
     "TrainSchedule",
     "StationStop",
     "TrainType",
+    "FareQuote",
+    "FareSlabTable",
+    "FareSource",
 ]
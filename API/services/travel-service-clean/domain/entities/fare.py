@@ -0,0 +1,97 @@
+"""
+Fare Domain Entities.
+
+Indian Railways fares are published in distance slabs: for a given
+train and class, the fare depends only on the distance travelled
+and never decreases as distance grows.
+"""
+
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import List, Optional
+
+
+class FareSource(Enum):
+    """Where a fare quote came from."""
+    CACHE = "cache"
+    UPSTREAM = "upstream"
+    ESTIMATE = "estimate"
+
+
+@dataclass(frozen=True)
+class FareQuote:
+    """Fare for one journey segment."""
+    train_number: str
+    from_station: str
+    to_station: str
+    travel_class: str
+    fare: float
+    source: FareSource
+    distance_km: Optional[int] = None
+
+    @property
+    def is_estimate(self) -> bool:
+        """Check if the fare was interpolated rather than published."""
+        return self.source == FareSource.ESTIMATE
+
+
+@dataclass
+class FareSlabTable:
+    """
+    Known (distance, fare) points for one train and class.
+
+    Because fares are monotonic in distance, two known points with
+    the same fare pin down every distance between them exactly.
+    Points with different fares only allow an estimate.
+    """
+    train_number: str
+    travel_class: str
+    distances: List[int] = field(default_factory=list)
+    fares: List[float] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.distances)
+
+    def add(self, distance_km: int, fare: float) -> None:
+        """Record a published fare for a distance."""
+        i = bisect_left(self.distances, distance_km)
+        if i < len(self.distances) and self.distances[i] == distance_km:
+            self.fares[i] = fare
+            return
+        insort(self.distances, distance_km)
+        self.fares.insert(i, fare)
+
+    def lookup(self, distance_km: int) -> Optional[float]:
+        """
+        Get the exact fare for a distance, if the table determines it.
+
+        Returns:
+            Fare if known exactly, None otherwise
+        """
+        i = bisect_left(self.distances, distance_km)
+        if i < len(self.distances) and self.distances[i] == distance_km:
+            return self.fares[i]
+
+        if 0 < i < len(self.distances) and self.fares[i - 1] == self.fares[i]:
+            return self.fares[i]
+
+        return None
+
+    def estimate(self, distance_km: int) -> Optional[float]:
+        """
+        Linearly interpolate a fare between the surrounding known points.
+
+        Returns:
+            Estimated fare, or None if the distance is not bracketed
+        """
+        i = bisect_left(self.distances, distance_km)
+        if i < len(self.distances) and self.distances[i] == distance_km:
+            return self.fares[i]
+
+        if i == 0 or i == len(self.distances):
+            return None
+
+        d0, d1 = self.distances[i - 1], self.distances[i]
+        f0, f1 = self.fares[i - 1], self.fares[i]
+        return round(f0 + (f1 - f0) * (distance_km - d0) / (d1 - d0), 2)
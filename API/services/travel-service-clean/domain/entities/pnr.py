@@ -8,7 +8,7 @@ This is a pure domain object with business logic.
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Optional
-from datetime import date
+from datetime import date, timedelta
 
 
 class BookingStatus(Enum):
@@ -60,6 +60,35 @@ class Passenger:
         return status_rank[self.current_status] > status_rank[self.booking_status]
 
 
+@dataclass(frozen=True)
+class PassengerStatusChange:
+    """Change in one passenger's current status between two checks."""
+    passenger_number: int
+    previous_status: BookingStatus
+    current_status: BookingStatus
+
+    @property
+    def improved(self) -> bool:
+        """Check if the change is an improvement (e.g. WL -> RAC)."""
+        # Reuse Passenger's ranking with the old status as the baseline
+        return Passenger(
+            number=self.passenger_number,
+            booking_status=self.previous_status,
+            current_status=self.current_status,
+        ).status_improved
+
+
+# Re-check interval by days left to journey, most distant first.
+# Waitlists move slowly weeks out and quickly in the last two days.
+RECHECK_SCHEDULE = [
+    (30, timedelta(hours=12)),
+    (7, timedelta(hours=6)),
+    (2, timedelta(hours=2)),
+    (1, timedelta(minutes=30)),
+    (0, timedelta(minutes=15)),
+]
+
+
 @dataclass
 class PNR:
     """
@@ -112,6 +141,38 @@ class PNR:
                 return p
         return None
 
+    def status_changes(self, previous: "PNR") -> List[PassengerStatusChange]:
+        """Get passengers whose current status differs from a previous snapshot."""
+        changes = []
+        for p in self.passengers:
+            old = previous.get_passenger(p.number)
+            if old is not None and old.current_status != p.current_status:
+                changes.append(PassengerStatusChange(
+                    passenger_number=p.number,
+                    previous_status=old.current_status,
+                    current_status=p.current_status,
+                ))
+        return changes
+
+    def next_check_interval(self, today: date) -> Optional[timedelta]:
+        """
+        Get how long to wait before re-checking this PNR.
+
+        Returns None when re-checking is pointless: the chart is
+        prepared (statuses are final) or the journey date has passed.
+        """
+        if self.chart_prepared:
+            return None
+
+        days_left = (self.journey_date - today).days
+        if days_left < 0:
+            return None
+
+        for min_days, interval in RECHECK_SCHEDULE:
+            if days_left >= min_days:
+                return interval
+        return RECHECK_SCHEDULE[-1][1]
+
     def validate(self) -> List[str]:
         """Validate PNR data, return list of errors."""
         errors = []
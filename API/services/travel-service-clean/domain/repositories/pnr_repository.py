@@ -34,6 +34,21 @@ class PNRRepository(ABC):
         """
         pass
 
+    async def get_cached(self, pnr_number: str) -> Optional[PNR]:
+        """
+        Get PNR status only if it can be served without an upstream call.
+
+        Repositories without a cache return None, so callers fall back
+        to get_by_pnr().
+
+        Args:
+            pnr_number: 10-digit PNR number
+
+        Returns:
+            Cached PNR entity, or None if not cached
+        """
+        return None
+
     @abstractmethod
     async def get_fare(
         self,
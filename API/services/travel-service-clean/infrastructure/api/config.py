@@ -30,6 +30,19 @@ class Settings(BaseSettings):
     # Cache
     CACHE_TTL_SECONDS: int = 300
 
+    # PNR batch
+    PNR_BATCH_MAX_SIZE: int = 50
+    PNR_UPSTREAM_CONCURRENCY: int = 5  # Max in-flight Railway API calls
+
+    # PNR watch
+    PNR_WATCH_ENABLED: bool = True
+    PNR_WATCH_MAX_ACTIVE: int = 10000
+
+    # Fares
+    FARE_BATCH_MAX_SIZE: int = 100
+    FARE_CACHE_MAX_TRAINS: int = 5000
+    FARE_WARM_TRAINS: str = ""  # Comma-separated train numbers warmed at startup
+
     class Config:
         env_file = ".env"
         env_prefix = "TRAVEL_"
@@ -5,21 +5,28 @@ This is where we wire everything together.
 FastAPI's Depends() system handles DI.
 """
 
+import asyncio
 from functools import lru_cache
 from typing import Generator
 
 from application.use_cases import (
     GetPNRStatusUseCase,
+    GetPNRBatchStatusUseCase,
     GetTrainScheduleUseCase,
     SearchTrainsUseCase,
     GetLiveStatusUseCase,
+    WatchPNRUseCase,
+    GetFareBatchUseCase,
 )
+from application.pnr_watch_registry import PNRWatchRegistry
+from application.fare_engine import FareEngine
 from domain.repositories import PNRRepository, TrainRepository
 from infrastructure.repositories import (
     MockPNRRepository,
     MockTrainRepository,
     PNRRepositoryImpl,
     TrainRepositoryImpl,
+    CachedPNRRepository,
 )
 from infrastructure.api.config import get_settings
 
@@ -35,15 +42,21 @@ def get_pnr_repository() -> PNRRepository:
 
     In production, returns real API implementation.
     In development/testing, returns mock.
+    Either way it is wrapped in an in-memory TTL cache.
     """
     settings = get_settings()
 
     if settings.USE_MOCK_DATA:
-        return MockPNRRepository()
-
-    return PNRRepositoryImpl(
-        api_url=settings.RAILWAY_API_URL,
-        api_key=settings.RAILWAY_API_KEY,
+        repository = MockPNRRepository()
+    else:
+        repository = PNRRepositoryImpl(
+            api_url=settings.RAILWAY_API_URL,
+            api_key=settings.RAILWAY_API_KEY,
+        )
+
+    return CachedPNRRepository(
+        repository,
+        ttl_seconds=settings.CACHE_TTL_SECONDS,
     )
 
 
@@ -63,6 +76,46 @@ def get_train_repository() -> TrainRepository:
     )
 
 
+@lru_cache()
+def get_pnr_upstream_semaphore() -> asyncio.Semaphore:
+    """
+    Get the semaphore bounding in-flight upstream PNR calls.
+
+    Shared by all batch requests so the Railway API rate limit
+    holds across the whole process, not per request.
+    """
+    return asyncio.Semaphore(get_settings().PNR_UPSTREAM_CONCURRENCY)
+
+
+@lru_cache()
+def get_pnr_watch_registry() -> PNRWatchRegistry:
+    """
+    Get the PNR watch registry.
+
+    Singleton - its scheduler loop is started in main.py lifespan.
+    """
+    return PNRWatchRegistry(
+        pnr_repository=get_pnr_repository(),
+        upstream_semaphore=get_pnr_upstream_semaphore(),
+        max_watches=get_settings().PNR_WATCH_MAX_ACTIVE,
+    )
+
+
+@lru_cache()
+def get_fare_engine() -> FareEngine:
+    """
+    Get the fare engine.
+
+    Singleton so slab tables are shared by all requests.
+    """
+    return FareEngine(
+        pnr_repository=get_pnr_repository(),
+        train_repository=get_train_repository(),
+        upstream_semaphore=get_pnr_upstream_semaphore(),
+        max_trains=get_settings().FARE_CACHE_MAX_TRAINS,
+    )
+
+
 # ============================================================================
 # Use Case Providers
 # ============================================================================
@@ -74,6 +127,30 @@ def get_pnr_use_case() -> GetPNRStatusUseCase:
     )
 
 
+def get_pnr_batch_use_case() -> GetPNRBatchStatusUseCase:
+    """Get batch PNR status use case."""
+    return GetPNRBatchStatusUseCase(
+        pnr_repository=get_pnr_repository(),
+        upstream_semaphore=get_pnr_upstream_semaphore(),
+        max_batch_size=get_settings().PNR_BATCH_MAX_SIZE,
+    )
+
+
+def get_watch_pnr_use_case() -> WatchPNRUseCase:
+    """Get PNR watch use case."""
+    return WatchPNRUseCase(
+        registry=get_pnr_watch_registry()
+    )
+
+
+def get_fare_batch_use_case() -> GetFareBatchUseCase:
+    """Get batch fare use case."""
+    return GetFareBatchUseCase(
+        fare_engine=get_fare_engine(),
+        max_batch_size=get_settings().FARE_BATCH_MAX_SIZE,
+    )
+
+
 def get_schedule_use_case() -> GetTrainScheduleUseCase:
     """Get train schedule use case."""
     return GetTrainScheduleUseCase(
@@ -7,5 +7,6 @@ Routers are thin - they just call use cases.
 
 from .pnr_router import router as pnr_router
 from .train_router import router as train_router
+from .fare_router import router as fare_router
 
-__all__ = ["pnr_router", "train_router"]
+__all__ = ["pnr_router", "train_router", "fare_router"]
@@ -0,0 +1,41 @@
+"""
+Fare API Router.
+
+HTTP layer for fare endpoints.
+"""
+
+from fastapi import APIRouter, HTTPException, Depends
+from typing import Annotated
+
+from application.dto import FareBatchRequest, FareBatchResponse
+from application.use_cases import GetFareBatchUseCase
+from application.use_cases.get_fare_batch import FareValidationError
+from infrastructure.api.dependencies import get_fare_batch_use_case
+
+router = APIRouter(prefix="/fare", tags=["Fares"])
+
+
+@router.post(
+    "/batch",
+    response_model=FareBatchResponse,
+    summary="Get Fares (Batch)",
+    description="Get fares for many train segments in one request"
+)
+async def get_fare_batch(
+    request: FareBatchRequest,
+    use_case: Annotated[GetFareBatchUseCase, Depends(get_fare_batch_use_case)]
+):
+    """
+    Get fares for many segments.
+
+    - **queries**: List of (train_number, from_station, to_station, travel_class)
+    - **allow_estimate**: Return interpolated fares instead of calling upstream
+
+    Fares are returned in request order; unavailable fares are
+    reported per item.
+    """
+    try:
+        return await use_case.execute(request.queries, request.allow_estimate)
+
+    except FareValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
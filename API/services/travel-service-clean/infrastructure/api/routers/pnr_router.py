@@ -4,20 +4,67 @@ PNR API Router.
 Thin HTTP layer that delegates to use cases.
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import StreamingResponse
 from typing import Annotated
 
-from application.dto import PNRResponse
-from application.use_cases import GetPNRStatusUseCase
+from application.dto import (
+    PNRResponse,
+    PNRBatchRequest,
+    PNRWatchRequest,
+    PNRWatchResponse,
+    PNRChangeEventsResponse,
+)
+from application.use_cases import (
+    GetPNRStatusUseCase,
+    GetPNRBatchStatusUseCase,
+    WatchPNRUseCase,
+)
 from application.use_cases.get_pnr_status import (
     PNRValidationError,
     PNRNotFoundError
 )
-from infrastructure.api.dependencies import get_pnr_use_case
+from application.use_cases.watch_pnr import PNRWatchLimitError
+from infrastructure.api.dependencies import (
+    get_pnr_use_case,
+    get_pnr_batch_use_case,
+    get_watch_pnr_use_case,
+)
 
 router = APIRouter(prefix="/pnr", tags=["PNR Status"])
 
 
+@router.post(
+    "/batch",
+    summary="Get PNR Status (Batch)",
+    description="Get the status of several PNRs, streamed as NDJSON",
+    response_class=StreamingResponse,
+)
+async def get_pnr_batch_status(
+    request: PNRBatchRequest,
+    use_case: Annotated[GetPNRBatchStatusUseCase, Depends(get_pnr_batch_use_case)]
+):
+    """
+    Get PNR status for many PNRs at once.
+
+    - **pnrs**: List of 10-digit PNR numbers (duplicates are ignored)
+
+    Returns one JSON object per line, in the order results complete.
+    Cached PNRs come back first; failures are reported per PNR.
+    """
+    try:
+        items = use_case.execute(request.pnrs)
+
+    except PNRValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def ndjson():
+        async for item in items:
+            yield item.model_dump_json() + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
 @router.get(
     "/{pnr_number}",
     response_model=PNRResponse,
@@ -46,3 +93,78 @@ async def get_pnr_status(
 
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.post(
+    "/{pnr_number}/watch",
+    response_model=PNRWatchResponse,
+    summary="Watch PNR",
+    description="Get notified when passenger status changes"
+)
+async def watch_pnr(
+    pnr_number: str,
+    request: PNRWatchRequest,
+    use_case: Annotated[WatchPNRUseCase, Depends(get_watch_pnr_use_case)]
+):
+    """
+    Watch a PNR for status changes.
+
+    - **pnr_number**: 10-digit PNR number
+    - **subscriber_id**: Who to notify
+
+    The PNR is re-checked on a schedule that tightens as the journey
+    gets closer, until the chart is prepared.
+    """
+    try:
+        return await use_case.execute(pnr_number, request.subscriber_id)
+
+    except PNRValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    except PNRNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    except PNRWatchLimitError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+
+@router.delete(
+    "/{pnr_number}/watch",
+    response_model=PNRWatchResponse,
+    summary="Unwatch PNR",
+    description="Stop status change notifications for a PNR"
+)
+async def unwatch_pnr(
+    pnr_number: str,
+    subscriber_id: str = Query(..., description="Subscriber to remove"),
+    use_case: Annotated[WatchPNRUseCase, Depends(get_watch_pnr_use_case)] = None
+):
+    """
+    Stop watching a PNR.
+
+    - **pnr_number**: 10-digit PNR number
+    - **subscriber_id**: Subscriber to remove
+    """
+    try:
+        return use_case.unwatch(pnr_number, subscriber_id)
+
+    except PNRNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.get(
+    "/watch/events",
+    response_model=PNRChangeEventsResponse,
+    summary="Get PNR Change Events",
+    description="Take pending PNR status change notifications"
+)
+async def get_pnr_change_events(
+    limit: int = Query(100, ge=1, le=1000, description="Max events to return"),
+    use_case: Annotated[WatchPNRUseCase, Depends(get_watch_pnr_use_case)] = None
+):
+    """
+    Take pending change events for the bot to deliver.
+
+    Events are removed from the queue once returned.
+    """
+    return use_case.pending_events(limit)
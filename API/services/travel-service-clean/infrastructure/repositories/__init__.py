@@ -9,10 +9,12 @@ from .pnr_repository_impl import PNRRepositoryImpl
 from .train_repository_impl import TrainRepositoryImpl
 from .mock_pnr_repository import MockPNRRepository
 from .mock_train_repository import MockTrainRepository
+from .cached_pnr_repository import CachedPNRRepository
 
 __all__ = [
     "PNRRepositoryImpl",
     "TrainRepositoryImpl",
     "MockPNRRepository",
     "MockTrainRepository",
+    "CachedPNRRepository",
 ]
@@ -0,0 +1,78 @@
+"""
+Cached PNR Repository.
+
+Decorator that keeps recently fetched PNRs in memory so repeated
+lookups within the TTL don't hit the upstream Railway API.
+"""
+
+from typing import Dict, Optional, Tuple
+import time
+
+from domain.repositories import PNRRepository
+from domain.entities import PNR
+
+
+class CachedPNRRepository(PNRRepository):
+    """
+    In-memory TTL cache in front of another PNR repository.
+
+    Only successful lookups are cached - misses and errors always
+    go through to the wrapped repository.
+    """
+
+    def __init__(
+        self,
+        repository: PNRRepository,
+        ttl_seconds: int = 300,
+        max_entries: int = 10000
+    ):
+        self._repository = repository
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: Dict[str, Tuple[float, PNR]] = {}
+
+    async def get_by_pnr(self, pnr_number: str) -> Optional[PNR]:
+        """Get PNR from cache, falling back to the wrapped repository."""
+        cached = await self.get_cached(pnr_number)
+        if cached is not None:
+            return cached
+
+        pnr = await self._repository.get_by_pnr(pnr_number)
+        if pnr is not None:
+            self._store(pnr_number, pnr)
+        return pnr
+
+    async def get_cached(self, pnr_number: str) -> Optional[PNR]:
+        """Get PNR only if a fresh cache entry exists."""
+        entry = self._entries.get(pnr_number)
+        if entry is None:
+            return None
+
+        expires_at, pnr = entry
+        if expires_at <= time.monotonic():
+            del self._entries[pnr_number]
+            return None
+        return pnr
+
+    async def get_fare(
+        self,
+        train_number: str,
+        from_station: str,
+        to_station: str,
+        travel_class: str
+    ) -> Optional[float]:
+        """Fares are not cached here - delegate to wrapped repository."""
+        return await self._repository.get_fare(
+            train_number, from_station, to_station, travel_class
+        )
+
+    def invalidate(self, pnr_number: str) -> None:
+        """Drop a PNR from the cache."""
+        self._entries.pop(pnr_number, None)
+
+    def _store(self, pnr_number: str, pnr: PNR) -> None:
+        """Store a PNR, evicting the oldest entry when full."""
+        if pnr_number not in self._entries and len(self._entries) >= self._max_entries:
+            # Dicts keep insertion order, so the first key is the oldest
+            del self._entries[next(iter(self._entries))]
+        self._entries[pnr_number] = (time.monotonic() + self._ttl_seconds, pnr)
@@ -4,13 +4,15 @@ Travel Service - Clean Architecture.
 This is the composition root where everything comes together.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import logging
 
 from infrastructure.api.config import get_settings
-from infrastructure.api.routers import pnr_router, train_router
+from infrastructure.api.routers import pnr_router, train_router, fare_router
+from infrastructure.api.dependencies import get_pnr_watch_registry, get_fare_engine
 
 # Configure logging
 settings = get_settings()
@@ -26,8 +28,22 @@ async def lifespan(app: FastAPI):
     """Application lifespan."""
     logger.info(f"Starting {settings.SERVICE_NAME} v{settings.SERVICE_VERSION}")
     logger.info(f"Mock data: {settings.USE_MOCK_DATA}")
+
+    tasks = []
+    if settings.PNR_WATCH_ENABLED:
+        tasks.append(asyncio.create_task(get_pnr_watch_registry().run()))
+
+    warm_trains = [t.strip() for t in settings.FARE_WARM_TRAINS.split(",") if t.strip()]
+    if warm_trains:
+        # Runs in the background so startup isn't blocked on upstream
+        tasks.append(asyncio.create_task(get_fare_engine().warm(warm_trains)))
+
     yield
+
     logger.info("Shutting down")
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
 
 
 # Create app
@@ -50,6 +66,7 @@ app.add_middleware(
 # Include routers
 app.include_router(pnr_router)
 app.include_router(train_router)
+app.include_router(fare_router)
 
 
 @app.get("/health")
@@ -77,9 +94,14 @@ async def root():
         },
         "endpoints": {
             "pnr_status": "GET /pnr/{pnr_number}",
+            "pnr_status_batch": "POST /pnr/batch",
+            "pnr_watch": "POST /pnr/{pnr_number}/watch",
+            "pnr_unwatch": "DELETE /pnr/{pnr_number}/watch?subscriber_id=X",
+            "pnr_watch_events": "GET /pnr/watch/events",
             "train_schedule": "GET /train/{train_number}/schedule",
             "train_status": "GET /train/{train_number}/status",
             "search_trains": "GET /trains/search?from=X&to=Y",
+            "fare_batch": "POST /fare/batch",
         },
     }
 
@@ -0,0 +1,189 @@
+"""
+Unit Tests for fares.
+
+Tests for:
+- FareSlabTable
+- FareEngine
+- GetFareBatchUseCase
+"""
+
+import pytest
+
+from domain.entities import FareSlabTable, FareSource
+from application.dto import FareQueryDTO
+from application.fare_engine import FareEngine
+from application.use_cases import GetFareBatchUseCase
+from application.use_cases.get_fare_batch import FareValidationError
+from infrastructure.repositories import MockPNRRepository, MockTrainRepository
+
+
+# Cumulative distances on the mock 12301 schedule
+STATION_KM = {"NDLS": 0, "CNB": 440, "ALD": 634, "MGS": 780, "HWH": 1447}
+
+
+class SlabFarePNRRepository(MockPNRRepository):
+    """Mock repository with slab fares that counts upstream calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.fare_calls = 0
+
+    async def get_fare(self, train_number, from_station, to_station, travel_class):
+        self.fare_calls += 1
+        if from_station not in STATION_KM or to_station not in STATION_KM:
+            return None
+        distance = STATION_KM[to_station] - STATION_KM[from_station]
+        return 500.0 + 250.0 * (distance // 500)
+
+
+class TestFareSlabTable:
+    """Test slab table lookups."""
+
+    @pytest.fixture
+    def table(self):
+        table = FareSlabTable(train_number="12301", travel_class="3A")
+        table.add(400, 500.0)
+        table.add(600, 750.0)
+        table.add(800, 750.0)
+        return table
+
+    def test_exact_lookup(self, table):
+        assert table.lookup(600) == 750.0
+
+    def test_same_slab_between_points(self, table):
+        """Test that points with equal fares pin down the gap."""
+        assert table.lookup(700) == 750.0
+
+    def test_different_slabs_not_exact(self, table):
+        """Test that a gap between slabs isn't answered exactly."""
+        assert table.lookup(500) is None
+        assert table.estimate(500) == 625.0
+
+    def test_outside_range(self, table):
+        assert table.lookup(100) is None
+        assert table.estimate(900) is None
+
+    def test_add_replaces(self, table):
+        table.add(600, 800.0)
+
+        assert len(table) == 3
+        assert table.lookup(600) == 800.0
+
+
+class TestFareEngine:
+    """Test suite for fare engine."""
+
+    @pytest.fixture
+    def pnr_repository(self):
+        return SlabFarePNRRepository()
+
+    @pytest.fixture
+    def engine(self, pnr_repository):
+        return FareEngine(
+            pnr_repository=pnr_repository,
+            train_repository=MockTrainRepository(),
+        )
+
+    @pytest.mark.asyncio
+    async def test_repeat_query_served_from_cache(self, engine, pnr_repository):
+        """Test that the second identical query doesn't go upstream."""
+        first = await engine.get_fare("12301", "NDLS", "CNB", "3A")
+        second = await engine.get_fare("12301", "NDLS", "CNB", "3A")
+
+        assert first.source == FareSource.UPSTREAM
+        assert second.source == FareSource.CACHE
+        assert second.fare == first.fare
+        assert second.distance_km == 440
+        assert pnr_repository.fare_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_warm_fills_tables(self, engine, pnr_repository):
+        """Test bulk warming from source to every stop."""
+        fetched = await engine.warm(["12301"])
+
+        # 4 stops after source x 3 classes
+        assert fetched == 12
+        calls_after_warm = pnr_repository.fare_calls
+
+        quote = await engine.get_fare("12301", "NDLS", "MGS", "2A")
+        assert quote.source == FareSource.CACHE
+        assert pnr_repository.fare_calls == calls_after_warm
+
+    @pytest.mark.asyncio
+    async def test_estimate_between_slabs(self, engine, pnr_repository):
+        """Test interpolation when allowed."""
+        await engine.warm(["12301"], classes=["3A"])
+        calls_after_warm = pnr_repository.fare_calls
+
+        quote = await engine.get_fare("12301", "CNB", "HWH", "3A", allow_estimate=True)
+
+        assert quote.is_estimate is True
+        assert 750.0 < quote.fare < 1000.0
+        assert pnr_repository.fare_calls == calls_after_warm
+
+    @pytest.mark.asyncio
+    async def test_unknown_route_goes_upstream(self, engine):
+        """Test that stations off the schedule still get a fare."""
+        quote = await engine.get_fare("12951", "NDLS", "HWH", "3A")
+
+        assert quote.source == FareSource.UPSTREAM
+        assert quote.distance_km is None
+
+
+class TestGetFareBatchUseCase:
+    """Test suite for batch fare use case."""
+
+    @pytest.fixture
+    def pnr_repository(self):
+        return SlabFarePNRRepository()
+
+    @pytest.fixture
+    def use_case(self, pnr_repository):
+        engine = FareEngine(
+            pnr_repository=pnr_repository,
+            train_repository=MockTrainRepository(),
+        )
+        return GetFareBatchUseCase(fare_engine=engine, max_batch_size=5)
+
+    def _query(self, from_station, to_station, travel_class="3A", train="12301"):
+        return FareQueryDTO(
+            train_number=train,
+            from_station=from_station,
+            to_station=to_station,
+            travel_class=travel_class,
+        )
+
+    @pytest.mark.asyncio
+    async def test_batch_preserves_order_and_dedupes(self, use_case, pnr_repository):
+        """Test request order and one upstream call per unique segment."""
+        result = await use_case.execute([
+            self._query("NDLS", "HWH"),
+            self._query("ndls", "cnb", "3a"),
+            self._query("NDLS", "HWH"),
+        ])
+
+        assert [f.to_station for f in result.fares] == ["HWH", "CNB", "HWH"]
+        assert result.found == 3
+        assert pnr_repository.fare_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_item_errors(self, use_case):
+        """Test that bad items fail individually."""
+        result = await use_case.execute([
+            self._query("NDLS", "NDLS"),
+            self._query("NDLS", "CNB", train="123"),
+            self._query("AAA", "BBB"),
+            self._query("NDLS", "CNB"),
+        ])
+
+        assert [f.success for f in result.fares] == [False, False, False, True]
+        assert result.fares[2].error == "Fare not available"
+
+    @pytest.mark.asyncio
+    async def test_batch_limits(self, use_case):
+        """Test batch size validation."""
+        with pytest.raises(FareValidationError):
+            await use_case.execute([])
+
+        with pytest.raises(FareValidationError):
+            await use_case.execute([self._query("NDLS", "CNB")] * 6)
@@ -7,13 +7,14 @@ These tests demonstrate how Clean Architecture enables testing:
 - Fast, isolated, reliable tests
 """
 
+import asyncio
 import pytest
 from datetime import date
 
 from domain.entities import PNR, Passenger, BookingStatus
-from application.use_cases import GetPNRStatusUseCase
+from application.use_cases import GetPNRStatusUseCase, GetPNRBatchStatusUseCase
 from application.use_cases.get_pnr_status import PNRValidationError, PNRNotFoundError
-from infrastructure.repositories import MockPNRRepository
+from infrastructure.repositories import MockPNRRepository, CachedPNRRepository
 
 
 class TestGetPNRStatusUseCase:
@@ -117,6 +118,102 @@ class TestGetPNRStatusUseCase:
         assert "not found" in str(exc_info.value)
 
 
+class TestGetPNRBatchStatusUseCase:
+    """Test suite for batch PNR status use case."""
+
+    @pytest.fixture
+    def mock_repository(self):
+        return MockPNRRepository()
+
+    @pytest.fixture
+    def cached_repository(self, mock_repository):
+        return CachedPNRRepository(mock_repository, ttl_seconds=60)
+
+    @pytest.fixture
+    def use_case(self, cached_repository):
+        return GetPNRBatchStatusUseCase(
+            pnr_repository=cached_repository,
+            max_batch_size=5,
+        )
+
+    async def _collect(self, use_case, pnrs):
+        return [item async for item in use_case.execute(pnrs)]
+
+    @pytest.mark.asyncio
+    async def test_batch_success(self, use_case):
+        """Test that every PNR gets exactly one result."""
+        items = await self._collect(use_case, ["1234567890", "9876543210"])
+
+        assert sorted(i.pnr for i in items) == ["1234567890", "9876543210"]
+        assert all(i.success for i in items)
+        assert all(i.status.pnr == i.pnr for i in items)
+
+    @pytest.mark.asyncio
+    async def test_batch_dedupes(self, use_case):
+        """Test that duplicate PNRs are fetched once."""
+        items = await self._collect(use_case, ["1234567890", " 1234567890", "1234567890"])
+
+        assert len(items) == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_serves_cached(self, use_case):
+        """Test that a second batch is served from cache."""
+        first = await self._collect(use_case, ["1234567890"])
+        second = await self._collect(use_case, ["1234567890"])
+
+        assert first[0].cached is False
+        assert second[0].cached is True
+        assert second[0].status.pnr == "1234567890"
+
+    @pytest.mark.asyncio
+    async def test_batch_reports_item_errors(self, use_case):
+        """Test that bad PNRs fail individually, not the whole batch."""
+        items = await self._collect(use_case, ["12345", "9999999999", "1234567890"])
+        by_pnr = {i.pnr: i for i in items}
+
+        assert "10 digits" in by_pnr["12345"].error
+        assert "not found" in by_pnr["9999999999"].error
+        assert by_pnr["1234567890"].success is True
+
+    def test_batch_too_large(self, use_case):
+        """Test that oversized batch is rejected before streaming."""
+        with pytest.raises(PNRValidationError) as exc_info:
+            use_case.execute([f"{n:010d}" for n in range(6)])
+
+        assert "At most 5" in str(exc_info.value)
+
+    def test_empty_batch(self, use_case):
+        """Test that empty batch is rejected."""
+        with pytest.raises(PNRValidationError):
+            use_case.execute([])
+
+    @pytest.mark.asyncio
+    async def test_batch_respects_concurrency_limit(self, mock_repository):
+        """Test that upstream calls never exceed the semaphore size."""
+        in_flight = 0
+        peak = 0
+        original = mock_repository.get_by_pnr
+
+        async def slow_get_by_pnr(pnr_number):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return await original(pnr_number)
+
+        mock_repository.get_by_pnr = slow_get_by_pnr
+        use_case = GetPNRBatchStatusUseCase(
+            pnr_repository=mock_repository,
+            upstream_semaphore=asyncio.Semaphore(2),
+        )
+
+        items = await self._collect(use_case, [f"{n:010d}" for n in range(8)])
+
+        assert len(items) == 8
+        assert peak == 2
+
+
 class TestPNREntity:
     """Test PNR domain entity business logic."""
 
@@ -0,0 +1,242 @@
+"""
+Unit Tests for PNR watching.
+
+Tests for:
+- PNR change detection and re-check schedule
+- PNRWatchRegistry
+- WatchPNRUseCase
+"""
+
+import asyncio
+import pytest
+from datetime import date, datetime, timedelta
+
+from domain.entities import PNR, Passenger, BookingStatus
+from application.pnr_watch_registry import PNRWatchRegistry
+from application.use_cases import WatchPNRUseCase
+from application.use_cases.get_pnr_status import PNRValidationError, PNRNotFoundError
+from infrastructure.repositories import MockPNRRepository
+
+
+def make_pnr(current_status=BookingStatus.WAITLIST, chart_prepared=False,
+             journey_date=date(2026, 3, 10)):
+    return PNR(
+        pnr_number="5555555555",
+        train_number="12301",
+        train_name="Howrah Rajdhani Express",
+        journey_date=journey_date,
+        from_station_code="NDLS",
+        from_station_name="New Delhi",
+        to_station_code="HWH",
+        to_station_name="Howrah Junction",
+        travel_class="3A",
+        passengers=[
+            Passenger(1, BookingStatus.WAITLIST, current_status),
+            Passenger(2, BookingStatus.CONFIRMED, BookingStatus.CONFIRMED),
+        ],
+        chart_prepared=chart_prepared,
+    )
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestPNRChangeDetection:
+    """Test PNR entity change detection and scheduling."""
+
+    def test_status_changes(self):
+        """Test that only passengers whose status moved are reported."""
+        before = make_pnr(BookingStatus.WAITLIST)
+        after = make_pnr(BookingStatus.RAC)
+
+        changes = after.status_changes(before)
+
+        assert len(changes) == 1
+        assert changes[0].passenger_number == 1
+        assert changes[0].previous_status == BookingStatus.WAITLIST
+        assert changes[0].current_status == BookingStatus.RAC
+        assert changes[0].improved is True
+
+    def test_no_changes(self):
+        """Test identical snapshots."""
+        assert make_pnr().status_changes(make_pnr()) == []
+
+    def test_schedule_tightens_near_departure(self):
+        """Test that re-checks get more frequent as the journey nears."""
+        pnr = make_pnr(journey_date=date(2026, 3, 10))
+
+        far = pnr.next_check_interval(date(2026, 1, 1))
+        near = pnr.next_check_interval(date(2026, 3, 9))
+        same_day = pnr.next_check_interval(date(2026, 3, 10))
+
+        assert far > near > same_day
+
+    def test_schedule_stops_when_final(self):
+        """Test that prepared charts and past journeys are not re-checked."""
+        assert make_pnr(chart_prepared=True).next_check_interval(date(2026, 3, 1)) is None
+        assert make_pnr().next_check_interval(date(2026, 3, 11)) is None
+
+
+class TestPNRWatchRegistry:
+    """Test suite for the watch registry."""
+
+    @pytest.fixture
+    def repository(self):
+        repository = MockPNRRepository()
+        repository.add_pnr(make_pnr())
+        return repository
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock(datetime(2026, 3, 1, 10, 0))
+
+    @pytest.fixture
+    def registry(self, repository, clock):
+        return PNRWatchRegistry(pnr_repository=repository, clock=clock)
+
+    @pytest.mark.asyncio
+    async def test_subscribers_share_one_watch(self, registry):
+        """Test that many subscribers mean one watch."""
+        await registry.watch("5555555555", "user-a")
+        watch = await registry.watch("5555555555", "user-b")
+
+        assert len(registry) == 1
+        assert watch.subscribers == {"user-a", "user-b"}
+
+    @pytest.mark.asyncio
+    async def test_nothing_due_before_schedule(self, registry):
+        """Test that no check runs before the next check time."""
+        await registry.watch("5555555555", "user-a")
+
+        assert await registry.check_due() == 0
+
+    @pytest.mark.asyncio
+    async def test_change_emits_event(self, registry, repository, clock):
+        """Test that a status change is queued for delivery."""
+        await registry.watch("5555555555", "user-a")
+        repository.add_pnr(make_pnr(BookingStatus.CONFIRMED))
+        clock.now += timedelta(days=1)
+
+        assert await registry.check_due() == 1
+
+        events = registry.drain_events()
+        assert len(events) == 1
+        assert events[0].subscribers == ["user-a"]
+        assert events[0].changes[0].current_status == BookingStatus.CONFIRMED
+
+    @pytest.mark.asyncio
+    async def test_unchanged_emits_nothing(self, registry, clock):
+        """Test that an unchanged PNR is rescheduled quietly."""
+        await registry.watch("5555555555", "user-a")
+        clock.now += timedelta(days=1)
+
+        await registry.check_due()
+
+        assert registry.drain_events() == []
+        assert registry.get("5555555555").next_check_at > clock.now
+
+    @pytest.mark.asyncio
+    async def test_chart_prepared_ends_watch(self, registry, repository, clock):
+        """Test that chart preparation is reported and ends the watch."""
+        await registry.watch("5555555555", "user-a")
+        repository.add_pnr(make_pnr(chart_prepared=True))
+        clock.now += timedelta(days=1)
+
+        await registry.check_due()
+
+        events = registry.drain_events()
+        assert events[0].chart_just_prepared is True
+        assert len(registry) == 0
+
+    @pytest.mark.asyncio
+    async def test_last_unwatch_drops_watch(self, registry):
+        """Test that the watch goes away with its last subscriber."""
+        await registry.watch("5555555555", "user-a")
+
+        assert registry.unwatch("5555555555", "user-a") is True
+        assert registry.unwatch("5555555555", "user-a") is False
+        assert len(registry) == 0
+
+    @pytest.mark.asyncio
+    async def test_unwatch_before_due_check_runs(self, registry, clock):
+        """Test that an unwatch between scheduling and checking is not an error."""
+        await registry.watch("5555555555", "user-a")
+        clock.now += timedelta(days=1)
+        # Runs after check_due picks the PNR, before its check starts
+        asyncio.get_running_loop().call_soon(registry.unwatch, "5555555555", "user-a")
+
+        assert await registry.check_due() == 1
+        assert len(registry) == 0
+        assert registry.drain_events() == []
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_oldest(self, repository, clock):
+        """Test that undelivered events don't grow without bound."""
+        registry = PNRWatchRegistry(
+            pnr_repository=repository, clock=clock, max_pending_events=1
+        )
+        await registry.watch("5555555555", "user-a")
+
+        for status in (BookingStatus.RAC, BookingStatus.CONFIRMED):
+            repository.add_pnr(make_pnr(status))
+            clock.now += timedelta(days=1)
+            await registry.check_due()
+
+        events = registry.drain_events()
+        assert len(events) == 1
+        assert events[0].changes[0].current_status == BookingStatus.CONFIRMED
+
+
+class TestWatchPNRUseCase:
+    """Test suite for PNR watch use case."""
+
+    @pytest.fixture
+    def use_case(self):
+        repository = MockPNRRepository()
+        repository.add_pnr(make_pnr(journey_date=date.today() + timedelta(days=10)))
+        return WatchPNRUseCase(registry=PNRWatchRegistry(pnr_repository=repository))
+
+    @pytest.mark.asyncio
+    async def test_watch_success(self, use_case):
+        """Test registering a watch."""
+        result = await use_case.execute("5555555555", "user-a")
+
+        assert result.watching is True
+        assert result.subscribers == 1
+        assert result.next_check_at is not None
+
+    @pytest.mark.asyncio
+    async def test_watch_final_status(self, use_case):
+        """Test watching a PNR whose chart is prepared."""
+        # Mock PNR 9876543210 has chart prepared
+        result = await use_case.execute("9876543210", "user-a")
+
+        assert result.watching is False
+        assert "final" in result.message
+
+    @pytest.mark.asyncio
+    async def test_watch_not_found(self, use_case):
+        """Test watching an unknown PNR."""
+        with pytest.raises(PNRNotFoundError):
+            await use_case.execute("9999999999", "user-a")
+
+    @pytest.mark.asyncio
+    async def test_watch_invalid(self, use_case):
+        """Test input validation."""
+        with pytest.raises(PNRValidationError):
+            await use_case.execute("123", "user-a")
+
+        with pytest.raises(PNRValidationError):
+            await use_case.execute("5555555555", " ")
+
+    def test_unwatch_unknown(self, use_case):
+        """Test unwatching a PNR that isn't watched."""
+        with pytest.raises(PNRNotFoundError):
+            use_case.unwatch("5555555555", "user-a")
@@ -2,8 +2,11 @@
 from .weather_dto import WeatherRequest, WeatherResponse
 from .gold_dto import GoldPriceRequest, GoldPriceResponse
 from .fuel_dto import FuelPriceRequest, FuelPriceResponse
-from .currency_dto import CurrencyRequest, CurrencyResponse, ConversionRequest
-from .pincode_dto import PincodeRequest, PincodeResponse
+from .currency_dto import (
+    CurrencyRequest, CurrencyResponse, ConversionRequest,
+    CurrencyMatrixRequest, CurrencyMatrixResponse, BatchConversionRequest, BatchConversionResponse
+)
+from .pincode_dto import PincodeRequest, PincodeSearchRequest, PincodeResponse
 from .ifsc_dto import IFSCRequest, IFSCResponse
 from .holiday_dto import HolidayRequest, HolidayResponse
 
@@ -12,7 +15,9 @@ __all__ = [
     "GoldPriceRequest", "GoldPriceResponse",
     "FuelPriceRequest", "FuelPriceResponse",
     "CurrencyRequest", "CurrencyResponse", "ConversionRequest",
-    "PincodeRequest", "PincodeResponse",
+    "CurrencyMatrixRequest", "CurrencyMatrixResponse",
+    "BatchConversionRequest", "BatchConversionResponse",
+    "PincodeRequest", "PincodeSearchRequest", "PincodeResponse",
     "IFSCRequest", "IFSCResponse",
     "HolidayRequest", "HolidayResponse"
 ]
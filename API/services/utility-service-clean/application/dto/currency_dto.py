@@ -1,6 +1,6 @@
 """Currency DTOs."""
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 
 
 class CurrencyRequest(BaseModel):
@@ -35,3 +35,27 @@ class ConversionResponse(BaseModel):
     to_currency: str
     converted_amount: float
     rate: float
+
+
+class BatchConversionRequest(BaseModel):
+    """Line items as parallel arrays: amounts[i] from from_currencies[i] to to_currencies[i]."""
+    amounts: List[float] = Field(..., min_length=1, max_length=100000)
+    from_currencies: List[str]
+    to_currencies: List[str]
+
+
+class BatchConversionResponse(BaseModel):
+    success: bool = True
+    converted_amounts: List[Optional[float]]  # In input order; None where no rate
+    rates: List[Optional[float]]
+    unavailable: List[str] = []  # Pairs without a rate, as "FROM/TO"
+
+
+class CurrencyMatrixRequest(BaseModel):
+    codes: Optional[List[str]] = None  # Default: every known currency
+
+
+class CurrencyMatrixResponse(BaseModel):
+    success: bool = True
+    codes: List[str]
+    rates: List[List[Optional[float]]]  # rates[i][j]: codes[j] per unit of codes[i]
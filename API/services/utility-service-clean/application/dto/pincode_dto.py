@@ -7,6 +7,12 @@ class PincodeRequest(BaseModel):
     pincode: str = Field(..., min_length=6, max_length=6, pattern=r"^\d{6}$")
 
 
+class PincodeSearchRequest(BaseModel):
+    area: str = Field(..., min_length=2, max_length=100)
+    state: Optional[str] = None
+    limit: int = Field(default=20, ge=1, le=100)
+
+
 class PincodeInfoDTO(BaseModel):
     pincode: str
     post_office: str
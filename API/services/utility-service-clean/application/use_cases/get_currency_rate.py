@@ -1,6 +1,12 @@
 """Get Currency Rate Use Case."""
+from itertools import chain
+from typing import Dict
+import numpy as np
 from domain.repositories import CurrencyRepository
-from application.dto import CurrencyRequest, CurrencyResponse
+from application.dto import (
+    CurrencyRequest, CurrencyResponse, CurrencyMatrixRequest, CurrencyMatrixResponse,
+    BatchConversionRequest, BatchConversionResponse
+)
 from application.dto.currency_dto import CurrencyRateDTO, ConversionRequest, ConversionResponse
 
 
@@ -9,6 +15,11 @@ class CurrencyNotFoundError(Exception):
     pass
 
 
+class CurrencyValidationError(Exception):
+    """Raised when a conversion request is invalid."""
+    pass
+
+
 class GetCurrencyRateUseCase:
     """Use case for getting currency rates."""
 
@@ -50,3 +61,62 @@ class GetCurrencyRateUseCase:
             converted_amount=round(converted, 2),
             rate=rate.rate
         )
+
+    async def matrix(self, request: CurrencyMatrixRequest) -> CurrencyMatrixResponse:
+        """Get rates between every pair of the requested (default: all) currencies."""
+        codes = list(dict.fromkeys(c.upper() for c in request.codes)) if request.codes else None
+        try:
+            matrix = await self.currency_repository.get_rate_matrix(codes)
+        except KeyError as e:
+            raise CurrencyNotFoundError(f"Rates not available for {e.args[0]}")
+
+        rates = np.asarray(matrix.rates, dtype=float)
+        return CurrencyMatrixResponse(
+            success=True,
+            codes=matrix.codes,
+            rates=np.where(np.isnan(rates), None, rates.round(6)).tolist()
+        )
+
+    async def convert_batch(self, request: BatchConversionRequest) -> BatchConversionResponse:
+        """
+        Convert many line items at once.
+
+        Items are grouped by currency, so each distinct code is looked up
+        once in the rate matrix; the conversion itself is one gather and
+        multiply in input order.
+        """
+        n = len(request.amounts)
+        if len(request.from_currencies) != n or len(request.to_currencies) != n:
+            raise CurrencyValidationError(
+                "amounts, from_currencies and to_currencies must have the same length"
+            )
+
+        matrix = await self.currency_repository.get_rate_matrix()
+        position = {code: i for i, code in enumerate(matrix.codes)}
+        # Group items by currency code: ids[k] numbers the distinct codes
+        groups: Dict[str, int] = {}
+        items = chain(request.from_currencies, request.to_currencies)
+        ids = np.fromiter(
+            (groups.setdefault(code, len(groups)) for code in items), dtype=np.intp, count=2 * n
+        )
+        codes = [code.upper() for code in groups]
+        index = np.array([position.get(code, -1) for code in codes], dtype=np.intp)[ids]
+        sources, targets = index[:n], index[n:]
+
+        known = (sources >= 0) & (targets >= 0)
+        rates = np.asarray(matrix.rates, dtype=float)[np.where(known, sources, 0), np.where(known, targets, 0)]
+        rates = np.where(known, rates, np.nan)
+        converted = np.asarray(request.amounts, dtype=float) * rates
+
+        missing = np.isnan(rates)
+        unavailable = []
+        if missing.any():
+            pairs = dict.fromkeys(zip(ids[:n][missing].tolist(), ids[n:][missing].tolist()))
+            # Codes differing only in case are one currency
+            unavailable = list(dict.fromkeys(f"{codes[i]}/{codes[j]}" for i, j in pairs))
+        return BatchConversionResponse(
+            success=True,
+            converted_amounts=np.where(missing, None, converted.round(2)).tolist(),
+            rates=np.where(missing, None, rates).tolist(),
+            unavailable=unavailable
+        )
@@ -1,6 +1,8 @@
 """Get Pincode Info Use Case."""
+from typing import List
+from domain.entities import PincodeInfo
 from domain.repositories import PincodeRepository
-from application.dto import PincodeRequest, PincodeResponse
+from application.dto import PincodeRequest, PincodeSearchRequest, PincodeResponse
 from application.dto.pincode_dto import PincodeInfoDTO
 
 
@@ -22,6 +24,16 @@ class GetPincodeInfoUseCase:
         if not infos:
             raise PincodeNotFoundError(f"Pincode {request.pincode} not found")
 
+        return self._response(infos)
+
+    async def search(self, request: PincodeSearchRequest) -> PincodeResponse:
+        """Find post offices by area name, optionally within a state."""
+        infos = await self.pincode_repository.search_by_area(
+            request.area, state=request.state, limit=request.limit
+        )
+        return self._response(infos)
+
+    def _response(self, infos: List[PincodeInfo]) -> PincodeResponse:
         return PincodeResponse(
             success=True,
             data=[
@@ -2,7 +2,7 @@
 from .weather import Weather, WeatherForecast
 from .gold import GoldPrice, MetalType
 from .fuel import FuelPrice, FuelType
-from .currency import CurrencyRate, CurrencyPair
+from .currency import CurrencyRate, CurrencyPair, CurrencyMatrix
 from .pincode import PincodeInfo
 from .ifsc import IFSCInfo
 from .holiday import Holiday, HolidayType
@@ -11,7 +11,7 @@ __all__ = [
     "Weather", "WeatherForecast",
     "GoldPrice", "MetalType",
     "FuelPrice", "FuelType",
-    "CurrencyRate", "CurrencyPair",
+    "CurrencyRate", "CurrencyPair", "CurrencyMatrix",
     "PincodeInfo",
     "IFSCInfo",
     "Holiday", "HolidayType"
@@ -1,7 +1,7 @@
 """Currency Domain Entities."""
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional, Sequence
 
 
 @dataclass
@@ -20,3 +20,10 @@ class CurrencyRate:
     change: float = 0
     change_percent: float = 0
     timestamp: Optional[datetime] = None
+
+
+@dataclass
+class CurrencyMatrix:
+    codes: List[str]
+    rates: Sequence[Sequence[float]]  # rates[i][j]: codes[j] per codes[i]; NaN if unknown
+    timestamp: Optional[datetime] = None
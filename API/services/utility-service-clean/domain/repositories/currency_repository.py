@@ -1,7 +1,7 @@
 """Currency Repository Interface."""
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from domain.entities import CurrencyRate, CurrencyPair
+from typing import List, Optional, Sequence
+from domain.entities import CurrencyRate, CurrencyPair, CurrencyMatrix
 
 
 class CurrencyRepository(ABC):
@@ -21,3 +21,8 @@ class CurrencyRepository(ABC):
     async def convert(self, amount: float, from_currency: str, to_currency: str) -> float:
         """Convert amount between currencies."""
         pass
+
+    @abstractmethod
+    async def get_rate_matrix(self, codes: Optional[Sequence[str]] = None) -> CurrencyMatrix:
+        """Get rates between every pair of currencies (default: all known ones)."""
+        pass
@@ -13,6 +13,8 @@ class PincodeRepository(ABC):
         pass
 
     @abstractmethod
-    async def search_by_area(self, area: str, state: Optional[str] = None) -> List[PincodeInfo]:
-        """Search pincodes by area name."""
+    async def search_by_area(
+        self, area: str, state: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[PincodeInfo]:
+        """Search pincodes by area name, returning at most limit offices."""
         pass
@@ -1,4 +1,6 @@
 """Dependency Injection for Utility Service API."""
+import os
+from pathlib import Path
 from infrastructure.repositories import (
     MockWeatherRepository,
     MockGoldRepository,
@@ -6,7 +8,8 @@ from infrastructure.repositories import (
     MockCurrencyRepository,
     MockPincodeRepository,
     MockIFSCRepository,
-    MockHolidayRepository
+    MockHolidayRepository,
+    SnapshotPincodeRepository
 )
 from application.use_cases import (
     GetWeatherUseCase,
@@ -24,7 +27,13 @@ _weather_repository = MockWeatherRepository()
 _gold_repository = MockGoldRepository()
 _fuel_repository = MockFuelRepository()
 _currency_repository = MockCurrencyRepository()
-_pincode_repository = MockPincodeRepository()
+_pincode_snapshot = Path(os.environ.get(
+    "PINCODE_SNAPSHOT", Path(__file__).resolve().parents[2] / "data" / "pincodes.snap"
+))
+# Built offline from the India Post CSV; the mock serves when none is deployed
+_pincode_repository = (
+    SnapshotPincodeRepository(_pincode_snapshot) if _pincode_snapshot.exists() else MockPincodeRepository()
+)
 _ifsc_repository = MockIFSCRepository()
 _holiday_repository = MockHolidayRepository()
 
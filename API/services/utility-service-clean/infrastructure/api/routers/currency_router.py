@@ -1,9 +1,13 @@
 """Currency API Router."""
-from fastapi import APIRouter, Depends, HTTPException
-from application.dto import CurrencyRequest, CurrencyResponse
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from application.dto import (
+    CurrencyRequest, CurrencyResponse, CurrencyMatrixRequest, CurrencyMatrixResponse,
+    BatchConversionRequest, BatchConversionResponse
+)
 from application.dto.currency_dto import ConversionRequest, ConversionResponse
 from application.use_cases import GetCurrencyRateUseCase
-from application.use_cases.get_currency_rate import CurrencyNotFoundError
+from application.use_cases.get_currency_rate import CurrencyNotFoundError, CurrencyValidationError
 from infrastructure.api.dependencies import get_currency_rate_use_case
 
 router = APIRouter(prefix="/currency", tags=["Currency"])
@@ -33,3 +37,30 @@ async def convert_currency(
         return await use_case.convert(request)
     except CurrencyNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.post("/convert/batch", response_model=BatchConversionResponse)
+async def convert_currency_batch(
+    request: BatchConversionRequest,
+    use_case: GetCurrencyRateUseCase = Depends(get_currency_rate_use_case)
+) -> BatchConversionResponse:
+    """Convert up to 100,000 line items in one call; items without a rate come back as null."""
+    try:
+        return await use_case.convert_batch(request)
+    except CurrencyValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/matrix", response_model=CurrencyMatrixResponse)
+async def get_currency_matrix(
+    codes: Optional[str] = Query(None, description="Comma-separated currency codes, e.g. USD,EUR,INR"),
+    use_case: GetCurrencyRateUseCase = Depends(get_currency_rate_use_case)
+) -> CurrencyMatrixResponse:
+    """Get cross rates between every pair of currencies."""
+    try:
+        request = CurrencyMatrixRequest(
+            codes=[c.strip() for c in (codes or "").split(",") if c.strip()] or None
+        )
+        return await use_case.matrix(request)
+    except CurrencyNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
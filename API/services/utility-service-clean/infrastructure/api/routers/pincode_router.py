@@ -1,6 +1,7 @@
 """Pincode API Router."""
-from fastapi import APIRouter, Depends, HTTPException
-from application.dto import PincodeRequest, PincodeResponse
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from application.dto import PincodeRequest, PincodeSearchRequest, PincodeResponse
 from application.use_cases import GetPincodeInfoUseCase
 from application.use_cases.get_pincode_info import PincodeNotFoundError
 from infrastructure.api.dependencies import get_pincode_info_use_case
@@ -8,6 +9,18 @@ from infrastructure.api.dependencies import get_pincode_info_use_case
 router = APIRouter(prefix="/pincode", tags=["Pincode"])
 
 
+@router.get("/search", response_model=PincodeResponse)
+async def search_pincodes(
+    area: str = Query(..., min_length=2, max_length=100),
+    state: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    use_case: GetPincodeInfoUseCase = Depends(get_pincode_info_use_case)
+) -> PincodeResponse:
+    """Find post offices by name or area, e.g. "andheri" or "connaught pl"."""
+    request = PincodeSearchRequest(area=area, state=state, limit=limit)
+    return await use_case.search(request)
+
+
 @router.get("/{pincode}", response_model=PincodeResponse)
 async def get_pincode_info(
     pincode: str,
@@ -6,6 +6,8 @@ from .mock_currency_repository import MockCurrencyRepository
 from .mock_pincode_repository import MockPincodeRepository
 from .mock_ifsc_repository import MockIFSCRepository
 from .mock_holiday_repository import MockHolidayRepository
+from .rate_matrix import RateMatrix
+from .snapshot_pincode_repository import SnapshotPincodeRepository, build_snapshot, read_offices
 
 __all__ = [
     "MockWeatherRepository",
@@ -14,5 +16,9 @@ __all__ = [
     "MockCurrencyRepository",
     "MockPincodeRepository",
     "MockIFSCRepository",
-    "MockHolidayRepository"
+    "MockHolidayRepository",
+    "RateMatrix",
+    "SnapshotPincodeRepository",
+    "build_snapshot",
+    "read_offices"
 ]
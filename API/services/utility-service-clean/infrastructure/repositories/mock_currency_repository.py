@@ -1,8 +1,9 @@
 """Mock Currency Repository Implementation."""
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from datetime import datetime
-from domain.entities import CurrencyRate, CurrencyPair
+from domain.entities import CurrencyRate, CurrencyPair, CurrencyMatrix
 from domain.repositories import CurrencyRepository
+from .rate_matrix import RateMatrix
 
 
 class MockCurrencyRepository(CurrencyRepository):
@@ -17,32 +18,55 @@ class MockCurrencyRepository(CurrencyRepository):
             ("JPY", "INR"): 0.55,
             ("INR", "USD"): 0.012,
         }
+        # Cross rates for every pair, through INR
+        self._matrix = RateMatrix(self._rates, pivot="INR")
+
+    @property
+    def matrix(self) -> RateMatrix:
+        return self._matrix
+
+    def set_rate(self, base: str, quote: str, rate: float) -> None:
+        """Update a quoted rate and the cross rates derived from it."""
+        self._rates[(base.upper(), quote.upper())] = rate
+        self._matrix.update(base, quote, rate)
 
     async def get_rate(self, base: str, quote: str) -> Optional[CurrencyRate]:
-        rate = self._rates.get((base.upper(), quote.upper()))
+        rate = self._matrix.rate(base, quote)
         if not rate:
             return None
+        quoted = self._matrix.is_quoted(base, quote)
         return CurrencyRate(
             pair=CurrencyPair(base=base.upper(), quote=quote.upper()),
             rate=rate,
-            change=0.15,
-            change_percent=0.18,
+            change=0.15 if quoted else 0,
+            change_percent=0.18 if quoted else 0,
             timestamp=datetime.now()
         )
 
     async def get_rates_for_base(self, base: str) -> List[CurrencyRate]:
+        i = self._matrix.index(base)
+        if i is None:
+            return []
         rates = []
-        for (b, q), rate in self._rates.items():
-            if b == base.upper():
+        for quote, rate in zip(self._matrix.codes, self._matrix.rates[i].tolist()):
+            if quote != base.upper() and rate == rate:  # Skip NaN (unconnected)
                 rates.append(CurrencyRate(
-                    pair=CurrencyPair(base=b, quote=q),
+                    pair=CurrencyPair(base=base.upper(), quote=quote),
                     rate=rate,
                     timestamp=datetime.now()
                 ))
         return rates
 
+    async def get_rate_matrix(self, codes: Optional[Sequence[str]] = None) -> CurrencyMatrix:
+        if codes is None:
+            codes, rates = self._matrix.codes, self._matrix.rates.copy()
+        else:
+            codes = [code.upper() for code in codes]
+            rates = self._matrix.submatrix(codes)
+        return CurrencyMatrix(codes=codes, rates=rates, timestamp=datetime.now())
+
     async def convert(self, amount: float, from_currency: str, to_currency: str) -> float:
-        rate = self._rates.get((from_currency.upper(), to_currency.upper()))
+        rate = self._matrix.rate(from_currency, to_currency)
         if not rate:
             return 0.0
         return amount * rate
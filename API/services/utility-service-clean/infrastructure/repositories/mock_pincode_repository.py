@@ -56,7 +56,9 @@ class MockPincodeRepository(PincodeRepository):
     async def get_by_pincode(self, pincode: str) -> List[PincodeInfo]:
         return self._pincodes.get(pincode, [])
 
-    async def search_by_area(self, area: str, state: Optional[str] = None) -> List[PincodeInfo]:
+    async def search_by_area(
+        self, area: str, state: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[PincodeInfo]:
         results = []
         area_lower = area.lower()
         for infos in self._pincodes.values():
@@ -64,4 +66,4 @@ class MockPincodeRepository(PincodeRepository):
                 if area_lower in info.post_office.lower() or area_lower in info.district.lower():
                     if state is None or info.state.lower() == state.lower():
                         results.append(info)
-        return results
+        return results[:limit]
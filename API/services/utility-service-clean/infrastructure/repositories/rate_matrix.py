@@ -0,0 +1,169 @@
+"""
+Currency Rate Matrix.
+
+Every pair of known currencies answered from one dense matrix, so a
+rate is an index lookup and a batch of conversions is one gather and
+multiply.
+
+Quoted pairs form a graph. A breadth-first tree from a pivot currency
+(the best-connected one) values every currency in pivot units by
+multiplying the rates along its fewest-hop path, and a cross rate is
+the ratio of two values. Quoted pairs, and the
+inverse of a pair quoted one way only, override the derived rate.
+
+When an existing quote changes, only its own cell and its inverse
+change -- unless it is a tree edge, in which case the subtree below it
+is rescaled by one factor and just those rows and columns recomputed.
+A newly quoted pair can shorten paths, so it rebuilds the matrix.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+
+class RateMatrix:
+    """Dense cross-rate matrix over all quoted currencies."""
+
+    def __init__(self, quotes: Dict[Tuple[str, str], float], pivot: Optional[str] = None):
+        self._quotes = {(b.upper(), q.upper()): float(r) for (b, q), r in quotes.items()}
+        self._pivot = pivot.upper() if pivot else None
+        self._build()
+
+    @property
+    def codes(self) -> List[str]:
+        return list(self._codes)
+
+    @property
+    def rates(self) -> np.ndarray:
+        """rates[i, j]: units of codes[j] per unit of codes[i]; NaN when unconnected."""
+        view = self._rates.view()
+        view.flags.writeable = False
+        return view
+
+    def index(self, code: str) -> Optional[int]:
+        return self._index.get(code.upper())
+
+    def indices(self, codes: Iterable[str]) -> np.ndarray:
+        """Matrix indices of codes, -1 for unknown ones."""
+        return np.array([self._index.get(c.upper(), -1) for c in codes], dtype=np.intp)
+
+    def is_quoted(self, base: str, quote: str) -> bool:
+        return (base.upper(), quote.upper()) in self._quotes
+
+    def rate(self, base: str, quote: str) -> Optional[float]:
+        """Units of quote per unit of base, or None when they are not connected."""
+        i, j = self.index(base), self.index(quote)
+        if i is None or j is None:
+            return None
+        rate = self._rates[i, j]
+        return None if np.isnan(rate) else float(rate)
+
+    def convert(self, amounts: Sequence[float], bases: np.ndarray, quotes: np.ndarray) -> np.ndarray:
+        """Convert amounts between currencies given as matrix indices; NaN where unknown."""
+        amounts = np.asarray(amounts, dtype=float)
+        known = (bases >= 0) & (quotes >= 0)
+        rates = self._rates[np.where(known, bases, 0), np.where(known, quotes, 0)]
+        return amounts * np.where(known, rates, np.nan)
+
+    def submatrix(self, codes: Sequence[str]) -> np.ndarray:
+        """Rates among a subset of currencies, in the given order."""
+        rows = self.indices(codes)
+        if (rows < 0).any():
+            raise KeyError(codes[int(np.flatnonzero(rows < 0)[0])])
+        return self._rates[np.ix_(rows, rows)]
+
+    def update(self, base: str, quote: str, rate: float) -> None:
+        """Set one quoted rate, recomputing only the cells it affects."""
+        base, quote = base.upper(), quote.upper()
+        known = (base, quote) in self._quotes or (quote, base) in self._quotes
+        self._quotes[(base, quote)] = float(rate)
+        if not known or base == quote:
+            # A new pair can change the graph's paths: rebuild
+            self._build()
+            return
+
+        i, j = self._index[base], self._index[quote]
+        if self._parent[j] == i or self._parent[i] == j:
+            child, parent = (j, i) if self._parent[j] == i else (i, j)
+            value = self._edge(child, parent) * self._value[parent]
+            if value != self._value[child]:
+                subtree = self._subtree(child)
+                self._value[subtree] *= value / self._value[child]
+                self._fill(subtree)
+                return
+        self._overlay(i, j)
+        self._overlay(j, i)
+
+    def _build(self) -> None:
+        codes = sorted({code for pair in self._quotes for code in pair})
+        n = len(codes)
+        self._codes = codes
+        self._index = {code: i for i, code in enumerate(codes)}
+        self._adjacent: List[Set[int]] = [set() for _ in range(n)]
+        for base, quote in self._quotes:
+            i, j = self._index[base], self._index[quote]
+            if i != j:
+                self._adjacent[i].add(j)
+                self._adjacent[j].add(i)
+
+        # Breadth-first trees, the pivot's component first
+        self._parent: List[Optional[int]] = [None] * n
+        self._children: List[List[int]] = [[] for _ in range(n)]
+        self._component = np.full(n, -1)
+        self._value = np.ones(n)
+        roots = sorted(
+            range(n), key=lambda i: (codes[i] != self._pivot, -len(self._adjacent[i]), codes[i])
+        )
+        for root in roots:
+            if self._component[root] >= 0:
+                continue
+            self._component[root] = root
+            queue = deque([root])
+            while queue:
+                node = queue.popleft()
+                for neighbour in sorted(self._adjacent[node]):
+                    if self._component[neighbour] < 0:
+                        self._component[neighbour] = root
+                        self._parent[neighbour] = node
+                        self._children[node].append(neighbour)
+                        self._value[neighbour] = self._edge(neighbour, node) * self._value[node]
+                        queue.append(neighbour)
+
+        self._rates = np.empty((n, n))
+        self._fill(np.arange(n))
+
+    def _edge(self, base: int, quote: int) -> float:
+        """Quoted rate from base to quote, or the inverse of the opposite quote."""
+        rate = self._quotes.get((self._codes[base], self._codes[quote]))
+        if rate is None:
+            rate = 1 / self._quotes[(self._codes[quote], self._codes[base])]
+        return rate
+
+    def _subtree(self, root: int) -> np.ndarray:
+        nodes, stack = [], [root]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(self._children[node])
+        return np.array(nodes, dtype=np.intp)
+
+    def _fill(self, rows: np.ndarray) -> None:
+        """Recompute the rows and columns of some currencies."""
+        value, component = self._value, self._component
+        self._rates[rows, :] = np.where(
+            component[rows, None] == component[None, :], value[rows, None] / value[None, :], np.nan
+        )
+        self._rates[:, rows] = np.where(
+            component[:, None] == component[None, rows], value[:, None] / value[None, rows], np.nan
+        )
+        self._rates[rows, rows] = 1.0
+        for i in rows.tolist():
+            for j in self._adjacent[i]:
+                self._overlay(i, j)
+                self._overlay(j, i)
+
+    def _overlay(self, i: int, j: int) -> None:
+        """Use the quoted (or inverse-quoted) rate for a connected pair."""
+        self._rates[i, j] = self._edge(i, j)
@@ -0,0 +1,303 @@
+"""
+Snapshot Pincode Repository.
+
+The all-India post office directory (about 155k offices) served from
+one prebuilt binary snapshot that is memory-mapped when the service
+starts. Nothing is parsed or indexed at startup, and every worker
+maps the same file, so they share one copy in the page cache.
+
+The snapshot holds:
+
+- the office table as integer columns sorted by pincode, every text
+  field interned once into a shared string table
+- an array indexed by pincode giving the first row of its offices, so
+  a lookup is two array reads and a slice
+- a prefix index over post office names: a trie flattened into sorted
+  order, where the names under a prefix are one contiguous run found
+  by two binary searches
+- a token index for area search: sorted words of office and district
+  names, each with the rows containing it
+
+Build a snapshot from the India Post CSV with:
+
+    python -m infrastructure.repositories.snapshot_pincode_repository <csv> <snapshot>
+"""
+
+import csv
+import json
+import os
+import re
+import sys
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from domain.entities import PincodeInfo
+from domain.repositories import PincodeRepository
+
+_MAGIC = b"PINSNAP1"
+_ALIGN = 64
+_FIRST_PIN, _LAST_PIN = 100000, 999999
+_WORD = re.compile(r"[a-z0-9]+")
+
+# Office fields stored as string ids (-1 for missing), in PincodeInfo order
+_FIELDS = (
+    "post_office", "district", "state", "delivery_status", "division", "region", "block", "branch_type"
+)
+
+# CSV column names, lower-cased, of the current and older India Post exports
+_COLUMNS = {
+    "officename": "post_office",
+    "office name": "post_office",
+    "districtname": "district",
+    "district": "district",
+    "statename": "state",
+    "state": "state",
+    "delivery": "delivery_status",
+    "deliverystatus": "delivery_status",
+    "divisionname": "division",
+    "regionname": "region",
+    "taluk": "block",
+    "block": "block",
+    "officetype": "branch_type",
+    "office type": "branch_type",
+}
+
+
+class SnapshotFormatError(ValueError):
+    """Raised when a file is not a pincode snapshot this code can read."""
+    pass
+
+
+def _words(text: str) -> List[str]:
+    return _WORD.findall(text.lower())
+
+
+def _key(text: str) -> str:
+    """Name as matched by prefix search: lower-case words joined by single spaces."""
+    return " ".join(_words(text))
+
+
+def _tokens(text: str) -> List[str]:
+    # Single letters are office-type suffixes ("S.O", "B.O"), not place names
+    return [word for word in _words(text) if len(word) > 1]
+
+
+class _Strings:
+    """Sequence view of strings packed as UTF-8 into one byte array."""
+
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray):
+        self._blob = blob
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        return self._blob[self._offsets[i]:self._offsets[i + 1]].tobytes().decode("utf-8")
+
+    def prefix_range(self, prefix: str) -> Tuple[int, int]:
+        """Positions of the strings starting with prefix; the strings must be sorted."""
+        lo = bisect_left(self, prefix)
+        hi = bisect_left(self, prefix + "\U0010ffff", lo)
+        return lo, hi
+
+
+def _pack(strings: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def _postings(keys: List[str], rows: List[List[int]], count: int) -> Dict[str, np.ndarray]:
+    """Sorted keys with their rows in compressed sparse row form."""
+    blob, offsets = _pack(keys)
+    starts = np.zeros(len(keys) + 1, dtype=np.int64)
+    np.cumsum([len(r) for r in rows], out=starts[1:])
+    dtype = np.int32 if count < 2 ** 31 else np.int64
+    flat = np.fromiter((row for r in rows for row in r), dtype=dtype, count=int(starts[-1]))
+    return {"blob": blob, "offsets": offsets, "starts": starts, "rows": flat}
+
+
+def read_offices(path: Path) -> List[PincodeInfo]:
+    """
+    Read the India Post pincode directory CSV.
+
+    Accepts the column names of the data.gov.in export (OfficeName,
+    Pincode, OfficeType, Delivery, DivisionName, RegionName, District,
+    StateName) and of the older one (Districtname, Taluk, Deliverystatus).
+    """
+    offices = []
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            row = {key.strip().lower(): (value or "").strip() for key, value in row.items() if key}
+            pincode = row.get("pincode", "")
+            fields = {}
+            for column, value in row.items():
+                field = _COLUMNS.get(column)
+                if field and value and value.upper() != "NA":
+                    fields.setdefault(field, value)
+            if not re.fullmatch(r"\d{6}", pincode) or "post_office" not in fields:
+                continue
+            offices.append(PincodeInfo(
+                pincode=pincode,
+                post_office=fields["post_office"],
+                district=fields.get("district", ""),
+                state=fields.get("state", ""),
+                delivery_status=fields.get("delivery_status", "Delivery"),
+                division=fields.get("division"),
+                region=fields.get("region"),
+                block=fields.get("block"),
+                branch_type=fields.get("branch_type")
+            ))
+    return offices
+
+
+def build_snapshot(offices: Iterable[PincodeInfo], path: Path) -> int:
+    """Write a snapshot of the offices to path, replacing it atomically; returns the office count."""
+    offices = sorted(offices, key=lambda o: (o.pincode, _key(o.post_office), o.post_office))
+    n = len(offices)
+
+    # Intern every text field into one table
+    interned: Dict[str, int] = {}
+    columns = {
+        field: np.fromiter(
+            (-1 if value is None else interned.setdefault(value, len(interned))
+             for value in (getattr(o, field) for o in offices)),
+            dtype=np.int32, count=n
+        )
+        for field in _FIELDS
+    }
+    arrays = {f"office.{field}": column for field, column in columns.items()}
+    arrays["strings.blob"], arrays["strings.offsets"] = _pack(list(interned))
+
+    pincodes = np.array([int(o.pincode) for o in offices], dtype=np.int32)
+    arrays["office.pincode"] = pincodes
+    arrays["pincode.first"] = np.searchsorted(
+        pincodes, np.arange(_FIRST_PIN, _LAST_PIN + 2), side="left"
+    ).astype(np.int32)
+
+    names: Dict[str, List[int]] = {}
+    tokens: Dict[str, List[int]] = {}
+    for row, office in enumerate(offices):
+        names.setdefault(_key(office.post_office), []).append(row)
+        for token in dict.fromkeys(_tokens(office.post_office) + _tokens(office.district)):
+            tokens.setdefault(token, []).append(row)
+    for prefix, index in (("names", names), ("tokens", tokens)):
+        keys = sorted(index)
+        for name, array in _postings(keys, [index[k] for k in keys], n).items():
+            arrays[f"{prefix}.{name}"] = array
+
+    header, offset = {}, 0
+    for name, array in arrays.items():
+        header[name] = [array.dtype.str, offset, int(array.shape[0])]
+        offset += -(-array.nbytes // _ALIGN) * _ALIGN
+    encoded = json.dumps({"offices": n, "arrays": header}).encode("utf-8")
+    start = -(-(len(_MAGIC) + 8 + len(encoded)) // _ALIGN) * _ALIGN
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(partial, "wb") as f:
+        f.write(_MAGIC + len(encoded).to_bytes(8, "little") + encoded)
+        for name, array in arrays.items():
+            f.seek(start + header[name][1])
+            f.write(np.ascontiguousarray(array).tobytes())
+        f.truncate(start + offset)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(partial, path)  # Workers holding the old file keep their mapping
+    return n
+
+
+class SnapshotPincodeRepository(PincodeRepository):
+    """Pincode directory read through a memory-mapped snapshot."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        buffer = np.memmap(self.path, dtype=np.uint8, mode="r")
+        if buffer[:len(_MAGIC)].tobytes() != _MAGIC:
+            raise SnapshotFormatError(f"{self.path} is not a pincode snapshot")
+        size = int.from_bytes(buffer[len(_MAGIC):len(_MAGIC) + 8].tobytes(), "little")
+        header = json.loads(buffer[len(_MAGIC) + 8:len(_MAGIC) + 8 + size].tobytes())
+        start = -(-(len(_MAGIC) + 8 + size) // _ALIGN) * _ALIGN
+
+        arrays = {}
+        for name, (dtype, offset, count) in header["arrays"].items():
+            dtype = np.dtype(dtype)
+            begin = start + offset
+            arrays[name] = buffer[begin:begin + count * dtype.itemsize].view(dtype)
+        self._offices = header["offices"]
+        self._pincodes = arrays["office.pincode"]
+        self._columns = {field: arrays[f"office.{field}"] for field in _FIELDS}
+        self._strings = _Strings(arrays["strings.blob"], arrays["strings.offsets"])
+        self._first = arrays["pincode.first"]
+        self._names = _Strings(arrays["names.blob"], arrays["names.offsets"])
+        self._name_starts, self._name_rows = arrays["names.starts"], arrays["names.rows"]
+        self._tokens = _Strings(arrays["tokens.blob"], arrays["tokens.offsets"])
+        self._token_starts, self._token_rows = arrays["tokens.starts"], arrays["tokens.rows"]
+
+        # Lower-cased state name -> string ids, for the state filter
+        self._states: Dict[str, List[int]] = {}
+        for state in np.unique(self._columns["state"]).tolist():
+            if state >= 0:
+                self._states.setdefault(self._strings[state].lower(), []).append(state)
+
+    def __len__(self) -> int:
+        return self._offices
+
+    async def get_by_pincode(self, pincode: str) -> List[PincodeInfo]:
+        if not re.fullmatch(r"\d{6}", pincode) or int(pincode) < _FIRST_PIN:
+            return []
+        i = int(pincode) - _FIRST_PIN
+        return self._infos(range(int(self._first[i]), int(self._first[i + 1])))
+
+    async def search_by_area(
+        self, area: str, state: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[PincodeInfo]:
+        """
+        Offices whose name starts with area, then those where every word
+        of area starts a word of the office or district name.
+        """
+        key = _key(area)
+        if not key:
+            return []
+        lo, hi = self._names.prefix_range(key)
+        by_name = self._name_rows[self._name_starts[lo]:self._name_starts[hi]]
+
+        by_token = None
+        for word in _tokens(area):
+            lo, hi = self._tokens.prefix_range(word)
+            rows = np.unique(self._token_rows[self._token_starts[lo]:self._token_starts[hi]])
+            by_token = rows if by_token is None else np.intersect1d(by_token, rows, assume_unique=True)
+        if by_token is None:
+            by_token = by_name[:0]
+        rows = np.concatenate([by_name, np.setdiff1d(by_token, by_name, assume_unique=True)])
+
+        if state is not None:
+            ids = self._states.get(state.strip().lower(), [])
+            rows = rows[np.isin(self._columns["state"][rows], ids)]
+        if limit is not None:
+            rows = rows[:limit]
+        return self._infos(rows.tolist())
+
+    def _infos(self, rows: Iterable[int]) -> List[PincodeInfo]:
+        strings, columns = self._strings, self._columns
+        infos = []
+        for row in rows:
+            values = {}
+            for field in _FIELDS:
+                i = int(columns[field][row])
+                values[field] = strings[i] if i >= 0 else None
+            infos.append(PincodeInfo(pincode=f"{self._pincodes[row]:06d}", **values))
+        return infos
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit(f"usage: python -m {__spec__.name if __spec__ else __file__} <csv> <snapshot>")
+    count = build_snapshot(read_offices(Path(sys.argv[1])), Path(sys.argv[2]))
+    print(f"Wrote {count} offices to {sys.argv[2]}")
@@ -46,7 +46,10 @@ async def root():
             "gold_price": "GET /gold",
             "fuel_price": "GET /fuel/{city}",
             "currency": "GET /currency/rate",
+            "currency_matrix": "GET /currency/matrix",
+            "currency_batch": "POST /currency/convert/batch",
             "pincode": "GET /pincode/{pincode}",
+            "pincode_search": "GET /pincode/search",
             "ifsc": "GET /ifsc/{code}",
             "holidays": "GET /holidays",
         },
@@ -0,0 +1,91 @@
+"""Unit tests for the memory-mapped pincode snapshot."""
+import asyncio
+
+import pytest
+
+from application.dto import PincodeRequest, PincodeSearchRequest
+from application.use_cases import GetPincodeInfoUseCase
+from application.use_cases.get_pincode_info import PincodeNotFoundError
+from infrastructure.repositories import SnapshotPincodeRepository, build_snapshot, read_offices
+from infrastructure.repositories.snapshot_pincode_repository import SnapshotFormatError
+
+CSV = """CircleName,RegionName,DivisionName,OfficeName,Pincode,OfficeType,Delivery,District,StateName
+Delhi Circle,Delhi Region,New Delhi Central Division,Connaught Place S.O,110001,PO,Delivery,CENTRAL DELHI,DELHI
+Delhi Circle,Delhi Region,New Delhi Central Division,Parliament Street H.O,110001,HO,Delivery,CENTRAL DELHI,DELHI
+Delhi Circle,Delhi Region,New Delhi Central Division,Connaught Circus S.O,110001,PO,Non Delivery,CENTRAL DELHI,DELHI
+Maharashtra Circle,Mumbai Region,Mumbai West Division,Andheri East S.O,400069,PO,Delivery,MUMBAI SUBURBAN,MAHARASHTRA
+Maharashtra Circle,Mumbai Region,Mumbai West Division,Andheri S.O,400053,PO,Delivery,MUMBAI SUBURBAN,MAHARASHTRA
+Maharashtra Circle,Mumbai Region,Mumbai GPO Division,Mumbai G.P.O.,400001,HO,Delivery,MUMBAI,MAHARASHTRA
+Karnataka Circle,Bangalore HQ Region,Bangalore GPO Division,Bangalore G.P.O.,560001,HO,Delivery,BENGALURU,KARNATAKA
+Karnataka Circle,Bangalore HQ Region,Bangalore East Division,Andheri B.O,560093,BO,Delivery,BENGALURU,KARNATAKA
+Karnataka Circle,Bangalore HQ Region,Bangalore East Division,Broken Row,NA,BO,Delivery,BENGALURU,KARNATAKA
+"""
+
+
+@pytest.fixture(scope="module")
+def repository(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("pincodes")
+    (directory / "pincodes.csv").write_text("\ufeff" + CSV, encoding="utf-8")
+    assert build_snapshot(read_offices(directory / "pincodes.csv"), directory / "pincodes.snap") == 8
+    return SnapshotPincodeRepository(directory / "pincodes.snap")
+
+
+class TestSnapshotPincodeRepository:
+    def test_get_by_pincode(self, repository):
+        offices = asyncio.run(repository.get_by_pincode("110001"))
+
+        assert [o.post_office for o in offices] == [
+            "Connaught Circus S.O", "Connaught Place S.O", "Parliament Street H.O"
+        ]
+        assert offices[0].delivery_status == "Non Delivery"
+        assert offices[1].district == "CENTRAL DELHI"
+        assert offices[1].division == "New Delhi Central Division"
+        assert offices[1].region == "Delhi Region"
+        assert offices[1].branch_type == "PO"
+        assert offices[1].block is None
+
+    def test_unknown_and_malformed_pincodes(self, repository):
+        assert asyncio.run(repository.get_by_pincode("999999")) == []
+        assert asyncio.run(repository.get_by_pincode("012345")) == []
+        assert asyncio.run(repository.get_by_pincode("11000")) == []
+
+    def test_name_prefix_matches_come_first(self, repository):
+        offices = asyncio.run(repository.search_by_area("connaught"))
+        assert [o.post_office for o in offices] == ["Connaught Circus S.O", "Connaught Place S.O"]
+
+        offices = asyncio.run(repository.search_by_area("Connaught  PL"))
+        assert [o.post_office for o in offices] == ["Connaught Place S.O"]
+
+    def test_token_search_matches_office_and_district_words(self, repository):
+        offices = asyncio.run(repository.search_by_area("east andh"))
+        assert [o.pincode for o in offices] == ["400069"]
+
+        offices = asyncio.run(repository.search_by_area("suburban"))
+        assert {o.pincode for o in offices} == {"400053", "400069"}
+
+    def test_state_filter_and_limit(self, repository):
+        offices = asyncio.run(repository.search_by_area("andheri", state="Karnataka"))
+        assert [o.pincode for o in offices] == ["560093"]
+
+        offices = asyncio.run(repository.search_by_area("andheri", limit=2))
+        assert len(offices) == 2
+        assert asyncio.run(repository.search_by_area("andheri", state="Goa")) == []
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "bogus.snap"
+        path.write_bytes(b"not a snapshot at all")
+        with pytest.raises(SnapshotFormatError):
+            SnapshotPincodeRepository(path)
+
+
+class TestPincodeSearchUseCase:
+    def test_search_and_lookup(self, repository):
+        use_case = GetPincodeInfoUseCase(pincode_repository=repository)
+
+        result = asyncio.run(use_case.search(PincodeSearchRequest(area="bangalore g")))
+        assert [o.pincode for o in result.data] == ["560001"]
+
+        result = asyncio.run(use_case.execute(PincodeRequest(pincode="400001")))
+        assert result.data[0].post_office == "Mumbai G.P.O."
+        with pytest.raises(PincodeNotFoundError):
+            asyncio.run(use_case.execute(PincodeRequest(pincode="400002")))
@@ -0,0 +1,112 @@
+"""Unit tests for the currency rate matrix."""
+import random
+import numpy as np
+import pytest
+from application.use_cases import GetCurrencyRateUseCase
+from application.use_cases.get_currency_rate import CurrencyNotFoundError, CurrencyValidationError
+from application.dto import CurrencyRequest, CurrencyMatrixRequest, BatchConversionRequest, ConversionRequest
+from infrastructure.repositories import MockCurrencyRepository, RateMatrix
+
+QUOTES = {("USD", "INR"): 83.12, ("EUR", "INR"): 89.45, ("INR", "USD"): 0.012, ("JPY", "INR"): 0.55}
+
+
+class TestRateMatrix:
+    def test_cross_and_quoted_rates(self):
+        matrix = RateMatrix(QUOTES, pivot="INR")
+
+        assert matrix.rate("EUR", "USD") == pytest.approx(89.45 / 83.12)
+        assert matrix.rate("INR", "EUR") == pytest.approx(1 / 89.45)
+        assert matrix.rate("INR", "USD") == 0.012  # Quoted both ways: each quote wins
+        assert matrix.rate("usd", "usd") == 1.0
+        assert matrix.rate("USD", "XYZ") is None
+
+    def test_separate_components(self):
+        matrix = RateMatrix({**QUOTES, ("BTC", "ETH"): 20.0})
+
+        assert matrix.rate("ETH", "BTC") == 0.05
+        assert matrix.rate("BTC", "INR") is None
+        matrix.update("ETH", "USD", 2000.0)
+        assert matrix.rate("BTC", "INR") == pytest.approx(20 * 2000 * 83.12)
+
+    def test_incremental_updates_match_rebuild(self):
+        rnd = random.Random(5)
+        codes = [f"C{i:02d}" for i in range(40)]
+        quotes = {(codes[i], codes[rnd.randrange(i)]): rnd.uniform(0.1, 10) for i in range(1, 40)}
+        quotes.update({tuple(rnd.sample(codes, 2)): rnd.uniform(0.1, 10) for _ in range(20)})
+        matrix = RateMatrix(quotes)
+
+        for _ in range(200):
+            base, quote = rnd.choice(list(quotes)) if rnd.random() < 0.9 else rnd.sample(codes, 2)
+            quotes[(base, quote)] = rate = rnd.uniform(0.1, 10)
+            matrix.update(base, quote, rate)
+
+        assert np.allclose(matrix.rates, RateMatrix(quotes).rates, rtol=1e-12, equal_nan=True)
+
+    def test_vectorized_convert(self):
+        matrix = RateMatrix(QUOTES)
+        bases = matrix.indices(["USD", "EUR", "XYZ"])
+        result = matrix.convert([100, 5, 1], bases, matrix.indices(["JPY", "USD", "INR"]))
+
+        assert result[0] == pytest.approx(100 * 83.12 / 0.55)
+        assert result[1] == pytest.approx(5 * 89.45 / 83.12)
+        assert np.isnan(result[2])
+
+
+class TestCurrencyMatrixUseCase:
+    @pytest.mark.asyncio
+    async def test_matrix_and_updates(self):
+        repository = MockCurrencyRepository()
+        use_case = GetCurrencyRateUseCase(currency_repository=repository)
+        result = await use_case.matrix(CurrencyMatrixRequest(codes=["eur", "usd"]))
+        assert result.codes == ["EUR", "USD"]
+        assert result.rates[0][1] == round(89.45 / 83.12, 6)
+
+        repository.set_rate("EUR", "INR", 90.0)
+        rate = await use_case.execute(CurrencyRequest(base="EUR", quote="GBP"))
+        assert rate.data.rate == pytest.approx(90.0 / 104.78)
+
+        with pytest.raises(CurrencyNotFoundError):
+            await use_case.matrix(CurrencyMatrixRequest(codes=["USD", "XYZ"]))
+
+
+class TestBatchConversion:
+    @pytest.mark.asyncio
+    async def test_input_order_and_unavailable_pairs(self):
+        use_case = GetCurrencyRateUseCase(currency_repository=MockCurrencyRepository())
+        result = await use_case.convert_batch(BatchConversionRequest(
+            amounts=[100, 5, 1, 2, 7],
+            from_currencies=["usd", "EUR", "XYZ", "INR", "xyz"],
+            to_currencies=["JPY", "USD", "INR", "inr", "INR"]
+        ))
+
+        assert result.converted_amounts == [
+            round(100 * 83.12 / 0.55, 2), round(5 * 89.45 / 83.12, 2), None, 2.0, None
+        ]
+        assert result.rates[2] is None
+        assert result.unavailable == ["XYZ/INR"]
+
+    @pytest.mark.asyncio
+    async def test_matches_single_conversions(self):
+        use_case = GetCurrencyRateUseCase(currency_repository=MockCurrencyRepository())
+        rnd = random.Random(9)
+        codes = ["USD", "EUR", "GBP", "INR", "AED", "JPY"]
+        items = [(rnd.uniform(1, 1000), rnd.choice(codes), rnd.choice(codes)) for _ in range(500)]
+        result = await use_case.convert_batch(BatchConversionRequest(
+            amounts=[a for a, _, _ in items],
+            from_currencies=[f for _, f, _ in items],
+            to_currencies=[t for _, _, t in items]
+        ))
+
+        for (amount, source, target), converted in zip(items, result.converted_amounts):
+            single = await use_case.convert(
+                ConversionRequest(amount=amount, from_currency=source, to_currency=target)
+            )
+            assert converted == single.converted_amount
+
+    @pytest.mark.asyncio
+    async def test_mismatched_lengths(self):
+        use_case = GetCurrencyRateUseCase(currency_repository=MockCurrencyRepository())
+        with pytest.raises(CurrencyValidationError):
+            await use_case.convert_batch(BatchConversionRequest(
+                amounts=[1, 2], from_currencies=["USD"], to_currencies=["INR", "INR"]
+            ))